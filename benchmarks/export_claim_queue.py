@@ -0,0 +1,168 @@
+"""Measure export claim latency against growing retained job history.
+
+The benchmark loads an in-process rdflib dataset with a constant queue of
+QUEUED jobs plus a growing number of retained READY/DELETED hulls, then times
+``GraphDbExportJobRepository.claim_next``. The indexed claim should stay flat
+while the former full-payload scan grows linearly with history.
+
+Run it from the repository root::
+
+    python -m benchmarks.export_claim_queue --sizes 100 1000 10000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from typing import Sequence
+from uuid import UUID
+
+from oldap_api.exports.domain import (
+    ExportJob,
+    ExportKind,
+    ExportProgress,
+    ExportSelectionSnapshot,
+    ExportState,
+    ExportTask,
+)
+from oldap_api.exports.repository import (
+    EXPORT_GRAPH,
+    GraphDbExportJobRepository,
+    _job_triples,
+    _select_claim_candidate,
+)
+from oldap_api.test.rdflib_connection import RdflibTransactionalConnection
+
+NOW = datetime(2026, 8, 14, 12, 0, tzinfo=UTC)
+QUEUE_DEPTH = 20
+LOAD_BATCH = 1_000
+
+
+def _job(index: int, state: ExportState) -> ExportJob:
+    job = ExportJob(
+        export_id=str(UUID(int=index, version=4)),
+        state=ExportState.QUEUED,
+        state_version=0,
+        created_at=NOW - timedelta(days=30) + timedelta(seconds=index),
+        updated_at=NOW,
+        requested_by_iri=f"https://example.org/users/user-{index % 50}",
+        requested_by_user_id=f"user-{index % 50}",
+        selection=ExportSelectionSnapshot(
+            project_short_name="museum",
+            kind=ExportKind.ARCHIVE_ALL,
+            display_name="Archive",
+            display_path="Archive",
+            profile_id="museum-v1",
+            profile_version="1.0.0",
+            profile_sha256="a" * 64,
+        ),
+        estimated_source_bytes=1_000_000,
+        progress=ExportProgress(files_total=10, bytes_total=1_000_000),
+        snapshot_at=NOW,
+        manifest_sha256="a" * 64,
+    )
+    if state is ExportState.READY:
+        return replace(
+            job,
+            state=state,
+            state_version=2,
+            ready_at=NOW,
+            expires_at=NOW + timedelta(days=1),
+            archive_size_bytes=1_000,
+            archive_sha256="b" * 64,
+        )
+    if state is ExportState.DELETED:
+        return replace(
+            job,
+            state=state,
+            state_version=4,
+            deleted_at=NOW,
+            audit_delete_at=NOW + timedelta(days=60),
+            manifest_sha256=None,
+        )
+    return job
+
+
+def _load(connection: RdflibTransactionalConnection, jobs: list[ExportJob]) -> None:
+    graph = connection.dataset.graph(EXPORT_GRAPH)
+    for start in range(0, len(jobs), LOAD_BATCH):
+        body = "\n".join(_job_triples(job) for job in jobs[start : start + LOAD_BATCH])
+        graph.parse(data=body, format="turtle")
+
+
+def _time(function, repetitions: int) -> float:
+    samples = []
+    for _ in range(repetitions):
+        started = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1_000
+
+
+def run(sizes: Sequence[int], repetitions: int, legacy_max: int) -> None:
+    connection = RdflibTransactionalConnection()
+    repository = GraphDbExportJobRepository(connection)
+    _load(connection, [_job(index, ExportState.QUEUED) for index in range(QUEUE_DEPTH)])
+    retained = 0
+    clock = {"now": NOW}
+
+    def claim() -> None:
+        clock["now"] += timedelta(minutes=2)
+        claimed = repository.claim_next(
+            worker_id="bench",
+            supported_tasks=(ExportTask.CLEANUP, ExportTask.BUILD),
+            claim_id=str(UUID(int=int(clock["now"].timestamp()), version=4)),
+            claimed_at=clock["now"],
+            lease_expires_at=clock["now"] + timedelta(minutes=1),
+        )
+        assert claimed is not None
+
+    def legacy_scan() -> None:
+        _select_claim_candidate(
+            repository._all(transactional=True),
+            (ExportTask.CLEANUP, ExportTask.BUILD),
+            clock["now"],
+        )
+
+    print(f"{'retained':>10} {'indexed claim ms':>18} {'full scan ms':>14}")
+    for size in sorted(sizes):
+        history = [
+            _job(
+                QUEUE_DEPTH + index,
+                ExportState.READY if index % 10 == 0 else ExportState.DELETED,
+            )
+            for index in range(retained, size)
+        ]
+        _load(connection, history)
+        retained = size
+        indexed = _time(claim, repetitions)
+        legacy = (
+            f"{_time(legacy_scan, max(1, repetitions // 5)):14.2f}"
+            if size <= legacy_max
+            else f"{'skipped':>14}"
+        )
+        print(f"{size:>10} {indexed:18.2f} {legacy}")
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[100, 1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--repetitions", type=int, default=25)
+    parser.add_argument(
+        "--legacy-max",
+        type=int,
+        default=10_000,
+        help="Largest history for which the former full scan is also timed.",
+    )
+    args = parser.parse_args(argv)
+    run(args.sizes, args.repetitions, args.legacy_max)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,120 @@
+"""Measure peak memory of whole-document versus streamed export manifests.
+
+The whole-document path builds every media entry as a dict, canonicalizes the
+complete manifest with ``rfc8785.dumps`` and decodes it for the SPARQL literal,
+as the former ``ExportManifest.from_dict`` persistence did. The streamed path
+feeds the same generated entries one at a time to ``ExportManifestWriter``,
+which spools canonical bytes to a temporary file while hashing. Peak Python
+allocations are reported by ``tracemalloc``.
+
+Run it from the repository root::
+
+    python -m benchmarks.export_manifest_memory --sizes 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import time
+import tracemalloc
+from typing import Any, Callable, Iterator, Sequence
+
+import rfc8785
+
+from oldap_api.exports.manifest import ExportManifestWriter
+
+ENVELOPE = {
+    "documentType": "oldap.zip-export.manifest",
+    "schemaVersion": "1.0.0",
+    "exportId": "11111111-1111-4111-8111-111111111111",
+    "generatedAt": "2026-08-14T12:00:00Z",
+    "kind": "STAGING_ALL",
+    "projectShortName": "museum",
+    "requestedByIri": "https://example.org/users/alice",
+    "profile": {
+        "profileId": "museum-v1",
+        "profileVersion": "1.0.0",
+        "profileSha256": "a" * 64,
+        "metadataSchemaVersion": "1.0.0",
+    },
+    "selection": {
+        "iri": "urn:uuid:22222222-2222-4222-8222-222222222222",
+        "displayName": "Staging",
+        "displayPath": "Staging",
+    },
+    "limits": {"maxArchiveBytes": 50_000_000_000},
+}
+
+
+def _media(count: int) -> Iterator[dict[str, Any]]:
+    for index in range(count):
+        yield {
+            "entryIndex": index,
+            "relativePath": f"Staging/folder-{index // 1_000}/image-{index}.tif",
+            "mediaIri": f"urn:uuid:00000000-0000-4000-8000-{index:012d}",
+            "containerIri": f"urn:uuid:10000000-0000-4000-8000-{index // 1_000:012d}",
+            "included": True,
+            "binarySource": {
+                "assetId": f"asset-{index}",
+                "storagePath": f"museum/assets/asset-{index}/original/image.tif",
+                "originalName": f"image-{index}.tif",
+                "originalMimeType": "image/tiff",
+                "expectedSizeBytes": 1_000,
+            },
+            "metadata": {"title": {"en": f"Image {index}"}},
+        }
+
+
+def whole_document(count: int) -> str:
+    value = dict(ENVELOPE, directories=[], media=list(_media(count)))
+    canonical = rfc8785.dumps(value)
+    hashlib.sha256(canonical).hexdigest()
+    return canonical.decode("utf-8")
+
+
+def streamed(count: int) -> str:
+    writer = ExportManifestWriter(ENVELOPE)
+    for item in _media(count):
+        writer.add_media(item)
+    return writer.finish().sha256
+
+
+def _measure(function: Callable[[int], Any], count: int) -> tuple[float, float]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    function(count)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024 / 1024, elapsed
+
+
+def run(sizes: Sequence[int], whole_max: int) -> None:
+    print(f"{'entries':>10} {'streamed MiB':>13} {'s':>7} {'whole MiB':>10} {'s':>7}")
+    for size in sorted(sizes):
+        peak, elapsed = _measure(streamed, size)
+        if size <= whole_max:
+            whole_peak, whole_elapsed = _measure(whole_document, size)
+            whole = f"{whole_peak:10.1f} {whole_elapsed:7.1f}"
+        else:
+            whole = f"{'skipped':>10} {'':>7}"
+        print(f"{size:>10} {peak:13.1f} {elapsed:7.1f} {whole}")
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument(
+        "--whole-max",
+        type=int,
+        default=1_000_000,
+        help="Largest manifest for which the whole-document path is also measured.",
+    )
+    args = parser.parse_args(argv)
+    run(args.sizes, args.whole_max)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,81 @@
+"""Measure the require_auth decorator with and without the verified-token cache.
+
+One access token is presented repeatedly to a protected no-op view inside a
+Flask test request context, as a UI polling the API would. The uncached run
+uses a cache of size zero, so every call decodes the JWT and rebuilds the
+authorization context; the cached run decodes once and then reuses it.
+
+Run it from the repository root::
+
+    python -m benchmarks.require_auth_cache --requests 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from typing import Sequence
+
+from flask import Flask
+from oldaplib.src.authentication import AuthorizationContext, TokenCodec
+from oldaplib.src.helpers.observable_dict import ObservableDict
+from oldaplib.src.in_project import InProjectClass
+from oldaplib.src.xsd.iri import Iri
+from oldaplib.src.xsd.xsd_ncname import Xsd_NCName
+
+from oldap_api import authentication
+
+SECRET = "benchmark-access-secret-with-at-least-32-bytes"
+
+
+def _token() -> str:
+    context = AuthorizationContext(
+        userIri=Iri("https://example.org/users/benchmark"),
+        userId=Xsd_NCName("benchmark"),
+        inProject=InProjectClass(),
+        hasRole=ObservableDict(),
+    )
+    return TokenCodec.from_environment().issue_access_token(context)
+
+
+def measure(cache: authentication.VerifiedTokenCache, requests: int) -> float:
+    """Return the mean seconds per protected call using ``cache``."""
+
+    authentication.VERIFIED_TOKEN_CACHE = cache
+    app = Flask(__name__)
+    view = authentication.require_auth(lambda: "")
+    headers = {"Authorization": f"Bearer {_token()}"}
+    with app.test_request_context("/", headers=headers):
+        started = time.perf_counter()
+        for _ in range(requests):
+            view()
+        return (time.perf_counter() - started) / requests
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5_000)
+    args = parser.parse_args(argv)
+    os.environ.setdefault("OLDAP_ACCESS_JWT_SECRET", SECRET)
+    original = authentication.VERIFIED_TOKEN_CACHE
+    try:
+        uncached = measure(authentication.VerifiedTokenCache(0), args.requests)
+        cache = authentication.VerifiedTokenCache()
+        cached = measure(cache, args.requests)
+    finally:
+        authentication.VERIFIED_TOKEN_CACHE = original
+    print(f"{'mode':>10} {'us/call':>10}")
+    print(f"{'uncached':>10} {uncached * 1e6:10.1f}")
+    print(f"{'cached':>10} {cached * 1e6:10.1f}")
+    stats = cache.stats()
+    print(
+        f"hit rate {stats['hitRate']:.4f}, mean hit "
+        f"{stats['meanHitSeconds'] * 1e6:.1f} us, mean miss "
+        f"{stats['meanMissSeconds'] * 1e6:.1f} us"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
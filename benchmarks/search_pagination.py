@@ -0,0 +1,145 @@
+"""Compare OFFSET and keyset cursor latency for deep pages of a class listing.
+
+The benchmark seeds a class of a project in a local GraphDB with resources the
+benchmark user may view, then reads the pages at the requested depths twice:
+with ``ResourceInstance.search`` and ``limit``/``offset``, and with
+``keyset_search`` following cursors. Offset pages slow down with their depth
+because the store sorts and skips every earlier row; cursor pages read only the
+rows after the previous page.
+
+Cursors are walked page by page, so the cursor time of a depth is measured for
+the one page read at that depth from the cursor of the page before it.
+
+Run it from the repository root against a repository loaded with the test data::
+
+    python -m benchmarks.search_pagination --seed 50000 --depths 0 1000 10000 49000
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from typing import Sequence
+
+from oldaplib.src.connection import Connection
+from oldaplib.src.helpers.context import Context
+from oldaplib.src.objectfactory import ResourceInstance, SortBy
+from oldaplib.src.xsd.xsd_ncname import Xsd_NCName
+from oldaplib.src.xsd.xsd_qname import Xsd_QName
+
+from oldap_api.search_cursor import keyset_search
+
+SEED_BATCH = 1_000
+SEED_PREFIX = "urn:oldap-benchmark:pagination:"
+
+
+def _seed(
+    con: Connection, project: str, resclass: Xsd_QName, prop: Xsd_QName, count: int
+) -> None:
+    role = next(iter(con.userdata.hasRole))
+    con.update_query(
+        f"{_prefixes(con)}DELETE {{ GRAPH {project}:data {{ ?res ?p ?o }} }} "
+        f"WHERE {{ GRAPH {project}:data {{ ?res ?p ?o "
+        f'FILTER(STRSTARTS(STR(?res), "{SEED_PREFIX}")) }} }}'
+    )
+    for start in range(0, count, SEED_BATCH):
+        triples = " ".join(
+            f"<{SEED_PREFIX}{index}> a {resclass.toRdf} ; "
+            f'{prop.toRdf} "{(index * 7919) % count:08d}" ; '
+            f"oldap:attachedToRole {role.toRdf} . "
+            f"<< <{SEED_PREFIX}{index}> oldap:attachedToRole {role.toRdf} >> "
+            f"oldap:hasDataPermission oldap:DATA_VIEW ."
+            for index in range(start, min(start + SEED_BATCH, count))
+        )
+        con.update_query(
+            f"{_prefixes(con)}INSERT DATA {{ GRAPH {project}:data {{ {triples} }} }}"
+        )
+
+
+def _prefixes(con: Connection) -> str:
+    return Context(name=con.context_name).sparql_context
+
+
+def _time(function, repetitions: int) -> float:
+    samples = []
+    for _ in range(repetitions):
+        started = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1_000
+
+
+def run(
+    con: Connection,
+    project: str,
+    resclass: Xsd_QName,
+    prop: Xsd_QName,
+    depths: Sequence[int],
+    page: int,
+    repetitions: int,
+) -> None:
+    sort_by = [SortBy(prop)]
+    listing = {"resClass": resclass, "sortBy": sort_by, "limit": page}
+
+    print(f"{'depth':>10} {'offset ms':>12} {'cursor ms':>12}")
+    cursor: str | None = None
+    walked = 0
+    for depth in sorted(depths):
+        while walked + page <= depth:
+            _, cursor = keyset_search(con, project, cursor=cursor, **listing)
+            walked += page
+        offset_ms = _time(
+            lambda: ResourceInstance.search(
+                con=con, project=Xsd_NCName(project), offset=depth, **listing
+            ),
+            repetitions,
+        )
+        cursor_ms = _time(
+            lambda: keyset_search(con, project, cursor=cursor, **listing),
+            repetitions,
+        )
+        print(f"{depth:>10} {offset_ms:12.2f} {cursor_ms:12.2f}")
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--user", default="rosenth")
+    parser.add_argument("--password", default="RioGrande")
+    parser.add_argument("--project", default="test")
+    parser.add_argument("--resclass", default="test:Book")
+    parser.add_argument("--sort-property", default="test:title")
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Replace the benchmark resources of the class with this many new ones.",
+    )
+    parser.add_argument(
+        "--depths", type=int, nargs="+", default=[0, 1_000, 10_000, 40_000]
+    )
+    parser.add_argument("--page", type=int, default=100)
+    parser.add_argument("--repetitions", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    con = Connection(
+        userId=args.user, credentials=args.password, context_name="DEFAULT"
+    )
+    resclass = Xsd_QName(args.resclass, validate=True)
+    prop = Xsd_QName(args.sort_property, validate=True)
+    if args.seed:
+        _seed(con, args.project, resclass, prop, args.seed)
+    run(
+        con,
+        args.project,
+        resclass,
+        prop,
+        [depth - depth % args.page for depth in args.depths],
+        args.page,
+        args.repetitions,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,79 @@
+"""Measure Staging write throughput as writes spread over more StagingAreas.
+
+Worker threads run short simulated Staging writes through
+``RedisStagingMutationLock`` against an in-process Redis stand-in from
+``fakeredis``. Each worker writes to one of ``--areas`` StagingAreas, so with a
+single area every write waits for the one before it, as all writes did under
+the former deployment-wide lease, while writes to different areas hold
+different leases and overlap.
+
+The stand-in keeps the lease queue and the redis-py lock protocol, including the
+polling while a lease is busy, but not the network round trips of a real server.
+
+Run it from the repository root with ``fakeredis[lua]`` installed; redis-py
+releases leases with a Lua script::
+
+    python -m benchmarks.staging_lock_sharding --workers 8 --areas 1 2 4 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Sequence
+
+from oldap_api.staging_lock import RedisStagingMutationLock, staging_area_scope
+
+AREA_PREFIX = "urn:oldap-benchmark:staging-area:"
+
+
+def _client() -> Any:
+    try:
+        import fakeredis
+    except ImportError as error:
+        raise SystemExit(
+            "This benchmark needs fakeredis: pip install 'fakeredis[lua]'"
+        ) from error
+    return fakeredis.FakeStrictRedis(decode_responses=True)
+
+
+def run(workers: int, areas: Sequence[int], writes: int, write_seconds: float) -> None:
+    print(f"{'areas':>6} {'writes':>8} {'seconds':>9} {'writes/s':>10}")
+    for area_count in areas:
+        guard = RedisStagingMutationLock(_client())
+
+        def worker(index: int) -> None:
+            scopes = [staging_area_scope(f"{AREA_PREFIX}{index % area_count}")]
+            for _ in range(writes):
+                guard.run(lambda: time.sleep(write_seconds), scopes)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(worker, range(workers)))
+        elapsed = time.perf_counter() - started
+        total = workers * writes
+        print(f"{area_count:>6} {total:>8} {elapsed:9.2f} {total / elapsed:10.1f}")
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--areas", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument(
+        "--writes", type=int, default=10, help="Writes per worker thread."
+    )
+    parser.add_argument(
+        "--write-ms",
+        type=float,
+        default=20.0,
+        help="Simulated GraphDB time of one write while the lease is held.",
+    )
+    args = parser.parse_args(argv)
+
+    run(args.workers, args.areas, args.writes, args.write_ms / 1_000)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
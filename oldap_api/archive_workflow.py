@@ -25,6 +25,8 @@ from oldaplib.src.xsd.xsd_integer import Xsd_integer
 from oldaplib.src.xsd.xsd_ncname import Xsd_NCName
 from oldaplib.src.xsd.xsd_qname import Xsd_QName
 
+from oldap_api.model_cache import CachedResourceInstanceFactory
+
 
 def _value(record: dict[Any, Any], property_name: str) -> Any | None:
     """Return the first projected value regardless of QName/string keys."""
@@ -67,7 +69,7 @@ def build_visible_staging_archive_proposal(
 
     project = Xsd_NCName(project_id, validate=True)
     area_iri = Iri(staging_area_iri, validate=True)
-    factory = ResourceInstanceFactory(con=connection, project=project)
+    factory = CachedResourceInstanceFactory(con=connection, project=project)
     area = factory.read(area_iri)
     if not _class_is_or_extends(area, Xsd_QName("shared:StagingArea", validate=False)):
         raise OldapErrorNotFound("The selected StagingArea was not found.")
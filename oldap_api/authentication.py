@@ -1,10 +1,16 @@
 """Shared bearer-authentication boundary for protected OLDAP API views."""
 
+import hashlib
+import time
+from collections import OrderedDict
 from collections.abc import Callable
 from functools import wraps
-from typing import ParamSpec, TypeVar, cast
+from threading import Lock
+from typing import Any, ParamSpec, TypeVar, cast
 
+import jwt
 from flask import Response, current_app, g, jsonify, request
+from oldaplib.src.authentication import AuthorizationContext, TokenCodec
 from oldaplib.src.connection import Connection
 from oldaplib.src.helpers.oldaperror import (
     OldapError,
@@ -14,6 +20,129 @@ from oldaplib.src.helpers.oldaperror import (
 P = ParamSpec("P")
 R = TypeVar("R")
 _CONNECTION_KEY = "oldap_authenticated_connection"
+VERIFIED_TOKEN_CACHE_SIZE = 4096
+VERIFIED_TOKEN_TTL_SECONDS = 60
+
+
+class VerifiedTokenCache:
+    """Bounded LRU of authorization contexts decoded from valid access tokens.
+
+    Entries are keyed by the SHA-256 of the bearer token and expire at the
+    earlier of the token's own ``exp`` and ``ttl_seconds`` after validation.
+    Access tokens carry no ``authVersion``; like the tokens themselves, cached
+    entries stay valid until they expire, and the short TTL bounds how long a
+    process keeps them. Only successful validations are cached.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = VERIFIED_TOKEN_CACHE_SIZE,
+        *,
+        ttl_seconds: float = VERIFIED_TOKEN_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_entries < 0 or ttl_seconds <= 0:
+            raise ValueError(
+                "max_entries must not be negative and ttl_seconds must be positive."
+            )
+        self._lock = Lock()
+        self._entries: OrderedDict[bytes, tuple[float, AuthorizationContext]] = (
+            OrderedDict()
+        )
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.hit_seconds = 0.0
+        self.miss_seconds = 0.0
+
+    def lookup(self, token: str) -> AuthorizationContext | None:
+        """Return the cached context of an unexpired validated token."""
+
+        key = _token_key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def store(self, token: str, context: AuthorizationContext) -> None:
+        """Remember the context of a token that has just been fully validated."""
+
+        expires = jwt.decode(token, options={"verify_signature": False}).get("exp")
+        if not self._max_entries or not isinstance(expires, int):
+            return
+        key = _token_key(token)
+        with self._lock:
+            self._entries[key] = (
+                min(float(expires), self._clock() + self._ttl_seconds),
+                context,
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def record(self, seconds: float, *, hit: bool) -> None:
+        """Add the wall-clock cost of one successful authentication."""
+
+        with self._lock:
+            if hit:
+                self.hit_seconds += seconds
+            else:
+                self.miss_seconds += seconds
+
+    def stats(self) -> dict[str, float]:
+        """Return counters, hit rate, and mean authentication latencies."""
+
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "hitRate": self.hits / lookups if lookups else 0.0,
+                "meanHitSeconds": self.hit_seconds / self.hits if self.hits else 0.0,
+                "meanMissSeconds": (
+                    self.miss_seconds / self.misses if self.misses else 0.0
+                ),
+            }
+
+    def clear(self) -> None:
+        """Drop all cached tokens and reset the counters."""
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+            self.hit_seconds = self.miss_seconds = 0.0
+
+
+VERIFIED_TOKEN_CACHE = VerifiedTokenCache()
+
+
+class _VerifiedTokenCodec:
+    """Hand a cached context to ``Connection`` instead of decoding again."""
+
+    def __init__(self, context: AuthorizationContext) -> None:
+        self._context = context
+
+    def decode_access_token(self, token: str) -> AuthorizationContext:
+        return self._context
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(TokenCodec.from_environment(), name)
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode("utf-8")).digest()
 
 
 def _authentication_failure(status: int = 401) -> Response:
@@ -43,7 +172,8 @@ def require_auth(view: Callable[P, R]) -> Callable[P, R | Response]:
     Missing, malformed, expired, wrong-purpose, and otherwise invalid bearer
     credentials deliberately receive the same ``401`` response. Runtime token
     configuration failures remain distinguishable as ``503`` operational
-    errors.
+    errors. Recently validated tokens are served from
+    :data:`VERIFIED_TOKEN_CACHE` with a fresh connection per request.
     """
 
     @wraps(view)
@@ -51,8 +181,21 @@ def require_auth(view: Callable[P, R]) -> Callable[P, R | Response]:
         token = _bearer_token()
         if token is None:
             return _authentication_failure()
+        started = time.perf_counter()
+        context = VERIFIED_TOKEN_CACHE.lookup(token)
         try:
-            connection = Connection(token=token, context_name="DEFAULT")
+            if context is not None:
+                connection = Connection(
+                    token=token,
+                    context_name="DEFAULT",
+                    token_codec=cast(TokenCodec, _VerifiedTokenCodec(context)),
+                )
+            else:
+                connection = Connection(token=token, context_name="DEFAULT")
+                if isinstance(
+                    getattr(connection, "userdata", None), AuthorizationContext
+                ):
+                    VERIFIED_TOKEN_CACHE.store(token, connection.userdata)
         except OldapErrorConfiguration as error:
             current_app.logger.error(
                 "Bearer authentication is not configured: %s", error
@@ -60,6 +203,9 @@ def require_auth(view: Callable[P, R]) -> Callable[P, R | Response]:
             return _authentication_failure(status=503)
         except OldapError:
             return _authentication_failure()
+        VERIFIED_TOKEN_CACHE.record(
+            time.perf_counter() - started, hit=context is not None
+        )
         setattr(g, _CONNECTION_KEY, connection)
         return view(*args, **kwargs)
 
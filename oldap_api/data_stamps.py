@@ -0,0 +1,114 @@
+"""Change stamps for project data graphs held in the API cache Redis.
+
+Derived results that depend on what a requester can see in a project, such as
+export download authorizations, are cached under the current stamp of that
+project. Every successful API request that may write a project's data graph
+increments the project's stamp; requests that may change data without naming a
+project, or that change users, roles, or projects, increment one global stamp
+that is part of every project stamp. Entries cached under an older stamp are
+simply never read again and expire on their own.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from flask import Flask, Response, request
+from redis import Redis
+from redis.exceptions import RedisError
+
+from oldap_api.redis_config import cache_redis_url
+
+PROJECT_STAMP_PREFIX = "oldap:data-stamp:project:"
+GLOBAL_STAMP_KEY = "oldap:data-stamp:global"
+MUTATING_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+# Mutating routes that only touch API job graphs, tokens, or nothing at all.
+NON_DATA_BLUEPRINTS = frozenset(
+    {
+        "auth",
+        "mobile_auth",
+        "imports",
+        "internal_import_claims",
+        "exports",
+        "internal_exports",
+        "internal_export_claims",
+    }
+)
+NON_DATA_ENDPOINTS = frozenset(
+    {
+        "instance.search_instance",
+        "instance.batch_read_instances",
+        "archive_workflow.preflight_archive_import",
+        "internal_imports.record_stored_sip",
+        "internal_imports.record_import_validation_result",
+        "internal_imports.fail_staging_import",
+        "internal_imports.complete_import_cleanup",
+    }
+)
+
+logger = logging.getLogger(__name__)
+
+
+class DataGraphStamps:
+    """Read and advance per-project data-graph change stamps."""
+
+    def __init__(self, client: Redis | None = None) -> None:
+        self._client = client or Redis.from_url(
+            cache_redis_url(),
+            decode_responses=True,
+            socket_connect_timeout=2,
+            socket_timeout=2,
+        )
+
+    @property
+    def client(self) -> Redis:
+        return self._client
+
+    def current(self, project_short_name: str) -> str:
+        """Return the combined project and global stamp for one project."""
+
+        project, shared = self._client.mget(
+            [_project_key(project_short_name), GLOBAL_STAMP_KEY]
+        )
+        return f"{int(project or 0)}.{int(shared or 0)}"
+
+    def bump(self, project_short_name: str | None) -> None:
+        """Invalidate one project, or every project when none is named."""
+
+        self._client.incr(
+            _project_key(project_short_name) if project_short_name else GLOBAL_STAMP_KEY
+        )
+
+
+def register_data_graph_stamps(
+    app: Flask, stamps: DataGraphStamps | None = None
+) -> None:
+    """Advance the stamp after every successful possibly data-writing request."""
+
+    state: dict[str, DataGraphStamps] = {}
+    if stamps is not None:
+        state["stamps"] = stamps
+
+    @app.after_request
+    def record_data_graph_write(response: Response) -> Response:
+        if request.method not in MUTATING_METHODS or response.status_code >= 400:
+            return response
+        endpoint = request.endpoint or ""
+        if (
+            endpoint in NON_DATA_ENDPOINTS
+            or endpoint.partition(".")[0] in NON_DATA_BLUEPRINTS
+        ):
+            return response
+        project = (request.view_args or {}).get("project")
+        try:
+            if "stamps" not in state:
+                state["stamps"] = DataGraphStamps()
+            state["stamps"].bump(project)
+        except RedisError:
+            logger.warning("Could not advance the data-graph stamp for %s.", endpoint)
+        return response
+
+
+def _project_key(project_short_name: str) -> str:
+    return f"{PROJECT_STAMP_PREFIX}{project_short_name}"
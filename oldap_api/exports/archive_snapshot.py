@@ -10,12 +10,14 @@ from __future__ import annotations
 import hashlib
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Any, Mapping, Protocol
+from typing import Any, Iterator, Mapping, Protocol
 
-import rfc8785
+from oldaplib.src.enums.datapermissions import DataPermission
 from oldaplib.src.helpers.context import Context
 from oldaplib.src.helpers.oldaperror import OldapErrorNoPermission, OldapErrorNotFound
-from oldaplib.src.objectfactory import ResourceInstance, ResourceInstanceFactory
+from oldaplib.src.helpers.query_processor import QueryProcessor
+from oldaplib.src.objectfactory import ResourceInstance
+from oldaplib.src.project import Project
 from oldaplib.src.xsd.iri import Iri
 from oldaplib.src.xsd.floatingpoint import FloatingPoint
 from oldaplib.src.xsd.xsd_boolean import Xsd_boolean
@@ -23,9 +25,11 @@ from oldaplib.src.xsd.xsd_integer import Xsd_integer
 from oldaplib.src.xsd.xsd_ncname import Xsd_NCName
 from oldaplib.src.xsd.xsd_qname import Xsd_QName
 
+from oldap_api.model_cache import CachedResourceInstanceFactory
+
 from .domain import MAX_EXPORT_BYTES, ExportKind, ExportSelectionSnapshot
-from .manifest import ExportManifest
-from .profiles import ExportMetadataProjection, ExportProfile
+from .manifest import ExportManifest, ExportManifestWriter
+from .profiles import ExportMetadataProjection, ExportProfile, profile_sha256
 from .snapshot_common import (
     BinarySourceResolver,
     ExportSizeLimitError,
@@ -137,7 +141,7 @@ class OldapVisibleLabelResolver:
     ) -> Mapping[str, str]:
         """Return the first visible preferred label for every readable IRI."""
 
-        factory = ResourceInstanceFactory(
+        factory = CachedResourceInstanceFactory(
             con=connection, project=Xsd_NCName(project_short_name, validate=True)
         )
         result: dict[str, str] = {}
@@ -159,7 +163,14 @@ class OldapVisibleLabelResolver:
 
 
 class OldapArchiveInventoryReader:
-    """Read requester-visible archive units and permitted media subclasses."""
+    """Read requester-visible archive units and permitted media subclasses.
+
+    By default the reader issues one OLDAP search for all archive units and one
+    per allowed media class. With ``single_query`` it instead runs one
+    permission-aware SPARQL query that selects the units and only the media
+    linked from them through ``shared:hasMediaObject``, ordered by subject, and
+    folds each subject's bindings into its record before reading the next.
+    """
 
     UNIT_PROPERTIES = {
         "schema:name",
@@ -185,8 +196,14 @@ class OldapArchiveInventoryReader:
         "schema:url",
     }
 
-    def __init__(self, label_resolver: ArchiveLabelResolver | None = None) -> None:
+    def __init__(
+        self,
+        label_resolver: ArchiveLabelResolver | None = None,
+        *,
+        single_query: bool = False,
+    ) -> None:
         self._labels = label_resolver or OldapVisibleLabelResolver()
+        self._single_query = single_query
 
     def read(
         self,
@@ -197,6 +214,8 @@ class OldapArchiveInventoryReader:
     ) -> AuthorizedArchiveInventory:
         """Return only units/media visible through the requester connection."""
 
+        if self._single_query:
+            return self._read_linked(connection, project_short_name, profile)
         project = Xsd_NCName(project_short_name, validate=True)
         unit_properties = self.UNIT_PROPERTIES | {
             projection.property_iri for projection in profile.archive_units
@@ -278,6 +297,80 @@ class OldapArchiveInventoryReader:
         )
         return AuthorizedArchiveInventory(units, media, unavailable)
 
+    def _read_linked(
+        self,
+        connection: Any,
+        project_short_name: str,
+        profile: ExportProfile,
+    ) -> AuthorizedArchiveInventory:
+        project = Project.read(
+            con=connection,
+            projectIri_SName=Xsd_NCName(project_short_name, validate=True),
+        )
+        context = Context(name=connection.context_name)
+        result = connection.query(
+            context.sparql_context
+            + _linked_inventory_query(
+                connection.userIri.toRdf,
+                f"{project.projectShortName}:data",
+                profile.allowed_archive_media_classes,
+                (
+                    self.UNIT_PROPERTIES
+                    | {item.property_iri for item in profile.archive_units},
+                    self.MEDIA_PROPERTIES
+                    | {item.property_iri for item in profile.archive_media},
+                ),
+            )
+        )
+
+        units: list[ArchiveUnitRecord] = []
+        media: list[ArchiveMediaRecord] = []
+        links: dict[str, set[str]] = {}
+        label_iris: set[str] = set()
+        for kind, row in _linked_rows(context, result):
+            if kind == _UNIT_ROW:
+                if len(units) == MAX_ARCHIVE_UNITS:
+                    raise ExportSnapshotError(
+                        "Visible archive units exceed the v1 bound."
+                    )
+                label_iris |= _label_iris((row,), profile.archive_units)
+                unit = _archive_unit_record(row, profile.archive_units, {})
+                for media_iri in unit.media_iris:
+                    links.setdefault(media_iri, set()).add(unit.iri)
+                units.append(unit)
+                continue
+            media_iri = _required_text(row, "iri", "Visible archive media")
+            if media_iri not in links:
+                continue
+            if len(media) == MAX_ARCHIVE_MEDIA:
+                raise ExportSnapshotError("Visible archive media exceeds the v1 bound.")
+            label_iris |= _label_iris((row,), profile.archive_media)
+            media.append(
+                _archive_media_record(
+                    row,
+                    tuple(sorted(links[media_iri])),
+                    profile.archive_media,
+                    {},
+                )
+            )
+
+        if label_iris:
+            labels = self._labels.resolve(
+                connection,
+                project_short_name=project_short_name,
+                iris=label_iris,
+            )
+            _fill_labels(units, profile.archive_units, labels)
+            _fill_labels(media, profile.archive_media, labels)
+        media.sort(key=lambda item: item.iri)
+        visible = {item.iri for item in media}
+        unavailable = tuple(
+            UnavailableArchiveMediaRecord(media_iri, tuple(sorted(unit_iris)))
+            for media_iri, unit_iris in sorted(links.items())
+            if media_iri not in visible
+        )
+        return AuthorizedArchiveInventory(tuple(units), tuple(media), unavailable)
+
 
 class ArchiveSnapshotProjector:
     """Build safe ARCHIVE_UNIT and ARCHIVE_ALL manifests."""
@@ -475,14 +568,8 @@ class ArchiveSnapshotProjector:
             for unit_iri, path in paths.items()
         ]
         directories.sort(key=lambda item: portable_path_key(item["relativePath"]))
-        archive_units = [
-            _unit_manifest_entry(units[unit_iri], paths[unit_iri], selected)
-            for unit_iri in sorted(
-                selected, key=lambda item: portable_path_key(paths[item])
-            )
-        ]
         selection_name, selection_path = _selection_display(kind, selection_iri, units)
-        profile_sha = hashlib.sha256(rfc8785.dumps(profile.to_dict())).hexdigest()
+        profile_sha = profile_sha256(profile)
         selection = ExportSelectionSnapshot(
             project_short_name=profile.project_short_name,
             kind=kind,
@@ -499,7 +586,7 @@ class ArchiveSnapshotProjector:
         }
         if selection_iri:
             selection_value["iri"] = selection_iri
-        manifest = ExportManifest.from_dict(
+        writer = ExportManifestWriter(
             {
                 "documentType": "oldap.zip-export.manifest",
                 "schemaVersion": "1.0.0",
@@ -518,11 +605,19 @@ class ArchiveSnapshotProjector:
                 },
                 "selection": selection_value,
                 "limits": {"maxArchiveBytes": self._max_archive_bytes},
-                "directories": directories,
-                "media": entries,
-                "archiveUnits": archive_units,
             }
         )
+        for unit_iri in sorted(
+            selected, key=lambda item: portable_path_key(paths[item])
+        ):
+            writer.add_archive_unit(
+                _unit_manifest_entry(units[unit_iri], paths[unit_iri], selected)
+            )
+        for directory in directories:
+            writer.add_directory(directory)
+        for entry in entries:
+            writer.add_media(entry)
+        manifest = writer.finish()
         return ExportSnapshot(
             selection=selection,
             manifest=manifest,
@@ -554,16 +649,7 @@ class ArchiveDownloadAuthorizer:
                 "Export source authorization is unavailable."
             )
         try:
-            profile = self._profiles.get_active(job.selection.project_short_name)
-            profile_sha = hashlib.sha256(rfc8785.dumps(profile.to_dict())).hexdigest()
-            if (
-                profile.profile_id != job.selection.profile_id
-                or profile.profile_version != job.selection.profile_version
-                or profile_sha != job.selection.profile_sha256
-            ):
-                raise ExportDownloadPermissionError(
-                    "Export profile is no longer available."
-                )
+            profile = _current_profile(self._profiles, job)
             inventory = self._inventory_reader.read(
                 connection,
                 project_short_name=job.selection.project_short_name,
@@ -607,6 +693,96 @@ class ArchiveDownloadAuthorizer:
                 )
 
 
+class TargetedArchiveDownloadAuthorizer:
+    """Recheck only the frozen units and media with batched ASK queries.
+
+    Each batch binds frozen IRIs in a ``VALUES`` block and asks whether any of
+    them is no longer visible, typed, or linked as frozen, so the cost follows
+    the size of the export rather than of the project's archive. A unit whose
+    frozen parent changed is treated as unavailable.
+    """
+
+    def __init__(self, profile_registry: Any, *, batch_size: int = 500) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive.")
+        self._profiles = profile_registry
+        self._batch_size = batch_size
+
+    def authorize(
+        self,
+        connection: Any,
+        *,
+        job: Any,
+        manifest: ExportManifest,
+    ) -> None:
+        """Fail closed at the first batch containing a hidden item."""
+
+        if job.selection.kind not in {ExportKind.ARCHIVE_UNIT, ExportKind.ARCHIVE_ALL}:
+            raise ExportDownloadPermissionError(
+                "Export source authorization is unavailable."
+            )
+        value = manifest.to_dict()
+        units = {
+            unit["unitIri"]: unit.get("parentUnitIri")
+            for unit in value.get("archiveUnits", [])
+        }
+        links = []
+        for item in value["media"]:
+            if not item["included"]:
+                continue
+            frozen_links = set(item["metadata"].get("archive_unit_iris", []))
+            if not frozen_links or not frozen_links <= set(units):
+                raise ExportDownloadPermissionError(
+                    "Export source authorization is no longer available."
+                )
+            links.extend((item["mediaIri"], unit) for unit in sorted(frozen_links))
+        if not units or (
+            job.selection.kind is ExportKind.ARCHIVE_UNIT
+            and job.selection.selection_iri not in units
+        ):
+            raise ExportDownloadPermissionError(
+                "Export source authorization is no longer available."
+            )
+        try:
+            profile = _current_profile(self._profiles, job)
+            project = Project.read(
+                con=connection,
+                projectIri_SName=Xsd_NCName(
+                    job.selection.project_short_name, validate=True
+                ),
+            )
+            context = Context(name=connection.context_name)
+            data_graph = f"{project.projectShortName}:data"
+            user_iri = connection.userIri.toRdf
+            for query in _hidden_item_queries(
+                user_iri,
+                data_graph,
+                sorted(units.items()),
+                links,
+                profile.allowed_archive_media_classes,
+                self._batch_size,
+            ):
+                if _ask(connection.query(context.sparql_context + query)):
+                    raise ExportDownloadPermissionError(
+                        "Export source authorization is no longer available."
+                    )
+        except (OldapErrorNoPermission, OldapErrorNotFound) as error:
+            raise ExportDownloadPermissionError(
+                "Export source authorization is no longer available."
+            ) from error
+
+
+def _current_profile(profiles: Any, job: Any) -> ExportProfile:
+    profile = profiles.get_active(job.selection.project_short_name)
+    if (
+        profile.profile_id != job.selection.profile_id
+        or profile.profile_version != job.selection.profile_version
+        or profile_sha256(profile) != job.selection.profile_sha256
+    ):
+        raise ExportDownloadPermissionError("Export profile is no longer available.")
+    return profile
+
+
 def _unique_units(
     values: tuple[ArchiveUnitRecord, ...],
 ) -> dict[str, ArchiveUnitRecord]:
@@ -828,6 +1004,172 @@ def _archive_media_record(
     )
 
 
+_UNIT_ROW = 0
+_MEDIA_ROW = 1
+
+
+def _linked_inventory_query(
+    user_iri: str,
+    data_graph: str,
+    media_classes: tuple[str, ...],
+    properties: tuple[set[str], set[str]],
+) -> str:
+    """Select visible units and their visible linked media in subject order.
+
+    The visibility patterns mirror ``ResourceInstance.search``: a resource is
+    readable when one of the requester's roles grants at least DATA_VIEW on it.
+    Media are reached only through a visible unit's link, so unlinked media of
+    the allowed classes are never read.
+    """
+
+    def visible(resource: str, suffix: str) -> str:
+        return _visible_pattern(user_iri, data_graph, resource, suffix)
+
+    classes = " ".join(_sparql_term(name) for name in media_classes)
+    projected = " ".join(
+        f'({kind} {_sparql_term(name)} "{name}")'
+        for kind, names in enumerate(properties)
+        for name in sorted(names)
+    )
+    return (
+        "SELECT ?kind ?res ?name ?value\nWHERE {\n"
+        "{ SELECT DISTINCT ?kind ?res WHERE {\n"
+        "{\n?res rdf:type shared:ArchiveUnit .\n"
+        + visible("?res", "")
+        + f"BIND({_UNIT_ROW} AS ?kind)\n}}\nUNION\n{{\n"
+        f"VALUES ?mediaClass {{ {classes} }}\n"
+        f"GRAPH {data_graph} {{ ?unit shared:hasMediaObject ?res . }}\n"
+        "?unit rdf:type shared:ArchiveUnit .\n?res rdf:type ?mediaClass .\n"
+        + visible("?unit", "Unit")
+        + visible("?res", "")
+        + f"BIND({_MEDIA_ROW} AS ?kind)\n}}\n}} }}\n"
+        f"OPTIONAL {{\nVALUES (?kind ?property ?name) {{ {projected} }}\n"
+        f"GRAPH {data_graph} {{ ?res ?property ?value . }}\n}}\n"
+        "}\nORDER BY ?kind STR(?res)\n"
+    )
+
+
+def _hidden_item_queries(
+    user_iri: str,
+    data_graph: str,
+    units: list[tuple[str, str | None]],
+    links: list[tuple[str, str]],
+    media_classes: tuple[str, ...],
+    batch_size: int,
+) -> Iterator[str]:
+    """Yield ASK queries that are true when a batch holds a hidden item.
+
+    Unit batches bind each frozen unit with its frozen parent, or ``UNDEF`` for
+    a selection root; media batches bind each frozen media-to-unit link.
+    """
+
+    for start in range(0, len(units), batch_size):
+        rows = " ".join(
+            f"({_sparql_term(unit)} "
+            f"{_sparql_term(parent) if parent is not None else 'UNDEF'})"
+            for unit, parent in units[start : start + batch_size]
+        )
+        yield (
+            f"ASK {{\nVALUES (?unit ?parent) {{ {rows} }}\nFILTER NOT EXISTS {{\n"
+            "?unit rdf:type shared:ArchiveUnit .\n"
+            + _visible_pattern(user_iri, data_graph, "?unit", "")
+            + "FILTER(!BOUND(?parent) || EXISTS { "
+            f"GRAPH {data_graph} {{ ?unit shared:parentArchiveUnit ?parent . }} }})\n"
+            "}\n}\n"
+        )
+    classes = " ".join(_sparql_term(name) for name in media_classes)
+    for start in range(0, len(links), batch_size):
+        rows = " ".join(
+            f"({_sparql_term(media)} {_sparql_term(unit)})"
+            for media, unit in links[start : start + batch_size]
+        )
+        yield (
+            f"ASK {{\nVALUES (?media ?unit) {{ {rows} }}\nFILTER NOT EXISTS {{\n"
+            f"VALUES ?mediaClass {{ {classes} }}\n"
+            "?media rdf:type ?mediaClass .\n"
+            f"GRAPH {data_graph} {{ ?unit shared:hasMediaObject ?media . }}\n"
+            + _visible_pattern(user_iri, data_graph, "?media", "")
+            + "}\n}\n"
+        )
+
+
+def _ask(result: Any) -> bool:
+    if not isinstance(result, dict) or type(result.get("boolean")) is not bool:
+        raise ExportSnapshotError("GraphDB returned an invalid ASK result.")
+    return result["boolean"]
+
+
+def _visible_pattern(user_iri: str, data_graph: str, resource: str, suffix: str) -> str:
+    """Require DATA_VIEW on ``resource`` through one of the requester's roles."""
+
+    return (
+        f"GRAPH oldap:admin {{ {user_iri} oldap:hasRole ?role{suffix} . "
+        f"?permission{suffix} oldap:permissionValue ?value{suffix} . "
+        f"FILTER(?value{suffix} >= {DataPermission.DATA_VIEW.numeric.toRdf}) }}\n"
+        f"GRAPH {data_graph} {{ {resource} oldap:attachedToRole ?role{suffix} . "
+        f"<< {resource} oldap:attachedToRole ?role{suffix} >> "
+        f"oldap:hasDataPermission ?permission{suffix} . }}\n"
+    )
+
+
+def _sparql_term(name: str) -> str:
+    return f"<{name}>" if name.startswith(("http://", "https://", "urn:")) else name
+
+
+def _linked_rows(
+    context: Context, result: Mapping[str, Any]
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Yield one search-shaped row per subject from subject-ordered bindings.
+
+    Each subject's bindings are converted on their own, so values carry the
+    same OLDAP scalar types as ``ResourceInstance.search`` rows while only one
+    subject's row is held at a time.
+    """
+
+    head = result["head"]
+    group: list[Mapping[str, Any]] = []
+    for binding in result["results"]["bindings"]:
+        if group and binding["res"] != group[0]["res"]:
+            yield _linked_row(context, head, group)
+            group = []
+        group.append(binding)
+    if group:
+        yield _linked_row(context, head, group)
+
+
+def _linked_row(
+    context: Context, head: Any, bindings: list[Mapping[str, Any]]
+) -> tuple[int, dict[str, Any]]:
+    row: dict[str, Any] = {}
+    kind = _UNIT_ROW
+    for item in QueryProcessor(
+        context, {"head": head, "results": {"bindings": bindings}}
+    ):
+        row.setdefault("iri", [item["res"]])
+        kind = int(item["kind"])
+        if item.get("name") is None or item.get("value") is None:
+            continue
+        values = row.setdefault(str(item["name"]), [])
+        if item["value"] not in values:
+            values.append(item["value"])
+    return kind, row
+
+
+def _fill_labels(
+    records: list[Any],
+    projections: tuple[ExportMetadataProjection, ...],
+    labels: Mapping[str, str],
+) -> None:
+    """Complete label projections that were built before labels were known."""
+
+    columns = [item.column_name for item in projections if item.resolve_labels]
+    for record in records:
+        for column in columns:
+            resolved = record.metadata[column]
+            for iri in resolved:
+                resolved[iri] = labels.get(iri, "")
+
+
 def _label_iris(
     rows: Any,
     projections: tuple[ExportMetadataProjection, ...],
@@ -939,5 +1281,6 @@ __all__ = [
     "AuthorizedArchiveInventory",
     "OldapArchiveInventoryReader",
     "OldapVisibleLabelResolver",
+    "TargetedArchiveDownloadAuthorizer",
     "UnavailableArchiveMediaRecord",
 ]
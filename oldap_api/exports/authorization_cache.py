@@ -0,0 +1,77 @@
+"""Short-lived cache for successful export download authorizations.
+
+A download authorization rereads the requester-visible source inventory to
+confirm that nothing frozen in the manifest has become invisible. Repeated
+download clicks and client retries would otherwise repeat that full read. A
+positive result is cached under the export, the requester, the manifest digest,
+and the current data-graph stamp of the export's project, so any write to that
+project, or any user, role, or project change, makes earlier entries
+unreachable. Failures are never cached, and an unavailable Redis only disables
+the cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+from redis.exceptions import RedisError
+
+from oldap_api.data_stamps import DataGraphStamps
+
+from .manifest import ExportManifest
+from .service import ExportDownloadAuthorizer
+
+AUTHORIZATION_KEY_PREFIX = "oldap:export-download-auth:"
+AUTHORIZATION_TTL_SECONDS = 60
+
+
+class CachedExportDownloadAuthorizer:
+    """Reuse a recent positive authorization while its stamp is current."""
+
+    def __init__(
+        self,
+        authorizer: ExportDownloadAuthorizer,
+        *,
+        stamps: DataGraphStamps | None = None,
+        ttl_seconds: int = AUTHORIZATION_TTL_SECONDS,
+    ) -> None:
+        if ttl_seconds < 1:
+            raise ValueError("ttl_seconds must be positive.")
+        self._authorizer = authorizer
+        self._stamps = stamps or DataGraphStamps()
+        self._ttl_seconds = ttl_seconds
+
+    def authorize(
+        self,
+        connection: Any,
+        *,
+        job: Any,
+        manifest: ExportManifest,
+    ) -> None:
+        """Authorize through the cache, falling back to the full recheck."""
+
+        key = None
+        try:
+            stamp = self._stamps.current(job.selection.project_short_name)
+            key = _authorization_key(job.export_id, connection, manifest, stamp)
+            if self._stamps.client.get(key) is not None:
+                return
+        except RedisError:
+            key = None
+        self._authorizer.authorize(connection, job=job, manifest=manifest)
+        if key is None:
+            return
+        try:
+            self._stamps.client.set(key, "1", ex=self._ttl_seconds)
+        except RedisError:
+            pass
+
+
+def _authorization_key(
+    export_id: str, connection: Any, manifest: ExportManifest, stamp: str
+) -> str:
+    identity = "\n".join((export_id, str(connection.userIri), manifest.sha256, stamp))
+    return (
+        AUTHORIZATION_KEY_PREFIX + hashlib.sha256(identity.encode("utf-8")).hexdigest()
+    )
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import hashlib
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Any, Mapping
+from io import BytesIO
+from tempfile import SpooledTemporaryFile
+from typing import Any, BinaryIO, Iterator, Mapping
 from uuid import UUID
 
 import rfc8785
@@ -16,6 +18,41 @@ from .domain import MAX_EXPORT_BYTES, ExportJob, ExportKind, ExportState
 MANIFEST_DOCUMENT_TYPE = "oldap.zip-export.manifest"
 MANIFEST_SCHEMA_VERSION = "1.0.0"
 MAX_MANIFEST_ENTRIES = 1_000_000
+MANIFEST_SPOOL_BYTES = 8 * 1024 * 1024
+
+_SECTIONS = frozenset({"archiveUnits", "directories", "media"})
+_REQUIRED_FIELDS = frozenset(
+    {
+        "documentType",
+        "schemaVersion",
+        "exportId",
+        "generatedAt",
+        "kind",
+        "projectShortName",
+        "requestedByIri",
+        "profile",
+        "selection",
+        "limits",
+        "directories",
+        "media",
+    }
+)
+_UNIT_FIELDS = frozenset(
+    {
+        "relativePath",
+        "unitIri",
+        "archiveLevelIri",
+        "title",
+        "identifier",
+        "description",
+        "temporal",
+        "materialExtent",
+        "creatorIris",
+        "provenance",
+        "conditionsOfAccess",
+        "metadata",
+    }
+)
 
 
 class ExportManifestError(ValueError):
@@ -24,14 +61,31 @@ class ExportManifestError(ValueError):
 
 @dataclass(frozen=True, slots=True)
 class ExportManifest:
-    """RFC-8785-canonical immutable export snapshot passed to the worker."""
+    """RFC-8785-canonical immutable export snapshot passed to the worker.
+
+    The canonical bytes are held either in memory or, for manifests produced by
+    ``ExportManifestWriter``, in a spooled temporary file. The envelope facts and
+    inventory totals needed to bind the manifest to its job are kept beside the
+    body so that binding never re-parses the entries.
+
+    A manifest is single-consumer: a file body is one shared handle that
+    ``iter_bytes`` rewinds, so it must be read by one consumer at a time and
+    released with ``close()`` or by using the manifest as a context manager.
+    """
 
     export_id: str
     generated_at: datetime
     kind: ExportKind
     project_short_name: str
-    canonical_json: bytes
+    requested_by_iri: str | None
+    profile: Mapping[str, Any]
+    selection: Mapping[str, Any]
+    files_total: int
+    warning_count: int
+    source_bytes: int
+    size_bytes: int
     sha256: str
+    body: bytes | BinaryIO = field(repr=False, compare=False)
 
     @classmethod
     def from_dict(cls, value: Mapping[str, Any]) -> "ExportManifest":
@@ -39,47 +93,10 @@ class ExportManifest:
 
         if not isinstance(value, Mapping):
             raise ExportManifestError("Export manifest must be an object.")
-        required = {
-            "documentType",
-            "schemaVersion",
-            "exportId",
-            "generatedAt",
-            "kind",
-            "projectShortName",
-            "requestedByIri",
-            "profile",
-            "selection",
-            "limits",
-            "directories",
-            "media",
-        }
-        allowed = required | {"archiveUnits"}
-        if not required <= set(value) <= allowed:
+        if not _REQUIRED_FIELDS <= set(value) <= _REQUIRED_FIELDS | {"archiveUnits"}:
             raise ExportManifestError(
                 "Export manifest fields must match the closed v1 envelope."
             )
-        if value["documentType"] != MANIFEST_DOCUMENT_TYPE:
-            raise ExportManifestError("Unsupported export manifest documentType.")
-        if value["schemaVersion"] != MANIFEST_SCHEMA_VERSION:
-            raise ExportManifestError("Unsupported export manifest schemaVersion.")
-        export_id = _canonical_uuid(value["exportId"], "exportId")
-        generated_at = _timestamp(value["generatedAt"], "generatedAt")
-        try:
-            kind = ExportKind(value["kind"])
-        except (TypeError, ValueError) as error:
-            raise ExportManifestError("Unsupported export kind.") from error
-        project = value["projectShortName"]
-        if not isinstance(project, str) or not project:
-            raise ExportManifestError("projectShortName must be a non-empty string.")
-        limits = value["limits"]
-        if (
-            not isinstance(limits, Mapping)
-            or set(limits) != {"maxArchiveBytes"}
-            or isinstance(limits["maxArchiveBytes"], bool)
-            or not isinstance(limits["maxArchiveBytes"], int)
-            or not 1 <= limits["maxArchiveBytes"] <= MAX_EXPORT_BYTES
-        ):
-            raise ExportManifestError("Manifest limits exceed the export v1 ceiling.")
         directories = value["directories"]
         media = value["media"]
         if not isinstance(directories, list) or len(directories) > MAX_MANIFEST_ENTRIES:
@@ -92,33 +109,92 @@ class ExportManifest:
             or len(archive_units) > MAX_MANIFEST_ENTRIES
         ):
             raise ExportManifestError("Manifest archive units exceed the v1 bound.")
-        if kind in {ExportKind.ARCHIVE_UNIT, ExportKind.ARCHIVE_ALL}:
-            if "archiveUnits" not in value:
-                raise ExportManifestError(
-                    "Archive manifests must contain archiveUnits."
-                )
-        elif "archiveUnits" in value:
-            raise ExportManifestError(
-                "Staging manifests must not contain archiveUnits."
-            )
-        _validate_media_inventory(media)
-        _validate_archive_units(archive_units)
-        if kind in {ExportKind.ARCHIVE_UNIT, ExportKind.ARCHIVE_ALL}:
-            _validate_archive_inventory(directories, media, archive_units)
-        try:
-            canonical = rfc8785.dumps(dict(value))
-        except (rfc8785.CanonicalizationError, TypeError) as error:
-            raise ExportManifestError(
-                "Manifest is not RFC-8785 serializable."
-            ) from error
-        return cls(
-            export_id=export_id,
-            generated_at=generated_at,
-            kind=kind,
-            project_short_name=project,
-            canonical_json=canonical,
-            sha256=hashlib.sha256(canonical).hexdigest(),
+        writer = ExportManifestWriter(
+            {key: item for key, item in value.items() if key not in _SECTIONS},
+            archive_units="archiveUnits" in value,
+            spool_max_bytes=None,
         )
+        for unit in archive_units:
+            writer.add_archive_unit(unit)
+        for directory in directories:
+            writer.add_directory(directory)
+        for item in media:
+            writer.add_media(item)
+        return writer.finish()
+
+    @classmethod
+    def from_summary(
+        cls,
+        summary: Mapping[str, Any],
+        body: bytes | BinaryIO,
+        *,
+        size_bytes: int,
+        sha256: str,
+    ) -> "ExportManifest":
+        """Restore a manifest from its persisted summary and verified body."""
+
+        try:
+            return cls(
+                export_id=_canonical_uuid(summary["exportId"], "exportId"),
+                generated_at=_timestamp(summary["generatedAt"], "generatedAt"),
+                kind=ExportKind(summary["kind"]),
+                project_short_name=str(summary["projectShortName"]),
+                requested_by_iri=summary["requestedByIri"],
+                profile=dict(summary["profile"]),
+                selection=dict(summary["selection"]),
+                files_total=int(summary["filesTotal"]),
+                warning_count=int(summary["warningCount"]),
+                source_bytes=int(summary["sourceBytes"]),
+                size_bytes=size_bytes,
+                sha256=sha256,
+                body=body,
+            )
+        except (KeyError, TypeError, ValueError) as error:
+            raise ExportManifestError("Export manifest summary is invalid.") from error
+
+    def summary(self) -> dict[str, Any]:
+        """Return the envelope facts and totals needed without the entries."""
+
+        return {
+            "exportId": self.export_id,
+            "generatedAt": self.generated_at.isoformat().replace("+00:00", "Z"),
+            "kind": self.kind.value,
+            "projectShortName": self.project_short_name,
+            "requestedByIri": self.requested_by_iri,
+            "profile": dict(self.profile),
+            "selection": dict(self.selection),
+            "filesTotal": self.files_total,
+            "warningCount": self.warning_count,
+            "sourceBytes": self.source_bytes,
+        }
+
+    @property
+    def canonical_json(self) -> bytes:
+        """Return the complete canonical bytes."""
+
+        return b"".join(self.iter_bytes())
+
+    def iter_bytes(self, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+        """Yield the canonical bytes without loading a spooled body at once."""
+
+        if isinstance(self.body, bytes):
+            yield self.body
+            return
+        self.body.seek(0)
+        while chunk := self.body.read(chunk_size):
+            yield chunk
+
+    def close(self) -> None:
+        """Release a file body; an in-memory body needs no cleanup."""
+
+        if not isinstance(self.body, bytes):
+            self.body.close()
+
+    def __enter__(self) -> "ExportManifest":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def to_dict(self) -> dict[str, Any]:
         """Return a fresh JSON-compatible representation of the snapshot."""
@@ -129,17 +205,11 @@ class ExportManifest:
         """Bind immutable manifest identity, profile, selection, and totals."""
 
         self.validate_identity_for_job(job)
-        value = self.to_dict()
-        included_media = [item for item in value["media"] if item["included"]]
-        excluded_media = [item for item in value["media"] if not item["included"]]
-        expected_sizes = [
-            item["binarySource"]["expectedSizeBytes"] for item in included_media
-        ]
         if (
             job.state is not ExportState.QUEUED
-            or len(included_media) != job.progress.files_total
-            or len(excluded_media) != job.warning_count
-            or sum(expected_sizes) != job.estimated_source_bytes
+            or self.files_total != job.progress.files_total
+            or self.warning_count != job.warning_count
+            or self.source_bytes != job.estimated_source_bytes
             or job.progress.bytes_total != job.estimated_source_bytes
         ):
             raise ExportManifestError(
@@ -149,26 +219,23 @@ class ExportManifest:
     def validate_identity_for_job(self, job: ExportJob) -> None:
         """Verify immutable binding independently of the current lifecycle state."""
 
-        value = self.to_dict()
-        profile = value["profile"]
-        selection = value["selection"]
         if (
             job.snapshot_at is None
             or self.export_id != job.export_id
             or self.generated_at != job.snapshot_at
             or self.kind is not job.selection.kind
             or self.project_short_name != job.selection.project_short_name
-            or value["requestedByIri"] != job.requested_by_iri
-            or profile
+            or self.requested_by_iri != job.requested_by_iri
+            or self.profile
             != {
                 "profileId": job.selection.profile_id,
                 "profileVersion": job.selection.profile_version,
                 "profileSha256": job.selection.profile_sha256,
                 "metadataSchemaVersion": job.selection.metadata_schema_version,
             }
-            or selection.get("iri") != job.selection.selection_iri
-            or selection.get("displayName") != job.selection.display_name
-            or selection.get("displayPath") != job.selection.display_path
+            or self.selection.get("iri") != job.selection.selection_iri
+            or self.selection.get("displayName") != job.selection.display_name
+            or self.selection.get("displayPath") != job.selection.display_path
             or self.sha256 != job.manifest_sha256
         ):
             raise ExportManifestError(
@@ -176,149 +243,306 @@ class ExportManifest:
             )
 
 
-def _validate_media_inventory(media: list[Any]) -> None:
-    indexes: set[int] = set()
-    paths: set[str] = set()
-    for item in media:
-        if not isinstance(item, Mapping):
-            raise ExportManifestError("Manifest media entries must be objects.")
-        included = item.get("included")
-        index = item.get("entryIndex")
-        path = item.get("relativePath")
-        if not isinstance(included, bool):
-            raise ExportManifestError("Manifest included flags must be boolean.")
-        if isinstance(index, bool) or not isinstance(index, int) or index < 0:
-            raise ExportManifestError("Manifest entryIndex must be non-negative.")
-        if index in indexes:
-            raise ExportManifestError("Manifest entryIndex values must be unique.")
-        if not isinstance(path, str) or not path or path in paths:
-            raise ExportManifestError("Manifest media relative paths must be unique.")
-        indexes.add(index)
-        paths.add(path)
-        binary = item.get("binarySource")
-        exclusion = item.get("exclusionReason")
-        if included:
-            if not isinstance(binary, Mapping) or exclusion is not None:
-                raise ExportManifestError(
-                    "Included media require binarySource and no exclusionReason."
-                )
-            size = binary.get("expectedSizeBytes")
+class ExportManifestWriter:
+    """Validate and canonicalize a manifest one inventory entry at a time.
+
+    RFC 8785 orders object members by key, and the canonical form of an array
+    is its canonical elements joined by commas. The writer therefore emits the
+    envelope members in key order and every entry as soon as it is added, into
+    a spooled temporary file while hashing. Entries must be added section by
+    section in canonical order: archive units, then directories, then media.
+    Only the identifiers needed for uniqueness and cross-reference checks are
+    retained.
+    """
+
+    def __init__(
+        self,
+        envelope: Mapping[str, Any],
+        *,
+        archive_units: bool | None = None,
+        spool_max_bytes: int | None = MANIFEST_SPOOL_BYTES,
+    ) -> None:
+        if not isinstance(envelope, Mapping):
+            raise ExportManifestError("Export manifest must be an object.")
+        if set(envelope) != _REQUIRED_FIELDS - _SECTIONS:
+            raise ExportManifestError(
+                "Export manifest fields must match the closed v1 envelope."
+            )
+        if envelope["documentType"] != MANIFEST_DOCUMENT_TYPE:
+            raise ExportManifestError("Unsupported export manifest documentType.")
+        if envelope["schemaVersion"] != MANIFEST_SCHEMA_VERSION:
+            raise ExportManifestError("Unsupported export manifest schemaVersion.")
+        self._export_id = _canonical_uuid(envelope["exportId"], "exportId")
+        self._generated_at = _timestamp(envelope["generatedAt"], "generatedAt")
+        try:
+            self._kind = ExportKind(envelope["kind"])
+        except (TypeError, ValueError) as error:
+            raise ExportManifestError("Unsupported export kind.") from error
+        project = envelope["projectShortName"]
+        if not isinstance(project, str) or not project:
+            raise ExportManifestError("projectShortName must be a non-empty string.")
+        limits = envelope["limits"]
+        if (
+            not isinstance(limits, Mapping)
+            or set(limits) != {"maxArchiveBytes"}
+            or isinstance(limits["maxArchiveBytes"], bool)
+            or not isinstance(limits["maxArchiveBytes"], int)
+            or not 1 <= limits["maxArchiveBytes"] <= MAX_EXPORT_BYTES
+        ):
+            raise ExportManifestError("Manifest limits exceed the export v1 ceiling.")
+        self._archive = self._kind in {ExportKind.ARCHIVE_UNIT, ExportKind.ARCHIVE_ALL}
+        if archive_units is None:
+            archive_units = self._archive
+        if self._archive and not archive_units:
+            raise ExportManifestError("Archive manifests must contain archiveUnits.")
+        if not self._archive and archive_units:
+            raise ExportManifestError(
+                "Staging manifests must not contain archiveUnits."
+            )
+        self._envelope = dict(envelope)
+        self._project = project
+        members = set(envelope) | {"directories", "media"}
+        if archive_units:
+            members.add("archiveUnits")
+        self._members = sorted(members)
+        self._position = 0
+        self._section: str | None = None
+        self._count = 0
+        self._buffer = (
+            BytesIO()
+            if spool_max_bytes is None
+            else SpooledTemporaryFile(max_size=spool_max_bytes)
+        )
+        self._digest = hashlib.sha256()
+        self._size = 0
+        self._media_indexes: set[int] = set()
+        self._media_paths: set[str] = set()
+        self._files_total = 0
+        self._source_bytes = 0
+        self._unit_paths: dict[str, str] = {}
+        self._unit_relative_paths: set[str] = set()
+        self._unit_parents: set[str] = set()
+        self._directory_pairs: set[tuple[str, str]] = set()
+        self._emit(b"{")
+
+    def add_archive_unit(self, unit: Mapping[str, Any]) -> None:
+        """Validate and append one closed archive-unit metadata entry."""
+
+        self._enter("archiveUnits", "Manifest archive units exceed the v1 bound.")
+        _validate_archive_unit(unit, self._unit_paths, self._unit_relative_paths)
+        self._unit_paths[unit["unitIri"]] = unit["relativePath"]
+        self._unit_relative_paths.add(unit["relativePath"])
+        if unit.get("parentUnitIri"):
+            self._unit_parents.add(unit["parentUnitIri"])
+        self._entry(unit)
+
+    def add_directory(self, directory: Mapping[str, Any]) -> None:
+        """Validate and append one directory entry."""
+
+        self._enter("directories", "Manifest directories exceed the v1 bound.")
+        if self._archive:
+            if (
+                not isinstance(directory, Mapping)
+                or set(directory) != {"relativePath", "containerIri"}
+                or not isinstance(directory["relativePath"], str)
+                or not isinstance(directory["containerIri"], str)
+            ):
+                raise ExportManifestError("Manifest archive directories are invalid.")
+            pair = (directory["containerIri"], directory["relativePath"])
             if (
-                isinstance(size, bool)
-                or not isinstance(size, int)
-                or not 0 <= size <= MAX_EXPORT_BYTES
+                pair in self._directory_pairs
+                or self._unit_paths.get(pair[0]) != pair[1]
             ):
                 raise ExportManifestError(
-                    "Included media require a bounded expectedSizeBytes value."
+                    "Manifest archive units differ from directory inventory."
                 )
-        elif binary is not None or not isinstance(exclusion, str):
-            raise ExportManifestError(
-                "Excluded media require exclusionReason and no binarySource."
-            )
+            self._directory_pairs.add(pair)
+        self._entry(directory)
 
+    def add_media(self, item: Mapping[str, Any]) -> None:
+        """Validate and append one included or excluded media entry."""
 
-def _validate_archive_units(units: list[Any]) -> None:
-    """Validate the closed common archive-unit metadata projection."""
+        self._enter("media", "Manifest media exceed the v1 bound.")
+        size = _validate_media_entry(item, self._media_indexes, self._media_paths)
+        if self._archive and item.get("containerIri") not in self._unit_paths:
+            raise ExportManifestError(
+                "Manifest media container is outside the archive snapshot."
+            )
+        self._media_indexes.add(item["entryIndex"])
+        self._media_paths.add(item["relativePath"])
+        if size is not None:
+            self._files_total += 1
+            self._source_bytes += size
+        self._entry(item)
+
+    def finish(self) -> ExportManifest:
+        """Close the document and return the immutable manifest."""
+
+        self._advance(len(self._members))
+        if self._archive:
+            if not self._unit_parents <= self._unit_paths.keys():
+                raise ExportManifestError(
+                    "Manifest archive-unit parent is outside the snapshot."
+                )
+            if len(self._directory_pairs) != len(self._unit_paths):
+                raise ExportManifestError(
+                    "Manifest archive units differ from directory inventory."
+                )
+        self._emit(b"}")
+        body: bytes | BinaryIO = self._buffer
+        if isinstance(self._buffer, BytesIO):
+            body = self._buffer.getvalue()
+        else:
+            self._buffer.seek(0)
+        return ExportManifest(
+            export_id=self._export_id,
+            generated_at=self._generated_at,
+            kind=self._kind,
+            project_short_name=self._project,
+            requested_by_iri=self._envelope["requestedByIri"],
+            profile=self._envelope["profile"],
+            selection=self._envelope["selection"],
+            files_total=self._files_total,
+            warning_count=len(self._media_paths) - self._files_total,
+            source_bytes=self._source_bytes,
+            size_bytes=self._size,
+            sha256=self._digest.hexdigest(),
+            body=body,
+        )
 
-    required = {
-        "relativePath",
-        "unitIri",
-        "archiveLevelIri",
-        "title",
-        "identifier",
-        "description",
-        "temporal",
-        "materialExtent",
-        "creatorIris",
-        "provenance",
-        "conditionsOfAccess",
-        "metadata",
-    }
-    iris: set[str] = set()
-    paths: set[str] = set()
-    for unit in units:
-        if not isinstance(unit, Mapping) or not required <= set(unit) <= required | {
-            "parentUnitIri"
-        }:
-            raise ExportManifestError("Manifest archive units must be closed objects.")
-        iri = unit["unitIri"]
-        path = unit["relativePath"]
-        creators = unit["creatorIris"]
-        metadata = unit["metadata"]
-        if (
-            not isinstance(iri, str)
-            or not iri
-            or iri in iris
-            or not isinstance(path, str)
-            or not path
-            or path in paths
-            or not isinstance(unit["archiveLevelIri"], str)
-            or not unit["archiveLevelIri"]
-            or not isinstance(unit["identifier"], str)
-            or not isinstance(unit["temporal"], str)
-            or not isinstance(creators, list)
-            or len(creators) > 10_000
-            or not all(isinstance(item, str) for item in creators)
-            or not isinstance(metadata, Mapping)
-            or len(metadata) > 256
-        ):
-            raise ExportManifestError("Manifest archive-unit facts are invalid.")
-        parent = unit.get("parentUnitIri")
-        if parent is not None and (not isinstance(parent, str) or not parent):
-            raise ExportManifestError("Manifest archive-unit parent is invalid.")
-        for value in (
-            unit["title"],
-            unit["description"],
-            unit["materialExtent"],
-            unit["provenance"],
-            unit["conditionsOfAccess"],
-        ):
-            if not _valid_metadata_value(value):
-                raise ExportManifestError("Manifest archive-unit metadata is invalid.")
-        if any(
-            not isinstance(key, str) or not _valid_metadata_value(value)
-            for key, value in metadata.items()
-        ):
-            raise ExportManifestError("Manifest archive-unit metadata is invalid.")
-        iris.add(iri)
-        paths.add(path)
-    if any(
-        unit.get("parentUnitIri") not in iris
-        for unit in units
-        if unit.get("parentUnitIri")
+    def _enter(self, section: str, bound_message: str) -> None:
+        if self._section != section:
+            if section not in self._members[self._position :]:
+                raise ExportManifestError(
+                    "Manifest entries must be added in canonical section order."
+                )
+            self._advance(self._members.index(section))
+            self._emit(b"," if self._position else b"")
+            self._emit(_canonical(section) + b":[")
+            self._section = section
+            self._count = 0
+        if self._count == MAX_MANIFEST_ENTRIES:
+            raise ExportManifestError(bound_message)
+        if self._count:
+            self._emit(b",")
+        self._count += 1
+
+    def _advance(self, position: int) -> None:
+        """Close an open section and emit the members preceding ``position``."""
+
+        if self._section is not None:
+            self._emit(b"]")
+            self._position += 1
+            self._section = None
+        while self._position < position:
+            name = self._members[self._position]
+            value = [] if name in _SECTIONS else self._envelope[name]
+            self._emit(b"," if self._position else b"")
+            self._emit(_canonical(name) + b":" + _canonical(value))
+            self._position += 1
+
+    def _entry(self, value: Mapping[str, Any]) -> None:
+        self._emit(_canonical(dict(value)))
+
+    def _emit(self, data: bytes) -> None:
+        self._buffer.write(data)
+        self._digest.update(data)
+        self._size += len(data)
+
+
+def _canonical(value: Any) -> bytes:
+    try:
+        return rfc8785.dumps(value)
+    except (rfc8785.CanonicalizationError, TypeError) as error:
+        raise ExportManifestError("Manifest is not RFC-8785 serializable.") from error
+
+
+def _validate_media_entry(item: Any, indexes: set[int], paths: set[str]) -> int | None:
+    """Validate one media entry and return its expected size if included."""
+
+    if not isinstance(item, Mapping):
+        raise ExportManifestError("Manifest media entries must be objects.")
+    included = item.get("included")
+    index = item.get("entryIndex")
+    path = item.get("relativePath")
+    if not isinstance(included, bool):
+        raise ExportManifestError("Manifest included flags must be boolean.")
+    if isinstance(index, bool) or not isinstance(index, int) or index < 0:
+        raise ExportManifestError("Manifest entryIndex must be non-negative.")
+    if index in indexes:
+        raise ExportManifestError("Manifest entryIndex values must be unique.")
+    if not isinstance(path, str) or not path or path in paths:
+        raise ExportManifestError("Manifest media relative paths must be unique.")
+    binary = item.get("binarySource")
+    exclusion = item.get("exclusionReason")
+    if not included:
+        if binary is not None or not isinstance(exclusion, str):
+            raise ExportManifestError(
+                "Excluded media require exclusionReason and no binarySource."
+            )
+        return None
+    if not isinstance(binary, Mapping) or exclusion is not None:
+        raise ExportManifestError(
+            "Included media require binarySource and no exclusionReason."
+        )
+    size = binary.get("expectedSizeBytes")
+    if (
+        isinstance(size, bool)
+        or not isinstance(size, int)
+        or not 0 <= size <= MAX_EXPORT_BYTES
     ):
         raise ExportManifestError(
-            "Manifest archive-unit parent is outside the snapshot."
+            "Included media require a bounded expectedSizeBytes value."
         )
+    return size
 
 
-def _validate_archive_inventory(
-    directories: list[Any], media: list[Any], units: list[Any]
-) -> None:
-    """Bind archive metadata rows, directories, and media containers exactly."""
+def _validate_archive_unit(unit: Any, iris: Mapping[str, str], paths: set[str]) -> None:
+    """Validate one closed common archive-unit metadata projection."""
 
+    if not isinstance(unit, Mapping) or not _UNIT_FIELDS <= set(unit) <= (
+        _UNIT_FIELDS | {"parentUnitIri"}
+    ):
+        raise ExportManifestError("Manifest archive units must be closed objects.")
+    iri = unit["unitIri"]
+    path = unit["relativePath"]
+    creators = unit["creatorIris"]
+    metadata = unit["metadata"]
+    if (
+        not isinstance(iri, str)
+        or not iri
+        or iri in iris
+        or not isinstance(path, str)
+        or not path
+        or path in paths
+        or not isinstance(unit["archiveLevelIri"], str)
+        or not unit["archiveLevelIri"]
+        or not isinstance(unit["identifier"], str)
+        or not isinstance(unit["temporal"], str)
+        or not isinstance(creators, list)
+        or len(creators) > 10_000
+        or not all(isinstance(item, str) for item in creators)
+        or not isinstance(metadata, Mapping)
+        or len(metadata) > 256
+    ):
+        raise ExportManifestError("Manifest archive-unit facts are invalid.")
+    parent = unit.get("parentUnitIri")
+    if parent is not None and (not isinstance(parent, str) or not parent):
+        raise ExportManifestError("Manifest archive-unit parent is invalid.")
+    for value in (
+        unit["title"],
+        unit["description"],
+        unit["materialExtent"],
+        unit["provenance"],
+        unit["conditionsOfAccess"],
+    ):
+        if not _valid_metadata_value(value):
+            raise ExportManifestError("Manifest archive-unit metadata is invalid.")
     if any(
-        not isinstance(directory, Mapping)
-        or set(directory) != {"relativePath", "containerIri"}
-        or not isinstance(directory["relativePath"], str)
-        or not isinstance(directory["containerIri"], str)
-        for directory in directories
+        not isinstance(key, str) or not _valid_metadata_value(value)
+        for key, value in metadata.items()
     ):
-        raise ExportManifestError("Manifest archive directories are invalid.")
-    directory_pairs = {
-        (directory["containerIri"], directory["relativePath"])
-        for directory in directories
-    }
-    unit_pairs = {(unit["unitIri"], unit["relativePath"]) for unit in units}
-    if len(directory_pairs) != len(directories) or directory_pairs != unit_pairs:
-        raise ExportManifestError(
-            "Manifest archive units differ from directory inventory."
-        )
-    unit_iris = {unit["unitIri"] for unit in units}
-    if any(item.get("containerIri") not in unit_iris for item in media):
-        raise ExportManifestError(
-            "Manifest media container is outside the archive snapshot."
-        )
+        raise ExportManifestError("Manifest archive-unit metadata is invalid.")
 
 
 def _valid_metadata_value(value: Any) -> bool:
@@ -0,0 +1,122 @@
+"""Content-addressed storage for canonical export manifest bodies.
+
+Large manifests are kept out of the GraphDB job graph: the repository records
+only the digest, size, and envelope summary, while the canonical bytes live in
+a blob store keyed by their SHA-256. Readers receive a read-only memory map
+that has been verified against the recorded digest.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, Protocol
+
+from .manifest import ExportManifest
+
+SHA256_RE = re.compile(r"[0-9a-f]{64}")
+VERIFY_CHUNK_BYTES = 8 * 1024 * 1024
+
+
+class ExportManifestBlobError(ValueError):
+    """Raised when a stored manifest body is missing or fails verification."""
+
+
+class ManifestBlobStore(Protocol):
+    """Persist immutable canonical manifest bodies by their SHA-256 digest."""
+
+    def put(self, manifest: ExportManifest) -> None: ...
+
+    def open(self, sha256: str, size_bytes: int) -> BinaryIO: ...
+
+    def delete(self, sha256: str) -> None: ...
+
+
+class FileManifestBlobStore:
+    """Keep manifest bodies as content-addressed files below one root.
+
+    Every API worker and the export service must share the same root. Bodies
+    are written to a temporary file in the target directory and renamed into
+    place, so a reader never observes a partial blob.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self._root = Path(root)
+
+    @classmethod
+    def from_environment(cls) -> "FileManifestBlobStore | None":
+        """Build the store from deployment configuration, if one is set."""
+
+        configured = os.getenv("OLDAP_EXPORT_MANIFEST_DIR", "").strip()
+        return cls(Path(configured)) if configured else None
+
+    def put(self, manifest: ExportManifest) -> None:
+        """Write one manifest body unless an identical blob already exists."""
+
+        path = self._path(manifest.sha256)
+        try:
+            if path.stat().st_size == manifest.size_bytes:
+                return
+        except FileNotFoundError:
+            pass
+        path.parent.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        handle = tempfile.NamedTemporaryFile(
+            dir=path.parent, prefix=".manifest-", delete=False
+        )
+        try:
+            with handle:
+                for chunk in manifest.iter_bytes():
+                    handle.write(chunk)
+                    digest.update(chunk)
+                handle.flush()
+                os.fsync(handle.fileno())
+            if digest.hexdigest() != manifest.sha256:
+                raise ExportManifestBlobError("Export manifest body digest mismatch.")
+            os.replace(handle.name, path)
+        except BaseException:
+            Path(handle.name).unlink(missing_ok=True)
+            raise
+
+    def open(self, sha256: str, size_bytes: int) -> BinaryIO:
+        """Return a read-only map of one body after verifying size and digest."""
+
+        try:
+            with open(self._path(sha256), "rb") as handle:
+                if os.fstat(handle.fileno()).st_size != size_bytes or not size_bytes:
+                    raise ExportManifestBlobError("Export manifest body size mismatch.")
+                body = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError as error:
+            raise ExportManifestBlobError(
+                "Export manifest body is unavailable."
+            ) from error
+        digest = hashlib.sha256()
+        view = memoryview(body)
+        for start in range(0, size_bytes, VERIFY_CHUNK_BYTES):
+            digest.update(view[start : start + VERIFY_CHUNK_BYTES])
+        view.release()
+        if digest.hexdigest() != sha256:
+            body.close()
+            raise ExportManifestBlobError("Export manifest body digest mismatch.")
+        return body
+
+    def delete(self, sha256: str) -> None:
+        """Remove one body; deleting an absent blob is not an error."""
+
+        self._path(sha256).unlink(missing_ok=True)
+
+    def _path(self, sha256: str) -> Path:
+        if SHA256_RE.fullmatch(sha256) is None:
+            raise ExportManifestBlobError("Export manifest digest is invalid.")
+        return self._root / sha256[:2] / f"{sha256}.json"
+
+
+__all__ = [
+    "ExportManifestBlobError",
+    "FileManifestBlobStore",
+    "ManifestBlobStore",
+]
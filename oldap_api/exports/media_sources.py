@@ -2,26 +2,52 @@
 
 from __future__ import annotations
 
+import logging
 import os
+import threading
+import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import jwt
 import requests
+from requests.adapters import HTTPAdapter
 
 from .snapshot_common import LocalBinaryReference, ResolvedBinarySource
 
 EXPORT_SOURCE_TOKEN_TYPE = "export-source-resolver"
 EXPORT_SOURCE_AUDIENCE = "oldap-media-export-service"
 MAX_RESOLVE_BATCH = 1_000
+RESOLVE_CONCURRENCY = 4
+TOKEN_LIFETIME = timedelta(minutes=1)
+TOKEN_RENEWAL_MARGIN = timedelta(seconds=10)
+
+logger = logging.getLogger(__name__)
 
 
 class ExportSourceUnavailableError(RuntimeError):
     """Raised when media cannot authoritatively resolve one source batch."""
 
 
+@dataclass(frozen=True)
+class SourceBatchTiming:
+    """Wall-clock latency of one resolve request."""
+
+    offset: int
+    items: int
+    seconds: float
+
+
 class MediaBinarySourceResolver:
-    """Resolve original facts through the internal media-service boundary."""
+    """Resolve original facts through the internal media-service boundary.
+
+    Batches are posted by up to ``max_concurrency`` threads over one keep-alive
+    connection pool, and one signed token is reused until shortly before it
+    expires. The first failing batch cancels the batches not yet started.
+    Every ``resolve`` call logs its wall-clock time and its slowest batch.
+    """
 
     def __init__(
         self,
@@ -32,7 +58,10 @@ class MediaBinarySourceResolver:
         subject: str = "oldap-api",
         timeout_seconds: float = 15.0,
         session: requests.Session | None = None,
+        max_concurrency: int = RESOLVE_CONCURRENCY,
     ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be positive.")
         self._secret = secret or os.getenv("OLDAP_EXPORT_SERVICE_JWT_SECRET", "")
         if len(self._secret.encode("utf-8")) < 32:
             raise RuntimeError(
@@ -47,7 +76,22 @@ class MediaBinarySourceResolver:
         self._issuer = issuer or os.getenv("OLDAP_JWT_ISSUER", "https://oldap.org")
         self._subject = subject
         self._timeout = timeout_seconds
-        self._session = session or requests.Session()
+        self._max_concurrency = max_concurrency
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_concurrency)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self._session = session
+        self._token_lock = threading.Lock()
+        self._cached_token: tuple[str, datetime] | None = None
+        self._timings: list[SourceBatchTiming] = []
+
+    @property
+    def batch_timings(self) -> tuple[SourceBatchTiming, ...]:
+        """Per-batch latencies of the most recent ``resolve`` call, by offset."""
+
+        return tuple(sorted(self._timings, key=lambda timing: timing.offset))
 
     def resolve(
         self, references: tuple[LocalBinaryReference, ...]
@@ -56,68 +100,135 @@ class MediaBinarySourceResolver:
 
         if len({item.media_iri for item in references}) != len(references):
             raise ExportSourceUnavailableError("Duplicate media IRI in source request.")
+        self._timings = []
+        started = time.perf_counter()
+        try:
+            return self._resolve_all(references)
+        finally:
+            _log_timings(self.batch_timings, time.perf_counter() - started)
+
+    def _resolve_all(
+        self, references: tuple[LocalBinaryReference, ...]
+    ) -> dict[str, ResolvedBinarySource]:
+        offsets = range(0, len(references), MAX_RESOLVE_BATCH)
         result: dict[str, ResolvedBinarySource] = {}
-        for offset in range(0, len(references), MAX_RESOLVE_BATCH):
-            batch = references[offset : offset + MAX_RESOLVE_BATCH]
-            try:
-                response = self._session.post(
-                    f"{self._base_url}/internal/export-sources/resolve",
-                    json={"items": [_reference_dict(item) for item in batch]},
-                    headers={
-                        "Authorization": f"Bearer {self._token()}",
-                        "Accept": "application/json",
-                    },
-                    timeout=self._timeout,
-                )
-            except requests.RequestException as error:
-                raise ExportSourceUnavailableError(
-                    "Media source resolver is unavailable."
-                ) from error
-            if response.status_code != 200:
-                raise ExportSourceUnavailableError(
-                    f"Media source resolver returned HTTP {response.status_code}."
-                )
-            try:
-                payload = response.json()
-            except ValueError as error:
-                raise ExportSourceUnavailableError(
-                    "Media source resolver returned invalid JSON."
-                ) from error
-            if not isinstance(payload, dict) or set(payload) != {"items"}:
-                raise ExportSourceUnavailableError("Invalid media source response.")
-            items = payload["items"]
-            if not isinstance(items, list) or len(items) != len(batch):
-                raise ExportSourceUnavailableError("Incomplete media source response.")
-            for value in items:
-                media_iri, source = _resolved_source(value)
-                if media_iri in result:
-                    raise ExportSourceUnavailableError(
-                        "Duplicate media IRI in source response."
-                    )
-                result[media_iri] = source
-            expected = {item.media_iri for item in batch}
-            if set(result).intersection(expected) != expected:
-                raise ExportSourceUnavailableError(
-                    "Media source response does not match the requested batch."
-                )
+        if len(offsets) <= 1 or self._max_concurrency == 1:
+            for offset in offsets:
+                result |= self._resolve_batch(references, offset)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self._max_concurrency, len(offsets)),
+                thread_name_prefix="export-source-resolve",
+            ) as executor:
+                futures = [
+                    executor.submit(self._resolve_batch, references, offset)
+                    for offset in offsets
+                ]
+                done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+                for future in pending:
+                    future.cancel()
+                failed = [
+                    future
+                    for future in futures
+                    if future in done and future.exception()
+                ]
+                if failed:
+                    raise failed[0].exception()
+                for future in futures:
+                    result |= future.result()
         if set(result) != {item.media_iri for item in references}:
             raise ExportSourceUnavailableError("Media source response contains extras.")
         return result
 
+    def _resolve_batch(
+        self, references: tuple[LocalBinaryReference, ...], offset: int
+    ) -> dict[str, ResolvedBinarySource]:
+        batch = references[offset : offset + MAX_RESOLVE_BATCH]
+        started = time.perf_counter()
+        try:
+            response = self._session.post(
+                f"{self._base_url}/internal/export-sources/resolve",
+                json={"items": [_reference_dict(item) for item in batch]},
+                headers={
+                    "Authorization": f"Bearer {self._token()}",
+                    "Accept": "application/json",
+                },
+                timeout=self._timeout,
+            )
+        except requests.RequestException as error:
+            raise ExportSourceUnavailableError(
+                "Media source resolver is unavailable."
+            ) from error
+        finally:
+            self._timings.append(
+                SourceBatchTiming(offset, len(batch), time.perf_counter() - started)
+            )
+        if response.status_code != 200:
+            raise ExportSourceUnavailableError(
+                f"Media source resolver returned HTTP {response.status_code}."
+            )
+        try:
+            payload = response.json()
+        except ValueError as error:
+            raise ExportSourceUnavailableError(
+                "Media source resolver returned invalid JSON."
+            ) from error
+        if not isinstance(payload, dict) or set(payload) != {"items"}:
+            raise ExportSourceUnavailableError("Invalid media source response.")
+        items = payload["items"]
+        if not isinstance(items, list) or len(items) != len(batch):
+            raise ExportSourceUnavailableError("Incomplete media source response.")
+        result: dict[str, ResolvedBinarySource] = {}
+        for value in items:
+            media_iri, source = _resolved_source(value)
+            if media_iri in result:
+                raise ExportSourceUnavailableError(
+                    "Duplicate media IRI in source response."
+                )
+            result[media_iri] = source
+        if set(result) != {item.media_iri for item in batch}:
+            raise ExportSourceUnavailableError(
+                "Media source response does not match the requested batch."
+            )
+        return result
+
     def _token(self, *, now: datetime | None = None) -> str:
         current = now or datetime.now(UTC)
-        return jwt.encode(
-            {
-                "typ": EXPORT_SOURCE_TOKEN_TYPE,
-                "sub": self._subject,
-                "iat": current,
-                "exp": current + timedelta(minutes=1),
-                "iss": self._issuer,
-                "aud": EXPORT_SOURCE_AUDIENCE,
-            },
-            self._secret,
-            algorithm="HS256",
-        )
+        with self._token_lock:
+            if self._cached_token is not None:
+                token, expires = self._cached_token
+                if current < expires - TOKEN_RENEWAL_MARGIN:
+                    return token
+            expires = current + TOKEN_LIFETIME
+            token = jwt.encode(
+                {
+                    "typ": EXPORT_SOURCE_TOKEN_TYPE,
+                    "sub": self._subject,
+                    "iat": current,
+                    "exp": expires,
+                    "iss": self._issuer,
+                    "aud": EXPORT_SOURCE_AUDIENCE,
+                },
+                self._secret,
+                algorithm="HS256",
+            )
+            self._cached_token = (token, expires)
+            return token
+
+
+def _log_timings(timings: tuple[SourceBatchTiming, ...], seconds: float) -> None:
+    if not timings:
+        return
+    slowest = max(timings, key=lambda timing: timing.seconds)
+    logger.info(
+        "Resolved %d export source(s) in %d batch(es) within %.3fs; "
+        "slowest batch at offset %d took %.3fs.",
+        sum(timing.items for timing in timings),
+        len(timings),
+        seconds,
+        slowest.offset,
+        slowest.seconds,
+    )
 
 
 def _reference_dict(value: LocalBinaryReference) -> dict[str, str]:
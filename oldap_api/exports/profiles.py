@@ -7,14 +7,20 @@ access rules owned by the generic export service.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import re
+import stat
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from threading import Lock
 from typing import Any, Mapping
 from urllib.parse import urlsplit
 
+import rfc8785
+
 PROJECT_RE = re.compile(r"^[A-Za-z][A-Za-z0-9_-]{0,63}$")
 PROFILE_ID_RE = re.compile(r"^[a-z][a-z0-9-]{0,62}-v[1-9][0-9]*$")
 VERSION_RE = re.compile(r"^[1-9][0-9]*\.[0-9]+\.[0-9]+$")
@@ -117,17 +123,83 @@ class ExportProfile:
         }
 
 
+@lru_cache(maxsize=128)
+def profile_sha256(profile: ExportProfile) -> str:
+    """Return the RFC 8785 SHA-256 digest bound into export manifests."""
+
+    return hashlib.sha256(rfc8785.dumps(profile.to_dict())).hexdigest()
+
+
+class ExportProfileCache:
+    """Share validated profiles across registries until their file changes.
+
+    Entries are keyed by profile path and validated against the file's device,
+    inode, modification time, and size, so an edited or atomically replaced
+    profile is parsed again on its next lookup.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._entries: dict[Path, tuple[tuple[int, int, int, int], ExportProfile]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(
+        self, path: Path, identity: tuple[int, int, int, int]
+    ) -> ExportProfile | None:
+        """Return the cached profile if ``path`` still has ``identity``."""
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == identity:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def store(
+        self, path: Path, identity: tuple[int, int, int, int], profile: ExportProfile
+    ) -> None:
+        """Remember one validated profile for the observed file identity."""
+
+        with self._lock:
+            self._entries[path] = (identity, profile)
+
+    def stats(self) -> dict[str, int]:
+        """Return hit, miss, and entry counters for operational diagnostics."""
+
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+            }
+
+    def clear(self) -> None:
+        """Drop all cached profiles and reset the counters."""
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+PROFILE_CACHE = ExportProfileCache()
+
+
 class FileExportProfileRegistry:
     """Load active project profiles from a trusted server-side directory.
 
     A deployment may mount its own directory through
     ``OLDAP_EXPORT_PROFILE_DIR``. The package-bundled directory provides the
     initial Fasnacht profile and keeps the runtime independent from repository
-    documentation paths.
+    documentation paths. Registries share :data:`PROFILE_CACHE` unless given
+    their own cache, so a lookup normally costs one ``lstat``.
     """
 
-    def __init__(self, root: Path) -> None:
+    def __init__(self, root: Path, *, cache: ExportProfileCache | None = None) -> None:
         self._root = root
+        self._cache = cache if cache is not None else PROFILE_CACHE
 
     @classmethod
     def from_environment(cls) -> "FileExportProfileRegistry":
@@ -146,15 +218,21 @@ class FileExportProfileRegistry:
             raise ExportProfileNotFoundError("Export profile not found.")
         path = self._root / f"{project_short_name}.json"
         try:
-            if (
-                path.is_symlink()
-                or not path.is_file()
-                or path.stat().st_size > 1_000_000
-            ):
-                raise ExportProfileNotFoundError("Export profile not found.")
+            status = path.lstat()
+        except FileNotFoundError as error:
+            raise ExportProfileNotFoundError("Export profile not found.") from error
+        except OSError as error:
+            raise ExportProfileError(
+                "Export profile configuration is invalid."
+            ) from error
+        if not stat.S_ISREG(status.st_mode) or status.st_size > 1_000_000:
+            raise ExportProfileNotFoundError("Export profile not found.")
+        identity = (status.st_dev, status.st_ino, status.st_mtime_ns, status.st_size)
+        cached = self._cache.lookup(path, identity)
+        if cached is not None:
+            return cached
+        try:
             value = json.loads(path.read_text(encoding="utf-8"))
-        except ExportProfileNotFoundError:
-            raise
         except (OSError, UnicodeDecodeError, json.JSONDecodeError) as error:
             raise ExportProfileError(
                 "Export profile configuration is invalid."
@@ -162,6 +240,8 @@ class FileExportProfileRegistry:
         profile = parse_export_profile(value)
         if profile.project_short_name != project_short_name:
             raise ExportProfileError("Export profile project identity is inconsistent.")
+        profile_sha256(profile)
+        self._cache.store(path, identity, profile)
         return profile
 
 
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
-from dataclasses import replace
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
 from threading import RLock
 from typing import Any, Protocol
@@ -12,7 +14,8 @@ from rdflib import Literal, URIRef
 from rdflib.namespace import RDF, XSD
 
 from .domain import ExportJob, ExportNotificationStatus, ExportState, ExportTask
-from .manifest import ExportManifest
+from .manifest import ExportManifest, ExportManifestError
+from .manifest_store import ExportManifestBlobError, ManifestBlobStore
 from .settings import ExportOperatingPolicy
 
 EXPORT_GRAPH = URIRef("urn:oldap:export-jobs")
@@ -26,7 +29,30 @@ EXPORT_MANIFEST_CLASS = URIRef("urn:oldap:ExportManifest")
 MANIFEST_PAYLOAD = URIRef("urn:oldap:exportManifestPayload")
 MANIFEST_SHA256 = URIRef("urn:oldap:exportManifestSha256")
 MANIFEST_FOR = URIRef("urn:oldap:exportManifestFor")
+MANIFEST_SIZE = URIRef("urn:oldap:exportManifestSize")
+MANIFEST_SUMMARY = URIRef("urn:oldap:exportManifestSummary")
 ACTIVE_CLAIM = URIRef("urn:oldap:exportActiveClaim")
+QUEUE_TASK = URIRef("urn:oldap:exportQueueTask")
+QUEUE_ELIGIBLE_AT = URIRef("urn:oldap:exportQueueEligibleAt")
+LEASE_EXPIRES_AT = URIRef("urn:oldap:exportLeaseExpiresAt")
+READY_EXPIRES_AT = URIRef("urn:oldap:exportReadyExpiresAt")
+AUDIT_DELETE_AT = URIRef("urn:oldap:exportAuditDeleteAt")
+INDEX_VERSION = URIRef("urn:oldap:exportIndexVersion")
+EXPORT_QUOTA_CLASS = URIRef("urn:oldap:ExportQuotaCounter")
+QUOTA_ACTIVE_JOBS = URIRef("urn:oldap:exportQuotaActiveJobs")
+QUOTA_RETAINED_BYTES = URIRef("urn:oldap:exportQuotaRetainedBytes")
+SYSTEM_QUOTA = URIRef("urn:oldap:export-quota:system")
+CURRENT_INDEX_VERSION = 1
+REINDEX_BATCH_SIZE = 500
+BUILD_STATES = frozenset({ExportState.QUEUED, ExportState.BUILDING})
+CLEANUP_STATES = frozenset(
+    {
+        ExportState.FAILED,
+        ExportState.CANCELLED,
+        ExportState.EXPIRED,
+        ExportState.DELETING,
+    }
+)
 
 
 class ExportNotFoundError(LookupError):
@@ -45,6 +71,14 @@ class ExportQuotaExceededError(ValueError):
     """Raised when an atomic job reservation exceeds deployment policy."""
 
 
+@dataclass(frozen=True, slots=True)
+class ExportQuotaUsage:
+    """Active jobs and retained source bytes counted against one quota scope."""
+
+    active_jobs: int = 0
+    retained_bytes: int = 0
+
+
 class ExportJobRepository(Protocol):
     """Storage contract to be implemented atomically in the OLDAP job graph."""
 
@@ -65,7 +99,12 @@ class ExportJobRepository(Protocol):
     def save(self, job: ExportJob, *, expected_previous_version: int) -> None: ...
 
     def list_for_user(
-        self, user_iri: str, *, state: ExportState | None = None
+        self,
+        user_iri: str,
+        *,
+        state: ExportState | None = None,
+        after: tuple[datetime, str] | None = None,
+        limit: int | None = None,
     ) -> tuple[ExportJob, ...]: ...
 
     def claim_next(
@@ -125,9 +164,18 @@ class InMemoryExportJobRepository:
             if job.export_id in self._jobs or job.export_id in self._manifests:
                 raise ExportAlreadyExistsError(job.export_id)
             if operating_policy is not None:
-                _require_quota(tuple(self._jobs.values()), job, operating_policy)
+                system, owners = _quota_counters(self._jobs.values())
+                _require_quota(
+                    owners.get(job.requested_by_iri, ExportQuotaUsage()),
+                    system,
+                    job,
+                    operating_policy,
+                )
             self._jobs[job.export_id] = job
-            self._manifests[job.export_id] = manifest
+            # Keep the bytes, not the caller's single-consumer body handle.
+            self._manifests[job.export_id] = replace(
+                manifest, body=manifest.canonical_json
+            )
 
     def get(self, export_id: str) -> ExportJob:
         """Return one immutable job or raise the privacy-neutral absence error."""
@@ -166,9 +214,18 @@ class InMemoryExportJobRepository:
             self._jobs[job.export_id] = job
 
     def list_for_user(
-        self, user_iri: str, *, state: ExportState | None = None
+        self,
+        user_iri: str,
+        *,
+        state: ExportState | None = None,
+        after: tuple[datetime, str] | None = None,
+        limit: int | None = None,
     ) -> tuple[ExportJob, ...]:
-        """Return caller-owned jobs newest first without cross-user leakage."""
+        """Return caller-owned jobs newest first without cross-user leakage.
+
+        ``after`` is the ``(createdAt, exportId)`` key of the last job already
+        returned; only strictly older jobs follow it.
+        """
 
         with self._lock:
             selected = [
@@ -176,8 +233,12 @@ class InMemoryExportJobRepository:
                 for job in self._jobs.values()
                 if job.requested_by_iri == user_iri
                 and (state is None or job.state is state)
+                and (after is None or (job.created_at, job.export_id) < after)
             ]
-        return tuple(sorted(selected, key=lambda job: job.created_at, reverse=True))
+        ordered = sorted(
+            selected, key=lambda job: (job.created_at, job.export_id), reverse=True
+        )
+        return tuple(ordered if limit is None else ordered[:limit])
 
     def claim_next(
         self,
@@ -307,17 +368,49 @@ class TransactionalConnection(Protocol):
     def transaction_abort(self) -> None: ...
 
 
+class QuotaLease(Protocol):
+    """Cross-worker lease held by transactions that read or move quota counters."""
+
+    def hold(self) -> None: ...
+
+    def release(self) -> None: ...
+
+
 class GraphDbExportJobRepository:
     """Persist canonical export jobs with indexed facts in one named graph.
 
     The complete internal JSON representation is authoritative. Indexed
-    triples are intentionally limited to ownership, ordering, filtering, and
-    optimistic locking. Every write validates and mutates within one GraphDB
+    triples are intentionally limited to ownership, ordering, filtering,
+    optimistic locking, and the derived worker-queue facts that let claims,
+    READY expiry, and audit purging select candidates without parsing every
+    retained payload. Every write validates and mutates within one GraphDB
     transaction.
+
+    Per-user and system-wide quota counters are maintained beside the jobs:
+    every job write moves its quota contribution in the same transaction, so
+    creation checks capacity by reading two counters. Counters are derived
+    state; the first quota check without them or with a duplicated value, or an
+    explicit :meth:`reconcile_quota_counters`, recomputes them from the payloads.
+    With a ``quota_lease`` every transaction that reads or moves a counter holds
+    that lease until it ends, because read-committed transactions would
+    otherwise lose concurrent increments.
+
+    With a ``manifest_store`` the canonical manifest body is written to that
+    content-addressed store before the job transaction, and the graph keeps
+    only its digest, size, and envelope summary. Manifests persisted as
+    literals by earlier releases remain readable.
     """
 
-    def __init__(self, connection: TransactionalConnection) -> None:
+    def __init__(
+        self,
+        connection: TransactionalConnection,
+        *,
+        manifest_store: ManifestBlobStore | None = None,
+        quota_lease: QuotaLease | None = None,
+    ) -> None:
         self._connection = connection
+        self._manifest_store = manifest_store
+        self._quota_lease = quota_lease
 
     def create(self, job: ExportJob) -> None:
         """Insert one new job atomically without replacing an existing UUID."""
@@ -327,9 +420,10 @@ class GraphDbExportJobRepository:
             if self._exists(job.export_id, transactional=True):
                 raise ExportAlreadyExistsError(job.export_id)
             self._connection.transaction_update(self._insert(job))
-            self._connection.transaction_commit()
+            self._move_quota(None, job)
+            self._commit()
         except Exception:
-            self._connection.transaction_abort()
+            self._abort()
             raise
 
     def create_with_manifest(
@@ -342,22 +436,42 @@ class GraphDbExportJobRepository:
         """Publish one immutable job/manifest pair in a single transaction."""
 
         manifest.validate_for_job(job)
+        if self._manifest_store is not None:
+            self._manifest_store.put(manifest)
         self._connection.transaction_start()
         try:
             if self._exists(job.export_id, transactional=True) or self._manifest_exists(
                 job.export_id, transactional=True
             ):
                 raise ExportAlreadyExistsError(job.export_id)
+            rebuilt = None
             if operating_policy is not None:
-                _require_quota(self._all(transactional=True), job, operating_policy)
+                self._hold_quota_lease()
+                usage = self._read_quota_counters(job.requested_by_iri)
+                if usage is None:
+                    rebuilt = _quota_counters(self._all(transactional=True))
+                    usage = (
+                        rebuilt[1].get(job.requested_by_iri, ExportQuotaUsage()),
+                        rebuilt[0],
+                    )
+                _require_quota(*usage, job, operating_policy)
+            if rebuilt is not None:
+                self._write_quota_counters(*rebuilt)
             update = (
                 f"INSERT DATA {{ GRAPH {EXPORT_GRAPH.n3()} {{ "
-                f"{_job_triples(job)} {_manifest_triples(manifest)} }} }}"
+                f"{_job_triples(job)} "
+                f"{_manifest_triples(manifest, stored=self._manifest_store is not None)}"
+                " } }"
             )
             self._connection.transaction_update(update)
-            self._connection.transaction_commit()
-        except Exception:
-            self._connection.transaction_abort()
+            self._move_quota(None, job)
+            self._commit()
+        except Exception as error:
+            self._abort()
+            if self._manifest_store is not None and not isinstance(
+                error, ExportAlreadyExistsError
+            ):
+                self._manifest_store.delete(manifest.sha256)
             raise
 
     def get(self, export_id: str) -> ExportJob:
@@ -371,20 +485,41 @@ class GraphDbExportJobRepository:
     def get_manifest(self, export_id: str) -> ExportManifest:
         """Read and digest-verify one immutable manifest by export UUID."""
 
+        manifest_iri = _manifest_iri(export_id).n3()
         query = f"""
-SELECT ?payload ?sha256
+SELECT ?payload ?summary ?size ?sha256
 WHERE {{ GRAPH {EXPORT_GRAPH.n3()} {{
-  {_manifest_iri(export_id).n3()} {MANIFEST_PAYLOAD.n3()} ?payload ;
-       {MANIFEST_SHA256.n3()} ?sha256 ;
+  {manifest_iri} {MANIFEST_SHA256.n3()} ?sha256 ;
        {MANIFEST_FOR.n3()} {_job_iri(export_id).n3()} .
+  OPTIONAL {{ {manifest_iri} {MANIFEST_PAYLOAD.n3()} ?payload }}
+  OPTIONAL {{
+    {manifest_iri} {MANIFEST_SUMMARY.n3()} ?summary ; {MANIFEST_SIZE.n3()} ?size .
+  }}
 }} }}
 LIMIT 1
 """
         rows = _bindings(self._connection.query(query))
         if not rows:
             raise ExportNotFoundError(export_id)
-        manifest = ExportManifest.from_dict(json.loads(rows[0]["payload"]["value"]))
-        if manifest.sha256 != rows[0]["sha256"]["value"]:
+        row = rows[0]
+        sha256 = row["sha256"]["value"]
+        if "payload" in row:
+            manifest = ExportManifest.from_dict(json.loads(row["payload"]["value"]))
+        elif "summary" in row and self._manifest_store is not None:
+            size = int(row["size"]["value"])
+            try:
+                manifest = ExportManifest.from_summary(
+                    json.loads(row["summary"]["value"]),
+                    self._manifest_store.open(sha256, size),
+                    size_bytes=size,
+                    sha256=sha256,
+                )
+            except (ExportManifestBlobError, ExportManifestError) as error:
+                raise ExportRepositoryConflict(str(error)) from error
+        else:
+            raise ExportRepositoryConflict("Persisted export manifest is unavailable.")
+        if manifest.sha256 != sha256:
+            manifest.close()
             raise ExportRepositoryConflict("Persisted export manifest digest mismatch.")
         return manifest
 
@@ -403,20 +538,31 @@ LIMIT 1
                 raise ExportRepositoryConflict(
                     "Saved export must advance stateVersion exactly once."
                 )
-            self._connection.transaction_update(self._replace(current, job))
-            self._connection.transaction_commit()
+            self._write(current, job)
+            self._commit()
         except Exception:
-            self._connection.transaction_abort()
+            self._abort()
             raise
 
     def list_for_user(
-        self, user_iri: str, *, state: ExportState | None = None
+        self,
+        user_iri: str,
+        *,
+        state: ExportState | None = None,
+        after: tuple[datetime, str] | None = None,
+        limit: int | None = None,
     ) -> tuple[ExportJob, ...]:
-        """List caller-owned jobs newest first, optionally filtered by state."""
+        """List caller-owned jobs newest first through a keyset range scan.
+
+        State, the ``(createdAt, exportId)`` continuation key, and the page
+        bound are evaluated by GraphDB, so only the returned page is parsed.
+        """
 
         state_triple = (
             f"?job {STATE.n3()} {Literal(state.value).n3()} ." if state else ""
         )
+        keyset = _keyset_filter(after, _job_iri) if after is not None else ""
+        bound = f"LIMIT {int(limit)}" if limit is not None else ""
         query = f"""
 SELECT ?payload ?created
 WHERE {{
@@ -426,9 +572,11 @@ WHERE {{
          {PAYLOAD.n3()} ?payload ;
          {CREATED_AT.n3()} ?created .
     {state_triple}
+    {keyset}
   }}
 }}
 ORDER BY DESC(?created) DESC(?job)
+{bound}
 """
         return tuple(
             ExportJob.from_dict(json.loads(row["payload"]["value"]))
@@ -448,24 +596,31 @@ ORDER BY DESC(?created) DESC(?job)
 
         self._connection.transaction_start()
         try:
-            jobs = self._all(transactional=True)
-            candidate = _select_claim_candidate(jobs, supported_tasks, claimed_at)
-            if candidate is None:
-                self._connection.transaction_commit()
+            rows = _bindings(
+                self._connection.transaction_query(
+                    _claim_candidate_query(supported_tasks, claimed_at)
+                )
+            )
+            if not rows:
+                self._commit()
                 return None
+            candidate = ExportJob.from_dict(json.loads(rows[0]["payload"]["value"]))
+            task = ExportTask(rows[0]["task"]["value"])
+            if not _job_is_claimable(candidate, task, claimed_at):
+                raise ExportRepositoryConflict("Export claim queue index is stale.")
             claimed = _attach_claim(
                 candidate,
-                _task_for_job(candidate, supported_tasks, claimed_at),
+                task,
                 claim_id,
                 worker_id,
                 claimed_at,
                 lease_expires_at,
             )
-            self._connection.transaction_update(self._replace(candidate, claimed))
-            self._connection.transaction_commit()
+            self._write(candidate, claimed)
+            self._commit()
             return claimed
         except Exception:
-            self._connection.transaction_abort()
+            self._abort()
             raise
 
     def get_by_claim(self, claim_id: str) -> ExportJob:
@@ -493,20 +648,31 @@ LIMIT 1
             persisted = self._get_transactional(current.export_id)
             if persisted != current:
                 raise ExportRepositoryConflict("Export claim changed concurrently.")
-            self._connection.transaction_update(self._replace(current, renewed))
-            self._connection.transaction_commit()
+            self._write(current, renewed)
+            self._commit()
         except Exception:
-            self._connection.transaction_abort()
+            self._abort()
             raise
 
     def expire_next_ready(self, *, now: datetime) -> ExportJob | None:
         """Atomically move the oldest elapsed READY job to EXPIRED."""
 
+        query = f"""
+SELECT ?payload
+WHERE {{ GRAPH {EXPORT_GRAPH.n3()} {{
+  ?job {READY_EXPIRES_AT.n3()} ?expires ;
+       {CREATED_AT.n3()} ?created ;
+       {PAYLOAD.n3()} ?payload .
+  FILTER(?expires <= {_datetime_literal(now)})
+}} }}
+ORDER BY ?created ?job
+LIMIT 1
+"""
         self._connection.transaction_start()
         try:
-            candidate = _select_expired_ready(self._all(transactional=True), now)
+            candidate = _select_expired_ready(self._indexed(query), now)
             if candidate is None:
-                self._connection.transaction_commit()
+                self._commit()
                 return None
             expired = candidate.transition(
                 ExportState.EXPIRED,
@@ -514,11 +680,11 @@ LIMIT 1
                 now=now,
                 cleanup_reason=ExportState.EXPIRED.value,
             )
-            self._connection.transaction_update(self._replace(candidate, expired))
-            self._connection.transaction_commit()
+            self._write(candidate, expired)
+            self._commit()
             return expired
         except Exception:
-            self._connection.transaction_abort()
+            self._abort()
             raise
 
     def next_notification_retry(
@@ -542,21 +708,26 @@ LIMIT 1
                 raise ExportRepositoryConflict(
                     "Export notification changed concurrently."
                 )
-            self._connection.transaction_update(self._replace(current, updated))
-            self._connection.transaction_commit()
+            self._write(current, updated)
+            self._commit()
         except Exception:
-            self._connection.transaction_abort()
+            self._abort()
             raise
 
     def purge_expired_audits(self, *, now: datetime) -> int:
         """Delete content-free DELETED job hulls after their audit deadline."""
 
+        query = f"""
+SELECT ?payload
+WHERE {{ GRAPH {EXPORT_GRAPH.n3()} {{
+  ?job {AUDIT_DELETE_AT.n3()} ?deleteAt ; {PAYLOAD.n3()} ?payload .
+  FILTER(?deleteAt <= {_datetime_literal(now)})
+}} }}
+"""
         self._connection.transaction_start()
         try:
             due = tuple(
-                job
-                for job in self._all(transactional=True)
-                if _audit_is_expired(job, now)
+                job for job in self._indexed(query) if _audit_is_expired(job, now)
             )
             for job in due:
                 job_iri = _job_iri(job.export_id).n3()
@@ -567,10 +738,10 @@ LIMIT 1
                 self._connection.transaction_update(
                     f"DELETE WHERE {{ GRAPH {EXPORT_GRAPH.n3()} {{ {manifest_iri} ?p ?o . }} }}"
                 )
-            self._connection.transaction_commit()
+            self._commit()
             return len(due)
         except Exception:
-            self._connection.transaction_abort()
+            self._abort()
             raise
 
     def complete_cleanup(self, current: ExportJob, deleted: ExportJob) -> None:
@@ -583,15 +754,153 @@ LIMIT 1
             persisted = self._get_transactional(current.export_id)
             if persisted != current:
                 raise ExportRepositoryConflict("Export cleanup changed concurrently.")
-            self._connection.transaction_update(self._replace(current, deleted))
+            self._write(current, deleted)
             manifest = _manifest_iri(current.export_id).n3()
             self._connection.transaction_update(
                 f"DELETE WHERE {{ GRAPH {EXPORT_GRAPH.n3()} {{ {manifest} ?p ?o . }} }}"
             )
-            self._connection.transaction_commit()
+            self._commit()
         except Exception:
-            self._connection.transaction_abort()
+            self._abort()
             raise
+        if self._manifest_store is not None and current.manifest_sha256:
+            self._manifest_store.delete(current.manifest_sha256)
+
+    def reindex_queue(self, *, batch_size: int = REINDEX_BATCH_SIZE) -> int:
+        """Rewrite jobs persisted before the current queue index version.
+
+        Jobs written by earlier releases lack the derived queue facts and are
+        therefore invisible to claims, expiry, and audit purging until they are
+        rewritten once. Each bounded batch commits separately and the command
+        is safe to repeat.
+        """
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive.")
+        query = f"""
+SELECT ?payload
+WHERE {{ GRAPH {EXPORT_GRAPH.n3()} {{
+  ?job {RDF.type.n3()} {EXPORT_JOB_CLASS.n3()} ; {PAYLOAD.n3()} ?payload .
+  FILTER NOT EXISTS {{
+    ?job {INDEX_VERSION.n3()} {Literal(CURRENT_INDEX_VERSION).n3()} .
+  }}
+}} }}
+LIMIT {batch_size}
+"""
+        total = 0
+        while True:
+            self._connection.transaction_start()
+            try:
+                jobs = self._indexed(query)
+                for job in jobs:
+                    self._write(job, job)
+                self._commit()
+            except Exception:
+                self._abort()
+                raise
+            total += len(jobs)
+            if len(jobs) < batch_size:
+                return total
+
+    def reconcile_quota_counters(self) -> int:
+        """Recompute all quota counters from the authoritative job payloads.
+
+        Returns the number of per-user counters written. The system counter is
+        always written, even when no retained job exists.
+        """
+
+        self._connection.transaction_start()
+        try:
+            self._hold_quota_lease()
+            system, owners = _quota_counters(self._all(transactional=True))
+            self._write_quota_counters(system, owners)
+            self._commit()
+        except Exception:
+            self._abort()
+            raise
+        return len(owners)
+
+    def _write(self, current: ExportJob, updated: ExportJob) -> None:
+        self._connection.transaction_update(self._replace(current, updated))
+        self._move_quota(current, updated)
+
+    def _move_quota(self, current: ExportJob | None, updated: ExportJob) -> None:
+        update = _quota_counter_update(current, updated)
+        if update:
+            self._hold_quota_lease()
+            self._connection.transaction_update(update)
+
+    def _hold_quota_lease(self) -> None:
+        if self._quota_lease is not None:
+            self._quota_lease.hold()
+
+    def _commit(self) -> None:
+        try:
+            self._connection.transaction_commit()
+        finally:
+            if self._quota_lease is not None:
+                self._quota_lease.release()
+
+    def _abort(self) -> None:
+        try:
+            self._connection.transaction_abort()
+        finally:
+            if self._quota_lease is not None:
+                self._quota_lease.release()
+
+    def _read_quota_counters(
+        self, owner_iri: str
+    ) -> tuple[ExportQuotaUsage, ExportQuotaUsage] | None:
+        """Return ``(owner, system)`` usage, or ``None`` when it must be recomputed.
+
+        Counters are recomputed before their first use and after a lost race
+        left a scope with more than one value.
+        """
+
+        query = f"""
+SELECT ?scope ?active ?bytes
+WHERE {{ GRAPH {EXPORT_GRAPH.n3()} {{
+  VALUES ?scope {{ {SYSTEM_QUOTA.n3()} {_quota_iri(owner_iri).n3()} }}
+  ?scope {QUOTA_ACTIVE_JOBS.n3()} ?active ;
+         {QUOTA_RETAINED_BYTES.n3()} ?bytes .
+}} }}
+"""
+        rows = _bindings(self._connection.transaction_query(query))
+        usage = {
+            row["scope"]["value"]: ExportQuotaUsage(
+                int(row["active"]["value"]), int(row["bytes"]["value"])
+            )
+            for row in rows
+        }
+        if str(SYSTEM_QUOTA) not in usage or len(usage) != len(rows):
+            return None
+        return (
+            usage.get(str(_quota_iri(owner_iri)), ExportQuotaUsage()),
+            usage[str(SYSTEM_QUOTA)],
+        )
+
+    def _write_quota_counters(
+        self, system: ExportQuotaUsage, owners: dict[str, ExportQuotaUsage]
+    ) -> None:
+        self._connection.transaction_update(f"""
+DELETE WHERE {{ GRAPH {EXPORT_GRAPH.n3()} {{
+  ?scope {RDF.type.n3()} {EXPORT_QUOTA_CLASS.n3()} ; ?property ?value .
+}} }}
+""")
+        counters = [_quota_counter_triples(SYSTEM_QUOTA, system)]
+        counters.extend(
+            _quota_counter_triples(_quota_iri(owner), usage, owner=owner)
+            for owner, usage in sorted(owners.items())
+        )
+        self._connection.transaction_update(
+            f"INSERT DATA {{ GRAPH {EXPORT_GRAPH.n3()} {{ {' '.join(counters)} }} }}"
+        )
+
+    def _indexed(self, query: str) -> tuple[ExportJob, ...]:
+        return tuple(
+            ExportJob.from_dict(json.loads(row["payload"]["value"]))
+            for row in _bindings(self._connection.transaction_query(query))
+        )
 
     def _get_transactional(self, export_id: str) -> ExportJob:
         rows = _bindings(
@@ -700,16 +1009,108 @@ def _job_triples(job: ExportJob) -> str:
   {OWNER.n3()} {URIRef(job.requested_by_iri).n3()} ;
   {STATE.n3()} {Literal(job.state.value).n3()} ;
   {STATE_VERSION.n3()} {Literal(job.state_version, datatype=XSD.integer).n3()} ;
+  {INDEX_VERSION.n3()} {Literal(CURRENT_INDEX_VERSION).n3()} ;
   {CREATED_AT.n3()} {Literal(job.created_at, datatype=XSD.dateTime).n3()} .
 {active_claim}
+{_queue_index_triples(job)}
 """
 
 
-def _manifest_triples(manifest: ExportManifest) -> str:
-    payload = manifest.canonical_json.decode("utf-8")
+def _queue_index_triples(job: ExportJob) -> str:
+    """Derive the worker-queue facts that are indexed beside the payload.
+
+    A claimable job carries its task and the earliest time a worker may lease
+    it: creation for an unclaimed job, otherwise the current lease expiry.
+    """
+
+    iri = _job_iri(job.export_id).n3()
+    facts: list[str] = []
+    if job.active_claim_lease_expires_at is not None:
+        facts.append(
+            f"{iri} {LEASE_EXPIRES_AT.n3()} "
+            f"{_datetime_literal(job.active_claim_lease_expires_at)} ."
+        )
+    task = (
+        ExportTask.BUILD
+        if job.state in BUILD_STATES
+        else ExportTask.CLEANUP if job.state in CLEANUP_STATES else None
+    )
+    if task is not None:
+        eligible_at = job.active_claim_lease_expires_at or job.created_at
+        facts.append(
+            f"{iri} {QUEUE_TASK.n3()} {Literal(task.value).n3()} ; "
+            f"{QUEUE_ELIGIBLE_AT.n3()} {_datetime_literal(eligible_at)} ."
+        )
+    if (
+        job.state is ExportState.READY
+        and job.expires_at is not None
+        and job.active_claim_id is None
+    ):
+        facts.append(
+            f"{iri} {READY_EXPIRES_AT.n3()} {_datetime_literal(job.expires_at)} ."
+        )
+    if job.state is ExportState.DELETED and job.audit_delete_at is not None:
+        facts.append(
+            f"{iri} {AUDIT_DELETE_AT.n3()} {_datetime_literal(job.audit_delete_at)} ."
+        )
+    return "\n".join(facts)
+
+
+def _claim_candidate_query(
+    supported_tasks: tuple[ExportTask, ...], now: datetime
+) -> str:
+    """Select at most one eligible job, cleanup before build, oldest first."""
+
+    priorities = " ".join(
+        f"({Literal(task.value).n3()} {priority})"
+        for priority, task in enumerate((ExportTask.CLEANUP, ExportTask.BUILD))
+        if task in supported_tasks
+    )
+    return f"""
+SELECT ?payload ?task
+WHERE {{ GRAPH {EXPORT_GRAPH.n3()} {{
+  VALUES (?task ?priority) {{ {priorities} }}
+  ?job {QUEUE_TASK.n3()} ?task ;
+       {QUEUE_ELIGIBLE_AT.n3()} ?eligible ;
+       {CREATED_AT.n3()} ?created ;
+       {PAYLOAD.n3()} ?payload .
+  FILTER(?eligible <= {_datetime_literal(now)})
+}} }}
+ORDER BY ?priority ?created ?job
+LIMIT 1
+"""
+
+
+def _datetime_literal(value: datetime) -> str:
+    return Literal(value, datatype=XSD.dateTime).n3()
+
+
+def _keyset_filter(
+    after: tuple[datetime, str], iri_for: Callable[[str], URIRef]
+) -> str:
+    """Restrict a newest-first listing to keys strictly after a cursor."""
+
+    created = _datetime_literal(after[0])
+    job = Literal(str(iri_for(after[1]))).n3()
+    return (
+        f"FILTER(?created < {created} || "
+        f"(?created = {created} && STR(?job) < {job}))"
+    )
+
+
+def _manifest_triples(manifest: ExportManifest, *, stored: bool = False) -> str:
+    if stored:
+        summary = json.dumps(manifest.summary(), separators=(",", ":"), sort_keys=True)
+        body = (
+            f"{MANIFEST_SUMMARY.n3()} {Literal(summary).n3()} ;\n"
+            f"  {MANIFEST_SIZE.n3()} {Literal(manifest.size_bytes).n3()} ;"
+        )
+    else:
+        payload = manifest.canonical_json.decode("utf-8")
+        body = f"{MANIFEST_PAYLOAD.n3()} {Literal(payload).n3()} ;"
     return f"""
 {_manifest_iri(manifest.export_id).n3()} {RDF.type.n3()} {EXPORT_MANIFEST_CLASS.n3()} ;
-  {MANIFEST_PAYLOAD.n3()} {Literal(payload).n3()} ;
+  {body}
   {MANIFEST_SHA256.n3()} {Literal(manifest.sha256).n3()} ;
   {MANIFEST_FOR.n3()} {_job_iri(manifest.export_id).n3()} .
 """
@@ -719,35 +1120,123 @@ def _bindings(result: Any) -> list[dict[str, Any]]:
     return list(result.get("results", {}).get("bindings", []))
 
 
+def _quota_iri(owner_iri: str) -> URIRef:
+    digest = hashlib.sha256(owner_iri.encode("utf-8")).hexdigest()
+    return URIRef(f"urn:oldap:export-quota:user:{digest}")
+
+
+def _quota_contribution(job: ExportJob | None) -> ExportQuotaUsage:
+    """Return what one job counts against its owner and the system."""
+
+    if job is None or job.state is ExportState.DELETED:
+        return ExportQuotaUsage()
+    return ExportQuotaUsage(
+        active_jobs=1 if job.state in BUILD_STATES else 0,
+        retained_bytes=job.estimated_source_bytes,
+    )
+
+
+def _quota_counters(
+    jobs: Iterable[ExportJob],
+) -> tuple[ExportQuotaUsage, dict[str, ExportQuotaUsage]]:
+    """Recompute system-wide and per-owner usage from complete jobs."""
+
+    system = ExportQuotaUsage()
+    owners: dict[str, ExportQuotaUsage] = {}
+    for job in jobs:
+        contribution = _quota_contribution(job)
+        if contribution == ExportQuotaUsage():
+            continue
+        system = _add_usage(system, contribution)
+        owners[job.requested_by_iri] = _add_usage(
+            owners.get(job.requested_by_iri, ExportQuotaUsage()), contribution
+        )
+    return system, owners
+
+
+def _add_usage(left: ExportQuotaUsage, right: ExportQuotaUsage) -> ExportQuotaUsage:
+    return ExportQuotaUsage(
+        left.active_jobs + right.active_jobs,
+        left.retained_bytes + right.retained_bytes,
+    )
+
+
+def _quota_counter_triples(
+    scope: URIRef, usage: ExportQuotaUsage, *, owner: str | None = None
+) -> str:
+    owner_triple = f"{OWNER.n3()} {URIRef(owner).n3()} ;" if owner else ""
+    return f"""
+{scope.n3()} {RDF.type.n3()} {EXPORT_QUOTA_CLASS.n3()} ; {owner_triple}
+  {QUOTA_ACTIVE_JOBS.n3()} {Literal(usage.active_jobs).n3()} ;
+  {QUOTA_RETAINED_BYTES.n3()} {Literal(usage.retained_bytes).n3()} .
+"""
+
+
+def _quota_counter_update(current: ExportJob | None, updated: ExportJob) -> str:
+    """Move one job's quota contribution after its write has been applied.
+
+    The update only matches once the job carries its new stateVersion, so a
+    rejected optimistic write never moves a counter. Counters that have not
+    been initialized are left absent for the next full recomputation.
+    """
+
+    before = _quota_contribution(current)
+    after = _quota_contribution(updated)
+    active = after.active_jobs - before.active_jobs
+    retained = after.retained_bytes - before.retained_bytes
+    if active == 0 and retained == 0:
+        return ""
+    graph = EXPORT_GRAPH.n3()
+    job = _job_iri(updated.export_id).n3()
+    version = Literal(updated.state_version, datatype=XSD.integer).n3()
+    owner = URIRef(updated.requested_by_iri)
+    return f"""
+DELETE {{ GRAPH {graph} {{
+  ?scope {QUOTA_ACTIVE_JOBS.n3()} ?active ; {QUOTA_RETAINED_BYTES.n3()} ?bytes .
+}} }}
+INSERT {{ GRAPH {graph} {{
+  ?scope {RDF.type.n3()} {EXPORT_QUOTA_CLASS.n3()} ;
+         {OWNER.n3()} ?owner ;
+         {QUOTA_ACTIVE_JOBS.n3()} ?nextActive ;
+         {QUOTA_RETAINED_BYTES.n3()} ?nextBytes .
+}} }}
+WHERE {{
+  GRAPH {graph} {{
+    {SYSTEM_QUOTA.n3()} {RDF.type.n3()} {EXPORT_QUOTA_CLASS.n3()} .
+    {job} {STATE_VERSION.n3()} {version} .
+  }}
+  VALUES (?scope ?owner) {{
+    ({SYSTEM_QUOTA.n3()} UNDEF)
+    ({_quota_iri(owner).n3()} {owner.n3()})
+  }}
+  OPTIONAL {{ GRAPH {graph} {{
+    ?scope {QUOTA_ACTIVE_JOBS.n3()} ?active ; {QUOTA_RETAINED_BYTES.n3()} ?bytes .
+  }} }}
+  BIND(COALESCE(?active, 0) + {Literal(active).n3()} AS ?nextActive)
+  BIND(COALESCE(?bytes, 0) + {Literal(retained).n3()} AS ?nextBytes)
+}}
+"""
+
+
 def _require_quota(
-    jobs: tuple[ExportJob, ...],
+    owner: ExportQuotaUsage,
+    system: ExportQuotaUsage,
     candidate: ExportJob,
     policy: ExportOperatingPolicy,
 ) -> None:
     """Reserve active-job and retained-byte capacity in the create transaction."""
 
-    active_states = {ExportState.QUEUED, ExportState.BUILDING}
-    retained = tuple(job for job in jobs if job.state is not ExportState.DELETED)
-    active = tuple(job for job in retained if job.state in active_states)
-    owner_active = tuple(
-        job for job in active if job.requested_by_iri == candidate.requested_by_iri
-    )
-    owner_retained = tuple(
-        job for job in retained if job.requested_by_iri == candidate.requested_by_iri
-    )
-    if len(owner_active) >= policy.max_active_jobs_per_user:
+    if owner.active_jobs >= policy.max_active_jobs_per_user:
         raise ExportQuotaExceededError("The user's active export-job quota is full.")
-    if len(active) >= policy.max_active_jobs_total:
+    if system.active_jobs >= policy.max_active_jobs_total:
         raise ExportQuotaExceededError("The system active export-job quota is full.")
     if (
-        sum(job.estimated_source_bytes for job in owner_retained)
-        + candidate.estimated_source_bytes
+        owner.retained_bytes + candidate.estimated_source_bytes
         > policy.max_reserved_bytes_per_user
     ):
         raise ExportQuotaExceededError("The user's retained export-byte quota is full.")
     if (
-        sum(job.estimated_source_bytes for job in retained)
-        + candidate.estimated_source_bytes
+        system.retained_bytes + candidate.estimated_source_bytes
         > policy.max_reserved_bytes_total
     ):
         raise ExportQuotaExceededError("The system retained export-byte quota is full.")
@@ -841,13 +1330,8 @@ def _job_is_claimable(job: ExportJob, task: ExportTask, now: datetime) -> bool:
     if active:
         return False
     if task is ExportTask.BUILD:
-        return job.state in {ExportState.QUEUED, ExportState.BUILDING}
-    return job.state in {
-        ExportState.FAILED,
-        ExportState.CANCELLED,
-        ExportState.EXPIRED,
-        ExportState.DELETING,
-    }
+        return job.state in BUILD_STATES
+    return job.state in CLEANUP_STATES
 
 
 def _attach_claim(
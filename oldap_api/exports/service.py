@@ -146,29 +146,30 @@ class ExportJobService:
             generated_at=current,
             enforce_size_limit=True,
         )
-        job = ExportJob(
-            export_id=identifier,
-            state=ExportState.QUEUED,
-            state_version=0,
-            created_at=current,
-            updated_at=current,
-            requested_by_iri=str(connection.userIri),
-            requested_by_user_id=str(connection.userid),
-            selection=snapshot.selection,
-            estimated_source_bytes=snapshot.source_bytes,
-            warning_count=snapshot.warning_count,
-            progress=ExportProgress(
-                files_total=snapshot.files_total,
-                bytes_total=snapshot.source_bytes,
-            ),
-            snapshot_at=current,
-            manifest_sha256=snapshot.manifest.sha256,
-        )
-        self._repository.create_with_manifest(
-            job,
-            snapshot.manifest,
-            operating_policy=self._operating_policy,
-        )
+        with snapshot.manifest:
+            job = ExportJob(
+                export_id=identifier,
+                state=ExportState.QUEUED,
+                state_version=0,
+                created_at=current,
+                updated_at=current,
+                requested_by_iri=str(connection.userIri),
+                requested_by_user_id=str(connection.userid),
+                selection=snapshot.selection,
+                estimated_source_bytes=snapshot.source_bytes,
+                warning_count=snapshot.warning_count,
+                progress=ExportProgress(
+                    files_total=snapshot.files_total,
+                    bytes_total=snapshot.source_bytes,
+                ),
+                snapshot_at=current,
+                manifest_sha256=snapshot.manifest.sha256,
+            )
+            self._repository.create_with_manifest(
+                job,
+                snapshot.manifest,
+                operating_policy=self._operating_policy,
+            )
         return job
 
     def get_for_user(self, export_id: str, connection: Any) -> ExportJob:
@@ -192,23 +193,12 @@ class ExportJobService:
 
         if not 1 <= limit <= 100:
             raise ExportValidationError("limit must be between 1 and 100.")
-        jobs = list(
-            self._repository.list_for_user(str(connection.userIri), state=state)
+        selected = self._repository.list_for_user(
+            str(connection.userIri),
+            state=state,
+            after=_decode_cursor(cursor) if cursor is not None else None,
+            limit=limit + 1,
         )
-        start = 0
-        if cursor is not None:
-            key = _decode_cursor(cursor)
-            try:
-                start = next(
-                    index + 1
-                    for index, job in enumerate(jobs)
-                    if (job.created_at, job.export_id) == key
-                )
-            except StopIteration as error:
-                raise ExportValidationError(
-                    "cursor does not identify a job in this result set."
-                ) from error
-        selected = jobs[start : start + limit + 1]
         items = tuple(selected[:limit])
         next_cursor = (
             _encode_cursor(items[-1]) if len(selected) > limit and items else None
@@ -271,9 +261,9 @@ class ExportJobService:
             raise ValueError("Export artifact is not downloadable.")
         if self._capability_issuer is None or self._download_authorizer is None:
             raise RuntimeError("Export download service is not configured.")
-        manifest = self._repository.get_manifest(export_id)
-        manifest.validate_identity_for_job(job)
-        self._download_authorizer.authorize(connection, job=job, manifest=manifest)
+        with self._repository.get_manifest(export_id) as manifest:
+            manifest.validate_identity_for_job(job)
+            self._download_authorizer.authorize(connection, job=job, manifest=manifest)
         return self._capability_issuer.issue(job, now=current)
 
     def _snapshot_dependencies(
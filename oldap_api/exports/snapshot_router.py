@@ -7,6 +7,7 @@ from typing import Any
 from .domain import ExportKind
 from .manifest import ExportManifest
 from .snapshot_common import ExportSnapshotError
+from .staging_snapshot import ExportDownloadPermissionError
 
 
 class ExportSnapshotRouter:
@@ -28,11 +29,23 @@ class ExportSnapshotRouter:
 
 
 class ExportDownloadAuthorizerRouter:
-    """Dispatch live source reauthorization by the immutable job kind."""
+    """Dispatch live source reauthorization by the immutable job kind.
 
-    def __init__(self, staging_authorizer: Any, archive_authorizer: Any) -> None:
+    An optional Archive fallback takes over when the primary Archive
+    authorizer fails for any reason other than a denial, so a targeted check
+    can be backed by the full inventory recheck.
+    """
+
+    def __init__(
+        self,
+        staging_authorizer: Any,
+        archive_authorizer: Any,
+        *,
+        archive_fallback: Any | None = None,
+    ) -> None:
         self._staging = staging_authorizer
         self._archive = archive_authorizer
+        self._archive_fallback = archive_fallback
 
     def authorize(
         self,
@@ -47,7 +60,14 @@ class ExportDownloadAuthorizerRouter:
             self._staging.authorize(connection, job=job, manifest=manifest)
             return
         if job.selection.kind in {ExportKind.ARCHIVE_UNIT, ExportKind.ARCHIVE_ALL}:
-            self._archive.authorize(connection, job=job, manifest=manifest)
+            try:
+                self._archive.authorize(connection, job=job, manifest=manifest)
+            except ExportDownloadPermissionError:
+                raise
+            except Exception:
+                if self._archive_fallback is None:
+                    raise
+                self._archive_fallback.authorize(connection, job=job, manifest=manifest)
             return
         raise ExportSnapshotError("Unsupported export kind.")
 
@@ -2,12 +2,10 @@
 
 from __future__ import annotations
 
-import hashlib
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any, Mapping, Protocol
 
-import rfc8785
 from oldaplib.src.helpers.oldaperror import (
     OldapErrorNoPermission,
     OldapErrorNotFound,
@@ -17,7 +15,6 @@ from oldaplib.src.helpers.context import Context
 from oldaplib.src.objectfactory import (
     CompOp,
     ResourceInstance,
-    ResourceInstanceFactory,
     SearchFilter,
 )
 from oldaplib.src.xsd.iri import Iri
@@ -27,9 +24,11 @@ from oldaplib.src.xsd.xsd_integer import Xsd_integer
 from oldaplib.src.xsd.xsd_ncname import Xsd_NCName
 from oldaplib.src.xsd.xsd_qname import Xsd_QName
 
+from oldap_api.model_cache import CachedResourceInstanceFactory
+
 from .domain import MAX_EXPORT_BYTES, ExportKind, ExportSelectionSnapshot
-from .manifest import ExportManifest
-from .profiles import ExportMetadataProjection, ExportProfile
+from .manifest import ExportManifest, ExportManifestWriter
+from .profiles import ExportMetadataProjection, ExportProfile, profile_sha256
 from .snapshot_common import (
     BinarySourceResolver,
     ExportSizeLimitError,
@@ -164,7 +163,7 @@ class OldapStagingInventoryReader:
                 "Staging metadata label resolution is not implemented in v1."
             )
         project = Xsd_NCName(project_short_name, validate=True)
-        factory = ResourceInstanceFactory(con=connection, project=project)
+        factory = CachedResourceInstanceFactory(con=connection, project=project)
         selected_iri = Iri(selection_iri, validate=True)
         if kind is ExportKind.STAGING_FOLDER:
             selected_folder = factory.read(selected_iri)
@@ -413,7 +412,7 @@ class StagingSnapshotProjector:
         selection_name, selection_path = _selection_display(
             kind, selection_iri, inventory.area, folders, path_by_folder
         )
-        profile_sha = hashlib.sha256(rfc8785.dumps(profile.to_dict())).hexdigest()
+        profile_sha = profile_sha256(profile)
         selection = ExportSelectionSnapshot(
             project_short_name=profile.project_short_name,
             kind=kind,
@@ -424,7 +423,7 @@ class StagingSnapshotProjector:
             profile_version=profile.profile_version,
             profile_sha256=profile_sha,
         )
-        manifest = ExportManifest.from_dict(
+        writer = ExportManifestWriter(
             {
                 "documentType": "oldap.zip-export.manifest",
                 "schemaVersion": "1.0.0",
@@ -447,10 +446,13 @@ class StagingSnapshotProjector:
                     "displayPath": selection_path,
                 },
                 "limits": {"maxArchiveBytes": self._max_archive_bytes},
-                "directories": directory_entries,
-                "media": media_entries,
             }
         )
+        for directory in directory_entries:
+            writer.add_directory(directory)
+        for entry in media_entries:
+            writer.add_media(entry)
+        manifest = writer.finish()
         return ExportSnapshot(
             selection=selection,
             manifest=manifest,
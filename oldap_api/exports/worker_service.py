@@ -122,7 +122,11 @@ class ExportWorkerService:
         if job.export_id != export_identifier:
             raise ExportClaimConflict("The claim does not belong to this export.")
         manifest = self._repository.get_manifest(export_identifier)
-        manifest.validate_identity_for_job(job)
+        try:
+            manifest.validate_identity_for_job(job)
+        except Exception:
+            manifest.close()
+            raise
         return manifest
 
     def record_build_result(
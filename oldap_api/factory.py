@@ -2,6 +2,8 @@ import requests
 import os
 
 from flask import Flask, jsonify
+from oldap_api.data_stamps import register_data_graph_stamps
+from oldap_api.model_cache import register_model_versions
 from oldap_api.version import __version__
 from datetime import datetime, UTC
 
@@ -60,6 +62,7 @@ def factory():
     from oldap_api.views import archive_views
     from oldap_api.views import export_views
     from oldap_api.views import mobile_media_views
+    from oldap_api.views import metrics_views
 
     app.register_blueprint(auth_views.auth_bp)
     app.register_blueprint(auth_views.mobile_auth_bp)
@@ -78,6 +81,9 @@ def factory():
     app.register_blueprint(export_views.internal_export_bp)
     app.register_blueprint(export_views.internal_export_claim_bp)
     app.register_blueprint(mobile_media_views.internal_mobile_media_bp)
+    app.register_blueprint(metrics_views.metrics_bp)
+    register_data_graph_stamps(app)
+    register_model_versions(app)
 
     @app.get("/_routes")
     def _routes():
@@ -0,0 +1,37 @@
+import hashlib
+from typing import Any, Callable
+
+from flask import Response, current_app, request
+from werkzeug.http import is_resource_modified
+
+from oldap_api.authentication import authenticated_connection
+
+
+def conditional_response(build: Callable[[], Any], *validators: Any) -> Response:
+    """
+    Return the response built by ``build``, or an empty 304 if the client's copy is current.
+    The validators are hashed together with the requesting user to a strong ETag before
+    anything is built, so a matching If-None-Match skips building and serializing the body
+    entirely. No Last-Modified is sent: HTTP dates have one-second precision while oldap
+    modification dates carry microseconds, so If-Modified-Since could not tell two writes
+    within the same second apart.
+    :param build: Callable returning the JSON-serializable body or a complete Response
+    :param validators: Values that change whenever the representation changes
+    :return: The 200 response with its ETag, or an empty 304 response
+    """
+    user = getattr(authenticated_connection(), "userIri", None)
+    digest = hashlib.sha256(
+        "\x1f".join(str(value) for value in (user, *validators)).encode()
+    )
+    etag = digest.hexdigest()[:32]
+
+    if not is_resource_modified(request.environ, etag=etag):
+        response = Response(status=304)
+    else:
+        body = build()
+        response = (
+            body if isinstance(body, Response) else current_app.json.response(body)
+        )
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
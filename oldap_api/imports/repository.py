@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import unicodedata
@@ -31,6 +32,14 @@ STATE_VERSION = URIRef("urn:oldap:importStateVersion")
 QUOTA_RESERVED = URIRef("urn:oldap:importQuotaReservedBytes")
 CREATED_AT = URIRef("urn:oldap:importCreatedAt")
 ACTIVE_CLAIM = URIRef("urn:oldap:importActiveClaim")
+STATE = URIRef("urn:oldap:importState")
+INDEX_VERSION = URIRef("urn:oldap:importIndexVersion")
+IMPORT_QUOTA_CLASS = URIRef("urn:oldap:ImportQuotaCounter")
+QUOTA_COUNTER_FOR = URIRef("urn:oldap:importQuotaCounterFor")
+QUOTA_COUNTER_RESERVED = URIRef("urn:oldap:importQuotaCounterReservedBytes")
+QUOTA_COUNTERS = URIRef("urn:oldap:import-quota")
+CURRENT_INDEX_VERSION = 1
+REINDEX_BATCH_SIZE = 500
 
 
 class ImportNotFoundError(LookupError):
@@ -52,7 +61,14 @@ class ImportJobRepository(Protocol):
 
     def get(self, import_id: str) -> ImportJob: ...
 
-    def list_for_owner(self, owner_iri: str) -> list[ImportJob]: ...
+    def list_for_owner(
+        self,
+        owner_iri: str,
+        *,
+        state: ImportState | None = None,
+        after: tuple[datetime, str] | None = None,
+        limit: int | None = None,
+    ) -> list[ImportJob]: ...
 
     def replace(
         self,
@@ -106,17 +122,27 @@ class InMemoryImportJobRepository:
             except KeyError as error:
                 raise ImportNotFoundError("Import job not found.") from error
 
-    def list_for_owner(self, owner_iri: str) -> list[ImportJob]:
+    def list_for_owner(
+        self,
+        owner_iri: str,
+        *,
+        state: ImportState | None = None,
+        after: tuple[datetime, str] | None = None,
+        limit: int | None = None,
+    ) -> list[ImportJob]:
         with self._lock:
-            return sorted(
+            ordered = sorted(
                 (
                     job
                     for job in self._jobs.values()
                     if job.requested_by_iri == owner_iri
+                    and (state is None or job.state is state)
+                    and (after is None or (job.created_at, job.import_id) < after)
                 ),
                 key=lambda job: (job.created_at, job.import_id),
                 reverse=True,
             )
+        return ordered if limit is None else ordered[:limit]
 
     def replace(
         self,
@@ -227,13 +253,26 @@ class TransactionalConnection(Protocol):
     def transaction_abort(self) -> None: ...
 
 
+class QuotaLease(Protocol):
+    """Cross-worker lease held by transactions that read or move quota counters."""
+
+    def hold(self) -> None: ...
+
+    def release(self) -> None: ...
+
+
 class GraphDbImportJobRepository:
     """Store canonical ImportJob JSON with indexed facts in one named graph.
 
     Every create/replace operation performs its version and quota checks inside
     the same GraphDB transaction as the write. The JSON literal is canonical
     persisted state; indexed triples exist only for authorization, ordering,
-    optimistic locking, and atomic staging-area quota sums.
+    and optimistic locking. Reserved bytes are additionally kept as one
+    counter per staging area that every job write adjusts in its own
+    transaction; the first quota check without counters or with a duplicated
+    value, or an explicit :meth:`reconcile_quota_counters`, recomputes them from
+    the payloads. With a ``quota_lease`` every transaction that reads or moves a
+    counter holds that lease until it ends.
     """
 
     def __init__(
@@ -242,8 +281,10 @@ class GraphDbImportJobRepository:
         *,
         data_graph_resolver: Callable[[Any, str], URIRef] | None = None,
         media_ingest_base_url: str | None = None,
+        quota_lease: QuotaLease | None = None,
     ) -> None:
         self._connection = connection
+        self._quota_lease = quota_lease
         self._data_graph_resolver = (
             data_graph_resolver or resolve_project_data_graph_iri
         )
@@ -257,11 +298,12 @@ class GraphDbImportJobRepository:
         try:
             if self._exists(job.import_id, transactional=True):
                 raise ImportVersionConflict("Import ID already exists.")
-            self._check_quota(job, quota_limit_bytes, transactional=True)
+            self._check_quota(job, quota_limit_bytes)
             self._connection.transaction_update(self._insert(job))
-            self._connection.transaction_commit()
+            self._move_quota(None, job)
+            self._commit()
         except Exception:
-            self._connection.transaction_abort()
+            self._abort()
             raise
 
     def get(self, import_id: str) -> ImportJob:
@@ -270,7 +312,31 @@ class GraphDbImportJobRepository:
             raise ImportNotFoundError("Import job not found.")
         return ImportJob.from_dict(json.loads(rows[0]["payload"]["value"]))
 
-    def list_for_owner(self, owner_iri: str) -> list[ImportJob]:
+    def list_for_owner(
+        self,
+        owner_iri: str,
+        *,
+        state: ImportState | None = None,
+        after: tuple[datetime, str] | None = None,
+        limit: int | None = None,
+    ) -> list[ImportJob]:
+        """List owner jobs newest first through a keyset range scan.
+
+        State, the ``(createdAt, importId)`` continuation key, and the page
+        bound are evaluated by GraphDB, so only the returned page is parsed.
+        """
+        state_triple = (
+            f"?job {STATE.n3()} {Literal(state.value).n3()} ." if state else ""
+        )
+        keyset = ""
+        if after is not None:
+            created = Literal(after[0], datatype=XSD.dateTime).n3()
+            job = Literal(str(_job_iri(after[1]))).n3()
+            keyset = (
+                f"FILTER(?created < {created} || "
+                f"(?created = {created} && STR(?job) < {job}))"
+            )
+        bound = f"LIMIT {int(limit)}" if limit is not None else ""
         query = f"""
 SELECT ?payload ?created
 WHERE {{
@@ -279,9 +345,12 @@ WHERE {{
          {OWNER.n3()} {URIRef(owner_iri).n3()} ;
          {PAYLOAD.n3()} ?payload ;
          {CREATED_AT.n3()} ?created .
+    {state_triple}
+    {keyset}
   }}
 }}
 ORDER BY DESC(?created) DESC(?job)
+{bound}
 """
         return [
             ImportJob.from_dict(json.loads(row["payload"]["value"]))
@@ -301,16 +370,11 @@ ORDER BY DESC(?created) DESC(?job)
             if current.state_version != expected_state_version:
                 raise ImportVersionConflict("Import job changed concurrently.")
             if quota_limit_bytes is not None:
-                self._check_quota(
-                    job,
-                    quota_limit_bytes,
-                    transactional=True,
-                    excluding=job.import_id,
-                )
-            self._connection.transaction_update(self._replace(current, job))
-            self._connection.transaction_commit()
+                self._check_quota(job, quota_limit_bytes, current=current)
+            self._write(current, job)
+            self._commit()
         except Exception:
-            self._connection.transaction_abort()
+            self._abort()
             raise
 
     def claim_next(
@@ -327,7 +391,7 @@ ORDER BY DESC(?created) DESC(?job)
             jobs = self._all(transactional=True)
             candidate = _select_claim_candidate(jobs, supported_tasks, claimed_at)
             if candidate is None:
-                self._connection.transaction_commit()
+                self._commit()
                 return None
             claimed = _attach_claim(
                 candidate,
@@ -337,11 +401,11 @@ ORDER BY DESC(?created) DESC(?job)
                 claimed_at,
                 lease_expires_at,
             )
-            self._connection.transaction_update(self._replace(candidate, claimed))
-            self._connection.transaction_commit()
+            self._write(candidate, claimed)
+            self._commit()
             return claimed
         except Exception:
-            self._connection.transaction_abort()
+            self._abort()
             raise
 
     def get_by_claim(self, claim_id: str) -> ImportJob:
@@ -396,10 +460,10 @@ LIMIT 1
                     self._media_base_url,
                 )
             )
-            self._connection.transaction_update(self._replace(persisted, updated))
-            self._connection.transaction_commit()
+            self._write(persisted, updated)
+            self._commit()
         except Exception:
-            self._connection.transaction_abort()
+            self._abort()
             raise
 
     def _commit_target_context(
@@ -470,6 +534,44 @@ LIMIT 1
                 "A deterministic resource or asset already exists."
             )
 
+    def reindex(self, *, batch_size: int = REINDEX_BATCH_SIZE) -> int:
+        """Rewrite jobs persisted before the current index version.
+
+        Jobs written by earlier releases lack the indexed state and are
+        therefore omitted from state-filtered listings until they are rewritten
+        once. Each bounded batch commits separately and the command is safe to
+        repeat.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive.")
+        query = f"""
+SELECT ?payload
+WHERE {{ GRAPH {IMPORT_GRAPH.n3()} {{
+  ?job {RDF.type.n3()} {IMPORT_JOB_CLASS.n3()} ; {PAYLOAD.n3()} ?payload .
+  FILTER NOT EXISTS {{
+    ?job {INDEX_VERSION.n3()} {Literal(CURRENT_INDEX_VERSION).n3()} .
+  }}
+}} }}
+LIMIT {batch_size}
+"""
+        total = 0
+        while True:
+            self._connection.transaction_start()
+            try:
+                jobs = [
+                    ImportJob.from_dict(json.loads(row["payload"]["value"]))
+                    for row in _bindings(self._connection.transaction_query(query))
+                ]
+                for job in jobs:
+                    self._write(job, job)
+                self._commit()
+            except Exception:
+                self._abort()
+                raise
+            total += len(jobs)
+            if len(jobs) < batch_size:
+                return total
+
     def _get_transactional(self, import_id: str) -> ImportJob:
         rows = _bindings(
             self._connection.transaction_query(self._select_one(import_id))
@@ -513,30 +615,96 @@ ASK {{ GRAPH {IMPORT_GRAPH.n3()} {{ {_job_iri(import_id).n3()} {RDF.type.n3()} {
         job: ImportJob,
         quota_limit_bytes: int,
         *,
-        transactional: bool,
-        excluding: str | None = None,
+        current: ImportJob | None = None,
     ) -> None:
-        exclusion = f"FILTER(?job != {_job_iri(excluding).n3()})" if excluding else ""
+        area = job.target.staging_area_iri
+        self._hold_quota_lease()
         query = f"""
-SELECT (COALESCE(SUM(?reserved), 0) AS ?used)
+SELECT ?reserved
 WHERE {{
   GRAPH {IMPORT_GRAPH.n3()} {{
-    ?job {STAGING_AREA.n3()} {URIRef(job.target.staging_area_iri).n3()} ;
-         {QUOTA_RESERVED.n3()} ?reserved .
-    {exclusion}
+    {QUOTA_COUNTERS.n3()} {RDF.type.n3()} {IMPORT_QUOTA_CLASS.n3()} .
+    OPTIONAL {{ {_quota_iri(area).n3()} {QUOTA_COUNTER_RESERVED.n3()} ?reserved . }}
   }}
 }}
 """
-        result = (
-            self._connection.transaction_query(query)
-            if transactional
-            else self._connection.query(query)
-        )
-        rows = _bindings(result)
-        used = int(rows[0]["used"]["value"]) if rows else 0
+        rows = _bindings(self._connection.transaction_query(query))
+        if len(rows) == 1:
+            reserved = rows[0].get("reserved")
+            used = int(reserved["value"]) if reserved else 0
+        else:
+            used = self._write_quota_counters().get(area, 0)
+        if current is not None:
+            used -= current.quota_reserved_bytes
         if used + job.quota_reserved_bytes > quota_limit_bytes:
             raise ImportQuotaExceededError("The staging-area quota is exhausted.")
 
+    def reconcile_quota_counters(self) -> int:
+        """Recompute all staging-area counters from the job payloads.
+
+        Returns the number of staging areas that currently hold reservations.
+        """
+        self._connection.transaction_start()
+        try:
+            self._hold_quota_lease()
+            counters = self._write_quota_counters()
+            self._commit()
+        except Exception:
+            self._abort()
+            raise
+        return len(counters)
+
+    def _write(self, current: ImportJob, updated: ImportJob) -> None:
+        self._connection.transaction_update(self._replace(current, updated))
+        self._move_quota(current, updated)
+
+    def _move_quota(self, current: ImportJob | None, updated: ImportJob) -> None:
+        update = _quota_counter_update(current, updated)
+        if update:
+            self._hold_quota_lease()
+            self._connection.transaction_update(update)
+
+    def _hold_quota_lease(self) -> None:
+        if self._quota_lease is not None:
+            self._quota_lease.hold()
+
+    def _commit(self) -> None:
+        try:
+            self._connection.transaction_commit()
+        finally:
+            if self._quota_lease is not None:
+                self._quota_lease.release()
+
+    def _abort(self) -> None:
+        try:
+            self._connection.transaction_abort()
+        finally:
+            if self._quota_lease is not None:
+                self._quota_lease.release()
+
+    def _write_quota_counters(self) -> dict[str, int]:
+        counters: dict[str, int] = {}
+        for job in self._all(transactional=True):
+            if job.quota_reserved_bytes:
+                area = job.target.staging_area_iri
+                counters[area] = counters.get(area, 0) + job.quota_reserved_bytes
+        self._connection.transaction_update(f"""
+DELETE WHERE {{ GRAPH {IMPORT_GRAPH.n3()} {{
+  ?counter {RDF.type.n3()} {IMPORT_QUOTA_CLASS.n3()} ; ?property ?value .
+}} }}
+""")
+        triples = [f"{QUOTA_COUNTERS.n3()} {RDF.type.n3()} {IMPORT_QUOTA_CLASS.n3()} ."]
+        triples.extend(
+            f"{_quota_iri(area).n3()} {RDF.type.n3()} {IMPORT_QUOTA_CLASS.n3()} ; "
+            f"{QUOTA_COUNTER_FOR.n3()} {URIRef(area).n3()} ; "
+            f"{QUOTA_COUNTER_RESERVED.n3()} {Literal(reserved).n3()} ."
+            for area, reserved in sorted(counters.items())
+        )
+        self._connection.transaction_update(
+            f"INSERT DATA {{ GRAPH {IMPORT_GRAPH.n3()} {{ {' '.join(triples)} }} }}"
+        )
+        return counters
+
     @staticmethod
     def _select_one(import_id: str) -> str:
         return f"""
@@ -570,6 +738,44 @@ def _job_iri(import_id: str) -> URIRef:
     return URIRef(f"urn:oldap:import:{import_id}")
 
 
+def _quota_iri(staging_area_iri: str) -> URIRef:
+    digest = hashlib.sha256(staging_area_iri.encode("utf-8")).hexdigest()
+    return URIRef(f"urn:oldap:import-quota:{digest}")
+
+
+def _quota_counter_update(current: ImportJob | None, updated: ImportJob) -> str:
+    """Move one job's reservation after its write has been applied.
+
+    The update only matches once the job carries its new stateVersion, so a
+    rejected optimistic write never moves the counter. Counters that have not
+    been initialized are left absent for the next full recomputation.
+    """
+    delta = updated.quota_reserved_bytes - (
+        current.quota_reserved_bytes if current is not None else 0
+    )
+    if delta == 0:
+        return ""
+    graph = IMPORT_GRAPH.n3()
+    counter = _quota_iri(updated.target.staging_area_iri).n3()
+    version = Literal(updated.state_version, datatype=XSD.integer).n3()
+    return f"""
+DELETE {{ GRAPH {graph} {{ {counter} {QUOTA_COUNTER_RESERVED.n3()} ?reserved . }} }}
+INSERT {{ GRAPH {graph} {{
+  {counter} {RDF.type.n3()} {IMPORT_QUOTA_CLASS.n3()} ;
+    {QUOTA_COUNTER_FOR.n3()} {URIRef(updated.target.staging_area_iri).n3()} ;
+    {QUOTA_COUNTER_RESERVED.n3()} ?next .
+}} }}
+WHERE {{
+  GRAPH {graph} {{
+    {QUOTA_COUNTERS.n3()} {RDF.type.n3()} {IMPORT_QUOTA_CLASS.n3()} .
+    {_job_iri(updated.import_id).n3()} {STATE_VERSION.n3()} {version} .
+    OPTIONAL {{ {counter} {QUOTA_COUNTER_RESERVED.n3()} ?reserved . }}
+  }}
+  BIND(COALESCE(?reserved, 0) + {Literal(delta).n3()} AS ?next)
+}}
+"""
+
+
 def _job_triples(job: ImportJob) -> str:
     payload = json.dumps(
         job.to_dict(internal=True),
@@ -587,7 +793,9 @@ def _job_triples(job: ImportJob) -> str:
   {PAYLOAD.n3()} {Literal(payload).n3()} ;
   {OWNER.n3()} {URIRef(job.requested_by_iri).n3()} ;
   {STAGING_AREA.n3()} {URIRef(job.target.staging_area_iri).n3()} ;
+  {STATE.n3()} {Literal(job.state.value).n3()} ;
   {STATE_VERSION.n3()} {Literal(job.state_version, datatype=XSD.integer).n3()} ;
+  {INDEX_VERSION.n3()} {Literal(CURRENT_INDEX_VERSION).n3()} ;
   {QUOTA_RESERVED.n3()} {Literal(job.quota_reserved_bytes, datatype=XSD.integer).n3()} ;
 {active_claim}
   {CREATED_AT.n3()} {Literal(job.created_at, datatype=XSD.dateTime).n3()} .
@@ -141,23 +141,12 @@ class ImportJobService:
         """List caller-owned jobs through an opaque, stable cursor."""
         if not 1 <= limit <= 100:
             raise ImportValidationError("limit must be between 1 and 100.")
-        jobs = self._repository.list_for_owner(str(connection.userIri))
-        if state is not None:
-            jobs = [job for job in jobs if job.state is state]
-        start = 0
-        if cursor is not None:
-            cursor_key = _decode_cursor(cursor)
-            try:
-                start = next(
-                    index + 1
-                    for index, job in enumerate(jobs)
-                    if (job.created_at, job.import_id) == cursor_key
-                )
-            except StopIteration as error:
-                raise ImportValidationError(
-                    "cursor does not identify a job in this result set."
-                ) from error
-        selected = jobs[start : start + limit + 1]
+        selected = self._repository.list_for_owner(
+            str(connection.userIri),
+            state=state,
+            after=_decode_cursor(cursor) if cursor is not None else None,
+            limit=limit + 1,
+        )
         items = tuple(selected[:limit])
         next_cursor = (
             _encode_cursor(items[-1]) if len(selected) > limit and items else None
@@ -659,6 +648,11 @@ class ImportJobService:
             raise
         return updated, commit.event_id, resources
 
+    def staging_area_iri(self, import_id: str) -> str:
+        """Return the StagingArea an import commits into, for write coordination."""
+        _validate_uuid(import_id)
+        return self._repository.get(import_id).target.staging_area_iri
+
     def fail_import(
         self,
         import_id: str,
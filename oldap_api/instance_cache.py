@@ -0,0 +1,183 @@
+"""Per-project caches that reduce a warm instance read to one SPARQL query.
+
+``read_instance`` needs the asserted types of the requested IRI and the
+generated resource class of the selected type before it can read the data.
+Both are derived from project state that changes rarely compared to how often
+instances are read, so this module keeps them per process under the project's
+current data-graph stamp. Any successful write to the project's data, model,
+or lists in any worker advances the stamp and discards the project's entries;
+transform and delete routes additionally forget the affected IRIs at once.
+
+Only class-level models are kept, never instances, values, or connections, and
+type entries carry no permission decision: the data read itself remains
+permission-checked for every request.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any
+
+from redis.exceptions import RedisError
+
+from oldap_api.data_stamps import DataGraphStamps
+
+MAX_CACHED_IRIS = 50_000
+
+
+@dataclass(frozen=True)
+class CachedInstanceClass:
+    """The parts of a generated resource class that a read needs."""
+
+    properties: Mapping[Any, Any]
+    resolved: Mapping[Any, Any]
+
+    def resolved_properties(self) -> dict[Any, Any]:
+        return dict(self.resolved)
+
+
+@dataclass
+class _ProjectEntries:
+    stamp: str
+    types: OrderedDict[str, tuple[list[str], Any]] = field(default_factory=OrderedDict)
+    classes: dict[str, CachedInstanceClass] = field(default_factory=dict)
+
+
+class InstanceReadCache:
+    """IRI-to-type and generated-class caches, scoped by data-graph stamp."""
+
+    def __init__(
+        self,
+        *,
+        stamps: DataGraphStamps | None = None,
+        max_iris: int = MAX_CACHED_IRIS,
+    ) -> None:
+        self._lock = Lock()
+        self._stamps = stamps
+        self._max_iris = max_iris
+        self._projects: dict[str, _ProjectEntries] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def stamp(self, project: str) -> str | None:
+        """Return the project's current stamp, or ``None`` to bypass caching."""
+
+        try:
+            if self._stamps is None:
+                self._stamps = DataGraphStamps()
+            return self._stamps.current(project)
+        except RedisError:
+            return None
+
+    def types(
+        self, project: str, stamp: str | None, iri: str
+    ) -> tuple[list[str], Any] | None:
+        """Return the cached asserted types and selected class of one IRI."""
+
+        with self._lock:
+            entries = self._entries(project, stamp)
+            value = entries.types.get(iri) if entries is not None else None
+            if value is None:
+                self.misses += 1
+                return None
+            entries.types.move_to_end(iri)
+            self.hits += 1
+            return list(value[0]), value[1]
+
+    def store_types(
+        self,
+        project: str,
+        stamp: str | None,
+        iri: str,
+        asserted_types: list[str],
+        resource: Any,
+    ) -> None:
+        """Remember the types read for an existing IRI."""
+
+        with self._lock:
+            entries = self._entries(project, stamp, create=True)
+            if entries is None:
+                return
+            entries.types[iri] = (list(asserted_types), resource)
+            entries.types.move_to_end(iri)
+            while len(entries.types) > self._max_iris:
+                entries.types.popitem(last=False)
+
+    def instance_class(
+        self, project: str, stamp: str | None, resource: Any
+    ) -> CachedInstanceClass | None:
+        """Return the cached class model of one resource class."""
+
+        with self._lock:
+            entries = self._entries(project, stamp)
+            value = entries.classes.get(str(resource)) if entries is not None else None
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def store_instance_class(
+        self, project: str, stamp: str | None, resource: Any, generated: Any
+    ) -> CachedInstanceClass:
+        """Keep the class model of a class generated by the project factory."""
+
+        value = CachedInstanceClass(
+            properties=dict(generated.properties),
+            resolved=generated.resolved_properties(),
+        )
+        with self._lock:
+            entries = self._entries(project, stamp, create=True)
+            if entries is not None:
+                entries.classes[str(resource)] = value
+        return value
+
+    def forget(self, project: str, *iris: str) -> None:
+        """Drop the cached types of IRIs whose class or existence changed."""
+
+        with self._lock:
+            entries = self._projects.get(project)
+            if entries is not None:
+                for iri in iris:
+                    entries.types.pop(iri, None)
+
+    def stats(self) -> dict[str, int]:
+        """Return hit, miss, and entry counters for operational diagnostics."""
+
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "projects": len(self._projects),
+                "iris": sum(len(item.types) for item in self._projects.values()),
+                "classes": sum(len(item.classes) for item in self._projects.values()),
+            }
+
+    def clear(self) -> None:
+        """Drop all cached entries and reset the counters."""
+
+        with self._lock:
+            self._projects.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _entries(
+        self, project: str, stamp: str | None, *, create: bool = False
+    ) -> _ProjectEntries | None:
+        if stamp is None:
+            return None
+        entries = self._projects.get(project)
+        if entries is not None and entries.stamp == stamp:
+            return entries
+        if entries is not None:
+            del self._projects[project]
+        if not create:
+            return None
+        entries = self._projects[project] = _ProjectEntries(stamp)
+        return entries
+
+
+INSTANCE_READ_CACHE = InstanceReadCache()
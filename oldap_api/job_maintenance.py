@@ -0,0 +1,151 @@
+"""Operator maintenance for the durable ZIP job graphs.
+
+Run it inside the deployed API container so that it uses the same GraphDB
+endpoint and restricted service identity as the API itself::
+
+    python -m oldap_api.job_maintenance export-reindex
+    python -m oldap_api.job_maintenance import-reindex
+    python -m oldap_api.job_maintenance export-reconcile-quotas
+    python -m oldap_api.job_maintenance import-reconcile-quotas
+
+``export-reindex`` rewrites export jobs persisted by an earlier release so that
+their derived worker-queue facts exist. Until it has run once after an upgrade,
+such legacy jobs are not claimed, expired, or purged. ``import-reindex`` does
+the same for the indexed import state used by state-filtered job listings.
+Both commands are idempotent and commit in bounded batches.
+
+The ``*-reconcile-quotas`` commands recompute the incrementally maintained
+quota counters from the authoritative job payloads in one transaction. Job
+creation initializes missing counters by itself; reconciliation is only needed
+after the job graph was edited outside the API.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from typing import Sequence
+
+from oldaplib.src.connection import Connection
+from oldaplib.src.helpers.oldaperror import OldapError
+
+from oldap_api.exports.repository import (
+    REINDEX_BATCH_SIZE,
+    GraphDbExportJobRepository,
+)
+from oldap_api.imports.repository import GraphDbImportJobRepository
+from oldap_api.staging_lock import (
+    EXPORT_QUOTA_SCOPE,
+    IMPORT_QUOTA_SCOPE,
+    RedisQuotaLease,
+    StagingMutationLockUnavailable,
+)
+
+
+def export_service_connection() -> Connection:
+    """Open the restricted non-token-issuing export service connection."""
+
+    return _service_connection("OLDAP_EXPORT_SERVICE")
+
+
+def import_service_connection() -> Connection:
+    """Open the dedicated non-token-issuing import service connection."""
+
+    return _service_connection("OLDAP_IMPORT_SERVICE")
+
+
+def _service_connection(prefix: str) -> Connection:
+    user_id = os.getenv(f"{prefix}_USER")
+    password = os.getenv(f"{prefix}_PASSWORD")
+    if not user_id or not password:
+        raise ValueError(f"{prefix}_USER and {prefix}_PASSWORD must be configured.")
+    return Connection(
+        userId=user_id,
+        credentials=password,
+        context_name="DEFAULT",
+        issue_access_token=False,
+    )
+
+
+def export_reindex(args: argparse.Namespace) -> str:
+    """Backfill the export queue index and describe the result."""
+
+    repository = GraphDbExportJobRepository(export_service_connection())
+    count = repository.reindex_queue(batch_size=args.batch_size)
+    return f"Reindexed {count} export job(s)."
+
+
+def import_reindex(args: argparse.Namespace) -> str:
+    """Backfill the import state index and describe the result."""
+
+    repository = GraphDbImportJobRepository(import_service_connection())
+    count = repository.reindex(batch_size=args.batch_size)
+    return f"Reindexed {count} import job(s)."
+
+
+def export_reconcile_quotas(args: argparse.Namespace) -> str:
+    """Recompute the export quota counters and describe the result."""
+
+    repository = GraphDbExportJobRepository(
+        export_service_connection(), quota_lease=RedisQuotaLease(EXPORT_QUOTA_SCOPE)
+    )
+    count = repository.reconcile_quota_counters()
+    return f"Reconciled export quota counters for {count} user(s)."
+
+
+def import_reconcile_quotas(args: argparse.Namespace) -> str:
+    """Recompute the staging-area quota counters and describe the result."""
+
+    repository = GraphDbImportJobRepository(
+        import_service_connection(), quota_lease=RedisQuotaLease(IMPORT_QUOTA_SCOPE)
+    )
+    count = repository.reconcile_quota_counters()
+    return f"Reconciled import quota counters for {count} staging area(s)."
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the command-line parser for the maintenance utility."""
+
+    parser = argparse.ArgumentParser(
+        description="Maintain durable OLDAP ZIP import/export job graphs."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    reindex = commands.add_parser(
+        "export-reindex",
+        help="Backfill derived queue facts for export jobs from earlier releases.",
+    )
+    reindex.add_argument("--batch-size", type=int, default=REINDEX_BATCH_SIZE)
+    reindex.set_defaults(handler=export_reindex)
+    reindex = commands.add_parser(
+        "import-reindex",
+        help="Backfill indexed state for import jobs from earlier releases.",
+    )
+    reindex.add_argument("--batch-size", type=int, default=REINDEX_BATCH_SIZE)
+    reindex.set_defaults(handler=import_reindex)
+    commands.add_parser(
+        "export-reconcile-quotas",
+        help="Recompute export quota counters from the persisted jobs.",
+    ).set_defaults(handler=export_reconcile_quotas)
+    commands.add_parser(
+        "import-reconcile-quotas",
+        help="Recompute staging-area quota counters from the persisted jobs.",
+    ).set_defaults(handler=import_reconcile_quotas)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run one maintenance command and return a process exit status."""
+
+    args = build_parser().parse_args(argv)
+    try:
+        message = args.handler(args)
+    except (ValueError, OldapError, StagingMutationLockUnavailable) as error:
+        print(f"Maintenance failed: {type(error).__name__}: {error}", file=sys.stderr)
+        return 1
+    print(message)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
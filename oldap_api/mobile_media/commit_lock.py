@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import TypeVar
 
 from redis import Redis
-from redis.exceptions import LockError, RedisError
+from redis.exceptions import RedisError
 
 from oldap_api.staging_lock import (
     STAGING_MUTATION_LEASE_SECONDS,
     STAGING_MUTATION_LOCK_NAME,
     STAGING_MUTATION_WAIT_SECONDS,
+    StagingMutationQueueFull,
+    acquire_leases,
+    release_leases,
 )
 from oldap_api.redis_config import staging_lock_redis_url
 
@@ -24,8 +27,9 @@ class RedisMobileMediaCommitLock:
     """Serialize GraphDB check-and-insert transactions across API workers.
 
     GraphDB exposes read-committed transactions, so two workers can otherwise
-    both observe an absent receipt before either transaction commits. A single
-    short Redis lease closes that race. The permanent GraphDB receipt remains
+    both observe an absent receipt before either transaction commits. Short
+    Redis leases on the target StagingArea and on the receipt stripes of the
+    commit's identifiers close that race. The permanent GraphDB receipt remains
     the source of truth; Redis holds no result or ownership data.
     """
 
@@ -41,21 +45,25 @@ class RedisMobileMediaCommitLock:
             socket_timeout=5,
         )
 
-    def run(self, operation: Callable[[], T]) -> T:
-        """Run one commit while holding the bounded global write lease."""
+    def run(self, operation: Callable[[], T], scopes: Iterable[str]) -> T:
+        """Run one commit while holding the bounded write leases of ``scopes``."""
 
-        lock = self._client.lock(
-            self.LOCK_NAME,
-            timeout=self.LEASE_SECONDS,
-            blocking_timeout=self.WAIT_SECONDS,
-        )
         try:
-            acquired = lock.acquire(blocking=True)
+            leases = acquire_leases(
+                self._client,
+                scopes,
+                timeout=self.LEASE_SECONDS,
+                blocking_timeout=self.WAIT_SECONDS,
+            )
         except RedisError as error:
             raise MobileMediaServiceUnavailableError(
                 "Mobile-media commit coordination is unavailable."
             ) from error
-        if not acquired:
+        except StagingMutationQueueFull as error:
+            raise MobileMediaServiceUnavailableError(
+                "Too many mobile-media commits are waiting."
+            ) from error
+        if leases is None:
             raise MobileMediaServiceUnavailableError(
                 "Another mobile-media commit is still active."
             )
@@ -63,18 +71,13 @@ class RedisMobileMediaCommitLock:
         try:
             result = operation()
         except Exception:
-            try:
-                lock.release()
-            except (LockError, RedisError):
-                pass
+            release_leases(self._client, leases)
             raise
 
-        try:
-            lock.release()
-        except (LockError, RedisError) as error:
+        if not release_leases(self._client, leases):
             # The GraphDB result may already be durable. Returning retryable 503
             # makes the caller resolve the permanent receipt on its next attempt.
             raise MobileMediaServiceUnavailableError(
                 "Mobile-media commit coordination was lost."
-            ) from error
+            )
         return result
@@ -16,6 +16,7 @@ import rfc8785
 MAX_ORIGINAL_BYTES = 100 * 1024 * 1024
 MAX_ORIGINAL_NAME_BYTES = 255
 MAX_COMMENT_CHARACTERS = 2_000
+MAX_BATCH_COMMITS = 100
 CHECKSUM_RE = re.compile(r"^sha256:([0-9a-f]{64})$")
 SUPPORTED_IMAGE_MIME_TYPES = frozenset(
     {"image/jpeg", "image/png", "image/heic", "image/heif"}
@@ -305,6 +306,38 @@ def validate_mobile_media_commit(upload_id: str, value: Any) -> MobileMediaCommi
     return replace(provisional, request_digest=hashlib.sha256(canonical).hexdigest())
 
 
+def validate_mobile_media_batch(value: Any) -> tuple[MobileMediaCommit, ...]:
+    """Validate a closed batch of commit requests, each naming its own upload.
+
+    One batch must not repeat an event, upload, or client asset identity, so
+    every item maps to exactly one permanent receipt.
+    """
+
+    if (
+        not isinstance(value, dict)
+        or set(value) != {"commits"}
+        or not isinstance(value["commits"], list)
+        or not 1 <= len(value["commits"]) <= MAX_BATCH_COMMITS
+    ):
+        raise MobileMediaValidationError("The mobile-media batch fields are invalid.")
+    commits = tuple(
+        validate_mobile_media_commit(
+            item.get("uploadId") if isinstance(item, dict) else None, item
+        )
+        for item in value["commits"]
+    )
+    for identities in (
+        [commit.event_id for commit in commits],
+        [commit.upload_id for commit in commits],
+        [commit.client_asset_id for commit in commits],
+    ):
+        if len(set(identities)) != len(identities):
+            raise MobileMediaValidationError(
+                "The mobile-media batch repeats an identity."
+            )
+    return commits
+
+
 def _publication(
     value: Any,
     upload_id: str,
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import os
 import re
+from collections.abc import Sequence
 from dataclasses import dataclass, replace
 from datetime import UTC, datetime
 from typing import Any, Protocol
@@ -174,6 +175,89 @@ class GraphDbMobileMediaRepository:
             self._connection.transaction_abort()
             raise
 
+    def commit_batch(
+        self,
+        commits: Sequence[MobileMediaCommit],
+        *,
+        committed_at: datetime | None = None,
+    ) -> list[MobileMediaCommitResult]:
+        """Create or exactly replay several registrations in one transaction.
+
+        Receipts and collisions of all items are checked with one query each,
+        and target, permission, and inbox with one query each per owner and
+        StagingArea. Items that already have an exact receipt return its stored
+        result; the remaining items are inserted together or not at all.
+        """
+
+        timestamp = (committed_at or datetime.now(UTC)).astimezone(UTC)
+        self._connection.transaction_start()
+        try:
+            results = self._existing_receipts(commits)
+            pending = [commit for commit in commits if commit.upload_id not in results]
+            if not pending:
+                self._connection.transaction_commit()
+                return [results[commit.upload_id] for commit in commits]
+
+            areas: dict[tuple[str, str], list[MobileMediaCommit]] = {}
+            for commit in pending:
+                areas.setdefault(
+                    (commit.owner_user_iri, commit.staging_area_id), []
+                ).append(commit)
+            targets: dict[str, MobileMediaTarget] = {}
+            for group in areas.values():
+                target = self._resolve_target(group[0])
+                if any(
+                    commit.publication.storage_path != target.storage_path
+                    for commit in group
+                ):
+                    raise MobileMediaDestinationChangedError(
+                        "The published media path no longer matches the StagingArea."
+                    )
+                if not _ask(
+                    self._connection.transaction_query(
+                        _admin_create_query(group[0], target.project_iri)
+                    )
+                ):
+                    raise MobileMediaUploadPermissionDeniedError(
+                        "Current media creation permission is unavailable."
+                    )
+                target = self._resolve_inbox(group[0], target)
+                targets.update((commit.upload_id, target) for commit in group)
+            if _ask(
+                self._connection.transaction_query(_batch_collision_query(pending))
+            ):
+                raise MobileMediaCommitConflict(
+                    "The mobile-media identity conflicts with existing data."
+                )
+
+            inserts = []
+            for commit in pending:
+                result = MobileMediaCommitResult(
+                    event_id=commit.event_id,
+                    upload_id=commit.upload_id,
+                    client_asset_id=commit.client_asset_id,
+                    staging_area_id=commit.staging_area_id,
+                    asset_id=commit.client_asset_id,
+                    resource_iri=commit.resource_iri,
+                    checksum=commit.checksum,
+                    committed_at=timestamp,
+                )
+                results[commit.upload_id] = result
+                inserts.append(
+                    _insert_graphs(
+                        commit,
+                        result,
+                        targets[commit.upload_id],
+                        media_base_url=self._media_base_url,
+                    )
+                )
+            self._connection.transaction_update(_insert_data(inserts))
+            self._connection.transaction_commit()
+            return [results[commit.upload_id] for commit in commits]
+        except Exception:
+            self._connection.transaction_abort()
+            raise
+
     def _existing_receipt(
         self, commit: MobileMediaCommit
     ) -> MobileMediaCommitResult | None:
@@ -184,40 +268,35 @@ class GraphDbMobileMediaRepository:
             raise MobileMediaCommitConflict(
                 "The mobile-media identity conflicts with existing data."
             )
-        row = rows[0]
-        try:
-            receipt_iri = row["receipt"]["value"]
-            event_id = row["eventId"]["value"]
-            request_digest = row["requestDigest"]["value"]
-            owner = row["owner"]["value"]
-            staging_area = row["stagingArea"]["value"]
-            resource = row["resource"]["value"]
-            result = MobileMediaCommitResult.from_dict(
-                json.loads(row["result"]["value"])
-            )
-        except (KeyError, TypeError, ValueError, json.JSONDecodeError) as error:
-            raise MobileMediaServiceUnavailableError(
-                "The permanent mobile-media receipt is invalid."
-            ) from error
-        if (
-            receipt_iri != commit.receipt_iri
-            or event_id != commit.event_id
-            or request_digest != commit.request_digest
-            or owner != commit.owner_user_iri
-            or staging_area != commit.staging_area_id
-            or resource != commit.resource_iri
-            or result.event_id != commit.event_id
-            or result.upload_id != commit.upload_id
-            or result.client_asset_id != commit.client_asset_id
-            or result.asset_id != commit.client_asset_id
-            or result.staging_area_id != commit.staging_area_id
-            or result.resource_iri != commit.resource_iri
-            or result.checksum != commit.checksum
-        ):
-            raise MobileMediaCommitConflict(
-                "The mobile-media identity conflicts with existing data."
-            )
-        return result
+        return _replayed_result(commit, rows[0])
+
+    def _existing_receipts(
+        self, commits: Sequence[MobileMediaCommit]
+    ) -> dict[str, MobileMediaCommitResult]:
+        """Return the replayed results of ``commits`` by upload ID."""
+
+        rows = _bindings(
+            self._connection.transaction_query(_batch_receipt_query(commits))
+        )
+        matches: dict[str, list[dict[str, Any]]] = {}
+        for row in rows:
+            owners = [commit for commit in commits if _receipt_matches(commit, row)]
+            if not owners:
+                raise MobileMediaCommitConflict(
+                    "The mobile-media identity conflicts with existing data."
+                )
+            for commit in owners:
+                matches.setdefault(commit.upload_id, []).append(row)
+        results = {}
+        for commit in commits:
+            found = matches.get(commit.upload_id, [])
+            if len(found) > 1:
+                raise MobileMediaCommitConflict(
+                    "The mobile-media identity conflicts with existing data."
+                )
+            if found:
+                results[commit.upload_id] = _replayed_result(commit, found[0])
+        return results
 
     def _resolve_target(self, commit: MobileMediaCommit) -> MobileMediaTarget:
         rows = _bindings(self._connection.transaction_query(_target_query(commit)))
@@ -276,6 +355,59 @@ class GraphDbMobileMediaRepository:
         return replace(target, mobile_folder_iri=mobile)
 
 
+def _replayed_result(
+    commit: MobileMediaCommit, row: dict[str, Any]
+) -> MobileMediaCommitResult:
+    """Return the stored result of a receipt that exactly matches ``commit``."""
+
+    try:
+        receipt_iri = row["receipt"]["value"]
+        event_id = row["eventId"]["value"]
+        request_digest = row["requestDigest"]["value"]
+        owner = row["owner"]["value"]
+        staging_area = row["stagingArea"]["value"]
+        resource = row["resource"]["value"]
+        result = MobileMediaCommitResult.from_dict(json.loads(row["result"]["value"]))
+    except (KeyError, TypeError, ValueError, json.JSONDecodeError) as error:
+        raise MobileMediaServiceUnavailableError(
+            "The permanent mobile-media receipt is invalid."
+        ) from error
+    if (
+        receipt_iri != commit.receipt_iri
+        or event_id != commit.event_id
+        or request_digest != commit.request_digest
+        or owner != commit.owner_user_iri
+        or staging_area != commit.staging_area_id
+        or resource != commit.resource_iri
+        or result.event_id != commit.event_id
+        or result.upload_id != commit.upload_id
+        or result.client_asset_id != commit.client_asset_id
+        or result.asset_id != commit.client_asset_id
+        or result.staging_area_id != commit.staging_area_id
+        or result.resource_iri != commit.resource_iri
+        or result.checksum != commit.checksum
+    ):
+        raise MobileMediaCommitConflict(
+            "The mobile-media identity conflicts with existing data."
+        )
+    return result
+
+
+def _receipt_matches(commit: MobileMediaCommit, row: dict[str, Any]) -> bool:
+    """Return whether a stored receipt shares any identity with ``commit``."""
+
+    def value(name: str) -> Any:
+        binding = row.get(name)
+        return binding.get("value") if isinstance(binding, dict) else None
+
+    return (
+        value("receipt") == commit.receipt_iri
+        or value("storedUploadId") == commit.upload_id
+        or value("storedClientAssetId") == commit.client_asset_id
+        or value("eventId") == commit.event_id
+    )
+
+
 def _bindings(value: Any) -> list[dict[str, Any]]:
     if not isinstance(value, dict):
         raise MobileMediaServiceUnavailableError(
@@ -336,6 +468,48 @@ LIMIT 2
 """
 
 
+def _batch_receipt_query(commits: Sequence[MobileMediaCommit]) -> str:
+    receipts = " ".join(URIRef(commit.receipt_iri).n3() for commit in commits)
+    upload_ids = " ".join(Literal(commit.upload_id).n3() for commit in commits)
+    client_asset_ids = " ".join(
+        Literal(commit.client_asset_id).n3() for commit in commits
+    )
+    event_ids = " ".join(Literal(commit.event_id).n3() for commit in commits)
+    return f"""
+SELECT DISTINCT ?receipt ?storedUploadId ?storedClientAssetId ?eventId
+  ?requestDigest ?owner ?stagingArea ?resource ?result
+WHERE {{
+  GRAPH {RECEIPT_GRAPH.n3()} {{
+    {{ VALUES ?receipt {{ {receipts} }} }}
+    UNION
+    {{
+      VALUES ?storedUploadId {{ {upload_ids} }}
+      ?receipt {UPLOAD_ID.n3()} ?storedUploadId .
+    }}
+    UNION
+    {{
+      VALUES ?storedClientAssetId {{ {client_asset_ids} }}
+      ?receipt {CLIENT_ASSET_ID.n3()} ?storedClientAssetId .
+    }}
+    UNION
+    {{
+      VALUES ?eventId {{ {event_ids} }}
+      ?receipt {EVENT_ID.n3()} ?eventId .
+    }}
+    ?receipt {RDF.type.n3()} {RECEIPT_CLASS.n3()} .
+    OPTIONAL {{ ?receipt {UPLOAD_ID.n3()} ?storedUploadId . }}
+    OPTIONAL {{ ?receipt {CLIENT_ASSET_ID.n3()} ?storedClientAssetId . }}
+    OPTIONAL {{ ?receipt {EVENT_ID.n3()} ?eventId . }}
+    OPTIONAL {{ ?receipt {REQUEST_DIGEST.n3()} ?requestDigest . }}
+    OPTIONAL {{ ?receipt {OWNER.n3()} ?owner . }}
+    OPTIONAL {{ ?receipt {STAGING_AREA.n3()} ?stagingArea . }}
+    OPTIONAL {{ ?receipt {RESOURCE.n3()} ?resource . }}
+    OPTIONAL {{ ?receipt {RESULT.n3()} ?result . }}
+  }}
+}}
+"""
+
+
 def _target_query(commit: MobileMediaCommit) -> str:
     owner = URIRef(commit.owner_user_iri).n3()
     area = URIRef(commit.staging_area_id).n3()
@@ -447,12 +621,59 @@ ASK {{
 """
 
 
+def _batch_collision_query(commits: Sequence[MobileMediaCommit]) -> str:
+    resources = " ".join(URIRef(commit.resource_iri).n3() for commit in commits)
+    assets = " ".join(Literal(commit.client_asset_id).n3() for commit in commits)
+    return f"""
+PREFIX shared: <http://oldap.org/shared#>
+ASK {{
+  GRAPH ?graph {{
+    {{
+      VALUES ?resource {{ {resources} }}
+      ?resource ?property ?value .
+    }}
+    UNION
+    {{
+      VALUES ?asset {{ {assets} }}
+      ?existing shared:assetId ?asset .
+    }}
+  }}
+}}
+"""
+
+
 def _atomic_insert(
     commit: MobileMediaCommit,
     result: MobileMediaCommitResult,
     target: MobileMediaTarget,
     *,
     media_base_url: str,
+) -> str:
+    return _insert_data(
+        [_insert_graphs(commit, result, target, media_base_url=media_base_url)]
+    )
+
+
+def _insert_data(graphs: Sequence[str]) -> str:
+    body = "\n".join(graphs)
+    return f"""
+PREFIX oldap: <http://oldap.org/base#>
+PREFIX shared: <http://oldap.org/shared#>
+PREFIX schema: <https://schema.org/>
+PREFIX dcterms: <http://purl.org/dc/terms/>
+PREFIX dcmitype: <http://purl.org/dc/dcmitype/>
+INSERT DATA {{
+{body}
+}}
+"""
+
+
+def _insert_graphs(
+    commit: MobileMediaCommit,
+    result: MobileMediaCommitResult,
+    target: MobileMediaTarget,
+    *,
+    media_base_url: str,
 ) -> str:
     graph = URIRef(target.data_graph_iri).n3()
     resource = URIRef(commit.resource_iri).n3()
@@ -469,13 +690,7 @@ def _atomic_insert(
         if commit.comment is not None
         else ""
     )
-    return f"""
-PREFIX oldap: <http://oldap.org/base#>
-PREFIX shared: <http://oldap.org/shared#>
-PREFIX schema: <https://schema.org/>
-PREFIX dcterms: <http://purl.org/dc/terms/>
-PREFIX dcmitype: <http://purl.org/dc/dcmitype/>
-INSERT DATA {{
+    return f"""\
   GRAPH {graph} {{
     {resource} a shared:StagingMediaObject ;
       dcterms:type dcmitype:StillImage ;
@@ -509,6 +724,4 @@ INSERT DATA {{
       {STAGING_AREA.n3()} {area} ;
       {RESOURCE.n3()} {resource} ;
       {RESULT.n3()} {result_json} .
-  }}
-}}
-"""
+  }}"""
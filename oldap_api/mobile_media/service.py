@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
+import hashlib
 from datetime import datetime
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Sequence
 from typing import Any, Protocol, TypeVar
 
+from oldap_api.staging_lock import staging_area_scope
+
 from .domain import (
     MobileMediaCommit,
     MobileMediaCommitResult,
+    validate_mobile_media_batch,
     validate_mobile_media_commit,
 )
 
+MOBILE_RECEIPT_STRIPES = 4096
+
 
 class MobileMediaRepository(Protocol):
     """Atomic persistence boundary consumed by the HTTP-independent service."""
@@ -20,6 +26,13 @@ class MobileMediaRepository(Protocol):
         self, commit: MobileMediaCommit, *, committed_at: datetime | None = None
     ) -> MobileMediaCommitResult: ...
 
+    def commit_batch(
+        self,
+        commits: Sequence[MobileMediaCommit],
+        *,
+        committed_at: datetime | None = None,
+    ) -> list[MobileMediaCommitResult]: ...
+
 
 T = TypeVar("T")
 
@@ -27,7 +40,7 @@ T = TypeVar("T")
 class MobileMediaCommitLock(Protocol):
     """Cross-worker boundary around receipt lookup and GraphDB insertion."""
 
-    def run(self, operation: Callable[[], T]) -> T: ...
+    def run(self, operation: Callable[[], T], scopes: Iterable[str]) -> T: ...
 
 
 class MobileMediaCommitService:
@@ -52,5 +65,48 @@ class MobileMediaCommitService:
 
         commit = validate_mobile_media_commit(upload_id, data)
         return self._commit_lock.run(
-            lambda: self._repository.commit(commit, committed_at=committed_at)
+            lambda: self._repository.commit(commit, committed_at=committed_at),
+            mobile_media_lock_scopes(commit),
         )
+
+    def commit_batch(
+        self,
+        data: Any,
+        *,
+        committed_at: datetime | None = None,
+    ) -> list[MobileMediaCommitResult]:
+        """Validate and atomically create or exactly replay a batch of media."""
+
+        commits = validate_mobile_media_batch(data)
+        return self._commit_lock.run(
+            lambda: self._repository.commit_batch(commits, committed_at=committed_at),
+            {scope for commit in commits for scope in mobile_media_lock_scopes(commit)},
+        )
+
+
+def mobile_media_lock_scopes(commit: MobileMediaCommit) -> tuple[str, ...]:
+    """Return the lock scopes of one commit's target area and receipt identifiers.
+
+    Receipts and resource collisions are checked deployment-wide by upload,
+    client asset, and event ID, so equal identifiers aimed at different areas
+    must still serialize. Each identifier is mapped onto one of
+    ``MOBILE_RECEIPT_STRIPES`` receipt leases of its kind, which bounds the
+    number of distinct lease names while unrelated batches seldom share one.
+    """
+
+    return tuple(
+        sorted(
+            {
+                staging_area_scope(commit.staging_area_id),
+                _receipt_stripe("upload", commit.upload_id),
+                _receipt_stripe("asset", commit.client_asset_id),
+                _receipt_stripe("event", commit.event_id),
+            }
+        )
+    )
+
+
+def _receipt_stripe(kind: str, identifier: str) -> str:
+    digest = hashlib.sha256(f"{kind}:{identifier}".encode("utf-8")).digest()
+    stripe = int.from_bytes(digest[:4]) % MOBILE_RECEIPT_STRIPES
+    return f"mobile-receipts:{kind}:{stripe}"
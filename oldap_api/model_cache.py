@@ -0,0 +1,345 @@
+"""Per-process cache of parsed project data models shared across requests.
+
+Every ``ResourceInstanceFactory`` reads the project, the shared project, and
+both data models before it can generate a class. Those reads are cheap in
+queries thanks to the oldaplib Redis cache, but decoding the SHACL/OWL model
+from JSON dominates many otherwise small requests. ``ProjectModelCache`` keeps
+the parsed objects per project under a model version kept in the API cache
+Redis and hands each request a deep copy rebound to the request's connection,
+so no model object is ever shared between two requests.
+
+The version of a project combines its own counter, the counter of the shared
+project, and one global counter. Successful writes through the data modelling
+and hierarchical list routes advance the counter of the project they name, and
+project administration advances the global counter, so every worker notices a
+model change with the single ``MGET`` it issues per checkout.
+
+``DatamodelDocumentCache`` keeps the serialized data model document under the
+same version, so steady-state reads of the model are a lookup and an ETag
+comparison.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from copy import deepcopy
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any
+
+from flask import Flask, Response, request
+from oldaplib.src.connection import Connection
+from oldaplib.src.datamodel import DataModel
+from oldaplib.src.enums.datapermissions import DataPermission
+from oldaplib.src.objectfactory import ResourceInstanceFactory
+from oldaplib.src.project import Project
+from oldaplib.src.xsd.iri import Iri
+from oldaplib.src.xsd.xsd_ncname import Xsd_NCName
+from redis import Redis
+from redis.exceptions import RedisError
+
+from oldap_api.data_stamps import MUTATING_METHODS
+from oldap_api.redis_config import cache_redis_url
+
+PROJECT_MODEL_VERSION_PREFIX = "oldap:model-version:project:"
+GLOBAL_MODEL_VERSION_KEY = "oldap:model-version:global"
+SHARED_PROJECT = "shared"
+
+# Blueprints whose successful writes may change a generated resource class.
+MODEL_BLUEPRINTS = frozenset({"datamodel", "hlist"})
+GLOBAL_MODEL_BLUEPRINTS = frozenset({"project"})
+
+logger = logging.getLogger(__name__)
+
+
+class ModelVersions:
+    """Read and advance per-project data-model versions."""
+
+    def __init__(self, client: Redis | None = None) -> None:
+        self._client = client or Redis.from_url(
+            cache_redis_url(),
+            decode_responses=True,
+            socket_connect_timeout=2,
+            socket_timeout=2,
+        )
+
+    def current(self, project_short_name: str) -> str:
+        """Return the combined project, shared, and global model version."""
+
+        values = self._client.mget(
+            [
+                _project_key(project_short_name),
+                _project_key(SHARED_PROJECT),
+                GLOBAL_MODEL_VERSION_KEY,
+            ]
+        )
+        return ".".join(str(int(value or 0)) for value in values)
+
+    def bump(self, project_short_name: str | None) -> None:
+        """Invalidate one project, or every project when none is named."""
+
+        self._client.incr(
+            _project_key(project_short_name)
+            if project_short_name
+            else GLOBAL_MODEL_VERSION_KEY
+        )
+
+
+@dataclass(frozen=True)
+class ProjectModels:
+    """The project objects a resource instance factory is built from."""
+
+    project: Project
+    shared_project: Project
+    datamodel: DataModel
+    shared_model: DataModel
+
+
+@dataclass(frozen=True)
+class _Entry:
+    version: str
+    connection: Any
+    models: ProjectModels
+
+
+class ProjectModelCache:
+    """Parsed project models, scoped by model version and copied per request."""
+
+    def __init__(self, *, versions: ModelVersions | None = None) -> None:
+        self._lock = Lock()
+        self._versions = versions
+        self._entries: dict[str, _Entry] = {}
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+
+    def models(self, con: Connection, project: str) -> ProjectModels:
+        """Return the models of ``project`` bound to ``con``.
+
+        Projects given by IRI and requests made while the version store is
+        unavailable are read directly and not cached.
+        """
+
+        version = self._version(project) if ":" not in project else None
+        if version is None:
+            with self._lock:
+                self.bypassed += 1
+            return _read_models(con, project)
+        with self._lock:
+            entry = self._entries.get(project)
+            if entry is not None and entry.version == version:
+                self.hits += 1
+            else:
+                entry = None
+                self.misses += 1
+        if entry is not None:
+            mark_list_node_context(con, project, SHARED_PROJECT)
+            return deepcopy(entry.models, {id(entry.connection): con})
+        models = _read_models(con, project)
+        entry = _Entry(version, con, deepcopy(models, {id(con): con}))
+        with self._lock:
+            self._entries[project] = entry
+        return models
+
+    def stats(self) -> dict[str, int]:
+        """Return hit, miss, and entry counters for operational diagnostics."""
+
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "bypassed": self.bypassed,
+                "projects": len(self._entries),
+            }
+
+    def clear(self) -> None:
+        """Drop all cached models and reset the counters."""
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.bypassed = 0
+
+    def _version(self, project: str) -> str | None:
+        try:
+            if self._versions is None:
+                self._versions = ModelVersions()
+            return self._versions.current(project)
+        except RedisError:
+            return None
+
+
+PROJECT_MODEL_CACHE = ProjectModelCache()
+
+
+class CachedResourceInstanceFactory(ResourceInstanceFactory):
+    """A ``ResourceInstanceFactory`` built from ``PROJECT_MODEL_CACHE``.
+
+    oldaplib has no public constructor from already read models, so this sets
+    the factory's private state itself. It therefore requires the exact oldaplib
+    release pinned in ``pyproject.toml``; ``test_model_cache`` fails when that
+    state changes.
+    """
+
+    def __init__(
+        self, con: Connection, project: Project | Iri | Xsd_NCName | str
+    ) -> None:
+        if isinstance(project, Project):
+            super().__init__(con=con, project=project)
+            return
+        models = PROJECT_MODEL_CACHE.models(con, str(project))
+        self._con = con
+        self._project = models.project
+        self._sharedProject = models.shared_project
+        self._user_default_roles = {
+            role: DataPermission.from_qname(permission)
+            for role, permission in (con._userdata.hasRole or {}).items()
+            if permission is not None
+        }
+        self._datamodel = models.datamodel
+        self._sharedModel = models.shared_model
+
+
+@dataclass(frozen=True)
+class DatamodelDocument:
+    """A serialized data model and its strong entity tag."""
+
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_body(cls, body: bytes) -> DatamodelDocument:
+        return cls(body=body, etag=hashlib.sha256(body).hexdigest()[:32])
+
+
+class DatamodelDocumentCache:
+    """Serialized ``GET /admin/datamodel/<project>`` documents by model version."""
+
+    def __init__(self, *, versions: ModelVersions | None = None) -> None:
+        self._lock = Lock()
+        self._versions = versions
+        self._documents: dict[str, tuple[str, DatamodelDocument]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.rebuilds = 0
+
+    def version(self, project: str) -> str | None:
+        """Return the project's model version, or ``None`` to bypass caching."""
+
+        if ":" in project:
+            return None
+        try:
+            if self._versions is None:
+                self._versions = ModelVersions()
+            return self._versions.current(project)
+        except RedisError:
+            return None
+
+    def get(self, project: str, version: str | None) -> DatamodelDocument | None:
+        """Return the document serialized under ``version``, if any."""
+
+        with self._lock:
+            entry = self._documents.get(project)
+            if version is not None and entry is not None and entry[0] == version:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def store(
+        self, project: str, version: str | None, body: bytes, *, rebuild: bool = False
+    ) -> DatamodelDocument:
+        """Remember a freshly serialized document and return it."""
+
+        document = DatamodelDocument.from_body(body)
+        with self._lock:
+            if rebuild:
+                self.rebuilds += 1
+            if version is not None:
+                self._documents[project] = (version, document)
+        return document
+
+    def stats(self) -> dict[str, int]:
+        """Return hit, miss, and rebuild counters for operational diagnostics."""
+
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "rebuilds": self.rebuilds,
+                "projects": len(self._documents),
+            }
+
+    def clear(self) -> None:
+        """Drop all cached documents and reset the counters."""
+
+        with self._lock:
+            self._documents.clear()
+            self.hits = 0
+            self.misses = 0
+            self.rebuilds = 0
+
+
+DATAMODEL_DOCUMENTS = DatamodelDocumentCache()
+
+
+def register_model_versions(app: Flask, versions: ModelVersions | None = None) -> None:
+    """Advance the model version after every successful model-changing request."""
+
+    state: dict[str, ModelVersions] = {}
+    if versions is not None:
+        state["versions"] = versions
+
+    @app.after_request
+    def record_model_write(response: Response) -> Response:
+        if request.method not in MUTATING_METHODS or response.status_code >= 400:
+            return response
+        blueprint = (request.endpoint or "").partition(".")[0]
+        if blueprint in MODEL_BLUEPRINTS:
+            project = str((request.view_args or {}).get("project") or "")
+            project = project if ":" not in project else None
+        elif blueprint in GLOBAL_MODEL_BLUEPRINTS:
+            project = None
+        else:
+            return response
+        try:
+            if "versions" not in state:
+                state["versions"] = ModelVersions()
+            state["versions"].bump(project)
+        except RedisError:
+            logger.warning(
+                "Could not advance the model version for %s.", request.endpoint
+            )
+        return response
+
+
+def _read_models(con: Connection, project: str) -> ProjectModels:
+    project_object = Project.read(con, project)
+    shared_project = Project.read(con, "oldap:SharedProject")
+    return ProjectModels(
+        project=project_object,
+        shared_project=shared_project,
+        datamodel=DataModel.read(con=con, project=project_object),
+        shared_model=DataModel.read(con=con, project=shared_project),
+    )
+
+
+def mark_list_node_context(con: Connection, *projects: str) -> None:
+    """Record list-node prefixes registered by an earlier request as loaded.
+
+    The read that filled a cache entry registered the prefixes in the named
+    context shared by every connection of this process, and list changes
+    advance the versions those entries are kept under. Connections without the
+    discovery state of the pinned oldaplib are left alone, so they discover the
+    prefixes themselves.
+    """
+
+    loaded = getattr(con, "_list_node_context_projects", None)
+    if isinstance(loaded, set):
+        loaded.update(projects)
+
+
+def _project_key(project_short_name: str) -> str:
+    return f"{PROJECT_MODEL_VERSION_PREFIX}{project_short_name}"
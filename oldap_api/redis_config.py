@@ -28,6 +28,12 @@ class RedisDatabaseIdentity:
     database: int
 
 
+def cache_redis_url() -> str:
+    """Return the API-owned Redis URL used for disposable cache entries."""
+
+    return os.getenv(CACHE_REDIS_ENV, DEFAULT_CACHE_REDIS_URL)
+
+
 def staging_lock_redis_url() -> str:
     """Return the API-owned Redis URL reserved for Staging coordination."""
 
@@ -66,9 +72,7 @@ def validate_redis_database_separation(*, production: bool) -> None:
             f"{STAGING_LOCK_REDIS_ENV} must be configured in production."
         )
 
-    cache_identity = redis_database_identity(
-        os.getenv(CACHE_REDIS_ENV, DEFAULT_CACHE_REDIS_URL)
-    )
+    cache_identity = redis_database_identity(cache_redis_url())
     lock_identity = redis_database_identity(lock_url or DEFAULT_STAGING_LOCK_REDIS_URL)
     if cache_identity == lock_identity:
         raise RedisConfigurationError(
@@ -0,0 +1,85 @@
+"""Roles a requester currently holds according to ``oldap:admin``.
+
+The access token lists the roles a user held when it was issued, but oldaplib's
+searches and reads admit resources through the user's current ``oldap:hasRole``
+statements in ``oldap:admin``. Results shared between requesters, such as
+cached searches and typeahead suggestions, must therefore be scoped by the
+roles in the graph, or a stale token could serve one user's results to another.
+
+Granting or revoking a role goes through the user routes, which advance the
+global data-graph stamp, so the roles read under one global stamp are kept per
+user until it moves. Without a stamp the roles are read for every request.
+"""
+
+from __future__ import annotations
+
+from threading import Lock
+from typing import Any
+
+from oldaplib.src.helpers.context import Context
+from oldaplib.src.xsd.iri import Iri
+
+MAX_REMEMBERED_USERS = 10_000
+
+
+class RequesterRoles:
+    """Current role IRIs per user, remembered under the global data-graph stamp."""
+
+    def __init__(self, *, max_users: int = MAX_REMEMBERED_USERS) -> None:
+        self._lock = Lock()
+        self._max_users = max_users
+        self._roles: dict[tuple[str, str], frozenset[str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def current(self, con: Any, global_stamp: str | None) -> frozenset[str]:
+        """Return the IRIs of the roles the requester of ``con`` holds in ``oldap:admin``."""
+
+        key = (str(con.userIri), global_stamp)
+        if global_stamp is not None:
+            with self._lock:
+                roles = self._roles.get(key)
+                if roles is not None:
+                    self.hits += 1
+                    return roles
+        roles = _read_roles(con)
+        with self._lock:
+            self.misses += 1
+            if global_stamp is not None:
+                if len(self._roles) >= self._max_users:
+                    self._roles.clear()
+                self._roles[key] = roles
+        return roles
+
+    def stats(self) -> dict[str, int]:
+        """Return hit and miss counters for operational diagnostics."""
+
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+    def clear(self) -> None:
+        """Forget all remembered roles and reset the counters."""
+
+        with self._lock:
+            self._roles.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def _read_roles(con: Any) -> frozenset[str]:
+    context = Context(name=con.context_name)
+    query = context.sparql_context
+    query += f"""
+    SELECT ?role
+    WHERE {{
+        GRAPH oldap:admin {{
+            {Iri(str(con.userIri), validate=True).toRdf} oldap:hasRole ?role .
+        }}
+    }}
+    """
+    return frozenset(
+        binding["role"]["value"] for binding in con.query(query)["results"]["bindings"]
+    )
+
+
+REQUESTER_ROLES = RequesterRoles()
@@ -0,0 +1,192 @@
+"""Shared cache of search results under the project's data-graph stamp.
+
+Dashboards and autocomplete widgets repeat the same ``/data/search`` and
+``/data/ofclass`` queries. A result is cached in the API cache Redis under a
+digest of the search operation, its normalized parameters, the roles the
+requester currently holds in ``oldap:admin``, and the current data-graph stamp
+of the project. Searches admit resources through those roles only, so
+requesters holding the same roles share entries. The roles listed in the
+access token may be out of date and are not used. Every write to the project's
+data, model, or lists, and every user, role, or project change, advances the
+stamp and makes earlier entries unreachable; they expire on their own.
+
+Results are stored in their JSON-compatible form. Large windows are not
+cached, and an unavailable Redis only disables the cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Callable, Mapping
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from threading import Lock
+from typing import Any
+
+from redis.exceptions import RedisError
+
+from oldap_api.data_stamps import DataGraphStamps
+from oldap_api.requester_roles import REQUESTER_ROLES, RequesterRoles
+
+SEARCH_RESULT_KEY_PREFIX = "oldap:search-result:"
+SEARCH_RESULT_TTL_SECONDS = 300
+MAX_CACHED_RESULT_BYTES = 1_000_000
+
+
+class SearchResultCache:
+    """Search results keyed by request, permissions, and data-graph stamp."""
+
+    def __init__(
+        self,
+        *,
+        stamps: DataGraphStamps | None = None,
+        roles: RequesterRoles = REQUESTER_ROLES,
+        ttl_seconds: int = SEARCH_RESULT_TTL_SECONDS,
+        max_bytes: int = MAX_CACHED_RESULT_BYTES,
+    ) -> None:
+        if ttl_seconds < 1:
+            raise ValueError("ttl_seconds must be positive.")
+        self._lock = Lock()
+        self._stamps = stamps
+        self._roles = roles
+        self._ttl_seconds = ttl_seconds
+        self._max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+
+    def result(
+        self,
+        connection: Any,
+        project: str,
+        operation: str,
+        params: Mapping[str, Any],
+        run: Callable[[], Any],
+    ) -> Any:
+        """Return the JSON-compatible result of ``run``, reusing an equal search.
+
+        :param operation: Name of the search function the parameters belong to
+        :param params: The keyword arguments of the search, excluding the connection
+        :param run: Performs the search and returns its JSON-compatible result
+        """
+
+        try:
+            if self._stamps is None:
+                self._stamps = DataGraphStamps()
+            stamp = self._stamps.current(project)
+        except RedisError:
+            stamp = None
+        key = cached = None
+        if stamp is not None:
+            roles = self._roles.current(connection, stamp.partition(".")[2])
+            key = _result_key(connection, roles, project, operation, params, stamp)
+            try:
+                cached = self._stamps.client.get(key)
+            except RedisError:
+                key = None
+        if cached is not None:
+            with self._lock:
+                self.hits += 1
+            return json.loads(cached)
+        with self._lock:
+            if key is None:
+                self.bypassed += 1
+            else:
+                self.misses += 1
+
+        value = run()
+        if key is None:
+            return value
+        body = json.dumps(value, separators=(",", ":"))
+        if len(body) <= self._max_bytes:
+            try:
+                self._stamps.client.set(key, body, ex=self._ttl_seconds)
+            except RedisError:
+                pass
+        return value
+
+    def stats(self) -> dict[str, int]:
+        """Return hit, miss, and bypass counters for operational diagnostics."""
+
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "bypassed": self.bypassed,
+            }
+
+    def clear(self) -> None:
+        """Reset the counters; stored entries become unreachable with the stamp."""
+
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.bypassed = 0
+
+
+SEARCH_RESULT_CACHE = SearchResultCache()
+
+
+def normalize_search_params(value: Any) -> Any:
+    """Return a JSON-serializable form of search parameters that equal searches share.
+
+    Mappings and sets are sorted, so parameters that compare equal yield one form.
+    """
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Enum):
+        return [type(value).__name__, normalize_search_params(value.value)]
+    if isinstance(value, Mapping):
+        return sorted(
+            [str(key), normalize_search_params(item)] for key, item in value.items()
+        )
+    if isinstance(value, (set, frozenset)):
+        return sorted(
+            (normalize_search_params(item) for item in value),
+            key=lambda item: json.dumps(item, sort_keys=True),
+        )
+    if isinstance(value, (list, tuple)):
+        return [normalize_search_params(item) for item in value]
+    if is_dataclass(value) and not isinstance(value, type):
+        return [
+            type(value).__name__,
+            {
+                item.name: normalize_search_params(getattr(value, item.name))
+                for item in fields(value)
+            },
+        ]
+    return [type(value).__name__, str(value)]
+
+
+def _result_key(
+    connection: Any,
+    roles: frozenset[str],
+    project: str,
+    operation: str,
+    params: Mapping[str, Any],
+    stamp: str,
+) -> str:
+    identity = json.dumps(
+        [
+            operation,
+            project,
+            _permission_scope(connection, roles),
+            normalize_search_params(params),
+            stamp,
+        ],
+        sort_keys=True,
+    )
+    return (
+        SEARCH_RESULT_KEY_PREFIX + hashlib.sha256(identity.encode("utf-8")).hexdigest()
+    )
+
+
+def _permission_scope(connection: Any, roles: frozenset[str]) -> Any:
+    # The search query admits resources through the requester's current roles
+    # only, so requesters holding the same roles share results; others are
+    # keyed alone.
+    if not roles:
+        return ["user", str(getattr(connection, "userIri", ""))]
+    return ["roles", sorted(roles)]
@@ -0,0 +1,298 @@
+"""Keyset cursors for deep pages of class listings.
+
+``ResourceInstance.search`` pages with ``LIMIT``/``OFFSET``, so the triple store
+has to sort and skip every row before the requested page; deep pages of large
+classes get slower with every page. A cursor instead remembers the sort keys and
+the IRI of the last resource of a page, and the next page is read with a filter
+that only admits resources ordered after it.
+
+The query mirrors the class listing of ``ResourceInstance.search``: the same
+access pattern, the same per-resource sort aggregates, the same order with the
+resource IRI as the final tie-breaker, and the same result rows. Cursors are
+opaque to clients. They carry a fingerprint of the project, class, and sort
+order they were issued for, and every value taken from a cursor is validated
+before it is written into SPARQL.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from typing import Any
+
+from oldaplib.src.enums.datapermissions import DataPermission
+from oldaplib.src.helpers.context import Context
+from oldaplib.src.helpers.oldaperror import OldapErrorValue
+from oldaplib.src.helpers.query_processor import QueryProcessor
+from oldaplib.src.objectfactory import SortBy, SortDir, SortKind
+from oldaplib.src.project import Project
+from oldaplib.src.xsd.iri import Iri
+from oldaplib.src.xsd.xsd_ncname import Xsd_NCName
+from oldaplib.src.xsd.xsd_qname import Xsd_QName
+
+CURSOR_VERSION = 1
+MAX_CURSOR_PAGE = 1000
+
+_IRI = re.compile(r'^[A-Za-z][A-Za-z0-9+.\-]*:[^\x00-\x20<>"{}|^`\\]*$')
+_LANGUAGE_TAG = re.compile(r"^[A-Za-z]{1,8}(-[A-Za-z0-9]{1,8})*$")
+
+
+@dataclass(frozen=True)
+class SearchCursor:
+    """The position after the last resource of a page."""
+
+    fingerprint: str
+    keys: tuple[tuple[bool, dict[str, str] | None], ...]
+    iri: str
+
+    def encode(self) -> str:
+        payload = {
+            "v": CURSOR_VERSION,
+            "f": self.fingerprint,
+            "k": [[unbound, binding] for unbound, binding in self.keys],
+            "r": self.iri,
+        }
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+    @classmethod
+    def decode(cls, token: str) -> SearchCursor:
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            payload = json.loads(raw.decode())
+        except (ValueError, binascii.Error, UnicodeDecodeError):
+            raise OldapErrorValue("Invalid cursor.")
+        if (
+            not isinstance(payload, dict)
+            or payload.get("v") != CURSOR_VERSION
+            or not isinstance(payload.get("f"), str)
+            or not isinstance(payload.get("k"), list)
+            or not isinstance(payload.get("r"), str)
+        ):
+            raise OldapErrorValue("Invalid cursor.")
+        keys = []
+        for key in payload["k"]:
+            if (
+                not isinstance(key, list)
+                or len(key) != 2
+                or not isinstance(key[0], bool)
+            ):
+                raise OldapErrorValue("Invalid cursor.")
+            unbound, binding = key
+            if unbound != (binding is None):
+                raise OldapErrorValue("Invalid cursor.")
+            if binding is not None:
+                _term(binding)
+            keys.append((unbound, binding))
+        return cls(fingerprint=payload["f"], keys=tuple(keys), iri=_iri(payload["r"]))
+
+
+def cursor_fingerprint(
+    project: str, resClass: Xsd_QName, sortBy: list[SortBy] | None
+) -> str:
+    """Identify the listing a cursor belongs to; projections may change between pages."""
+
+    listing = [
+        str(project),
+        str(resClass),
+        [[str(s.property), s.dir.value, s.kind.value] for s in sortBy or []],
+    ]
+    return hashlib.sha256(json.dumps(listing).encode()).hexdigest()[:16]
+
+
+def keyset_search(
+    con: Any,
+    project: Project | Xsd_NCName | str,
+    resClass: Xsd_QName,
+    includeProperties: set[Xsd_QName] | None = None,
+    sortBy: list[SortBy] | None = None,
+    limit: int = 100,
+    cursor: str | None = None,
+) -> tuple[list[dict[str, Any]], str | None]:
+    """Read one page of a class listing after ``cursor``.
+
+    :return: The rows in the shape of ``ResourceInstance.search`` and the cursor
+        of the next page, or ``None`` after the last page.
+    """
+
+    if not 0 < limit <= MAX_CURSOR_PAGE:
+        raise OldapErrorValue(
+            f'"limit" must be between 1 and {MAX_CURSOR_PAGE} when paging with a cursor.'
+        )
+    sortBy = list(sortBy or [])
+    if any(s.kind == SortKind.DATING for s in sortBy):
+        raise OldapErrorValue("Cursors do not support dating sort keys.")
+    project_obj = (
+        project if isinstance(project, Project) else Project.read(con, project)
+    )
+    graph = str(project_obj.projectShortName)
+    fingerprint = cursor_fingerprint(graph, resClass, sortBy)
+    after = SearchCursor.decode(cursor) if cursor else None
+    if after is not None and (
+        after.fingerprint != fingerprint or len(after.keys) != len(sortBy)
+    ):
+        raise OldapErrorValue("The cursor belongs to a different listing.")
+
+    projection = list(includeProperties or [])
+    projection += [s.property for s in sortBy if s.property not in projection]
+    context = Context(name=con.context_name)
+    sparql = context.sparql_context + _page_query(
+        con, graph, resClass, projection, sortBy, limit, after
+    )
+    jsonres = con.query(sparql)
+
+    result: list[dict[str, Any]] = []
+    by_iri: dict[Iri, dict[str, Any]] = {}
+    last: dict[str, Any] = {}
+    for row, bindings in zip(
+        QueryProcessor(context, jsonres), jsonres["results"]["bindings"]
+    ):
+        iri = row["res"]
+        if iri not in by_iri:
+            by_iri[iri] = {"iri": iri, "resclass": row.get("resclass")}
+            result.append(by_iri[iri])
+            last = bindings
+        item = by_iri[iri]
+        for index, prop in enumerate(projection):
+            value = row.get(f"prop_{index}")
+            if value is not None:
+                item.setdefault(str(prop), [])
+                if value not in item[str(prop)]:
+                    item[str(prop)].append(value)
+
+    if len(result) < limit:
+        return result, None
+    keys = []
+    for index in range(len(sortBy)):
+        unbound = last.get(f"sort_{index}_unbound", {}).get("value") in ("true", "1")
+        keys.append((unbound, None if unbound else last.get(f"sort_{index}_key")))
+    next_cursor = SearchCursor(
+        fingerprint=fingerprint,
+        keys=tuple(keys),
+        iri=last["res"]["value"],
+    )
+    return result, next_cursor.encode()
+
+
+def _page_query(
+    con: Any,
+    graph: str,
+    resClass: Xsd_QName,
+    projection: list[Xsd_QName],
+    sortBy: list[SortBy],
+    limit: int,
+    after: SearchCursor | None,
+) -> str:
+    access = (
+        f"GRAPH oldap:admin {{ {con.userIri.toRdf} oldap:hasRole ?role . "
+        f"?DataPermission oldap:permissionValue ?permval . "
+        f"FILTER(?permval >= {DataPermission.DATA_VIEW.numeric.toRdf}) }} "
+        f"GRAPH {graph}:data {{ ?res rdf:type ?searchResclass . "
+        f"?res oldap:attachedToRole ?role . "
+        f"<< ?res oldap:attachedToRole ?role >> oldap:hasDataPermission ?DataPermission . }} "
+        f"?res rdf:type {resClass.toRdf} ."
+    )
+    order = _order_by(sortBy)
+    keyset = f"FILTER({_after(sortBy, after)})" if after is not None else ""
+    sort_vars = " ".join(f"?sort_{i}_key ?sort_{i}_unbound" for i in range(len(sortBy)))
+    prop_vars = " ".join(f"?prop_{i}" for i in range(len(projection)))
+
+    if sortBy:
+        aggregates = " ".join(
+            f"({'MIN' if s.dir == SortDir.asc else 'MAX'}(?sort_{i}_raw) AS ?sort_{i}_key) "
+            f"(COUNT(?sort_{i}_raw) = 0 AS ?sort_{i}_unbound)"
+            for i, s in enumerate(sortBy)
+        )
+        bindings = " ".join(
+            f"OPTIONAL {{ ?res {s.property.toRdf} ?sort_{i}_raw }} ."
+            for i, s in enumerate(sortBy)
+        )
+        page = (
+            f"SELECT ?res {sort_vars}\n"
+            f"WHERE {{\n"
+            f"{{ SELECT ?res {aggregates}\n"
+            f"WHERE {{ {access} {bindings} }}\n"
+            f"GROUP BY ?res }}\n"
+            f"{keyset}\n"
+            f"}}\n"
+        )
+    else:
+        page = f"SELECT DISTINCT ?res\nWHERE {{ {access} {keyset} }}\n"
+
+    optionals = " ".join(
+        f"OPTIONAL {{ ?res {p.toRdf} ?prop_{i} }} ." for i, p in enumerate(projection)
+    )
+    return (
+        f"SELECT DISTINCT ?res ?resclass {sort_vars} {prop_vars}\n"
+        f"WHERE {{\n"
+        f"{{ {page}ORDER BY {order}\nLIMIT {limit} }}\n"
+        f"GRAPH {graph}:data {{ ?res rdf:type ?resclass . {optionals} }}\n"
+        f"}}\n"
+        f"ORDER BY {order}\n"
+    )
+
+
+def _order_by(sortBy: list[SortBy]) -> str:
+    parts = [
+        f"ASC(?sort_{i}_unbound) {'ASC' if s.dir == SortDir.asc else 'DESC'}(?sort_{i}_key)"
+        for i, s in enumerate(sortBy)
+    ]
+    return " ".join(parts + ["ASC(STR(?res))"])
+
+
+def _after(sortBy: list[SortBy], after: SearchCursor) -> str:
+    # Strictly after the cursor in ORDER BY order: for the first sort component
+    # that differs, the resource must come later; all earlier ones are equal.
+    components: list[tuple[str, str]] = []
+    for i, (s, (unbound, binding)) in enumerate(zip(sortBy, after.keys)):
+        flag = f"?sort_{i}_unbound"
+        if unbound:
+            components.append((f"{flag} = true", "false"))
+            continue
+        components.append((f"{flag} = false", f"{flag} = true"))
+        key = f"?sort_{i}_key"
+        term, plain = _term(binding)
+        op = ">" if s.dir == SortDir.asc else "<"
+        if plain:
+            components.append((f"STR({key}) = {term}", f"STR({key}) {op} {term}"))
+        else:
+            components.append((f"{key} = {term}", f"{key} {op} {term}"))
+    condition = f"STR(?res) > {json.dumps(after.iri, ensure_ascii=False)}"
+    for equal, later in reversed(components):
+        condition = f"{later} || ({equal} && {condition})"
+    return condition
+
+
+def _term(binding: Any) -> tuple[str, bool]:
+    """Return a SPARQL term for a result binding, and whether it compares by its string."""
+
+    if not isinstance(binding, dict) or not isinstance(binding.get("value"), str):
+        raise OldapErrorValue("Invalid cursor.")
+    value = binding["value"]
+    kind = binding.get("type")
+    if kind == "uri":
+        return json.dumps(_iri(value), ensure_ascii=False), True
+    if kind not in ("literal", "typed-literal"):
+        raise OldapErrorValue("Invalid cursor.")
+    text = json.dumps(value, ensure_ascii=False)
+    if "xml:lang" in binding:
+        if not isinstance(binding["xml:lang"], str) or not _LANGUAGE_TAG.match(
+            binding["xml:lang"]
+        ):
+            raise OldapErrorValue("Invalid cursor.")
+        return text, True
+    if "datatype" in binding:
+        if not isinstance(binding["datatype"], str):
+            raise OldapErrorValue("Invalid cursor.")
+        return f"{text}^^<{_iri(binding['datatype'])}>", False
+    return text, False
+
+
+def _iri(value: str) -> str:
+    if not isinstance(value, str) or not _IRI.match(value):
+        raise OldapErrorValue("Invalid cursor.")
+    return value
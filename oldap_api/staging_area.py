@@ -2,20 +2,25 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass
+from threading import Lock
 from typing import Any, Protocol, TypeVar
 
 from oldaplib.src.helpers.context import Context
 from oldaplib.src.helpers.oldaperror import OldapError, OldapErrorValue
 from oldaplib.src.xsd.iri import Iri
 from oldaplib.src.xsd.xsd_ncname import Xsd_NCName
+from oldaplib.src.xsd.xsd_qname import Xsd_QName
 from rdflib import Literal, URIRef
 from rdflib.namespace import XSD
+from redis.exceptions import RedisError
 
+from oldap_api.model_cache import ModelVersions
 from oldap_api.staging_lock import (
     RedisStagingMutationLock,
     StagingMutationLockUnavailable,
+    staging_area_scope,
 )
 
 STAGING_FOLDER_CLASS = "http://oldap.org/shared#StagingFolder"
@@ -34,7 +39,10 @@ STAGING_MUTATION_CLASSES = {
     "shared:StagingMediaObject",
     "http://oldap.org/shared#StagingMediaObject",
 }
+STAGING_SCOPE_ATTEMPTS = 3
+STAGING_LOCATION_PROPERTIES = ("shared:inStagingArea", "shared:inStagingFolder")
 T = TypeVar("T")
+_RESCOPE = object()
 
 
 class StagingStructureError(Exception):
@@ -105,14 +113,24 @@ class StagingGraph:
 
     @classmethod
     def resolve(cls, connection: QueryConnection, project: str) -> "StagingGraph":
-        """Resolve a project prefix to its authoritative data graph IRI."""
+        """Resolve a project prefix to its authoritative data graph IRI.
 
+        Resolved graphs are kept in ``STAGING_GRAPHS`` per context and project.
+        """
+
+        return STAGING_GRAPHS.graph(
+            connection.context_name, project, lambda: cls._resolve(connection, project)
+        )
+
+    @classmethod
+    def _resolve(cls, connection: QueryConnection, project: str) -> "StagingGraph":
         try:
             project_short_name = str(Xsd_NCName(project, validate=True))
             namespace = Context(name=connection.context_name).get(project_short_name)
         except (OldapError, OldapErrorValue, ValueError) as error:
             raise StagingAreaNotFound("The project does not exist.") from error
         if namespace is None:
+            STAGING_GRAPHS.record_fallback_query()
             try:
                 rows = _bindings(
                     connection.query(_project_namespace_query(project_short_name))
@@ -150,6 +168,86 @@ class StagingGraph:
         )
 
 
+class StagingGraphCache:
+    """Process-wide resolved ``StagingGraph`` objects per context and project.
+
+    Entries are kept under the project's model version from ``ModelVersions``.
+    Every successful write through the project routes advances the global
+    model version in Redis, so a project modified, deleted, or recreated
+    through any worker is resolved again in every worker. While the version
+    store is unavailable, graphs are resolved without the cache.
+    ``fallback_queries`` counts the namespace queries issued because a context
+    did not know the project prefix.
+    """
+
+    def __init__(self, *, versions: ModelVersions | None = None) -> None:
+        self._lock = Lock()
+        self._versions = versions
+        self._graphs: dict[tuple[str, str], tuple[str, StagingGraph]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.fallback_queries = 0
+
+    def graph(
+        self, context_name: str, project: str, resolve: Callable[[], StagingGraph]
+    ) -> StagingGraph:
+        """Return the graph of ``project``, calling ``resolve`` when none is current."""
+
+        version = self._version(project)
+        if version is None:
+            with self._lock:
+                self.bypassed += 1
+            return resolve()
+        with self._lock:
+            entry = self._graphs.get((context_name, project))
+            if entry is not None and entry[0] == version:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        graph = resolve()
+        with self._lock:
+            self._graphs[(context_name, project)] = (version, graph)
+        return graph
+
+    def record_fallback_query(self) -> None:
+        with self._lock:
+            self.fallback_queries += 1
+
+    def stats(self) -> dict[str, int]:
+        """Return hit, miss, and fallback-query counters for diagnostics."""
+
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "bypassed": self.bypassed,
+                "fallbackQueries": self.fallback_queries,
+                "entries": len(self._graphs),
+            }
+
+    def clear(self) -> None:
+        """Drop all graphs and reset the counters."""
+
+        with self._lock:
+            self._graphs.clear()
+            self.hits = 0
+            self.misses = 0
+            self.bypassed = 0
+            self.fallback_queries = 0
+
+    def _version(self, project: str) -> str | None:
+        try:
+            if self._versions is None:
+                self._versions = ModelVersions()
+            return self._versions.current(project)
+        except RedisError:
+            return None
+
+
+STAGING_GRAPHS = StagingGraphCache()
+
+
 class StagingSystemFolderPolicy:
     """Guard the exact ``top`` / ``Mobile`` / ``Trash`` system structure."""
 
@@ -157,7 +255,35 @@ class StagingSystemFolderPolicy:
         self._connection = connection
         self._graph = StagingGraph.resolve(connection, project)
 
-    def assert_create_allowed(self, resource_class: str, data: Any) -> None:
+    def snapshot(
+        self, *, folders: Iterable[str] = (), areas: Iterable[str] = ()
+    ) -> "StagingPolicySnapshot":
+        """Load the system folders of ``areas`` and of the areas of ``folders``.
+
+        One query returns every fact the ``assert_*`` methods evaluate, so a
+        write that checks several folders of its areas can pass the snapshot
+        to each of them.
+        """
+
+        folders = sorted({_validated_absolute_iri(value) for value in folders})
+        areas = sorted({_validated_absolute_iri(value) for value in areas})
+        if not folders and not areas:
+            return StagingPolicySnapshot({}, {})
+        return StagingPolicySnapshot.from_rows(
+            _bindings(
+                self._connection.query(
+                    _policy_snapshot_query(self._graph, folders, areas)
+                )
+            )
+        )
+
+    def assert_create_allowed(
+        self,
+        resource_class: str,
+        data: Any,
+        *,
+        snapshot: "StagingPolicySnapshot | None" = None,
+    ) -> None:
         """Reject reserved-name ambiguity, duplicates, and Mobile children."""
 
         if not _is_staging_folder_class(resource_class):
@@ -171,7 +297,7 @@ class StagingSystemFolderPolicy:
         if not name or not area:
             return
 
-        state = self._system_state(area)
+        state = (snapshot or self.snapshot(areas=(area,))).state(area)
         reserved_kind = _reserved_kind(name)
         if reserved_kind is None:
             if parent is not None and parent in state.mobile:
@@ -211,7 +337,13 @@ class StagingSystemFolderPolicy:
                     "The Mobile inbox must grant only DATA_VIEW to the StagingArea default role."
                 )
 
-    def assert_update_allowed(self, folder_iri: str, data: Any) -> None:
+    def assert_update_allowed(
+        self,
+        folder_iri: str,
+        data: Any,
+        *,
+        snapshot: "StagingPolicySnapshot | None" = None,
+    ) -> None:
         """Reject every generic mutation of protected system folders."""
 
         if not isinstance(data, dict):
@@ -221,27 +353,38 @@ class StagingSystemFolderPolicy:
             raise StagingStructureConflict(
                 "Reserved Staging system-folder names cannot be assigned through a generic update."
             )
-        if self._is_protected(folder_iri):
+        snapshot = snapshot or self.snapshot(folders=(folder_iri,))
+        if snapshot.is_protected(folder_iri):
             raise StagingStructureConflict(
                 "Protected Staging system folders cannot be changed through the generic API."
             )
 
-    def assert_move_allowed(self, folder_iri: str, target_iri: str) -> None:
+    def assert_move_allowed(
+        self,
+        folder_iri: str,
+        target_iri: str,
+        *,
+        snapshot: "StagingPolicySnapshot | None" = None,
+    ) -> None:
         """Reject moves of protected folders and moves into Mobile."""
 
-        if self._is_protected(folder_iri):
+        snapshot = snapshot or self.snapshot(folders=(folder_iri, target_iri))
+        if snapshot.is_protected(folder_iri):
             raise StagingStructureConflict(
                 "Protected Staging system folders cannot be moved."
             )
-        if self._is_mobile(target_iri):
+        if snapshot.is_mobile(target_iri):
             raise StagingStructureConflict(
                 "The protected Mobile inbox cannot contain child folders."
             )
 
-    def assert_delete_allowed(self, folder_iri: str) -> None:
+    def assert_delete_allowed(
+        self, folder_iri: str, *, snapshot: "StagingPolicySnapshot | None" = None
+    ) -> None:
         """Reject generic deletion of every managed system folder."""
 
-        if self._is_protected(folder_iri):
+        snapshot = snapshot or self.snapshot(folders=(folder_iri,))
+        if snapshot.is_protected(folder_iri):
             raise StagingStructureConflict(
                 "Protected Staging system folders cannot be deleted through the generic API."
             )
@@ -254,10 +397,13 @@ class StagingSystemFolderPolicy:
                 "StagingAreas must be deleted through the atomic empty-area operation."
             )
 
-    def assert_transform_allowed(self, folder_iri: str) -> None:
+    def assert_transform_allowed(
+        self, folder_iri: str, *, snapshot: "StagingPolicySnapshot | None" = None
+    ) -> None:
         """Reject reclassification of every protected system-folder resource."""
 
-        if self._is_protected(folder_iri):
+        snapshot = snapshot or self.snapshot(folders=(folder_iri,))
+        if snapshot.is_protected(folder_iri):
             raise StagingStructureConflict(
                 "Protected Staging system folders cannot be transformed."
             )
@@ -278,40 +424,71 @@ class StagingSystemFolderPolicy:
                 "StagingAreas and folders must be created through validated create operations."
             )
 
-    def _is_protected(self, folder_iri: str) -> bool:
-        return _ask(
-            self._connection.query(_protected_folder_query(self._graph, folder_iri))
+
+@dataclass(frozen=True, slots=True)
+class StagingPolicySnapshot:
+    """Reserved system folders and default roles of the StagingAreas of a write."""
+
+    default_roles: Mapping[str, frozenset[str]]
+    folders: Mapping[str, frozenset[tuple[str, str, str | None]]]
+
+    @classmethod
+    def from_rows(cls, rows: list[dict[str, Any]]) -> "StagingPolicySnapshot":
+        """Group snapshot query rows by StagingArea."""
+
+        default_roles: dict[str, set[str]] = {}
+        folders: dict[str, set[tuple[str, str, str | None]]] = {}
+        for row in rows:
+            try:
+                area = row["area"]["value"]
+                role = row.get("defaultRole", {}).get("value")
+                folder = row.get("reservedFolder", {}).get("value")
+                if folder is not None:
+                    name = row["reservedName"]["value"]
+                    parent = row.get("reservedParent", {}).get("value")
+            except (KeyError, TypeError, AttributeError) as error:
+                raise StagingAreaServiceUnavailable(
+                    "GraphDB returned an invalid StagingArea structure."
+                ) from error
+            default_roles.setdefault(area, set())
+            folders.setdefault(area, set())
+            if role is not None:
+                default_roles[area].add(role)
+            if folder is not None:
+                folders[area].add((folder, name, parent))
+        return cls(
+            {area: frozenset(roles) for area, roles in default_roles.items()},
+            {area: frozenset(entries) for area, entries in folders.items()},
         )
 
-    def _is_mobile(self, folder_iri: str) -> bool:
-        return _ask(
-            self._connection.query(_mobile_folder_query(self._graph, folder_iri))
+    def is_protected(self, folder_iri: str) -> bool:
+        """Return whether ``folder_iri`` is a root top or its Mobile or Trash."""
+
+        return any(
+            self._is_system_folder(area, folder_iri, ("top", "Mobile", "Trash"))
+            for area in self.folders
         )
 
-    def _system_state(self, staging_area_iri: str) -> "SystemFolderState":
-        rows = _bindings(
-            self._connection.query(_system_state_query(self._graph, staging_area_iri))
+    def is_mobile(self, folder_iri: str) -> bool:
+        """Return whether ``folder_iri`` is the Mobile folder below a root top."""
+
+        return any(
+            self._is_system_folder(area, folder_iri, ("Mobile",))
+            for area in self.folders
         )
-        if not rows:
+
+    def state(self, staging_area_iri: str) -> "SystemFolderState":
+        """Validate and return the exact system-folder identities of one area."""
+
+        default_roles = self.default_roles.get(staging_area_iri)
+        if not default_roles:
             raise StagingStructureConflict("The StagingArea does not exist.")
-        default_roles = _values(rows, "defaultRole")
         if len(default_roles) != 1:
             raise StagingStructureConflict(
                 "The StagingArea default-role configuration is ambiguous."
             )
         folders: dict[str, tuple[str, str | None]] = {}
-        for row in rows:
-            folder_entry = row.get("reservedFolder")
-            if folder_entry is None:
-                continue
-            try:
-                folder = folder_entry["value"]
-                name = row["reservedName"]["value"]
-                parent = row.get("reservedParent", {}).get("value")
-            except (KeyError, TypeError) as error:
-                raise StagingAreaServiceUnavailable(
-                    "GraphDB returned an invalid StagingArea structure."
-                ) from error
+        for folder, name, parent in self.folders.get(staging_area_iri, ()):
             current = folders.setdefault(folder, (name, parent))
             if current != (name, parent):
                 raise StagingStructureConflict(
@@ -350,6 +527,19 @@ class StagingSystemFolderPolicy:
             trash=frozenset(by_kind["trash"]),
         )
 
+    def _is_system_folder(
+        self, area: str, folder_iri: str, names: tuple[str, ...]
+    ) -> bool:
+        entries = self.folders[area]
+        for folder, name, parent in entries:
+            if folder != folder_iri or name not in names:
+                continue
+            if name == "top" and parent is None:
+                return True
+            if name != "top" and (parent, "top", None) in entries:
+                return True
+        return False
+
 
 @dataclass(frozen=True, slots=True)
 class SystemFolderState:
@@ -497,8 +687,18 @@ class GraphDbStagingAreaRepository:
         return _values(rows, "resource") == frozenset(target.resources)
 
 
-def run_staging_mutation(resource_classes: Any, operation: Callable[[], T]) -> T:
-    """Serialize one affected generic or dedicated Staging write."""
+def run_staging_mutation(
+    resource_classes: Any,
+    operation: Callable[[], T],
+    scopes: Callable[[], Iterable[str]],
+) -> T:
+    """Serialize one affected generic or dedicated Staging write.
+
+    ``scopes`` resolves the lock scopes of the StagingAreas the write touches.
+    It runs before the leases are taken and again while they are held; a write
+    whose resources moved to another area in between is retried with the new
+    scopes.
+    """
 
     values = (
         resource_classes
@@ -507,10 +707,75 @@ def run_staging_mutation(resource_classes: Any, operation: Callable[[], T]) -> T
     )
     if not any(is_staging_mutation_class(value) for value in values):
         return operation()
-    try:
-        return RedisStagingMutationLock().run(operation)
-    except StagingMutationLockUnavailable as error:
-        raise StagingAreaServiceUnavailable(str(error)) from error
+    lock = RedisStagingMutationLock()
+    for _ in range(STAGING_SCOPE_ATTEMPTS):
+        expected = frozenset(scopes())
+
+        def scoped_operation() -> Any:
+            if not frozenset(scopes()) <= expected:
+                return _RESCOPE
+            return operation()
+
+        try:
+            result = lock.run(scoped_operation, expected)
+        except StagingMutationLockUnavailable as error:
+            raise StagingAreaServiceUnavailable(str(error)) from error
+        if result is not _RESCOPE:
+            return result
+    raise StagingAreaServiceUnavailable(
+        "The affected StagingAreas changed during the write."
+    )
+
+
+def staging_lock_scopes(
+    connection: QueryConnection,
+    project: str,
+    resources: Iterable[str] = (),
+    data: Any = None,
+) -> tuple[str, ...]:
+    """Return the lock scopes of the StagingAreas a Staging write touches.
+
+    :param resources: Existing StagingAreas, folders, or media objects the
+        write reads or changes
+    :param data: The request payload, whose ``shared:inStagingArea`` and
+        ``shared:inStagingFolder`` values name further areas and folders
+
+    A StagingArea, and a resource without an area, is scoped by its own IRI.
+    A write that names no existing resource, such as creating a StagingArea,
+    is scoped by its project.
+    """
+
+    context = Context(name=connection.context_name)
+    areas: set[str] = set()
+    pending = {
+        iri
+        for iri in (_scope_iri(str(value), context) for value in resources)
+        if iri is not None
+    }
+    if isinstance(data, dict):
+        for prop in STAGING_LOCATION_PROPERTIES:
+            for value in _payload_strings(data.get(prop)):
+                iri = _scope_iri(value, context)
+                if iri is None:
+                    continue
+                if prop == "shared:inStagingArea":
+                    areas.add(iri)
+                else:
+                    pending.add(iri)
+    if pending:
+        graph = StagingGraph.resolve(connection, project)
+        rows = _bindings(connection.query(_staging_area_of_query(graph, pending)))
+        located: dict[str, set[str]] = {}
+        for row in rows:
+            resource = _values([row], "resource")
+            area = _values([row], "area")
+            for iri in resource:
+                located.setdefault(iri, set()).update(area)
+        for iri in pending:
+            areas.update(located.get(iri) or {iri})
+    if not areas:
+        return (f"project:{project}",)
+    return tuple(sorted(staging_area_scope(area) for area in areas))
 
 
 def _is_staging_folder_class(value: str) -> bool:
@@ -573,6 +838,16 @@ def _single_iri(value: Any, *, required: bool = True) -> str | None:
         return None
 
 
+def _payload_strings(value: Any) -> list[str]:
+    if isinstance(value, str):
+        return [value.strip()] if value.strip() else []
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, (list, tuple, set)):
+        return [text for item in value for text in _payload_strings(item)]
+    return []
+
+
 def _reserved_kind(name: str) -> str | None:
     normalized = name.casefold()
     for kind, reserved in SYSTEM_FOLDER_NAMES.items():
@@ -590,6 +865,19 @@ def _expanded_iri(value: str, context: Context) -> str | None:
         return None
 
 
+def _scope_iri(value: str, context: Context) -> str | None:
+    prefix, separator, _ = value.partition(":")
+    if separator and context.get(prefix) is not None:
+        try:
+            value = str(context.qname2iri(Xsd_QName(value, validate=False)))
+        except (OldapError, OldapErrorValue, ValueError):
+            return None
+    try:
+        return _validated_absolute_iri(value)
+    except StagingStructureConflict:
+        return None
+
+
 def _has_exact_mobile_policy(roles: Any, default_role: str, context: Context) -> bool:
     if not isinstance(roles, dict) or len(roles) != 1:
         return False
@@ -663,18 +951,31 @@ def _iri_term(value: str) -> str:
     return URIRef(_validated_absolute_iri(value)).n3()
 
 
-def _system_state_query(graph: StagingGraph, area: str) -> str:
-    return f"""# staging-system-state
-PREFIX oldap: <http://oldap.org/base#>
+def _policy_snapshot_query(
+    graph: StagingGraph, folders: Iterable[str], areas: Iterable[str]
+) -> str:
+    branches = []
+    if areas:
+        branches.append(
+            f"{{ VALUES ?area {{ {' '.join(_iri_term(area) for area in areas)} }} }}"
+        )
+    if folders:
+        subjects = " ".join(_iri_term(folder) for folder in folders)
+        branches.append(
+            f"{{ VALUES ?subject {{ {subjects} }} ?subject shared:inStagingArea ?area . }}"
+        )
+    union = "\n    UNION\n    ".join(branches)
+    return f"""# staging-policy-snapshot
 PREFIX shared: <http://oldap.org/shared#>
 PREFIX schema: <https://schema.org/>
-SELECT ?defaultRole ?reservedFolder ?reservedName ?reservedParent WHERE {{
+SELECT DISTINCT ?area ?defaultRole ?reservedFolder ?reservedName ?reservedParent WHERE {{
   GRAPH {_graph_term(graph)} {{
-    {_iri_term(area)} shared:stagingDefaultRole ?defaultRole .
+    {union}
+    OPTIONAL {{ ?area shared:stagingDefaultRole ?defaultRole . }}
     OPTIONAL {{
       ?reservedFolder a shared:StagingFolder ;
         schema:name ?reservedName ;
-        shared:inStagingArea {_iri_term(area)} .
+        shared:inStagingArea ?area .
       FILTER(LCASE(STR(?reservedName)) IN ("top", "mobile", "trash"))
       OPTIONAL {{ ?reservedFolder shared:inStagingFolder ?reservedParent . }}
     }}
@@ -683,6 +984,17 @@ SELECT ?defaultRole ?reservedFolder ?reservedName ?reservedParent WHERE {{
 """
 
 
+def _staging_area_of_query(graph: StagingGraph, resources: Iterable[str]) -> str:
+    values = " ".join(_iri_term(resource) for resource in sorted(resources))
+    return f"""# staging-area-of
+PREFIX shared: <http://oldap.org/shared#>
+SELECT ?resource ?area WHERE {{
+  VALUES ?resource {{ {values} }}
+  OPTIONAL {{ GRAPH {_graph_term(graph)} {{ ?resource shared:inStagingArea ?area . }} }}
+}}
+"""
+
+
 def _project_namespace_query(project_short_name: str) -> str:
     return f"""# staging-project-namespace
 PREFIX oldap: <http://oldap.org/base#>
@@ -695,42 +1007,6 @@ LIMIT 2
 """
 
 
-def _protected_folder_query(graph: StagingGraph, folder: str) -> str:
-    folder_term = _iri_term(folder)
-    return f"""# protected-staging-folder
-PREFIX shared: <http://oldap.org/shared#>
-PREFIX schema: <https://schema.org/>
-ASK {{ GRAPH {_graph_term(graph)} {{
-  {{
-    {folder_term} a shared:StagingFolder ; schema:name ?name ; shared:inStagingArea ?area .
-    FILTER(STR(?name) = "top")
-    FILTER NOT EXISTS {{ {folder_term} shared:inStagingFolder ?parent . }}
-  }} UNION {{
-    {folder_term} a shared:StagingFolder ; schema:name ?name ;
-      shared:inStagingArea ?area ; shared:inStagingFolder ?top .
-    ?top a shared:StagingFolder ; schema:name ?topName ; shared:inStagingArea ?area .
-    FILTER(STR(?name) IN ("Mobile", "Trash") && STR(?topName) = "top")
-    FILTER NOT EXISTS {{ ?top shared:inStagingFolder ?parent . }}
-  }}
-}} }}
-"""
-
-
-def _mobile_folder_query(graph: StagingGraph, folder: str) -> str:
-    folder_term = _iri_term(folder)
-    return f"""# protected-mobile-folder
-PREFIX shared: <http://oldap.org/shared#>
-PREFIX schema: <https://schema.org/>
-ASK {{ GRAPH {_graph_term(graph)} {{
-  {folder_term} a shared:StagingFolder ; schema:name ?name ;
-    shared:inStagingArea ?area ; shared:inStagingFolder ?top .
-  ?top a shared:StagingFolder ; schema:name ?topName ; shared:inStagingArea ?area .
-  FILTER(STR(?name) = "Mobile" && STR(?topName) = "top")
-  FILTER NOT EXISTS {{ ?top shared:inStagingFolder ?parent . }}
-}} }}
-"""
-
-
 def _deletion_target_query(graph: StagingGraph, area: str) -> str:
     return f"""# staging-area-deletion-target
 PREFIX shared: <http://oldap.org/shared#>
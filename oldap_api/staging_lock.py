@@ -1,11 +1,33 @@
-"""Cross-worker coordination for writes that affect Staging structure."""
+"""Cross-worker coordination for writes that affect Staging structure.
+
+Leases are scoped: a write holds one lease per StagingArea it touches, plus
+any further scopes its own checks depend on, so writes to different areas and
+projects run in parallel. Writes that need several leases take them in sorted
+name order, which keeps two such writes from waiting on each other.
+
+Writers wait for a lease in a first-come, first-served queue kept beside it in
+Redis. A writer that would join a queue already ``STAGING_QUEUE_DEPTH`` long is
+refused at once, so a busy StagingArea answers 503 quickly instead of tying up
+workers until the wait budget runs out. Every acquisition of a StagingArea lease
+records its wait and hold time, timeouts, refusals, and renewal failures,
+together with the current holder, for ``staging_lock_metrics``. Leases of other
+scopes, such as the mobile receipt stripes and the job quota counters, are not
+recorded.
+"""
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
-from collections.abc import Callable
+import os
+import socket
+import time
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
 from threading import Event, Thread
-from typing import TypeVar
+from typing import Any, TypeVar
+from uuid import uuid4
 
 from redis import Redis
 from redis.exceptions import LockError, RedisError
@@ -17,19 +39,276 @@ T = TypeVar("T")
 STAGING_MUTATION_LOCK_NAME = "oldap-api:staging:mutation"
 STAGING_MUTATION_LEASE_SECONDS = 300
 STAGING_MUTATION_WAIT_SECONDS = 30
+STAGING_QUEUE_DEPTH = 8
+STAGING_QUEUE_POLL_SECONDS = 0.05
+STAGING_WAITER_TTL_MILLISECONDS = 2_000
+STAGING_METRICS_KEY = "oldap-api:staging:metrics"
+STAGING_METRICS_TTL_SECONDS = 7 * 24 * 60 * 60
+QUOTA_LEASE_SECONDS = 60
+QUOTA_QUEUE_DEPTH = 256
+EXPORT_QUOTA_SCOPE = "quota:export"
+IMPORT_QUOTA_SCOPE = "quota:import"
+
+_TICKET_KEY = "oldap-api:staging:ticket"
+_WAITER_PREFIX = "oldap-api:staging:waiter:"
+_HOLDER = f"{socket.gethostname()}:{os.getpid()}"
+_COUNTERS = ("acquired", "timeouts", "rejected", "renewalFailures")
+_DURATIONS = ("waitSeconds", "holdSeconds")
 
 
 class StagingMutationLockUnavailable(RuntimeError):
     """Raised before a Staging write when cross-worker coordination is unavailable."""
 
 
+class StagingMutationQueueFull(StagingMutationLockUnavailable):
+    """Raised without waiting when too many writes already queue for one lease."""
+
+
+@dataclass(frozen=True, slots=True)
+class StagingLease:
+    """One held lease, the scope it guards, and when it was acquired."""
+
+    name: str
+    scope: str
+    lock: Any
+    acquired_at: float
+
+
+def staging_area_scope(area_iri: str) -> str:
+    """Return the lock scope of the StagingArea with the absolute IRI ``area_iri``."""
+
+    return f"area:{area_iri}"
+
+
+def staging_lock_name(scope: str) -> str:
+    """Return the lease name guarding ``scope``."""
+
+    digest = hashlib.sha256(scope.encode("utf-8")).hexdigest()[:32]
+    return f"{STAGING_MUTATION_LOCK_NAME}:{digest}"
+
+
+def staging_lock_names(scopes: Iterable[str]) -> tuple[str, ...]:
+    """Return the distinct lease names guarding ``scopes`` in acquisition order."""
+
+    names = {staging_lock_name(scope) for scope in scopes}
+    if not names:
+        raise ValueError("A Staging write needs at least one lock scope.")
+    return tuple(sorted(names))
+
+
+def acquire_leases(
+    client: Any,
+    scopes: Iterable[str],
+    *,
+    timeout: int,
+    blocking_timeout: float,
+    queue_depth: int = STAGING_QUEUE_DEPTH,
+    **options: Any,
+) -> list[StagingLease] | None:
+    """Acquire the leases of ``scopes`` in name order within one shared wait budget.
+
+    Returns the held leases, or ``None`` when one could not be acquired in
+    time. Leases already taken are released before returning ``None`` or
+    propagating ``StagingMutationQueueFull`` or a Redis error.
+    """
+
+    deadline = time.monotonic() + blocking_timeout
+    scoped = {staging_lock_name(scope): scope for scope in scopes}
+    if not scoped:
+        raise ValueError("A Staging write needs at least one lock scope.")
+    held: list[StagingLease] = []
+    try:
+        for name in sorted(scoped):
+            lease = _acquire_queued(
+                client,
+                name,
+                scoped[name],
+                deadline,
+                timeout=timeout,
+                queue_depth=queue_depth,
+                **options,
+            )
+            if lease is None:
+                release_leases(client, held)
+                return None
+            held.append(lease)
+    except BaseException:
+        release_leases(client, held)
+        raise
+    return held
+
+
+def release_leases(client: Any, leases: Sequence[StagingLease]) -> bool:
+    """Release ``leases`` in reverse order; return whether every release succeeded."""
+
+    released = True
+    for lease in reversed(leases):
+        _record(
+            client,
+            lease.name,
+            lease.scope,
+            holdSeconds=time.monotonic() - lease.acquired_at,
+            holder=None,
+        )
+        try:
+            lease.lock.release()
+        except (LockError, RedisError):
+            released = False
+    return released
+
+
+def record_renewal_failure(client: Any, lease: StagingLease) -> None:
+    """Count one failed extension of ``lease`` during an active write."""
+
+    _record(client, lease.name, lease.scope, renewalFailures=1)
+
+
+def staging_lock_metrics(client: Any) -> list[dict[str, Any]]:
+    """Return the recorded metrics, holder, and queue depth of every recent lease."""
+
+    names = sorted(
+        client.zrangebyscore(
+            STAGING_METRICS_KEY, time.time() - STAGING_METRICS_TTL_SECONDS, "+inf"
+        )
+    )
+    pipe = client.pipeline(transaction=False)
+    for name in names:
+        pipe.hgetall(_metrics_key(name))
+        pipe.get(f"{name}:holder")
+        pipe.zcard(f"{name}:queue")
+    replies = pipe.execute() if names else []
+    leases = []
+    for index, name in enumerate(names):
+        values, holder, depth = replies[3 * index : 3 * index + 3]
+        if not values:
+            continue
+        leases.append(
+            {
+                "lease": name,
+                "scope": values.get("scope"),
+                **{field: int(values.get(field, 0)) for field in _COUNTERS},
+                **{
+                    field: round(float(values.get(field, 0)), 6) for field in _DURATIONS
+                },
+                "queueDepth": depth,
+                "holder": json.loads(holder) if holder else None,
+            }
+        )
+    return leases
+
+
+def _acquire_queued(
+    client: Any,
+    name: str,
+    scope: str,
+    deadline: float,
+    *,
+    timeout: int,
+    queue_depth: int,
+    **options: Any,
+) -> StagingLease | None:
+    queue = f"{name}:queue"
+    started = time.monotonic()
+    token = _enqueue(client, queue, scope)
+    try:
+        if client.zrank(queue, token) >= queue_depth:
+            _record(client, name, scope, rejected=1)
+            raise StagingMutationQueueFull(
+                "Too many Staging writes are waiting for the same StagingArea."
+            )
+        lock = client.lock(name, timeout=timeout, **options)
+        while True:
+            head = client.zrange(queue, 0, 0)
+            if head and head[0] != token:
+                if not client.exists(_WAITER_PREFIX + head[0]):
+                    # The waiter at the head stopped refreshing its entry.
+                    client.zrem(queue, head[0])
+                    continue
+            elif lock.acquire(blocking=False):
+                lease = StagingLease(name, scope, lock, time.monotonic())
+                _record(
+                    client,
+                    name,
+                    scope,
+                    acquired=1,
+                    waitSeconds=lease.acquired_at - started,
+                    holder=timeout,
+                )
+                return lease
+            if time.monotonic() >= deadline:
+                _record(client, name, scope, timeouts=1)
+                return None
+            time.sleep(STAGING_QUEUE_POLL_SECONDS)
+            if not client.pexpire(
+                _WAITER_PREFIX + token, STAGING_WAITER_TTL_MILLISECONDS
+            ):
+                client.zrem(queue, token)
+                token = _enqueue(client, queue, scope)
+    finally:
+        client.zrem(queue, token)
+        client.delete(_WAITER_PREFIX + token)
+
+
+def _enqueue(client: Any, queue: str, scope: str) -> str:
+    token = uuid4().hex
+    client.set(_WAITER_PREFIX + token, scope, px=STAGING_WAITER_TTL_MILLISECONDS)
+    client.zadd(queue, {token: client.incr(_TICKET_KEY)})
+    return token
+
+
+def _record(client: Any, name: str, scope: str, **values: Any) -> None:
+    """Add ``values`` to the lease's metrics; metrics never fail a write.
+
+    ``holder`` sets the current holder for that many seconds, or clears it when
+    ``None``. Only StagingArea leases are recorded, in an index ordered by last
+    use from which leases unused for ``STAGING_METRICS_TTL_SECONDS`` are dropped.
+    """
+
+    if not scope.startswith(staging_area_scope("")):
+        return
+    key = _metrics_key(name)
+    now = time.time()
+    try:
+        pipe = client.pipeline(transaction=False)
+        if "holder" in values:
+            seconds = values.pop("holder")
+            if seconds is None:
+                pipe.delete(f"{name}:holder")
+            else:
+                pipe.set(
+                    f"{name}:holder",
+                    json.dumps({"holder": _HOLDER, "since": time.time()}),
+                    ex=seconds,
+                )
+        pipe.hset(key, "scope", scope)
+        for field, value in values.items():
+            if field in _DURATIONS:
+                pipe.hincrbyfloat(key, field, value)
+            else:
+                pipe.hincrby(key, field, value)
+        pipe.expire(key, STAGING_METRICS_TTL_SECONDS)
+        pipe.zadd(STAGING_METRICS_KEY, {name: now})
+        pipe.zremrangebyscore(
+            STAGING_METRICS_KEY, "-inf", now - STAGING_METRICS_TTL_SECONDS
+        )
+        pipe.expire(STAGING_METRICS_KEY, STAGING_METRICS_TTL_SECONDS)
+        pipe.execute()
+    except RedisError:
+        logging.getLogger(__name__).warning("Staging lease metrics are unavailable.")
+
+
+def _metrics_key(name: str) -> str:
+    return f"{STAGING_METRICS_KEY}:{name.rsplit(':', 1)[-1]}"
+
+
 class RedisStagingMutationLock:
     """Serialize Staging structure writes across API workers.
 
-    GraphDB transactions use read-committed isolation. The bounded Redis lease
-    therefore protects check-then-write operations from concurrent folder,
-    media, and StagingArea mutations. GraphDB remains the durable source of
-    truth; Redis stores neither resources nor operation results.
+    GraphDB transactions use read-committed isolation. The bounded Redis leases
+    of the affected StagingAreas therefore protect check-then-write operations
+    from concurrent folder, media, and StagingArea mutations in those areas.
+    GraphDB remains the durable source of truth; Redis stores neither resources
+    nor operation results.
     """
 
     LOCK_NAME = STAGING_MUTATION_LOCK_NAME
@@ -44,22 +323,27 @@ class RedisStagingMutationLock:
             socket_timeout=5,
         )
 
-    def run(self, operation: Callable[[], T]) -> T:
-        """Run one Staging mutation while holding the bounded global lease."""
+    def metrics(self) -> list[dict[str, Any]]:
+        """Return the deployment-wide metrics of every recently used lease."""
+
+        return staging_lock_metrics(self._client)
+
+    def run(self, operation: Callable[[], T], scopes: Iterable[str]) -> T:
+        """Run one Staging mutation while holding the bounded leases of ``scopes``."""
 
-        lock = self._client.lock(
-            self.LOCK_NAME,
-            timeout=self.LEASE_SECONDS,
-            blocking_timeout=self.WAIT_SECONDS,
-            thread_local=False,
-        )
         try:
-            acquired = lock.acquire(blocking=True)
+            leases = acquire_leases(
+                self._client,
+                scopes,
+                timeout=self.LEASE_SECONDS,
+                blocking_timeout=self.WAIT_SECONDS,
+                thread_local=False,
+            )
         except RedisError as error:
             raise StagingMutationLockUnavailable(
                 "Staging write coordination is unavailable."
             ) from error
-        if not acquired:
+        if leases is None:
             raise StagingMutationLockUnavailable(
                 "Another Staging write is still active."
             )
@@ -70,11 +354,13 @@ class RedisStagingMutationLock:
         def renew_lease() -> None:
             interval = max(1, self.LEASE_SECONDS // 3)
             while not renewal_stop.wait(interval):
-                try:
-                    lock.extend(self.LEASE_SECONDS, replace_ttl=True)
-                except (LockError, RedisError):
-                    renewal_failed.set()
-                    return
+                for lease in leases:
+                    try:
+                        lease.lock.extend(self.LEASE_SECONDS, replace_ttl=True)
+                    except (LockError, RedisError):
+                        record_renewal_failure(self._client, lease)
+                        renewal_failed.set()
+                        return
 
         renewal = Thread(
             target=renew_lease,
@@ -87,10 +373,7 @@ class RedisStagingMutationLock:
         except BaseException:
             renewal_stop.set()
             renewal.join()
-            try:
-                lock.release()
-            except (LockError, RedisError):
-                pass
+            release_leases(self._client, leases)
             raise
 
         renewal_stop.set()
@@ -99,12 +382,68 @@ class RedisStagingMutationLock:
             logging.getLogger(__name__).error(
                 "Staging mutation lease renewal failed during an active write."
             )
-        try:
-            lock.release()
-        except (LockError, RedisError):
+        if not release_leases(self._client, leases):
             # The operation may already be durable. Keep its truthful success
             # response; the bounded lease expires without storing domain data.
             logging.getLogger(__name__).warning(
                 "Staging mutation lease could not be released after a successful write."
             )
         return result
+
+
+class RedisQuotaLease:
+    """Serialize the quota counter moves of one job kind across API workers.
+
+    Job repositories move quota counters with read-modify-write updates inside
+    read-committed GraphDB transactions, so two concurrent moves could read the
+    same value and one increment would be lost. A transaction takes the lease
+    of ``scope`` before it first reads a counter and keeps it until it commits
+    or aborts; :meth:`hold` is therefore idempotent until :meth:`release`.
+    """
+
+    LEASE_SECONDS = QUOTA_LEASE_SECONDS
+    WAIT_SECONDS = STAGING_MUTATION_WAIT_SECONDS
+
+    def __init__(self, scope: str, client: Redis | None = None) -> None:
+        self._scope = scope
+        self._client = client or Redis.from_url(
+            staging_lock_redis_url(),
+            decode_responses=True,
+            socket_connect_timeout=5,
+            socket_timeout=5,
+        )
+        self._leases: list[StagingLease] | None = None
+
+    def hold(self) -> None:
+        """Take the lease unless the current transaction already holds it."""
+
+        if self._leases is not None:
+            return
+        try:
+            leases = acquire_leases(
+                self._client,
+                (self._scope,),
+                timeout=self.LEASE_SECONDS,
+                blocking_timeout=self.WAIT_SECONDS,
+                queue_depth=QUOTA_QUEUE_DEPTH,
+                thread_local=False,
+            )
+        except RedisError as error:
+            raise StagingMutationLockUnavailable(
+                "Quota coordination is unavailable."
+            ) from error
+        if leases is None:
+            raise StagingMutationLockUnavailable(
+                "Another quota update is still active."
+            )
+        self._leases = leases
+
+    def release(self) -> None:
+        """Release the lease after the transaction that took it has ended."""
+
+        leases, self._leases = self._leases, None
+        if leases and not release_leases(self._client, leases):
+            # The transaction has already ended; the bounded lease expires.
+            logging.getLogger(__name__).warning(
+                "Quota lease could not be released after its transaction ended."
+            )
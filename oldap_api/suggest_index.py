@@ -0,0 +1,359 @@
+"""In-process edge n-gram index for typeahead suggestions.
+
+``/data/text`` and ``/data/textsearch`` send every keystroke to the GraphDB
+full-text or regex search. Projects listed in ``OLDAP_SUGGEST_PROPERTIES`` get a
+per-process index over the values of their configured label properties
+instead, which ``/data/suggest/<project>`` answers from memory. The variable
+names the properties per project, for example::
+
+    OLDAP_SUGGEST_PROPERTIES="fasnacht=shared:name rdfs:label;test=test:title"
+
+Each label is folded to lower case without diacritics and split into words;
+every word prefix of up to ``MAX_PREFIX_LENGTH`` characters points to the
+resources carrying it. Each resource remembers the roles through which it may
+be viewed, and a lookup only returns resources reachable through one of the
+roles the requester currently holds in ``oldap:admin``.
+
+The index is built with one query on first use. Successful instance writes
+append the IRIs they touched to a per-project log in the API cache Redis, and
+every worker re-reads only those resources before its next lookup. Because each
+of those writes also advances the project's data-graph stamp by one, an index
+whose stamp moved further than its log did missed a change the log does not
+describe, such as a model or list change, an import, or a user or role change,
+and is rebuilt instead. Without Redis the index is rebuilt for every lookup.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import os
+import re
+import unicodedata
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
+from threading import Lock
+from typing import Any
+
+from oldaplib.src.enums.datapermissions import DataPermission
+from oldaplib.src.helpers.context import Context
+from oldaplib.src.xsd.xsd_qname import Xsd_QName
+from redis.exceptions import RedisError
+
+from oldap_api.data_stamps import DataGraphStamps
+from oldap_api.requester_roles import REQUESTER_ROLES, RequesterRoles
+
+SUGGEST_PROPERTIES_ENV = "OLDAP_SUGGEST_PROPERTIES"
+SUGGEST_LOG_PREFIX = "oldap:suggest-log:project:"
+MAX_SUGGEST_LOG = 10_000
+MAX_PREFIX_LENGTH = 12
+MIN_QUERY_LENGTH = 2
+DEFAULT_SUGGESTIONS = 10
+MAX_SUGGESTIONS = 50
+
+_WORD = re.compile(r"\w+")
+_IRIREF = re.compile(r'^[A-Za-z][A-Za-z0-9+.\-]*:[^\x00-\x20<>"{}|^`\\]*$')
+
+
+@dataclass(frozen=True)
+class Suggestion:
+    """One resource offered for a typed prefix, with its best matching label."""
+
+    iri: str
+    label: str
+    lang: str | None = None
+
+
+@dataclass(frozen=True)
+class _Labelled:
+    labels: tuple[tuple[str, str | None], ...]
+    roles: frozenset[str]
+
+
+@dataclass
+class _ProjectIndex:
+    stamp: tuple[int, int] | None
+    position: int
+    entries: dict[str, _Labelled] = field(default_factory=dict)
+    prefixes: dict[str, set[str]] = field(default_factory=dict)
+
+    def put(self, iri: str, entry: _Labelled | None) -> None:
+        old = self.entries.pop(iri, None)
+        if old is not None:
+            for prefix in _prefixes(label for label, _ in old.labels):
+                members = self.prefixes.get(prefix)
+                if members is not None:
+                    members.discard(iri)
+                    if not members:
+                        del self.prefixes[prefix]
+        if entry is None:
+            return
+        self.entries[iri] = entry
+        for prefix in _prefixes(label for label, _ in entry.labels):
+            self.prefixes.setdefault(prefix, set()).add(iri)
+
+    def lookup(self, query: str, roles: frozenset[str], limit: int) -> list[Suggestion]:
+        folded = fold(query)
+        words = _WORD.findall(folded)
+        if not words:
+            return []
+        candidates = sorted(
+            (self.prefixes.get(word[:MAX_PREFIX_LENGTH], set()) for word in words),
+            key=len,
+        )
+        ranked = []
+        for iri in set.intersection(*candidates) if candidates else ():
+            entry = self.entries[iri]
+            if not entry.roles & roles:
+                continue
+            best = None
+            for label, lang in entry.labels:
+                label_folded = fold(label)
+                label_words = _WORD.findall(label_folded)
+                if not all(
+                    any(w.startswith(word) for w in label_words) for word in words
+                ):
+                    continue
+                rank = (
+                    (
+                        0
+                        if label_folded == folded
+                        else 1 if label_folded.startswith(folded) else 2
+                    ),
+                    len(label),
+                    label_folded,
+                    iri,
+                )
+                if best is None or rank < best[0]:
+                    best = (rank, Suggestion(iri=iri, label=label, lang=lang))
+            if best is not None:
+                ranked.append(best)
+        return [suggestion for _, suggestion in heapq.nsmallest(limit, ranked)]
+
+
+class SuggestIndex:
+    """Per-project label indexes kept in step with the suggest log."""
+
+    def __init__(
+        self,
+        *,
+        stamps: DataGraphStamps | None = None,
+        properties: Callable[[str], tuple[Xsd_QName, ...]] | None = None,
+        roles: RequesterRoles = REQUESTER_ROLES,
+    ) -> None:
+        self._lock = Lock()
+        self._stamps = stamps
+        self._roles = roles
+        self._properties = properties or configured_suggest_properties
+        self._projects: dict[str, _ProjectIndex] = {}
+        self.lookups = 0
+        self.rebuilds = 0
+        self.updates = 0
+
+    def enabled(self, project: str) -> bool:
+        """Return whether suggestions are configured for ``project``."""
+
+        return bool(self._properties(project))
+
+    def suggest(
+        self, con: Any, project: str, query: str, *, limit: int = DEFAULT_SUGGESTIONS
+    ) -> list[Suggestion]:
+        """Return up to ``limit`` resources visible to ``con`` with a label matching ``query``.
+
+        Every word of the query must be a prefix of a word of the same label.
+        """
+
+        if len(query.strip()) < MIN_QUERY_LENGTH:
+            return []
+        index = self._synchronized(con, project)
+        roles = self._roles.current(
+            con, str(index.stamp[1]) if index.stamp is not None else None
+        )
+        with self._lock:
+            self.lookups += 1
+            return index.lookup(query, roles, limit)
+
+    def record_writes(self, project: str, iris: Iterable[str]) -> None:
+        """Log the resources a successful write touched for every worker to re-read."""
+
+        iris = sorted({str(iri) for iri in iris})
+        if not iris or not self.enabled(project):
+            return
+        try:
+            client = self._client()
+            length = client.rpush(_log_key(project), json.dumps(iris))
+            if length > MAX_SUGGEST_LOG:
+                client.delete(_log_key(project))
+        except RedisError:
+            pass
+
+    def stats(self) -> dict[str, int]:
+        """Return lookup, rebuild, and update counters for operational diagnostics."""
+
+        with self._lock:
+            return {
+                "lookups": self.lookups,
+                "rebuilds": self.rebuilds,
+                "updates": self.updates,
+                "projects": len(self._projects),
+                "resources": sum(len(item.entries) for item in self._projects.values()),
+            }
+
+    def clear(self) -> None:
+        """Drop all indexes and reset the counters."""
+
+        with self._lock:
+            self._projects.clear()
+            self.lookups = 0
+            self.rebuilds = 0
+            self.updates = 0
+
+    def _client(self) -> Any:
+        if self._stamps is None:
+            self._stamps = DataGraphStamps()
+        return self._stamps.client
+
+    def _synchronized(self, con: Any, project: str) -> _ProjectIndex:
+        try:
+            client = self._client()
+            stamp = _parse_stamp(self._stamps.current(project))
+            length = client.llen(_log_key(project))
+        except RedisError:
+            stamp, length = None, 0
+        with self._lock:
+            index = self._projects.get(project)
+        if index is not None and stamp is not None and index.stamp is not None:
+            logged = length - index.position
+            if stamp == index.stamp:
+                return index
+            if stamp[1] == index.stamp[1] and 0 <= logged == stamp[0] - index.stamp[0]:
+                try:
+                    entries = client.lrange(
+                        _log_key(project), index.position, length - 1
+                    )
+                except RedisError:
+                    entries = None
+                if entries is not None and len(entries) == logged:
+                    context = Context(name=con.context_name)
+                    iris = {
+                        _expand(context, iri)
+                        for entry in entries
+                        for iri in json.loads(entry)
+                    }
+                    iris = {iri for iri in iris if _IRIREF.match(iri)}
+                    fresh = self._read(con, project, iris)
+                    with self._lock:
+                        for iri in iris:
+                            index.put(iri, fresh.get(iri))
+                        index.stamp = stamp
+                        index.position = length
+                        self.updates += 1
+                    return index
+
+        index = _ProjectIndex(stamp=stamp, position=length)
+        for iri, entry in self._read(con, project, None).items():
+            index.put(iri, entry)
+        with self._lock:
+            self.rebuilds += 1
+            if stamp is not None:
+                self._projects[project] = index
+        return index
+
+    def _read(
+        self, con: Any, project: str, iris: set[str] | None
+    ) -> dict[str, _Labelled]:
+        """Read the labels and viewing roles of all, or of the given, resources."""
+
+        if iris is not None and not iris:
+            return {}
+        properties = " ".join(prop.toRdf for prop in self._properties(project))
+        restriction = ""
+        if iris is not None:
+            restriction = (
+                f"VALUES ?res {{ {' '.join(f'<{iri}>' for iri in sorted(iris))} }}"
+            )
+        context = Context(name=con.context_name)
+        query = context.sparql_context
+        query += f"""
+        SELECT ?res ?label ?role
+        WHERE {{
+            {restriction}
+            VALUES ?prop {{ {properties} }}
+            GRAPH {project}:data {{
+                ?res ?prop ?label .
+                ?res oldap:attachedToRole ?role .
+                << ?res oldap:attachedToRole ?role >> oldap:hasDataPermission ?DataPermission .
+            }}
+            GRAPH oldap:admin {{
+                ?DataPermission oldap:permissionValue ?permval .
+                FILTER(?permval >= {DataPermission.DATA_VIEW.numeric.toRdf})
+            }}
+        }}
+        """
+        labels: dict[str, dict[tuple[str, str | None], None]] = {}
+        roles: dict[str, set[str]] = {}
+        for binding in con.query(query)["results"]["bindings"]:
+            iri = binding["res"]["value"]
+            label = binding["label"]
+            labels.setdefault(iri, {})[(label["value"], label.get("xml:lang"))] = None
+            roles.setdefault(iri, set()).add(binding["role"]["value"])
+        return {
+            iri: _Labelled(labels=tuple(labels[iri]), roles=frozenset(roles[iri]))
+            for iri in labels
+        }
+
+
+def configured_suggest_properties(project: str) -> tuple[Xsd_QName, ...]:
+    """Return the label properties configured for ``project``, if any."""
+
+    return _parse_suggest_properties(os.getenv(SUGGEST_PROPERTIES_ENV, "")).get(
+        project, ()
+    )
+
+
+@lru_cache(maxsize=4)
+def _parse_suggest_properties(value: str) -> Mapping[str, tuple[Xsd_QName, ...]]:
+    projects: dict[str, tuple[Xsd_QName, ...]] = {}
+    for item in value.split(";"):
+        project, _, properties = item.partition("=")
+        if project.strip() and properties.strip():
+            projects[project.strip()] = tuple(
+                Xsd_QName(prop, validate=True) for prop in properties.split()
+            )
+    return projects
+
+
+def fold(text: str) -> str:
+    """Lower-case ``text`` and strip diacritics for matching."""
+
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+def _prefixes(labels: Iterable[str]) -> set[str]:
+    return {
+        word[:length]
+        for label in labels
+        for word in _WORD.findall(fold(label))
+        for length in range(1, min(len(word), MAX_PREFIX_LENGTH) + 1)
+    }
+
+
+def _expand(context: Context, iri: str) -> str:
+    prefix, separator, _ = iri.partition(":")
+    if separator and context.get(prefix) is not None:
+        return str(context.qname2iri(Xsd_QName(iri, validate=False)))
+    return iri
+
+
+def _parse_stamp(stamp: str) -> tuple[int, int]:
+    project, _, shared = stamp.partition(".")
+    return int(project), int(shared)
+
+
+def _log_key(project: str) -> str:
+    return f"{SUGGEST_LOG_PREFIX}{project}"
+
+
+SUGGEST_INDEX = SuggestIndex()
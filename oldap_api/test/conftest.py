@@ -7,6 +7,10 @@ from oldaplib.src.helpers.context import Context
 from oldaplib.src.xsd.xsd_qname import Xsd_QName
 from oldaplib.src.dtypes.namespaceiri import NamespaceIRI
 from oldap_api.factory import factory
+from redis.exceptions import RedisError
+
+from oldap_api.data_stamps import DataGraphStamps
+from oldap_api.model_cache import DATAMODEL_DOCUMENTS, PROJECT_MODEL_CACHE
 
 
 class ConnectionManager:
@@ -128,6 +132,14 @@ def app():
     con.clear_graph(Xsd_QName('test:data'))
     con.upload_turtle(os.environ['OLDAPBASE'] + "/oldaplib/oldaplib/testdata/objectfactory_test.trig")
     con.upload_turtle(os.environ['OLDAPBASE'] + "/oldaplib/oldaplib/testdata/instances_test.trig")
+    # The graphs were replaced behind the API's back, so forget parsed models
+    # and make results cached under the old data-graph stamps unreachable.
+    PROJECT_MODEL_CACHE.clear()
+    DATAMODEL_DOCUMENTS.clear()
+    try:
+        DataGraphStamps().bump(None)
+    except RedisError:
+        pass
 
     yield app
 
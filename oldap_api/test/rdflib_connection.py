@@ -0,0 +1,72 @@
+"""In-process rdflib stand-in for the transactional OLDAP connection.
+
+Repository tests and benchmarks use it to execute the generated SPARQL instead
+of matching query text. Transactions are recorded but not isolated; callers
+that need rollback semantics must use the GraphDB-backed tests.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from rdflib import BNode, Dataset, Literal, URIRef
+
+
+class RdflibTransactionalConnection:
+    """Answer SPARQL with GraphDB-shaped JSON results from one rdflib Dataset."""
+
+    def __init__(self) -> None:
+        self.dataset = Dataset()
+        self.started = 0
+        self.committed = 0
+        self.aborted = 0
+        self.queries: list[str] = []
+        self.updates: list[str] = []
+
+    def query(self, query: str) -> dict[str, Any]:
+        self.queries.append(query)
+        return _json_result(self.dataset.query(query))
+
+    def transaction_start(self) -> None:
+        self.started += 1
+
+    def transaction_query(self, query: str) -> dict[str, Any]:
+        return self.query(query)
+
+    def transaction_update(self, query: str) -> None:
+        self.updates.append(query)
+        self.dataset.update(query)
+
+    def transaction_commit(self) -> None:
+        self.committed += 1
+
+    def transaction_abort(self) -> None:
+        self.aborted += 1
+
+
+def _json_result(result: Any) -> dict[str, Any]:
+    if result.type == "ASK":
+        return {"boolean": bool(result.askAnswer)}
+    variables = [str(variable) for variable in result.vars]
+    bindings = []
+    for row in result:
+        binding = {}
+        for name, term in zip(variables, row):
+            if term is not None:
+                binding[name] = _json_term(term)
+        bindings.append(binding)
+    return {"head": {"vars": variables}, "results": {"bindings": bindings}}
+
+
+def _json_term(term: Any) -> dict[str, str]:
+    if isinstance(term, URIRef):
+        return {"type": "uri", "value": str(term)}
+    if isinstance(term, BNode):
+        return {"type": "bnode", "value": str(term)}
+    value: dict[str, str] = {"type": "literal", "value": str(term)}
+    if isinstance(term, Literal):
+        if term.language:
+            value["xml:lang"] = term.language
+        elif term.datatype is not None:
+            value["datatype"] = str(term.datatype)
+    return value
@@ -200,7 +200,7 @@ def test_staging_service_uses_only_visible_search_results_and_never_writes(monke
         pass
 
     factory = type("Factory", (), {"read": lambda self, _iri: VisibleArea()})()
-    monkeypatch.setattr(archive_workflow, "ResourceInstanceFactory", lambda **_kwargs: factory)
+    monkeypatch.setattr(archive_workflow, "CachedResourceInstanceFactory", lambda **_kwargs: factory)
     calls = []
 
     def search(**kwargs):
@@ -1,12 +1,22 @@
 """Unit tests for the centralized bearer-authentication boundary."""
 
+from types import SimpleNamespace
+
+import jwt
 import requests
 from flask import Flask, jsonify
 
-from oldap_api.authentication import authenticated_connection, require_auth
+from oldap_api import authentication
+from oldap_api.authentication import (
+    VERIFIED_TOKEN_CACHE,
+    VerifiedTokenCache,
+    authenticated_connection,
+    require_auth,
+)
 from oldap_api.factory import factory
-from oldap_api.views import auth_views
+from oldap_api.views import auth_views, metrics_views
 from oldaplib.src.authentication import AuthorizationContext, TokenCodec, TokenSettings
+from oldaplib.src.enums.adminpermissions import AdminPermission
 from oldaplib.src.helpers.observable_dict import ObservableDict
 from oldaplib.src.in_project import InProjectClass
 from oldaplib.src.xsd.iri import Iri
@@ -57,6 +67,86 @@ def test_valid_access_token_reaches_view(monkeypatch):
     assert response.json == {"userId": "tester"}
 
 
+def test_repeated_access_token_is_served_from_the_verified_token_cache(monkeypatch):
+    monkeypatch.setenv("OLDAP_ACCESS_JWT_SECRET", ACCESS_SECRET)
+    VERIFIED_TOKEN_CACHE.clear()
+    decoded = []
+    decode = TokenCodec.decode_access_token
+
+    def counting_decode(self, token):
+        decoded.append(token)
+        return decode(self, token)
+
+    monkeypatch.setattr(TokenCodec, "decode_access_token", counting_decode)
+    client = _app().test_client()
+    headers = {"Authorization": f"Bearer {_access_token()}"}
+
+    responses = [client.get("/protected", headers=headers) for _ in range(3)]
+
+    assert [response.json for response in responses] == [{"userId": "tester"}] * 3
+    assert len(decoded) == 1
+    stats = VERIFIED_TOKEN_CACHE.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 1, 1)
+    assert stats["hitRate"] == 2 / 3
+    assert stats["meanMissSeconds"] > 0
+    VERIFIED_TOKEN_CACHE.clear()
+
+
+def test_verified_token_cache_honours_ttl_expiry_and_size():
+    now = [1_000.0]
+    cache = VerifiedTokenCache(2, ttl_seconds=30, clock=lambda: now[0])
+    context = object()
+
+    def token(exp):
+        return jwt.encode({"exp": exp, "n": exp}, "k" * 32, algorithm="HS256")
+
+    long_lived, short_lived = token(5_000), token(1_010)
+    cache.store(long_lived, context)
+    cache.store(short_lived, context)
+    assert cache.lookup(long_lived) is context
+    now[0] = 1_011
+    assert cache.lookup(short_lived) is None
+    now[0] = 1_031
+    assert cache.lookup(long_lived) is None
+
+    now[0] = 2_000
+    for exp in (5_001, 5_002, 5_003):
+        cache.store(token(exp), context)
+    assert cache.lookup(token(5_001)) is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_token_cache_metrics_are_limited_to_system_administrators(monkeypatch):
+    permissions = {
+        "admin": {"oldap:SystemProject": {AdminPermission.ADMIN_OLDAP}},
+        "editor": {"test:project": {AdminPermission.ADMIN_RESOURCES}},
+    }
+
+    class FakeConnection:
+        def __init__(self, token=None, **kwargs) -> None:
+            self.userdata = SimpleNamespace(inProject=permissions[token])
+
+    monkeypatch.setattr(authentication, "Connection", FakeConnection)
+    VERIFIED_TOKEN_CACHE.clear()
+    app = Flask(__name__)
+    app.register_blueprint(metrics_views.metrics_bp)
+    client = app.test_client()
+
+    denied = client.get(
+        "/metrics/auth-tokens", headers={"Authorization": "Bearer editor"}
+    )
+    allowed = client.get(
+        "/metrics/auth-tokens", headers={"Authorization": "Bearer admin"}
+    )
+
+    assert denied.status_code == 403
+    assert allowed.status_code == 200
+    assert allowed.headers["Cache-Control"] == "no-store"
+    assert set(allowed.json) == set(VERIFIED_TOKEN_CACHE.stats())
+    assert (allowed.json["hits"], allowed.json["misses"]) == (0, 2)
+    VERIFIED_TOKEN_CACHE.clear()
+
+
 def test_missing_malformed_and_invalid_credentials_are_uniform(monkeypatch):
     monkeypatch.setenv("OLDAP_ACCESS_JWT_SECRET", ACCESS_SECRET)
     client = _app().test_client()
@@ -0,0 +1,127 @@
+"""Batch instance reads resolve types once and read each class group together."""
+
+import re
+from types import SimpleNamespace
+
+from flask import Flask
+from oldaplib.src.xsd.xsd_qname import Xsd_QName
+
+from oldap_api import authentication
+from oldap_api.data_stamps import DataGraphStamps
+from oldap_api.instance_cache import InstanceReadCache
+from oldap_api.test.test_data_stamps import FakeRedis
+from oldap_api.test.test_instance_cache import GeneratedClass
+from oldap_api.views import instance_views
+
+FIRST = "urn:uuid:11111111-1111-4111-8111-111111111111"
+SECOND = "urn:uuid:22222222-2222-4222-8222-222222222222"
+HIDDEN = "urn:uuid:33333333-3333-4333-8333-333333333333"
+MISSING = "urn:uuid:44444444-4444-4444-8444-444444444444"
+TYPED = (FIRST, SECOND, HIDDEN)
+
+
+class FakeConnection:
+    context_name = "DEFAULT"
+    userIri = "https://example.org/users/alice"
+    queries: list[str] = []
+
+    def __init__(self, **kwargs) -> None:
+        pass
+
+    def query(self, query):
+        FakeConnection.queries.append(query)
+        bindings = [
+            {
+                "key": {
+                    "type": "literal",
+                    "value": key,
+                    "datatype": "http://www.w3.org/2001/XMLSchema#integer",
+                },
+                "resclass": {
+                    "type": "uri",
+                    "value": "http://oldap.org/shared#StagingFolder",
+                },
+            }
+            for key, iri in re.findall(r"\((\d+) <([^>]+)>\)", query)
+            if iri in TYPED
+        ]
+        return {
+            "head": {"vars": ["key", "resclass"]},
+            "results": {"bindings": bindings},
+        }
+
+
+class Factory:
+    created = 0
+    reads: list[list[str]] = []
+
+    def __init__(self, con, project):
+        Factory.created += 1
+
+    def createObjectInstance(self, resource):
+        return GeneratedClass
+
+    def read_summaries(self, iris, include_properties):
+        Factory.reads.append([str(iri) for iri in iris])
+        return {
+            iri: SimpleNamespace(
+                data={
+                    Xsd_QName("rdf:type", validate=False): [
+                        Xsd_QName("shared:StagingFolder", validate=False)
+                    ],
+                    Xsd_QName("shared:name", validate=False): str(iri)[-4:],
+                }
+            )
+            for iri in iris
+            if str(iri) != HIDDEN
+        }
+
+
+def test_batch_read_groups_by_class_and_reports_unreadable_items(monkeypatch):
+    FakeConnection.queries = []
+    Factory.created = 0
+    Factory.reads = []
+    monkeypatch.setattr(authentication, "Connection", FakeConnection)
+    monkeypatch.setattr(
+        instance_views,
+        "INSTANCE_READ_CACHE",
+        InstanceReadCache(stamps=DataGraphStamps(FakeRedis())),
+    )
+    monkeypatch.setattr(instance_views, "CachedResourceInstanceFactory", Factory)
+    app = Flask(__name__)
+    app.register_blueprint(instance_views.instance_bp)
+    client = app.test_client()
+    headers = {"Authorization": "Bearer valid-test-token"}
+    body = {"iris": [FIRST, SECOND, HIDDEN, MISSING, FIRST]}
+
+    response = client.post("/data/shared/batch-read", json=body, headers=headers)
+
+    assert response.status_code == 200
+    assert response.json["resources"] == {
+        FIRST: {"rdf:type": ["shared:StagingFolder"], "shared:name": "1111"},
+        SECOND: {"rdf:type": ["shared:StagingFolder"], "shared:name": "2222"},
+    }
+    assert set(response.json["errors"]) == {HIDDEN, MISSING}
+    assert response.json["errors"][HIDDEN]["status"] == 404
+    assert len(FakeConnection.queries) == 1
+    assert Factory.reads == [[FIRST, SECOND, HIDDEN]]
+
+    client.post("/data/shared/batch-read", json=body, headers=headers)
+    assert len(FakeConnection.queries) == 2
+    assert FIRST not in FakeConnection.queries[1]
+    assert f"(0 <{MISSING}>)" in FakeConnection.queries[1]
+
+    for invalid in ({"iris": []}, {"iris": [1]}, {"iris": [FIRST], "extra": 1}):
+        assert (
+            client.post(
+                "/data/shared/batch-read", json=invalid, headers=headers
+            ).status_code
+            == 400
+        )
+    too_many = {"iris": [f"urn:example:{index}" for index in range(201)]}
+    assert (
+        client.post(
+            "/data/shared/batch-read", json=too_many, headers=headers
+        ).status_code
+        == 400
+    )
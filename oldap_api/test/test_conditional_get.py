@@ -0,0 +1,100 @@
+"""Read routes answer revalidations with 304 and skip building the body."""
+
+from types import SimpleNamespace
+
+from flask import Flask
+from oldaplib.src.xsd.xsd_datetime import Xsd_dateTime
+
+from oldap_api import authentication
+from oldap_api.data_stamps import DataGraphStamps
+from oldap_api.instance_cache import InstanceReadCache
+from oldap_api.test.test_data_stamps import FakeRedis
+from oldap_api.test.test_instance_cache import IRI, Factory, FakeConnection, Reader
+from oldap_api.views import instance_views, project_views
+
+HEADERS = {"Authorization": "Bearer valid-test-token"}
+
+
+class FakeProject:
+    modified = "2025-04-25T17:39:56.637331+02:00"
+
+    @classmethod
+    def read(cls, con, projectIri_SName):
+        return SimpleNamespace(
+            projectIri="http://example.org/projects/hyha",
+            creator=None,
+            created=None,
+            contributor=None,
+            modified=Xsd_dateTime(cls.modified),
+            label=None,
+            comment=None,
+            projectShortName="hyha",
+            namespaceIri=None,
+            projectStart=None,
+            projectEnd=None,
+        )
+
+
+def test_project_read_honors_only_the_etag(monkeypatch):
+    monkeypatch.setattr(authentication, "Connection", FakeConnection)
+    monkeypatch.setattr(project_views, "Project", FakeProject)
+    app = Flask(__name__)
+    app.register_blueprint(project_views.project_bp)
+    client = app.test_client()
+
+    first = client.get("/admin/project/hyha", headers=HEADERS)
+    assert first.status_code == 200
+    assert first.json["projectShortName"] == "hyha"
+    etag = first.headers["ETag"]
+    assert "Last-Modified" not in first.headers
+
+    matched = client.get(
+        "/admin/project/hyha", headers={**HEADERS, "If-None-Match": etag}
+    )
+    assert (matched.status_code, matched.data, matched.headers["ETag"]) == (
+        304,
+        b"",
+        etag,
+    )
+    # A write within the same second is invisible to a one-second HTTP date.
+    FakeProject.modified = "2025-04-25T17:39:56.901204+02:00"
+    since = client.get(
+        "/admin/project/hyha",
+        headers={**HEADERS, "If-Modified-Since": "Fri, 25 Apr 2025 15:39:56 GMT"},
+    )
+    assert since.status_code == 200
+    changed = client.get(
+        "/admin/project/hyha", headers={**HEADERS, "If-None-Match": etag}
+    )
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+def test_instance_revalidation_skips_the_response_shaping(monkeypatch):
+    shaped = []
+    original = instance_views.instance_read_response
+    monkeypatch.setattr(authentication, "Connection", FakeConnection)
+    monkeypatch.setattr(
+        instance_views,
+        "INSTANCE_READ_CACHE",
+        InstanceReadCache(stamps=DataGraphStamps(FakeRedis())),
+    )
+    monkeypatch.setattr(instance_views, "CachedResourceInstanceFactory", Factory)
+    monkeypatch.setattr(instance_views, "ResourceInstance", Reader)
+    monkeypatch.setattr(
+        instance_views,
+        "instance_read_response",
+        lambda *args: shaped.append(args) or original(*args),
+    )
+    app = Flask(__name__)
+    app.register_blueprint(instance_views.instance_bp)
+    client = app.test_client()
+
+    first = client.get(f"/data/shared/{IRI}", headers=HEADERS)
+    second = client.get(
+        f"/data/shared/{IRI}",
+        headers={**HEADERS, "If-None-Match": first.headers["ETag"]},
+    )
+
+    assert (first.status_code, second.status_code) == (200, 304)
+    assert len(shaped) == 1
@@ -0,0 +1,151 @@
+"""Data-graph change stamps and the cached export download authorization."""
+
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask, Blueprint
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from oldap_api.data_stamps import DataGraphStamps, register_data_graph_stamps
+from oldap_api.exports.authorization_cache import CachedExportDownloadAuthorizer
+from oldap_api.exports.staging_snapshot import ExportDownloadPermissionError
+
+
+class FakeRedis:
+    """Implement the few string commands used by the stamps and the cache."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+
+    def mget(self, keys):
+        return [self.values.get(key) for key in keys]
+
+    def incr(self, key):
+        self.values[key] = str(int(self.values.get(key, 0)) + 1)
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        assert ex == 60
+        self.values[key] = value
+
+
+class BrokenRedis:
+    def __getattr__(self, name):
+        def fail(*args, **kwargs):
+            raise RedisConnectionError("down")
+
+        return fail
+
+
+def _app(stamps: DataGraphStamps) -> Flask:
+    app = Flask(__name__)
+    instance = Blueprint("instance", __name__)
+    user = Blueprint("user", __name__)
+    exports = Blueprint("exports", __name__)
+
+    @instance.post("/data/<project>/<iri>")
+    def update_instance(project, iri):
+        return {"status": int(iri)}, int(iri)
+
+    @instance.post("/data/search/<project>")
+    def search_instance(project):
+        return {}
+
+    @user.post("/user/<userid>")
+    def modify_user(userid):
+        return {}
+
+    @exports.post("/exports")
+    def create_export():
+        return {}
+
+    for blueprint in (instance, user, exports):
+        app.register_blueprint(blueprint)
+    register_data_graph_stamps(app, stamps)
+    return app
+
+
+def test_successful_data_writes_advance_project_or_global_stamps():
+    stamps = DataGraphStamps(FakeRedis())
+    client = _app(stamps).test_client()
+
+    assert stamps.current("museum") == "0.0"
+    client.post("/data/museum/200")
+    client.post("/data/museum/404")
+    client.post("/data/search/museum")
+    client.post("/exports")
+    client.get("/data/museum/200")
+    assert stamps.current("museum") == "1.0"
+    assert stamps.current("library") == "0.0"
+
+    client.post("/user/alice")
+    assert stamps.current("museum") == "1.1"
+    assert stamps.current("library") == "0.1"
+
+
+def test_stamp_failures_do_not_fail_the_write():
+    response = (
+        _app(DataGraphStamps(BrokenRedis())).test_client().post("/data/museum/200")
+    )
+
+    assert response.status_code == 200
+
+
+class CountingAuthorizer:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.allowed = True
+
+    def authorize(self, connection, *, job, manifest):
+        self.calls += 1
+        if not self.allowed:
+            raise ExportDownloadPermissionError("no longer visible")
+
+
+def _download(export_id="11111111-1111-4111-8111-111111111111", user="alice"):
+    return (
+        SimpleNamespace(userIri=f"https://example.org/users/{user}"),
+        SimpleNamespace(
+            export_id=export_id,
+            selection=SimpleNamespace(project_short_name="museum"),
+        ),
+        SimpleNamespace(sha256="a" * 64),
+    )
+
+
+def test_cached_authorization_is_reused_until_the_project_changes():
+    stamps = DataGraphStamps(FakeRedis())
+    inner = CountingAuthorizer()
+    cached = CachedExportDownloadAuthorizer(inner, stamps=stamps)
+    connection, job, manifest = _download()
+
+    cached.authorize(connection, job=job, manifest=manifest)
+    cached.authorize(connection, job=job, manifest=manifest)
+    assert inner.calls == 1
+
+    other, _, _ = _download(user="bob")
+    cached.authorize(other, job=job, manifest=manifest)
+    assert inner.calls == 2
+
+    stamps.bump("museum")
+    inner.allowed = False
+    with pytest.raises(ExportDownloadPermissionError):
+        cached.authorize(connection, job=job, manifest=manifest)
+    with pytest.raises(ExportDownloadPermissionError):
+        cached.authorize(connection, job=job, manifest=manifest)
+    assert inner.calls == 4
+
+
+def test_unavailable_redis_falls_back_to_full_authorization():
+    inner = CountingAuthorizer()
+    cached = CachedExportDownloadAuthorizer(
+        inner, stamps=DataGraphStamps(BrokenRedis())
+    )
+    connection, job, manifest = _download()
+
+    cached.authorize(connection, job=job, manifest=manifest)
+    cached.authorize(connection, job=job, manifest=manifest)
+
+    assert inner.calls == 2
@@ -0,0 +1,107 @@
+"""Data model documents are served from cache with ETags and rebuilt on writes."""
+
+from types import SimpleNamespace
+
+from flask import Flask
+
+from oldap_api import authentication
+from oldap_api.model_cache import (
+    DatamodelDocumentCache,
+    ModelVersions,
+    register_model_versions,
+)
+from oldap_api.test.test_data_stamps import FakeRedis
+from oldap_api.views import datamodelling_views
+
+
+class FakeConnection:
+    def __init__(self, **kwargs) -> None:
+        pass
+
+
+def _resource_class():
+    return SimpleNamespace(
+        superclass=None,
+        created=None,
+        creator=None,
+        modified=None,
+        contributor=None,
+        projectid=None,
+        label=None,
+        comment=None,
+        closed=None,
+        properties={},
+    )
+
+
+class FakeDataModel:
+    reads = 0
+    resources: dict = {}
+
+    @classmethod
+    def read(cls, con, project, ignore_cache=False):
+        cls.reads += 1
+        return cls()
+
+    def get_extontos(self):
+        return []
+
+    def get_propclasses(self):
+        return []
+
+    def get_resclasses(self):
+        return list(FakeDataModel.resources)
+
+    def __getitem__(self, key):
+        return FakeDataModel.resources[key]
+
+    def __delitem__(self, key):
+        del FakeDataModel.resources[key]
+
+    def update(self):
+        pass
+
+
+def test_unchanged_model_is_revalidated_and_writes_rebuild_it(monkeypatch):
+    FakeDataModel.reads = 0
+    FakeDataModel.resources = {
+        "hyha:Book": _resource_class(),
+        "hyha:Page": _resource_class(),
+    }
+    versions = ModelVersions(FakeRedis())
+    documents = DatamodelDocumentCache(versions=versions)
+    monkeypatch.setattr(authentication, "Connection", FakeConnection)
+    monkeypatch.setattr(datamodelling_views, "DataModel", FakeDataModel)
+    monkeypatch.setattr(datamodelling_views, "DATAMODEL_DOCUMENTS", documents)
+    app = Flask(__name__)
+    app.register_blueprint(datamodelling_views.datamodel_bp)
+    register_model_versions(app, versions)
+    client = app.test_client()
+    headers = {"Authorization": "Bearer valid-test-token"}
+
+    first = client.get("/admin/datamodel/hyha", headers=headers)
+    assert first.status_code == 200
+    assert [item["iri"] for item in first.json["resources"]] == [
+        "hyha:Book",
+        "hyha:Page",
+    ]
+    etag = first.headers["ETag"]
+    revalidated = client.get(
+        "/admin/datamodel/hyha", headers={**headers, "If-None-Match": etag}
+    )
+    assert revalidated.status_code == 304
+    assert revalidated.data == b""
+    assert FakeDataModel.reads == 1
+
+    deleted = client.delete("/admin/datamodel/hyha/hyha:Page", headers=headers)
+    assert deleted.status_code == 200
+    assert FakeDataModel.reads == 3
+
+    changed = client.get(
+        "/admin/datamodel/hyha", headers={**headers, "If-None-Match": etag}
+    )
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert [item["iri"] for item in changed.json["resources"]] == ["hyha:Book"]
+    assert FakeDataModel.reads == 3
+    assert documents.stats() == {"hits": 2, "misses": 1, "rebuilds": 1, "projects": 1}
@@ -19,10 +19,12 @@ from oldap_api.exports.archive_snapshot import (
     AuthorizedArchiveInventory,
     OldapArchiveInventoryReader,
     OldapVisibleLabelResolver,
+    TargetedArchiveDownloadAuthorizer,
     UnavailableArchiveMediaRecord,
 )
 from oldap_api.exports.domain import ExportKind
 from oldap_api.exports.profiles import ExportProfile, parse_export_profile
+from oldap_api.exports.snapshot_router import ExportDownloadAuthorizerRouter
 from oldap_api.exports.staging_snapshot import (
     ExportDownloadPermissionError,
     ExportSnapshotError,
@@ -370,6 +372,106 @@ def test_oldap_reader_uses_requester_connection_and_resolves_profile_labels(
     assert result.unavailable_media == (UnavailableArchiveMediaRecord(HIDDEN, (ROOT,)),)
 
 
+def test_single_query_reader_reads_linked_media_in_one_query(monkeypatch) -> None:
+    status = "urn:uuid:11111111-2222-4333-8444-555555555555"
+    subject = "urn:uuid:66666666-7777-4888-8999-000000000000"
+    unlinked = "urn:uuid:99999999-9999-4999-8999-999999999999"
+    queries = []
+
+    def uri(value):
+        return {"type": "uri", "value": value}
+
+    def text(value, **extra):
+        return {"type": "literal", "value": value, **extra}
+
+    def binding(kind, res, name=None, value=None):
+        row = {
+            "kind": text(
+                str(kind), datatype="http://www.w3.org/2001/XMLSchema#integer"
+            ),
+            "res": uri(res),
+        }
+        if name is not None:
+            row |= {"name": text(name), "value": value}
+        return row
+
+    class Connection:
+        context_name = "DEFAULT"
+        userIri = SimpleNamespace(toRdf="<https://example.org/users/alice>")
+
+        def query(self, query):
+            queries.append(query)
+            return {
+                "head": {"vars": ["kind", "res", "name", "value"]},
+                "results": {
+                    "bindings": [
+                        binding(
+                            0,
+                            ROOT,
+                            "schema:name",
+                            text("Posters", **{"xml:lang": "en"}),
+                        ),
+                        binding(
+                            0,
+                            ROOT,
+                            "shared:archiveLevel",
+                            uri("http://oldap.org/shared#Fonds"),
+                        ),
+                        binding(0, ROOT, "shared:hasMediaObject", uri(MEDIA)),
+                        binding(0, ROOT, "shared:hasMediaObject", uri(HIDDEN)),
+                        binding(0, ROOT, "schema:about", uri(subject)),
+                        binding(0, ROOT, "schema:about", uri(subject)),
+                        binding(1, MEDIA, "shared:mediaAccessMode", text("local")),
+                        binding(1, MEDIA, "shared:originalName", text("portrait.tif")),
+                        binding(
+                            1, MEDIA, "shared:originalMimeType", text("image/tiff")
+                        ),
+                        binding(1, MEDIA, "shared:assetId", text("asset-portrait")),
+                        binding(1, MEDIA, "museum:publicationStatus", uri(status)),
+                        binding(1, unlinked),
+                    ]
+                },
+            }
+
+    connection = Connection()
+
+    class Labels:
+        def resolve(self, actual_connection, **kwargs):
+            assert actual_connection is connection
+            assert kwargs["iris"] == {status, subject}
+            return {status: "Published", subject: "Posters"}
+
+    class Project:
+        @staticmethod
+        def read(**kwargs):
+            assert kwargs["con"] is connection
+            return SimpleNamespace(projectShortName="museum")
+
+    class Search:
+        @staticmethod
+        def search(**kwargs):
+            raise AssertionError("the single-query reader must not search per class")
+
+    monkeypatch.setattr(archive_snapshot, "Project", Project)
+    monkeypatch.setattr(archive_snapshot, "ResourceInstance", Search)
+    result = OldapArchiveInventoryReader(Labels(), single_query=True).read(
+        connection,
+        project_short_name="museum",
+        profile=projected_profile(),
+    )
+
+    assert len(queries) == 1
+    assert "shared:hasMediaObject ?res" in queries[0]
+    assert "museum:DigitalSurrogate" in queries[0]
+    assert result.units[0].metadata == {"subjects": {subject: "Posters"}}
+    assert result.units[0].title == {"en": "Posters"}
+    assert result.units[0].archive_level_iri == "shared:Fonds"
+    assert [item.iri for item in result.media] == [MEDIA]
+    assert result.media[0].metadata == {"publication_status": {status: "Published"}}
+    assert result.media[0].unit_iris == (ROOT,)
+    assert result.unavailable_media == (UnavailableArchiveMediaRecord(HIDDEN, (ROOT,)),)
+
+
 def test_visible_label_resolver_reads_through_requester_connection(monkeypatch) -> None:
     connection = object()
     target = "urn:uuid:12121212-3434-4567-8787-909090909090"
@@ -387,7 +489,7 @@ def test_visible_label_resolver_reads_through_requester_connection(monkeypatch)
             assert str(iri) == target
             return Visible()
 
-    monkeypatch.setattr(archive_snapshot, "ResourceInstanceFactory", Factory)
+    monkeypatch.setattr(archive_snapshot, "CachedResourceInstanceFactory", Factory)
 
     assert OldapVisibleLabelResolver().resolve(
         connection,
@@ -466,3 +568,75 @@ def test_archive_download_rechecks_profile_units_media_and_relationships() -> No
         ArchiveDownloadAuthorizer(
             StaticReader(current), Registry(changed_profile)
         ).authorize(object(), job=job, manifest=snapshot.manifest)
+
+
+def test_targeted_download_check_asks_only_for_frozen_items(monkeypatch) -> None:
+    snapshot = ArchiveSnapshotProjector(Reader(), Resolver()).project_inventory(
+        export_id=EXPORT_ID,
+        kind=ExportKind.ARCHIVE_UNIT,
+        selection_iri=ROOT,
+        profile=profile(),
+        generated_at=NOW,
+        inventory=inventory(),
+    )
+    job = SimpleNamespace(selection=snapshot.selection)
+
+    class Registry:
+        def get_active(self, project_short_name):
+            assert project_short_name == "museum"
+            return profile()
+
+    class Project:
+        @staticmethod
+        def read(**kwargs):
+            return SimpleNamespace(projectShortName="museum")
+
+    class Connection:
+        context_name = "DEFAULT"
+        userIri = SimpleNamespace(toRdf="<https://example.org/users/alice>")
+
+        def __init__(self, *answers):
+            self.answers = list(answers)
+            self.queries = []
+
+        def query(self, query):
+            self.queries.append(query)
+            return {"head": {}, "boolean": self.answers.pop(0)}
+
+    monkeypatch.setattr(archive_snapshot, "Project", Project)
+    authorizer = TargetedArchiveDownloadAuthorizer(Registry(), batch_size=1)
+
+    visible = Connection(False, False, False, False)
+    authorizer.authorize(visible, job=job, manifest=snapshot.manifest)
+    assert len(visible.queries) == 4
+    assert f"(<{ROOT}> UNDEF)" in visible.queries[0]
+    assert f"(<{CHILD}> <{ROOT}>)" in visible.queries[1]
+    assert f"(<{MEDIA}> <{ROOT}>)" in visible.queries[2]
+    assert f"(<{MEDIA}> <{CHILD}>)" in visible.queries[3]
+    assert "VALUES ?mediaClass" in visible.queries[3]
+
+    hidden = Connection(False, True, False, False)
+    with pytest.raises(ExportDownloadPermissionError):
+        authorizer.authorize(hidden, job=job, manifest=snapshot.manifest)
+    assert len(hidden.queries) == 2
+
+    broken = Connection({"unexpected": True})
+    with pytest.raises(ExportSnapshotError, match="ASK"):
+        authorizer.authorize(broken, job=job, manifest=snapshot.manifest)
+
+    class Fallback:
+        calls = 0
+
+        def authorize(self, connection, *, job, manifest):
+            Fallback.calls += 1
+
+    router = ExportDownloadAuthorizerRouter(
+        object(), authorizer, archive_fallback=Fallback()
+    )
+    router.authorize(
+        Connection({"unexpected": True}), job=job, manifest=snapshot.manifest
+    )
+    assert Fallback.calls == 1
+    with pytest.raises(ExportDownloadPermissionError):
+        router.authorize(Connection(True), job=job, manifest=snapshot.manifest)
+    assert Fallback.calls == 1
@@ -26,7 +26,14 @@ from oldap_api.exports.domain import (
     ExportVersionConflict,
     allowed_export_transition,
 )
-from oldap_api.exports.profiles import ExportProfileError, parse_export_profile
+from oldap_api.exports.profiles import (
+    ExportProfileCache,
+    ExportProfileError,
+    ExportProfileNotFoundError,
+    FileExportProfileRegistry,
+    parse_export_profile,
+    profile_sha256,
+)
 from oldap_api.exports.repository import (
     ExportAlreadyExistsError,
     ExportRepositoryConflict,
@@ -314,6 +321,33 @@ def test_documented_profile_examples_use_the_runtime_boundary(name):
     assert parse_export_profile(value).to_dict() == value
 
 
+def test_profile_registry_reuses_parsed_profiles_until_the_file_changes(tmp_path):
+    cache = ExportProfileCache()
+    path = tmp_path / "fasnacht.json"
+    path.write_text(json.dumps(fasnacht_profile()), encoding="utf-8")
+
+    first = FileExportProfileRegistry(tmp_path, cache=cache).get_active("fasnacht")
+    second = FileExportProfileRegistry(tmp_path, cache=cache).get_active("fasnacht")
+
+    assert second is first
+    assert cache.stats() == {"hits": 1, "misses": 1, "entries": 1}
+
+    changed = fasnacht_profile()
+    changed["profileVersion"] = "1.0.1"
+    replacement = tmp_path / "fasnacht.json.new"
+    replacement.write_text(json.dumps(changed), encoding="utf-8")
+    replacement.replace(path)
+    reloaded = FileExportProfileRegistry(tmp_path, cache=cache).get_active("fasnacht")
+
+    assert reloaded.profile_version == "1.0.1"
+    assert profile_sha256(reloaded) != profile_sha256(first)
+    assert cache.stats() == {"hits": 1, "misses": 2, "entries": 1}
+
+    (tmp_path / "museum.json").symlink_to(path)
+    with pytest.raises(ExportProfileNotFoundError):
+        FileExportProfileRegistry(tmp_path, cache=cache).get_active("museum")
+
+
 def test_generic_export_runtime_contains_no_fasnacht_vocabulary():
     package_root = Path(__file__).resolve().parents[1] / "exports"
     source = "\n".join(
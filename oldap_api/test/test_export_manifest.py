@@ -3,10 +3,12 @@
 from copy import deepcopy
 from dataclasses import replace
 from datetime import UTC, datetime
+import hashlib
 import json
 from pathlib import Path
 
 import pytest
+import rfc8785
 from jsonschema import Draft202012Validator
 
 from oldap_api.exports.domain import (
@@ -17,7 +19,11 @@ from oldap_api.exports.domain import (
     ExportSelectionSnapshot,
     ExportState,
 )
-from oldap_api.exports.manifest import ExportManifest, ExportManifestError
+from oldap_api.exports.manifest import (
+    ExportManifest,
+    ExportManifestError,
+    ExportManifestWriter,
+)
 
 NOW = datetime(2026, 8, 14, 12, 0, tzinfo=UTC)
 PROFILE_SHA = "a" * 64
@@ -201,3 +207,48 @@ def test_manifest_rejects_noncanonical_uuid_and_unknown_envelope_field():
     value = manifest_value() | {"workerCallback": "https://attacker.example"}
     with pytest.raises(ExportManifestError, match="closed v1 envelope"):
         ExportManifest.from_dict(value)
+
+
+def test_streaming_writer_spools_the_same_canonical_bytes():
+    value = manifest_value()
+    envelope = {
+        key: item
+        for key, item in value.items()
+        if key not in {"archiveUnits", "directories", "media"}
+    }
+    writer = ExportManifestWriter(envelope, spool_max_bytes=64)
+    for unit in value["archiveUnits"]:
+        writer.add_archive_unit(unit)
+    for directory in value["directories"]:
+        writer.add_directory(directory)
+    for item in value["media"]:
+        writer.add_media(item)
+
+    manifest = writer.finish()
+
+    assert manifest.body._rolled
+    assert manifest.canonical_json == rfc8785.dumps(value)
+    assert manifest.sha256 == hashlib.sha256(rfc8785.dumps(value)).hexdigest()
+    assert manifest.size_bytes == len(manifest.canonical_json)
+    assert (manifest.files_total, manifest.warning_count) == (2, 0)
+    assert manifest.source_bytes == 12_345
+    assert manifest == ExportManifest.from_dict(value)
+
+    with manifest:
+        pass
+    assert manifest.body.closed
+
+
+def test_streaming_writer_requires_canonical_section_order():
+    value = manifest_value()
+    envelope = {
+        key: item
+        for key, item in value.items()
+        if key not in {"archiveUnits", "directories", "media"}
+    }
+    writer = ExportManifestWriter(envelope)
+    writer.add_archive_unit(value["archiveUnits"][0])
+    writer.add_media(value["media"][0])
+
+    with pytest.raises(ExportManifestError, match="canonical section order"):
+        writer.add_directory(value["directories"][0])
@@ -1,8 +1,14 @@
 """Purpose-specific API-to-media export source resolver tests."""
 
+from datetime import UTC, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+
 import jwt
 import pytest
 
+from oldap_api.exports import media_sources
 from oldap_api.exports.media_sources import (
     EXPORT_SOURCE_AUDIENCE,
     ExportSourceUnavailableError,
@@ -131,3 +137,116 @@ def test_resolver_rejects_duplicate_request_identity_and_reused_secret(monkeypat
     monkeypatch.setenv("OLDAP_MEDIA_JWT_SECRET", SECRET)
     with pytest.raises(RuntimeError, match="purpose-specific"):
         MediaBinarySourceResolver(secret=SECRET)
+
+
+class StubMediaServer:
+    """Serve the resolve route locally, waiting until ``parties`` batches overlap."""
+
+    def __init__(self, parties: int, *, failing_offset: int | None = None) -> None:
+        self.barrier = threading.Barrier(parties, timeout=5)
+        self.failing_offset = failing_offset
+        self.tokens: list[str] = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                stub.tokens.append(self.headers["Authorization"])
+                items = body["items"]
+                try:
+                    stub.barrier.wait()
+                except threading.BrokenBarrierError:
+                    pass
+                status = 200
+                if items[0]["mediaIri"].endswith(f"-{stub.failing_offset}"):
+                    status = 503
+                payload = json.dumps(
+                    {"items": [resolved(item["mediaIri"]) for item in items]}
+                ).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_port}"
+
+    def __enter__(self) -> "StubMediaServer":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def resolved(media_iri: str) -> dict:
+    return response_item() | {"mediaIri": media_iri}
+
+
+def references(count: int) -> tuple[LocalBinaryReference, ...]:
+    return tuple(
+        LocalBinaryReference(
+            media_iri=f"urn:example:media-{index}",
+            asset_id=f"asset-{index}",
+            storage_path_candidate="museum/image",
+            original_name=f"{index}.jpg",
+        )
+        for index in range(count)
+    )
+
+
+def test_resolver_posts_batches_concurrently_with_one_reused_token(monkeypatch, caplog):
+    monkeypatch.setattr(media_sources, "MAX_RESOLVE_BATCH", 2)
+    caplog.set_level("INFO", logger=media_sources.__name__)
+    with StubMediaServer(3) as server:
+        resolver = MediaBinarySourceResolver(
+            secret=SECRET, media_internal_url=server.url, max_concurrency=3
+        )
+
+        result = resolver.resolve(references(5))
+
+    assert sorted(result) == sorted(item.media_iri for item in references(5))
+    assert not server.barrier.broken
+    assert len(server.tokens) == 3 and len(set(server.tokens)) == 1
+    assert [(timing.offset, timing.items) for timing in resolver.batch_timings] == [
+        (0, 2),
+        (2, 2),
+        (4, 1),
+    ]
+    assert all(timing.seconds > 0 for timing in resolver.batch_timings)
+    (record,) = caplog.records
+    assert record.getMessage().startswith(
+        "Resolved 5 export source(s) in 3 batch(es) within "
+    )
+
+
+def test_resolver_fails_closed_when_one_concurrent_batch_fails(monkeypatch):
+    monkeypatch.setattr(media_sources, "MAX_RESOLVE_BATCH", 2)
+    with StubMediaServer(2, failing_offset=2) as server:
+        resolver = MediaBinarySourceResolver(
+            secret=SECRET, media_internal_url=server.url, max_concurrency=2
+        )
+
+        with pytest.raises(ExportSourceUnavailableError, match="HTTP 503"):
+            resolver.resolve(references(4))
+
+
+def test_resolver_renews_its_token_shortly_before_expiry():
+    resolver = MediaBinarySourceResolver(secret=SECRET)
+    issued = datetime(2026, 8, 15, 20, 0, tzinfo=UTC)
+
+    token = resolver._token(now=issued)
+
+    assert resolver._token(now=issued + timedelta(seconds=45)) == token
+    assert resolver._token(now=issued + timedelta(seconds=51)) != token
@@ -3,6 +3,7 @@
 import json
 from dataclasses import replace
 from datetime import UTC, datetime, timedelta
+from uuid import uuid4
 
 import pytest
 
@@ -15,13 +16,20 @@ from oldap_api.exports.domain import (
     ExportState,
     ExportTask,
 )
+from oldap_api.exports.manifest_store import FileManifestBlobStore
 from oldap_api.exports.repository import (
+    EXPORT_GRAPH,
+    MANIFEST_PAYLOAD,
     ExportAlreadyExistsError,
+    ExportNotFoundError,
     ExportQuotaExceededError,
+    ExportQuotaUsage,
     ExportRepositoryConflict,
     GraphDbExportJobRepository,
+    InMemoryExportJobRepository,
 )
 from oldap_api.exports.settings import ExportOperatingPolicy
+from oldap_api.test.rdflib_connection import RdflibTransactionalConnection
 from oldap_api.test.test_export_manifest import bound_job
 
 NOW = datetime(2026, 8, 14, 12, 0, tzinfo=UTC)
@@ -106,7 +114,12 @@ class FakeTransactionalConnection:
         self.queries.append(query)
         if "ASK" in query:
             return {"boolean": self.exists}
-        return self._job_result()
+        if "urn:oldap:exportQuotaActiveJobs" in query:
+            return {"results": {"bindings": []}}
+        result = self._job_result()
+        if "urn:oldap:exportQueueTask" in query:
+            result["results"]["bindings"][0]["task"] = {"value": "BUILD"}
+        return result
 
     def transaction_update(self, query):
         self.updates.append(query)
@@ -150,7 +163,7 @@ def test_graphdb_create_is_atomic_and_stores_canonical_indexed_facts():
     assert connection.started == 1
     assert connection.committed == 1
     assert connection.aborted == 0
-    assert len(connection.updates) == 1
+    assert len(connection.updates) == 2
     update = connection.updates[0]
     assert "urn:oldap:export-jobs" in update
     assert "urn:oldap:exportOwner" in update
@@ -293,7 +306,7 @@ def test_graphdb_publishes_bound_job_and_manifest_in_one_insert():
     assert connection.started == 1
     assert connection.committed == 1
     assert connection.aborted == 0
-    assert len(connection.updates) == 1
+    assert len(connection.updates) == 2
     update = connection.updates[0]
     assert "urn:oldap:ExportJob" in update
     assert "urn:oldap:ExportManifest" in update
@@ -402,6 +415,331 @@ def test_graphdb_cleanup_atomically_purges_manifest_payload():
     GraphDbExportJobRepository(connection).complete_cleanup(current, deleted)
 
     assert connection.committed == 1
-    assert len(connection.updates) == 2
-    assert "DELETE WHERE" in connection.updates[1]
-    assert "export-manifest" in connection.updates[1]
+    assert len(connection.updates) == 3
+    assert "urn:oldap:exportQuotaRetainedBytes" in connection.updates[1]
+    assert "DELETE WHERE" in connection.updates[2]
+    assert "export-manifest" in connection.updates[2]
+
+
+def test_manifest_store_keeps_body_out_of_the_graph_and_verifies_reads(tmp_path):
+    job, manifest = bound_job()
+    connection = RdflibTransactionalConnection()
+    repository = GraphDbExportJobRepository(
+        connection, manifest_store=FileManifestBlobStore(tmp_path)
+    )
+
+    repository.create_with_manifest(job, manifest)
+
+    graph = connection.dataset.graph(EXPORT_GRAPH)
+    assert not list(graph.triples((None, MANIFEST_PAYLOAD, None)))
+    stored = repository.get_manifest(job.export_id)
+    assert stored == manifest
+    assert stored.canonical_json == manifest.canonical_json
+    stored.body.close()
+
+    blob = tmp_path / manifest.sha256[:2] / f"{manifest.sha256}.json"
+    blob.write_bytes(blob.read_bytes().replace(b"Posters", b"Postery"))
+    with pytest.raises(ExportRepositoryConflict, match="digest mismatch"):
+        repository.get_manifest(job.export_id)
+
+
+def _stored(connection, *jobs: ExportJob) -> GraphDbExportJobRepository:
+    """Persist jobs through the repository into an executable rdflib dataset."""
+
+    repository = GraphDbExportJobRepository(connection)
+    for job in jobs:
+        repository.create(job)
+    return repository
+
+
+def _queued(index: int, *, minutes: int = 0, **changes) -> ExportJob:
+    return replace(
+        _job(),
+        export_id=f"{index:08d}-1111-4111-8111-111111111111",
+        created_at=NOW + timedelta(minutes=minutes),
+        updated_at=NOW + timedelta(minutes=minutes),
+        **changes,
+    )
+
+
+def test_indexed_claim_prefers_cleanup_then_oldest_build():
+    connection = RdflibTransactionalConnection()
+    failed = _queued(3, minutes=5, state=ExportState.FAILED, failure_code="X_FAIL")
+    repository = _stored(
+        connection,
+        _queued(1, minutes=2),
+        _queued(2, minutes=1),
+        failed,
+        _queued(4, state=ExportState.DELETED, deleted_at=NOW),
+    )
+    claimed_at = NOW + timedelta(hours=1)
+
+    def claim(tasks):
+        return repository.claim_next(
+            worker_id="worker-1",
+            supported_tasks=tasks,
+            claim_id=str(uuid4()),
+            claimed_at=claimed_at,
+            lease_expires_at=claimed_at + timedelta(minutes=5),
+        )
+
+    first = claim((ExportTask.BUILD, ExportTask.CLEANUP))
+    second = claim((ExportTask.BUILD,))
+    third = claim((ExportTask.BUILD,))
+
+    assert first.export_id == failed.export_id
+    assert first.state is ExportState.DELETING
+    assert first.active_claim_task is ExportTask.CLEANUP
+    assert second.export_id == _queued(2).export_id
+    assert third.export_id == _queued(1).export_id
+    assert claim((ExportTask.BUILD, ExportTask.CLEANUP)) is None
+
+
+def test_indexed_claim_skips_active_leases_and_reclaims_expired_ones():
+    connection = RdflibTransactionalConnection()
+    repository = _stored(connection, _queued(1))
+    claimed_at = NOW + timedelta(minutes=1)
+    lease = claimed_at + timedelta(minutes=5)
+    first = repository.claim_next(
+        worker_id="worker-1",
+        supported_tasks=(ExportTask.BUILD,),
+        claim_id="33333333-3333-4333-8333-333333333333",
+        claimed_at=claimed_at,
+        lease_expires_at=lease,
+    )
+
+    during_lease = repository.claim_next(
+        worker_id="worker-2",
+        supported_tasks=(ExportTask.BUILD,),
+        claim_id="44444444-4444-4444-8444-444444444444",
+        claimed_at=lease - timedelta(seconds=1),
+        lease_expires_at=lease + timedelta(minutes=5),
+    )
+    after_lease = repository.claim_next(
+        worker_id="worker-2",
+        supported_tasks=(ExportTask.BUILD,),
+        claim_id="55555555-5555-4555-8555-555555555555",
+        claimed_at=lease,
+        lease_expires_at=lease + timedelta(minutes=5),
+    )
+
+    assert first.state_version == 1
+    assert during_lease is None
+    assert after_lease.active_claim_worker_id == "worker-2"
+    assert after_lease.state_version == 2
+    assert repository.get_by_claim(after_lease.active_claim_id) == after_lease
+
+
+def test_indexed_expiry_and_audit_purge_select_only_due_jobs():
+    connection = RdflibTransactionalConnection()
+    ready = _queued(
+        1,
+        state=ExportState.READY,
+        state_version=2,
+        ready_at=NOW,
+        expires_at=NOW + timedelta(hours=24),
+        archive_size_bytes=123,
+        archive_sha256="b" * 64,
+    )
+    deleted = _queued(
+        2,
+        state=ExportState.DELETED,
+        deleted_at=NOW,
+        audit_delete_at=NOW + timedelta(days=60),
+        manifest_sha256=None,
+    )
+    repository = _stored(connection, ready, deleted)
+
+    assert repository.expire_next_ready(now=NOW + timedelta(hours=23)) is None
+    expired = repository.expire_next_ready(now=ready.expires_at)
+    assert expired.state is ExportState.EXPIRED
+    assert repository.expire_next_ready(now=ready.expires_at) is None
+
+    assert repository.purge_expired_audits(now=NOW + timedelta(days=59)) == 0
+    assert repository.purge_expired_audits(now=deleted.audit_delete_at) == 1
+    assert repository.get(ready.export_id) == expired
+    with pytest.raises(ExportNotFoundError):
+        repository.get(deleted.export_id)
+
+
+def test_reindex_makes_legacy_jobs_claimable_exactly_once():
+    connection = RdflibTransactionalConnection()
+    repository = _stored(connection, _queued(1), _queued(2, minutes=1))
+    connection.dataset.update("""
+DELETE WHERE { GRAPH <urn:oldap:export-jobs> {
+  ?job <urn:oldap:exportIndexVersion> ?version ;
+       <urn:oldap:exportQueueTask> ?task ;
+       <urn:oldap:exportQueueEligibleAt> ?eligible .
+} }
+""")
+
+    def claim():
+        return repository.claim_next(
+            worker_id="worker-1",
+            supported_tasks=(ExportTask.BUILD,),
+            claim_id=str(uuid4()),
+            claimed_at=NOW + timedelta(hours=1),
+            lease_expires_at=NOW + timedelta(hours=1, minutes=5),
+        )
+
+    assert claim() is None
+    assert repository.reindex_queue(batch_size=1) == 2
+    assert repository.reindex_queue() == 0
+    assert claim().export_id == _queued(1).export_id
+
+
+def test_keyset_listing_matches_between_graphdb_and_memory():
+    connection = RdflibTransactionalConnection()
+    jobs = (
+        _queued(1, minutes=1),
+        _queued(2, minutes=1),
+        _queued(3, minutes=2, state=ExportState.CANCELLED),
+        _queued(4),
+        replace(_queued(5, minutes=3), requested_by_iri="https://example.org/bob"),
+    )
+    graphdb = _stored(connection, *jobs)
+    memory = InMemoryExportJobRepository()
+    for job in jobs:
+        memory.create(job)
+    alice = "https://example.org/users/alice"
+
+    for repository in (graphdb, memory):
+        first = repository.list_for_user(alice, limit=2)
+        last = first[-1]
+        rest = repository.list_for_user(
+            alice, after=(last.created_at, last.export_id), limit=10
+        )
+        queued = repository.list_for_user(alice, state=ExportState.QUEUED, limit=10)
+
+        assert [job.export_id for job in first] == [
+            _queued(3).export_id,
+            _queued(2).export_id,
+        ]
+        assert [job.export_id for job in rest] == [
+            _queued(1).export_id,
+            _queued(4).export_id,
+        ]
+        assert _queued(3).export_id not in {job.export_id for job in queued}
+        assert len(queued) == 3
+    assert "LIMIT 10" in connection.queries[-1]
+
+
+def test_quota_counters_follow_transitions_and_reconcile_from_payloads():
+    connection = RdflibTransactionalConnection()
+    bob = "https://example.org/users/bob"
+    repository = _stored(
+        connection,
+        _queued(1),
+        _queued(2, minutes=1),
+        replace(_queued(3), requested_by_iri=bob),
+    )
+    job, manifest = bound_job()
+    alice = job.requested_by_iri
+
+    def counters(owner=alice):
+        connection.transaction_start()
+        return repository._read_quota_counters(owner)
+
+    assert counters() is None
+    repository.create_with_manifest(
+        job,
+        manifest,
+        operating_policy=ExportOperatingPolicy(max_active_jobs_per_user=3),
+    )
+    assert counters() == (ExportQuotaUsage(3, 37_035), ExportQuotaUsage(4, 49_380))
+
+    cancelled = _queued(2).transition(
+        ExportState.CANCELLED, expected_state_version=0, now=NOW
+    )
+    repository.save(cancelled, expected_previous_version=0)
+    with pytest.raises(ExportRepositoryConflict):
+        repository.save(cancelled, expected_previous_version=0)
+    assert counters() == (ExportQuotaUsage(2, 37_035), ExportQuotaUsage(3, 49_380))
+    assert counters(bob) == (ExportQuotaUsage(1, 12_345), ExportQuotaUsage(3, 49_380))
+
+    connection.dataset.update("""
+DELETE WHERE { GRAPH <urn:oldap:export-jobs> {
+  <urn:oldap:export-quota:system> <urn:oldap:exportQuotaActiveJobs> ?active .
+} } ;
+INSERT DATA { GRAPH <urn:oldap:export-jobs> {
+  <urn:oldap:export-quota:system> <urn:oldap:exportQuotaActiveJobs> 99 .
+} }
+""")
+    assert repository.reconcile_quota_counters() == 2
+    assert counters() == (ExportQuotaUsage(2, 37_035), ExportQuotaUsage(3, 49_380))
+
+
+class RecordingQuotaLease:
+    """Record the transaction counters whenever the quota lease changes hands."""
+
+    def __init__(self, connection) -> None:
+        self.connection = connection
+        self.held = False
+        self.events: list[tuple[str, int, int]] = []
+
+    def hold(self) -> None:
+        if not self.held:
+            self.held = True
+            self._record("hold")
+
+    def release(self) -> None:
+        if self.held:
+            self.held = False
+            self._record("release")
+
+    def _record(self, event: str) -> None:
+        self.events.append((event, self.connection.committed, self.connection.aborted))
+
+
+def test_quota_moves_hold_the_quota_lease_until_their_transaction_ends():
+    connection = RdflibTransactionalConnection()
+    lease = RecordingQuotaLease(connection)
+    repository = GraphDbExportJobRepository(connection, quota_lease=lease)
+
+    repository.create(_queued(1))
+    assert lease.events == [("hold", 0, 0), ("release", 1, 0)]
+
+    lease.events.clear()
+    claimed = repository.claim_next(
+        worker_id="worker-1",
+        supported_tasks=(ExportTask.BUILD,),
+        claim_id=str(uuid4()),
+        claimed_at=NOW,
+        lease_expires_at=NOW + timedelta(minutes=5),
+    )
+    assert claimed is not None
+    assert lease.events == []
+
+    job, manifest = bound_job()
+    with pytest.raises(ExportQuotaExceededError):
+        repository.create_with_manifest(
+            job,
+            manifest,
+            operating_policy=ExportOperatingPolicy(max_active_jobs_per_user=1),
+        )
+    assert lease.events == [("hold", 2, 0), ("release", 2, 1)]
+
+
+def test_duplicated_quota_values_are_recomputed_instead_of_picked():
+    connection = RdflibTransactionalConnection()
+    repository = _stored(connection, _queued(1), _queued(2, minutes=1))
+    repository.reconcile_quota_counters()
+    connection.dataset.update("""
+INSERT DATA { GRAPH <urn:oldap:export-jobs> {
+  <urn:oldap:export-quota:system> <urn:oldap:exportQuotaActiveJobs> 1 .
+} }
+""")
+    job, manifest = bound_job()
+    connection.transaction_start()
+    assert repository._read_quota_counters(job.requested_by_iri) is None
+
+    repository.create_with_manifest(
+        job,
+        manifest,
+        operating_policy=ExportOperatingPolicy(max_active_jobs_total=3),
+    )
+    connection.transaction_start()
+    assert repository._read_quota_counters(job.requested_by_iri) == (
+        ExportQuotaUsage(3, 37_035),
+        ExportQuotaUsage(3, 37_035),
+    )
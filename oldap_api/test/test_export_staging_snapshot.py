@@ -357,7 +357,7 @@ def test_oldap_reader_uses_requester_connection_for_folder_area_and_searches(
                 }
             ]
 
-    monkeypatch.setattr(staging_snapshot, "ResourceInstanceFactory", FakeFactory)
+    monkeypatch.setattr(staging_snapshot, "CachedResourceInstanceFactory", FakeFactory)
     monkeypatch.setattr(staging_snapshot, "ResourceInstance", FakeResourceInstance)
 
     result = OldapStagingInventoryReader().read(
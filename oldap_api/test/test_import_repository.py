@@ -1,10 +1,19 @@
 """Transaction-orchestration tests for the GraphDB import queue repository."""
 
 import json
+from dataclasses import replace
 from datetime import UTC, datetime, timedelta
 
+import pytest
+
 from oldap_api.imports.domain import ImportJob, ImportState, ImportTask, TargetSnapshot
-from oldap_api.imports.repository import GraphDbImportJobRepository
+from oldap_api.imports.repository import (
+    GraphDbImportJobRepository,
+    ImportQuotaExceededError,
+    InMemoryImportJobRepository,
+    _quota_iri,
+)
+from oldap_api.test.rdflib_connection import RdflibTransactionalConnection
 
 
 def _job() -> ImportJob:
@@ -119,3 +128,133 @@ def test_graphdb_queue_does_not_write_while_an_unexpired_claim_exists():
     assert claimed is None
     assert connection.committed == 1
     assert connection.updates == []
+
+
+def _listed_jobs() -> tuple[ImportJob, ...]:
+    created = datetime(2026, 8, 14, 12, 0, tzinfo=UTC)
+
+    def job(index: int, minutes: int, state: ImportState) -> ImportJob:
+        return replace(
+            _job(),
+            import_id=f"{index:08d}-1111-4111-8111-111111111111",
+            state=state,
+            created_at=created + timedelta(minutes=minutes),
+            updated_at=created + timedelta(minutes=minutes),
+        )
+
+    return (
+        job(1, 1, ImportState.VALIDATING),
+        job(2, 1, ImportState.READY),
+        job(3, 2, ImportState.VALIDATING),
+        job(4, 0, ImportState.VALIDATING),
+    )
+
+
+def test_keyset_listing_matches_between_graphdb_and_memory():
+    connection = RdflibTransactionalConnection()
+    graphdb = GraphDbImportJobRepository(connection)
+    memory = InMemoryImportJobRepository()
+    for job in _listed_jobs():
+        graphdb.create(job, quota_limit_bytes=10**12)
+        memory.create(job, quota_limit_bytes=10**12)
+    owner = "https://example.org/users/alice"
+    ids = [job.import_id for job in _listed_jobs()]
+
+    for repository in (graphdb, memory):
+        first = repository.list_for_owner(owner, limit=2)
+        last = first[-1]
+        rest = repository.list_for_owner(
+            owner, after=(last.created_at, last.import_id), limit=10
+        )
+        validating = repository.list_for_owner(
+            owner,
+            state=ImportState.VALIDATING,
+            after=(first[0].created_at, first[0].import_id),
+        )
+
+        assert [job.import_id for job in first] == [ids[2], ids[1]]
+        assert [job.import_id for job in rest] == [ids[0], ids[3]]
+        assert [job.import_id for job in validating] == [ids[0], ids[3]]
+
+
+def test_reindex_adds_state_to_legacy_jobs_once():
+    connection = RdflibTransactionalConnection()
+    repository = GraphDbImportJobRepository(connection)
+    for job in _listed_jobs():
+        repository.create(job, quota_limit_bytes=10**12)
+    connection.dataset.update("""
+DELETE WHERE { GRAPH <urn:oldap:import-jobs> {
+  ?job <urn:oldap:importState> ?state ; <urn:oldap:importIndexVersion> ?version .
+} }
+""")
+    owner = "https://example.org/users/alice"
+
+    assert repository.list_for_owner(owner, state=ImportState.READY) == []
+    assert repository.reindex(batch_size=3) == 4
+    assert repository.reindex() == 0
+    assert [
+        job.state for job in repository.list_for_owner(owner, state=ImportState.READY)
+    ] == [ImportState.READY]
+
+
+def test_staging_quota_counter_follows_reservations_and_reconciles():
+    connection = RdflibTransactionalConnection()
+    repository = GraphDbImportJobRepository(connection)
+    first, second, third, fourth = _listed_jobs()
+    for job in (first, second, third):
+        repository.create(job, quota_limit_bytes=160_000_000)
+
+    with pytest.raises(ImportQuotaExceededError):
+        repository.create(fourth, quota_limit_bytes=160_000_000)
+    repository.replace(
+        replace(first, state_version=2, quota_reserved_bytes=0),
+        expected_state_version=1,
+    )
+    repository.create(fourth, quota_limit_bytes=160_000_000)
+
+    assert not any("SUM(" in query for query in connection.queries)
+    connection.dataset.update("""
+DELETE WHERE { GRAPH <urn:oldap:import-jobs> {
+  ?counter <urn:oldap:importQuotaCounterReservedBytes> ?reserved .
+} }
+""")
+    assert repository.reconcile_quota_counters() == 1
+    with pytest.raises(ImportQuotaExceededError):
+        repository.create(
+            replace(first, import_id="55555555-1111-4111-8111-111111111111"),
+            quota_limit_bytes=160_000_000,
+        )
+
+
+def test_duplicated_quota_counter_is_recomputed_under_the_quota_lease():
+    connection = RdflibTransactionalConnection()
+    events = []
+
+    class RecordingQuotaLease:
+        def hold(self):
+            events.append(("hold", connection.committed, connection.aborted))
+
+        def release(self):
+            events.append(("release", connection.committed, connection.aborted))
+
+    repository = GraphDbImportJobRepository(
+        connection, quota_lease=RecordingQuotaLease()
+    )
+    first, second, third, _ = _listed_jobs()
+    for job in (first, second):
+        repository.create(job, quota_limit_bytes=160_000_000)
+    counter = _quota_iri(first.target.staging_area_iri).n3()
+    connection.dataset.update(f"""
+INSERT DATA {{ GRAPH <urn:oldap:import-jobs> {{
+  {counter} <urn:oldap:importQuotaCounterReservedBytes> 0 .
+}} }}
+""")
+    events.clear()
+    connection.updates.clear()
+
+    with pytest.raises(ImportQuotaExceededError):
+        repository.create(third, quota_limit_bytes=120_000_000)
+    assert "urn:oldap:ImportQuotaCounter" in connection.updates[0]
+    assert events[0] == ("hold", 2, 0)
+    assert events[-1] == ("release", 2, 1)
+    assert repository.reconcile_quota_counters() == 1
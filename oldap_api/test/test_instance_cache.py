@@ -0,0 +1,110 @@
+"""Warm instance reads reuse cached types and generated class models."""
+
+from flask import Flask
+from oldaplib.src.xsd.xsd_qname import Xsd_QName
+
+from oldap_api import authentication
+from oldap_api.data_stamps import DataGraphStamps
+from oldap_api.instance_cache import InstanceReadCache
+from oldap_api.test.test_data_stamps import FakeRedis
+from oldap_api.views import instance_views
+
+IRI = "urn:uuid:11111111-1111-4111-8111-111111111111"
+
+
+class FakeConnection:
+    context_name = "DEFAULT"
+    userIri = "https://example.org/users/alice"
+    queries: list[str] = []
+
+    def __init__(self, **kwargs) -> None:
+        self._list_node_context_projects: set[str] = set()
+
+    def query(self, query):
+        FakeConnection.queries.append(query)
+        return {
+            "head": {"vars": ["resclass"]},
+            "results": {
+                "bindings": [
+                    {
+                        "resclass": {
+                            "type": "uri",
+                            "value": "http://oldap.org/shared#StagingFolder",
+                        }
+                    }
+                ]
+            },
+        }
+
+
+class GeneratedClass:
+    properties: dict = {}
+
+    @staticmethod
+    def resolved_properties():
+        return {}
+
+
+class Factory:
+    created = 0
+
+    def __init__(self, con, project):
+        Factory.created += 1
+
+    def createObjectInstance(self, resource):
+        assert str(resource) == "shared:StagingFolder"
+        return GeneratedClass
+
+
+class Reader:
+    connections: list[FakeConnection] = []
+
+    @staticmethod
+    def read_data(*, con, iri, projectShortName, allowed_properties):
+        Reader.connections.append(con)
+        return {
+            Xsd_QName("rdf:type", validate=False): [
+                Xsd_QName("shared:StagingFolder", validate=False)
+            ],
+            Xsd_QName("shared:name", validate=False): "Inbox",
+        }
+
+
+def test_warm_read_issues_no_type_query_and_builds_no_factory(monkeypatch):
+    stamps = DataGraphStamps(FakeRedis())
+    cache = InstanceReadCache(stamps=stamps)
+    FakeConnection.queries = []
+    Factory.created = 0
+    Reader.connections = []
+    monkeypatch.setattr(authentication, "Connection", FakeConnection)
+    monkeypatch.setattr(instance_views, "INSTANCE_READ_CACHE", cache)
+    monkeypatch.setattr(instance_views, "CachedResourceInstanceFactory", Factory)
+    monkeypatch.setattr(instance_views, "ResourceInstance", Reader)
+    app = Flask(__name__)
+    app.register_blueprint(instance_views.instance_bp)
+    client = app.test_client()
+    headers = {"Authorization": "Bearer valid-test-token"}
+
+    first = client.get(f"/data/shared/{IRI}", headers=headers)
+    second = client.get(f"/data/shared/{IRI}", headers=headers)
+
+    assert first.status_code == second.status_code == 200
+    assert first.json == second.json
+    assert first.json["rdf:type"] == ["shared:StagingFolder"]
+    assert (len(FakeConnection.queries), Factory.created) == (1, 1)
+    assert "shared" in Reader.connections[1]._list_node_context_projects
+    assert cache.stats() == {
+        "hits": 2,
+        "misses": 2,
+        "projects": 1,
+        "iris": 1,
+        "classes": 1,
+    }
+
+    cache.forget("shared", IRI)
+    client.get(f"/data/shared/{IRI}", headers=headers)
+    assert (len(FakeConnection.queries), Factory.created) == (2, 1)
+
+    stamps.bump("shared")
+    client.get(f"/data/shared/{IRI}", headers=headers)
+    assert (len(FakeConnection.queries), Factory.created) == (3, 2)
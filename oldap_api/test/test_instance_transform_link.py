@@ -27,7 +27,7 @@ def test_transform_forwards_atomic_link_contract(client, token_headers, monkeypa
             calls["read"] = iri
             return FakeInstance()
 
-    monkeypatch.setattr(instance_views, "ResourceInstanceFactory", FakeFactory)
+    monkeypatch.setattr(instance_views, "CachedResourceInstanceFactory", FakeFactory)
     response = client.post(
         f"/data/test/{media_iri}/transform",
         json={
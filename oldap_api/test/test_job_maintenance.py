@@ -0,0 +1,56 @@
+"""Unit tests for the standalone ZIP job maintenance command."""
+
+from oldap_api import job_maintenance
+from oldap_api.test.rdflib_connection import RdflibTransactionalConnection
+
+
+def test_export_reindex_uses_the_service_connection(monkeypatch, capsys):
+    connection = RdflibTransactionalConnection()
+    monkeypatch.setattr(
+        job_maintenance, "export_service_connection", lambda: connection
+    )
+
+    assert job_maintenance.main(["export-reindex", "--batch-size", "10"]) == 0
+
+    assert capsys.readouterr().out.strip() == "Reindexed 0 export job(s)."
+    assert connection.committed == 1
+
+
+def test_export_reindex_requires_service_credentials(monkeypatch, capsys):
+    monkeypatch.delenv("OLDAP_EXPORT_SERVICE_USER", raising=False)
+    monkeypatch.delenv("OLDAP_EXPORT_SERVICE_PASSWORD", raising=False)
+
+    assert job_maintenance.main(["export-reindex"]) == 1
+
+    assert "OLDAP_EXPORT_SERVICE_USER" in capsys.readouterr().err
+
+
+def test_import_reconcile_quotas_initializes_empty_counters(monkeypatch, capsys):
+    connection = RdflibTransactionalConnection()
+    leases = []
+
+    class QuotaLease:
+        def __init__(self, scope):
+            self.scope = scope
+            leases.append(self)
+
+        def hold(self):
+            leases.append(("hold", self.scope))
+
+        def release(self):
+            leases.append(("release", connection.committed))
+
+    monkeypatch.setattr(
+        job_maintenance, "import_service_connection", lambda: connection
+    )
+    monkeypatch.setattr(job_maintenance, "RedisQuotaLease", QuotaLease)
+
+    assert job_maintenance.main(["import-reconcile-quotas"]) == 0
+
+    assert (
+        capsys.readouterr().out.strip()
+        == "Reconciled import quota counters for 0 staging area(s)."
+    )
+    assert connection.committed == 1
+    assert len(connection.updates) == 2
+    assert leases[1:] == [("hold", "quota:import"), ("release", 1)]
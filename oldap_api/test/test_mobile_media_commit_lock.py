@@ -13,13 +13,21 @@ from oldap_api.mobile_media.commit_lock import RedisMobileMediaCommitLock
 from oldap_api.mobile_media.domain import (
     MobileMediaCommitResult,
     MobileMediaServiceUnavailableError,
+    validate_mobile_media_commit,
 )
-from oldap_api.mobile_media.service import MobileMediaCommitService
+from oldap_api.mobile_media.service import (
+    MOBILE_RECEIPT_STRIPES,
+    MobileMediaCommitService,
+    mobile_media_lock_scopes,
+)
+from oldap_api.staging_lock import staging_area_scope, staging_lock_names
+from oldap_api.test.test_staging_lock import QueueRedis
 from oldap_api.test.test_mobile_media_domain import (
     CHECKSUM,
     CLIENT_ASSET_ID,
     EVENT_ID,
     UPLOAD_ID,
+    batch_request,
     commit_request,
 )
 
@@ -36,7 +44,7 @@ class FakeRedisLock:
         self.released = 0
 
     def acquire(self, *, blocking: bool):
-        assert blocking is True
+        assert blocking is False
         if self.acquire_error is not None:
             raise self.acquire_error
         return self.acquired
@@ -47,28 +55,66 @@ class FakeRedisLock:
             raise self.release_error
 
 
-class FakeRedis:
+class FakeRedis(QueueRedis):
     def __init__(self, lock: FakeRedisLock) -> None:
+        super().__init__()
         self.redis_lock = lock
-        self.arguments = None
+        self.arguments = []
 
-    def lock(self, name, *, timeout, blocking_timeout):
-        self.arguments = (name, timeout, blocking_timeout)
+    def lock(self, name, *, timeout):
+        self.arguments.append((name, timeout))
         return self.redis_lock
 
 
+SCOPES = mobile_media_lock_scopes(
+    validate_mobile_media_commit(UPLOAD_ID, commit_request())
+)
+
+
 def test_redis_commit_lock_uses_a_bounded_lease_and_releases_it() -> None:
     redis_lock = FakeRedisLock()
     client = FakeRedis(redis_lock)
     guard = RedisMobileMediaCommitLock(client)
 
-    assert guard.run(lambda: "committed") == "committed"
-    assert client.arguments == (
-        RedisMobileMediaCommitLock.LOCK_NAME,
-        RedisMobileMediaCommitLock.LEASE_SECONDS,
-        RedisMobileMediaCommitLock.WAIT_SECONDS,
+    assert guard.run(lambda: "committed", SCOPES) == "committed"
+    names = [name for name, _ in client.arguments]
+    assert names == list(staging_lock_names(SCOPES)) == sorted(names)
+    assert len(names) == len(SCOPES)
+    assert all(name.startswith(RedisMobileMediaCommitLock.LOCK_NAME) for name in names)
+    for _, timeout in client.arguments:
+        assert timeout == RedisMobileMediaCommitLock.LEASE_SECONDS
+    assert redis_lock.released == len(SCOPES)
+
+
+def test_commit_shares_the_area_lease_of_generic_staging_writes() -> None:
+    commit = validate_mobile_media_commit(UPLOAD_ID, commit_request())
+
+    assert staging_lock_names([staging_area_scope(commit.staging_area_id)])[0] in (
+        staging_lock_names(mobile_media_lock_scopes(commit))
     )
-    assert redis_lock.released == 1
+
+
+def test_a_batch_holds_its_area_and_the_receipt_stripes_of_its_identifiers() -> None:
+    class RecordingLock:
+        def run(self, operation, scopes):
+            self.scopes = set(scopes)
+            return operation()
+
+    class Repository:
+        def commit_batch(self, commits, *, committed_at=None):
+            return []
+
+    lock = RecordingLock()
+    MobileMediaCommitService(Repository(), lock).commit_batch(batch_request(100))
+
+    area = validate_mobile_media_commit(UPLOAD_ID, commit_request()).staging_area_id
+    receipts = lock.scopes - {staging_area_scope(area)}
+    assert len(receipts) == len(lock.scopes) - 1
+    assert {scope.split(":")[1] for scope in receipts} == {"upload", "asset", "event"}
+    # A full batch holds a small share of the stripes, so unrelated batches
+    # seldom wait for one another.
+    assert 290 <= len(receipts) <= 300
+    assert all(int(scope.split(":")[2]) < MOBILE_RECEIPT_STRIPES for scope in receipts)
 
 
 @pytest.mark.parametrize(
@@ -80,9 +126,10 @@ def test_redis_commit_lock_uses_a_bounded_lease_and_releases_it() -> None:
 )
 def test_unavailable_commit_coordination_fails_retryably(redis_lock) -> None:
     guard = RedisMobileMediaCommitLock(FakeRedis(redis_lock))
+    guard.WAIT_SECONDS = 0.1
 
     with pytest.raises(MobileMediaServiceUnavailableError) as caught:
-        guard.run(lambda: pytest.fail("operation must not run"))
+        guard.run(lambda: pytest.fail("operation must not run"), SCOPES)
 
     assert caught.value.retryable is True
 
@@ -92,9 +139,11 @@ def test_operation_failure_is_preserved_and_the_lease_is_released() -> None:
     guard = RedisMobileMediaCommitLock(FakeRedis(redis_lock))
 
     with pytest.raises(ValueError, match="transaction failed"):
-        guard.run(lambda: (_ for _ in ()).throw(ValueError("transaction failed")))
+        guard.run(
+            lambda: (_ for _ in ()).throw(ValueError("transaction failed")), SCOPES
+        )
 
-    assert redis_lock.released == 1
+    assert redis_lock.released == len(SCOPES)
 
 
 def test_lost_lease_after_a_commit_returns_a_retryable_reconciliation_error() -> None:
@@ -104,10 +153,10 @@ def test_lost_lease_after_a_commit_returns_a_retryable_reconciliation_error() ->
     guard = RedisMobileMediaCommitLock(FakeRedis(redis_lock))
 
     with pytest.raises(MobileMediaServiceUnavailableError) as caught:
-        guard.run(lambda: "durable GraphDB result")
+        guard.run(lambda: "durable GraphDB result", SCOPES)
 
     assert caught.value.retryable is True
-    assert redis_lock.released == 1
+    assert redis_lock.released == len(SCOPES)
 
 
 def test_concurrent_exact_commits_observe_one_durable_logical_result() -> None:
@@ -117,7 +166,7 @@ def test_concurrent_exact_commits_observe_one_durable_logical_result() -> None:
         def __init__(self) -> None:
             self.lock = Lock()
 
-        def run(self, operation):
+        def run(self, operation, scopes):
             with self.lock:
                 return operation()
 
@@ -6,8 +6,10 @@ from uuid import NAMESPACE_URL, uuid4, uuid5
 import pytest
 
 from oldap_api.mobile_media.domain import (
+    MAX_BATCH_COMMITS,
     MAX_ORIGINAL_BYTES,
     MobileMediaValidationError,
+    validate_mobile_media_batch,
     validate_mobile_media_commit,
 )
 from oldap_api.mobile_media.service import MobileMediaCommitService
@@ -110,6 +112,38 @@ def test_commit_rejects_untrusted_or_inconsistent_fields(mutation, message) -> N
         validate_mobile_media_commit(UPLOAD_ID, value)
 
 
+def batch_request(count: int) -> dict:
+    """Return ``count`` valid requests for distinct uploads into one StagingArea."""
+
+    commits = []
+    for index in range(count):
+        value = commit_request()
+        if index:
+            value["uploadId"] = str(uuid5(NAMESPACE_URL, f"upload:{index}"))
+            value["clientAssetId"] = str(uuid5(NAMESPACE_URL, f"asset:{index}"))
+            value["eventId"] = str(uuid5(NAMESPACE_URL, f"event:{index}"))
+            value["publication"]["ownerUploadId"] = value["uploadId"]
+            value["publication"]["assetId"] = value["clientAssetId"]
+        commits.append(value)
+    return {"commits": commits}
+
+
+def test_batch_rejects_repeated_identities_and_oversized_batches() -> None:
+    assert len(validate_mobile_media_batch(batch_request(3))) == 3
+
+    repeated = batch_request(2)
+    repeated["commits"][1]["eventId"] = EVENT_ID
+    for value in (
+        repeated,
+        batch_request(MAX_BATCH_COMMITS + 1),
+        {"commits": []},
+        {"commits": [commit_request()], "extra": True},
+        {"commits": ["not-a-commit"]},
+    ):
+        with pytest.raises(MobileMediaValidationError):
+            validate_mobile_media_batch(value)
+
+
 def test_service_validates_before_repository_side_effects() -> None:
     class RecordingRepository:
         called = False
@@ -121,7 +155,7 @@ def test_service_validates_before_repository_side_effects() -> None:
     class RecordingLock:
         called = False
 
-        def run(self, operation):
+        def run(self, operation, scopes):
             self.called = True
             return operation()
 
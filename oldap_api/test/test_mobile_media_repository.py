@@ -15,6 +15,7 @@ from oldap_api.mobile_media.domain import (
     MobileMediaPermissionDeniedError,
     MobileMediaServiceUnavailableError,
     MobileMediaUploadPermissionDeniedError,
+    validate_mobile_media_batch,
     validate_mobile_media_commit,
 )
 from oldap_api.mobile_media.repository import GraphDbMobileMediaRepository
@@ -23,6 +24,7 @@ from oldap_api.test.test_mobile_media_domain import (
     CLIENT_ASSET_ID,
     EVENT_ID,
     UPLOAD_ID,
+    batch_request,
     commit_request,
 )
 
@@ -432,3 +434,59 @@ def test_failed_atomic_insert_aborts_and_never_commits() -> None:
     assert connection.committed == 0
     assert connection.aborted == 1
     assert len(connection.updates) == 1
+
+
+def test_batch_resolves_the_area_once_and_inserts_new_items_together() -> None:
+    first, *new = validate_mobile_media_batch(batch_request(3))
+    accepted = GraphDbMobileMediaRepository(
+        CommitConnection(), media_ingest_base_url="https://media.example.org"
+    ).commit(first, committed_at=COMMITTED_AT)
+    connection = CommitConnection(receipt_rows=[_receipt_row(first, accepted)])
+
+    results = GraphDbMobileMediaRepository(connection).commit_batch(
+        [first, *new], committed_at=datetime(2030, 1, 1, tzinfo=UTC)
+    )
+
+    assert results[0] == accepted
+    assert [result.upload_id for result in results[1:]] == [
+        commit.upload_id for commit in new
+    ]
+    assert {result.committed_at for result in results[1:]} == {
+        datetime(2030, 1, 1, tzinfo=UTC)
+    }
+    assert connection.started == connection.committed == 1
+    assert len(connection.queries) == 5
+    receipt_query = connection.queries[0]
+    assert f'"{new[1].event_id}"' in receipt_query
+    assert f"<{first.receipt_iri}>" in receipt_query
+    (update,) = connection.updates
+    assert update.count("shared:StagingMediaObject") == 2
+    assert first.client_asset_id not in update
+    assert all(commit.client_asset_id in update for commit in new)
+
+
+def test_batch_replays_without_writes_and_one_conflict_aborts_all() -> None:
+    commits = validate_mobile_media_batch(batch_request(2))
+    accepted = GraphDbMobileMediaRepository(CommitConnection()).commit_batch(
+        commits, committed_at=COMMITTED_AT
+    )
+    connection = CommitConnection(
+        receipt_rows=[_receipt_row(c, r) for c, r in zip(commits, accepted)]
+    )
+
+    assert GraphDbMobileMediaRepository(connection).commit_batch(commits) == accepted
+    assert len(connection.queries) == 1
+    assert connection.updates == []
+
+    foreign = _receipt_row(commits[0], accepted[0]) | {
+        "receipt": _value("urn:oldap:mobile-media-commit:foreign"),
+        "eventId": _value("urn:uuid:foreign"),
+    }
+    for connection in (
+        CommitConnection(collision=True),
+        CommitConnection(receipt_rows=[foreign]),
+    ):
+        with pytest.raises(MobileMediaCommitConflict):
+            GraphDbMobileMediaRepository(connection).commit_batch(commits)
+        assert connection.aborted == 1
+        assert connection.updates == []
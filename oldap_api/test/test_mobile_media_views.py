@@ -21,6 +21,7 @@ from oldap_api.test.test_mobile_media_domain import (
     CLIENT_ASSET_ID,
     EVENT_ID,
     UPLOAD_ID,
+    batch_request,
     commit_request,
 )
 from oldap_api.views import mobile_media_views
@@ -105,6 +106,29 @@ def test_exact_service_token_and_closed_route_return_durable_result(
     }
 
 
+def test_batch_route_returns_every_result_in_request_order(monkeypatch) -> None:
+    class BatchService:
+        def commit_batch(self, data):
+            assert data == batch_request(2)
+            return [SuccessfulService().commit(UPLOAD_ID, commit_request())] * 2
+
+    client = _client(monkeypatch, BatchService())
+    url = "/internal/mobile-media/v1/uploads/commit-batch"
+
+    response = client.post(
+        url, json=batch_request(2), headers={"Authorization": f"Bearer {_token()}"}
+    )
+    unauthenticated = client.post(url, json=batch_request(2))
+
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "no-store"
+    assert [item["uploadId"] for item in response.get_json()["results"]] == [
+        UPLOAD_ID,
+        UPLOAD_ID,
+    ]
+    assert unauthenticated.status_code == 401
+
+
 def test_missing_wrong_purpose_and_overlong_tokens_are_rejected(monkeypatch) -> None:
     client = _client(monkeypatch, SuccessfulService())
     missing = client.post(
@@ -255,3 +279,7 @@ def test_factory_keeps_existing_routes_and_registers_only_the_new_commit() -> No
         "POST",
         "OPTIONS",
     }
+    assert rules["/internal/mobile-media/v1/uploads/commit-batch"] == {
+        "POST",
+        "OPTIONS",
+    }
@@ -0,0 +1,168 @@
+"""Parsed project models are reused across requests until a model write."""
+
+import ast
+import inspect
+import textwrap
+from types import SimpleNamespace
+
+from flask import Blueprint, Flask
+from oldaplib.src.enums.adminpermissions import AdminPermission
+from oldaplib.src.iconnection import IConnection
+from oldaplib.src.objectfactory import ResourceInstanceFactory
+from oldaplib.src.oldaplist import OldapList
+
+from oldap_api import authentication, model_cache
+from oldap_api.model_cache import (
+    CachedResourceInstanceFactory,
+    ModelVersions,
+    ProjectModelCache,
+    ProjectModels,
+)
+from oldap_api.test.test_data_stamps import BrokenRedis, FakeRedis
+from oldap_api.views import metrics_views
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self._list_node_context_projects: set[str] = set()
+
+
+class Model:
+    def __init__(self, con, name) -> None:
+        self._con = con
+        self.name = name
+
+
+def _reader(reads):
+    def read(con, project):
+        reads.append(project)
+        shared = Model(con, "shared")
+        return ProjectModels(
+            project=Model(con, project),
+            shared_project=shared,
+            datamodel=Model(con, f"{project}-model"),
+            shared_model=Model(con, "shared-model"),
+        )
+
+    return read
+
+
+def _app(versions: ModelVersions) -> Flask:
+    app = Flask(__name__)
+    datamodel = Blueprint("datamodel", __name__)
+    project = Blueprint("project", __name__)
+
+    @datamodel.post("/datamodel/<project>/<resource>")
+    def add_resource(project, resource):
+        return {}
+
+    @project.put("/project/<projectid>")
+    def create_project(projectid):
+        return {}
+
+    app.register_blueprint(datamodel)
+    app.register_blueprint(project)
+    model_cache.register_model_versions(app, versions)
+    return app
+
+
+def test_checkouts_are_rebound_copies_until_a_model_write(monkeypatch):
+    reads = []
+    monkeypatch.setattr(model_cache, "_read_models", _reader(reads))
+    versions = ModelVersions(FakeRedis())
+    cache = ProjectModelCache(versions=versions)
+    client = _app(versions).test_client()
+    first, second = FakeConnection(), FakeConnection()
+
+    cold = cache.models(first, "fasnacht")
+    warm = cache.models(second, "fasnacht")
+
+    assert reads == ["fasnacht"]
+    assert warm.datamodel is not cold.datamodel
+    assert warm.datamodel.name == "fasnacht-model"
+    assert {warm.datamodel._con, warm.shared_model._con} == {second}
+    assert cold.datamodel._con is first
+    assert second._list_node_context_projects == {"fasnacht", "shared"}
+
+    client.post("/datamodel/other/Book")
+    cache.models(second, "fasnacht")
+    assert reads == ["fasnacht"]
+
+    client.post("/datamodel/fasnacht/Book")
+    cache.models(second, "fasnacht")
+    client.post("/datamodel/shared/Book")
+    cache.models(second, "fasnacht")
+    client.put("/project/other")
+    cache.models(second, "fasnacht")
+    assert reads == ["fasnacht"] * 4
+    assert cache.stats() == {"hits": 2, "misses": 4, "bypassed": 0, "projects": 1}
+
+
+def test_unavailable_versions_and_project_iris_bypass_the_cache(monkeypatch):
+    reads = []
+    monkeypatch.setattr(model_cache, "_read_models", _reader(reads))
+    cache = ProjectModelCache(versions=ModelVersions(BrokenRedis()))
+
+    cache.models(FakeConnection(), "fasnacht")
+    cache.models(FakeConnection(), "fasnacht")
+    ProjectModelCache(versions=ModelVersions(FakeRedis())).models(
+        FakeConnection(), "http://example.org/projects/fasnacht"
+    )
+
+    assert len(reads) == 3
+    assert cache.stats()["bypassed"] == 2
+
+
+def _assigned_attributes(method) -> set[str]:
+    tree = ast.parse(textwrap.dedent(inspect.getsource(inspect.unwrap(method))))
+    return {
+        node.attr
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Attribute)
+        and isinstance(node.ctx, ast.Store)
+        and isinstance(node.value, ast.Name)
+        and node.value.id == "self"
+    }
+
+
+def test_private_oldaplib_surface_matches_the_pinned_release():
+    # The cached factory fills the private state of ResourceInstanceFactory and
+    # marks list-node discovery on the connection; both must follow oldaplib.
+    assert _assigned_attributes(
+        CachedResourceInstanceFactory.__init__
+    ) == _assigned_attributes(ResourceInstanceFactory.__init__)
+    assert "_list_node_context_projects" in IConnection.__annotations__
+    assert "con._list_node_context_projects" in inspect.getsource(
+        OldapList.ensure_list_node_context
+    )
+
+
+def test_cache_metrics_are_limited_to_system_administrators(monkeypatch):
+    permissions = {
+        "admin": {"oldap:SystemProject": {AdminPermission.ADMIN_OLDAP}},
+        "editor": {"test:project": {AdminPermission.ADMIN_RESOURCES}},
+    }
+
+    class FakeAuthenticatedConnection:
+        def __init__(self, token=None, **kwargs) -> None:
+            self.userdata = SimpleNamespace(inProject=permissions[token])
+
+    monkeypatch.setattr(authentication, "Connection", FakeAuthenticatedConnection)
+    app = Flask(__name__)
+    app.register_blueprint(metrics_views.metrics_bp)
+    client = app.test_client()
+
+    denied = client.get(
+        "/metrics/model-cache", headers={"Authorization": "Bearer editor"}
+    )
+    allowed = client.get(
+        "/metrics/model-cache", headers={"Authorization": "Bearer admin"}
+    )
+
+    assert denied.status_code == 403
+    assert allowed.status_code == 200
+    assert allowed.headers["Cache-Control"] == "no-store"
+    assert allowed.json == {
+        "projectModels": model_cache.PROJECT_MODEL_CACHE.stats(),
+        "datamodelDocuments": model_cache.DATAMODEL_DOCUMENTS.stats(),
+    }
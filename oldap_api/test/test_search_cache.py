@@ -0,0 +1,135 @@
+"""Repeated searches are answered from the shared result cache until a write."""
+
+from types import SimpleNamespace
+
+from flask import Flask
+
+from oldap_api import authentication
+from oldap_api.data_stamps import DataGraphStamps
+from oldap_api.requester_roles import RequesterRoles
+from oldap_api.search_cache import SearchResultCache
+from oldap_api.test.test_data_stamps import BrokenRedis, FakeRedis
+from oldap_api.views import instance_views
+
+EDITOR = "http://example.org/test#Editor"
+ROLES = {
+    "alice": {"test:Editor": "oldap:DATA_UPDATE"},
+    "bob": {"test:Editor": "oldap:DATA_UPDATE"},
+    "carol": {"test:Guest": "oldap:DATA_VIEW"},
+    "dave": {"test:Editor": "oldap:DATA_UPDATE"},
+}
+# The roles in oldap:admin; dave was granted a role after his token was issued.
+GRAPH_ROLES = {
+    "alice": [EDITOR],
+    "bob": [EDITOR],
+    "carol": ["http://example.org/test#Guest"],
+    "dave": [EDITOR, "http://example.org/test#Curator"],
+}
+
+
+class FakeConnection:
+    context_name = "DEFAULT"
+    role_queries = 0
+
+    def __init__(self, token=None, **kwargs) -> None:
+        self.token = token
+        self.userIri = f"https://example.org/users/{token}"
+        self.userdata = SimpleNamespace(hasRole=ROLES[token])
+
+    def query(self, query):
+        assert f"<{self.userIri}> oldap:hasRole ?role" in query
+        FakeConnection.role_queries += 1
+        bindings = [
+            {"role": {"type": "uri", "value": role}} for role in GRAPH_ROLES[self.token]
+        ]
+        return {"results": {"bindings": bindings}}
+
+
+class FakeResourceInstance:
+    calls = 0
+
+    @staticmethod
+    def search(con, project, countOnly=False, **kwargs):
+        FakeResourceInstance.calls += 1
+        if countOnly:
+            return 2
+        return [{"iri": "urn:example:1", "resclass": "test:Book"}]
+
+
+def _client(monkeypatch, client) -> tuple:
+    FakeResourceInstance.calls = 0
+    FakeConnection.role_queries = 0
+    stamps = DataGraphStamps(client)
+    monkeypatch.setattr(authentication, "Connection", FakeConnection)
+    monkeypatch.setattr(instance_views, "ResourceInstance", FakeResourceInstance)
+    monkeypatch.setattr(
+        instance_views,
+        "SEARCH_RESULT_CACHE",
+        SearchResultCache(stamps=stamps, roles=RequesterRoles(), ttl_seconds=60),
+    )
+    app = Flask(__name__)
+    app.register_blueprint(instance_views.instance_bp)
+    return app.test_client(), stamps
+
+
+def _headers(user: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {user}"}
+
+
+def test_equal_searches_share_results_per_role_set_and_stamp(monkeypatch):
+    client, stamps = _client(monkeypatch, FakeRedis())
+    count = "/data/ofclass/test?resClass=test:Book&countOnly=true"
+
+    assert client.get(count, headers=_headers("alice")).json == {"count": 2}
+    assert client.get(count, headers=_headers("bob")).json == {"count": 2}
+    assert FakeResourceInstance.calls == 1
+
+    client.get(count, headers=_headers("carol"))
+    assert FakeResourceInstance.calls == 2
+
+    body = {
+        "resClass": "test:Book",
+        "includeProperties": ["test:title", "test:pubDate"],
+        "sortBy": ["test:title|DESC"],
+    }
+    reordered = dict(body, includeProperties=["test:pubDate", "test:title"])
+    # Streamed bodies are read before the next request starts.
+    first = client.post("/data/search/test", json=body, headers=_headers("alice")).json
+    second = client.post(
+        "/data/search/test", json=reordered, headers=_headers("bob")
+    ).json
+    assert first == second == [{"iri": "urn:example:1", "resclass": "test:Book"}]
+    assert FakeResourceInstance.calls == 3
+
+    stamps.bump("test")
+    client.get(count, headers=_headers("alice"))
+    client.get(count, headers=_headers("alice"))
+    assert FakeResourceInstance.calls == 4
+    assert instance_views.SEARCH_RESULT_CACHE.stats() == {
+        "hits": 3,
+        "misses": 4,
+        "bypassed": 0,
+    }
+    # Roles are read once per user and global stamp.
+    assert FakeConnection.role_queries == 3
+
+
+def test_entries_are_keyed_by_the_roles_in_the_graph_not_the_token(monkeypatch):
+    client, _ = _client(monkeypatch, FakeRedis())
+    count = "/data/ofclass/test?resClass=test:Book&countOnly=true"
+
+    client.get(count, headers=_headers("dave"))
+    client.get(count, headers=_headers("alice"))
+
+    assert FakeResourceInstance.calls == 2
+
+
+def test_unavailable_redis_runs_every_search(monkeypatch):
+    client, _ = _client(monkeypatch, BrokenRedis())
+    count = "/data/ofclass/test?resClass=test:Book&countOnly=true"
+
+    for _ in range(2):
+        assert client.get(count, headers=_headers("alice")).json == {"count": 2}
+
+    assert FakeResourceInstance.calls == 2
+    assert instance_views.SEARCH_RESULT_CACHE.stats()["bypassed"] == 2
@@ -0,0 +1,145 @@
+"""Class listings page with keyset cursors instead of OFFSET."""
+
+from types import SimpleNamespace
+
+from flask import Flask
+from oldaplib.src.xsd.iri import Iri
+
+from oldap_api import authentication, search_cursor
+from oldap_api.search_cursor import SearchCursor
+from oldap_api.views import instance_views
+
+XSD_STRING = "http://www.w3.org/2001/XMLSchema#string"
+XSD_BOOLEAN = "http://www.w3.org/2001/XMLSchema#boolean"
+
+
+def _row(number: int, name: str) -> dict:
+    return {
+        "res": {"type": "uri", "value": f"urn:example:{number}"},
+        "resclass": {"type": "uri", "value": "http://oldap.org/shared#StagingFolder"},
+        "sort_0_key": {"type": "literal", "value": name, "datatype": XSD_STRING},
+        "sort_0_unbound": {
+            "type": "literal",
+            "value": "false",
+            "datatype": XSD_BOOLEAN,
+        },
+        "prop_0": {"type": "literal", "value": name, "datatype": XSD_STRING},
+    }
+
+
+class FakeConnection:
+    context_name = "DEFAULT"
+    userIri = Iri("https://example.org/users/alice")
+    queries: list[str] = []
+    pages: list[list[dict]] = []
+
+    def __init__(self, **kwargs) -> None:
+        pass
+
+    def query(self, query):
+        FakeConnection.queries.append(query)
+        return {
+            "head": {
+                "vars": ["res", "resclass", "sort_0_key", "sort_0_unbound", "prop_0"]
+            },
+            "results": {"bindings": FakeConnection.pages.pop(0)},
+        }
+
+
+class FakeProject:
+    @staticmethod
+    def read(con, project):
+        return SimpleNamespace(projectShortName=str(project))
+
+
+def _client(monkeypatch):
+    FakeConnection.queries = []
+    monkeypatch.setattr(authentication, "Connection", FakeConnection)
+    monkeypatch.setattr(search_cursor, "Project", FakeProject)
+    app = Flask(__name__)
+    app.register_blueprint(instance_views.instance_bp)
+    return app.test_client()
+
+
+def test_cursor_pages_continue_after_the_last_sort_key(monkeypatch):
+    client = _client(monkeypatch)
+    headers = {"Authorization": "Bearer valid-test-token"}
+    FakeConnection.pages = [[_row(1, "a"), _row(2, "b")], [_row(3, "c")]]
+    listing = "/data/ofclass/shared?resClass=shared:StagingFolder&sortBy[]=shared:name|DESC&limit=2"
+
+    first = client.get(f"{listing}&cursor=", headers=headers)
+
+    assert first.status_code == 200
+    assert [item["iri"] for item in first.json["items"]] == [
+        "urn:example:1",
+        "urn:example:2",
+    ]
+    assert first.json["items"][1]["shared:name"] == ["b"]
+    assert "OFFSET" not in FakeConnection.queries[0]
+    assert "FILTER(?sort_0_unbound" not in FakeConnection.queries[0]
+
+    second = client.get(f"{listing}&cursor={first.json['nextCursor']}", headers=headers)
+
+    assert second.status_code == 200
+    assert second.json == {
+        "items": [
+            {
+                "iri": "urn:example:3",
+                "resclass": "shared:StagingFolder",
+                "shared:name": ["c"],
+            }
+        ],
+        "nextCursor": None,
+    }
+    query = FakeConnection.queries[1]
+    assert "OFFSET" not in query
+    assert f'?sort_0_key < "b"^^<{XSD_STRING}>' in query
+    assert 'STR(?res) > "urn:example:2"' in query
+    assert "LIMIT 2" in query
+
+
+def test_invalid_and_foreign_cursors_are_rejected(monkeypatch):
+    client = _client(monkeypatch)
+    headers = {"Authorization": "Bearer valid-test-token"}
+    listing = "/data/ofclass/shared?resClass=shared:StagingFolder&sortBy[]=shared:name"
+    foreign = SearchCursor(
+        fingerprint="0" * 16,
+        keys=((False, {"type": "literal", "value": "b"}),),
+        iri="urn:example:2",
+    ).encode()
+    injected = SearchCursor(
+        fingerprint=search_cursor.cursor_fingerprint(
+            "shared", instance_views.Xsd_QName("shared:StagingFolder"), []
+        ),
+        keys=(),
+        iri='urn:example:2"} DELETE WHERE { ?s ?p ?o',
+    ).encode()
+
+    for cursor in ("not-a-cursor", foreign):
+        assert (
+            client.get(f"{listing}&cursor={cursor}", headers=headers).status_code == 400
+        )
+    assert (
+        client.get(
+            f"/data/ofclass/shared?resClass=shared:StagingFolder&cursor={injected}",
+            headers=headers,
+        ).status_code
+        == 400
+    )
+    assert (
+        client.get(f"{listing}&cursor=&offset=100", headers=headers).status_code == 400
+    )
+    assert (
+        client.post(
+            "/data/search/shared",
+            json={
+                "resClass": "shared:StagingFolder",
+                "cursor": "",
+                "q": "x",
+                "ftField": "name",
+            },
+            headers=headers,
+        ).status_code
+        == 400
+    )
+    assert FakeConnection.queries == []
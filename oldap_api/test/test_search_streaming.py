@@ -0,0 +1,90 @@
+"""Large search results are read in windows and streamed as one JSON array."""
+
+import json
+
+import pytest
+from flask import Flask
+from oldaplib.src.helpers.oldaperror import OldapError
+
+from oldap_api import authentication
+from oldap_api.views import instance_views
+
+HEADERS = {"Authorization": "Bearer valid-test-token"}
+ROWS = [{"iri": f"urn:example:{index:04d}"} for index in range(1200)]
+
+
+class FakeConnection:
+    def __init__(self, **kwargs) -> None:
+        pass
+
+
+class FakeResourceInstance:
+    windows: list[tuple[int, int]] = []
+    fail_at_offset: int | None = None
+
+    @classmethod
+    def search(cls, *, con, project, limit, offset, **params):
+        cls.windows.append((limit, offset))
+        if offset == cls.fail_at_offset:
+            raise OldapError("GraphDB went away")
+        return ROWS[offset : offset + limit]
+
+    @classmethod
+    def search_fulltext(cls, *, con, project, searchstr, limit, **params):
+        cls.windows.append((limit, params.get("offset", 0)))
+        return ROWS[:limit]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    FakeResourceInstance.windows = []
+    FakeResourceInstance.fail_at_offset = None
+    monkeypatch.setattr(authentication, "Connection", FakeConnection)
+    monkeypatch.setattr(instance_views, "ResourceInstance", FakeResourceInstance)
+    app = Flask(__name__)
+    app.register_blueprint(instance_views.instance_bp)
+    return app.test_client()
+
+
+def test_results_are_streamed_from_bounded_windows(client):
+    response = client.get(
+        "/data/ofclass/shared?resClass=shared:Thing&limit=1100&offset=50",
+        headers=HEADERS,
+    )
+
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.json == ROWS[50:1150]
+    assert FakeResourceInstance.windows == [(500, 50), (500, 550), (100, 1050)]
+
+    FakeResourceInstance.windows = []
+    short = client.post(
+        "/data/search/shared",
+        json={"resClass": "shared:Thing", "limit": 5000, "offset": 1000},
+        headers=HEADERS,
+    )
+    assert short.json == ROWS[1000:]
+    assert FakeResourceInstance.windows == [(500, 1000)]
+
+
+def test_failures_before_and_after_the_first_window(client):
+    FakeResourceInstance.fail_at_offset = 0
+    failed = client.get("/data/ofclass/shared?resClass=shared:Thing", headers=HEADERS)
+    assert failed.status_code == 400
+
+    FakeResourceInstance.fail_at_offset = 500
+    truncated = client.get(
+        "/data/ofclass/shared?resClass=shared:Thing&limit=1000", headers=HEADERS
+    )
+    assert truncated.status_code == 200
+    with pytest.raises(json.JSONDecodeError):
+        json.loads(truncated.get_data(as_text=True))
+
+
+def test_fulltext_searches_run_as_one_query(client):
+    # search_fulltext neither orders totally nor limits resources, so windows
+    # could skip or repeat rows.
+    response = client.get("/data/text/shared?q=fasnacht&limit=1100", headers=HEADERS)
+
+    assert response.json == ROWS[:1100]
+    assert FakeResourceInstance.windows == [(1100, 0)]
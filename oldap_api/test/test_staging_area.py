@@ -7,21 +7,29 @@ from oldaplib.src.helpers.oldaperror import OldapError
 from oldaplib.src.xsd.iri import Iri
 import pytest
 
+from oldap_api import staging_area
 from oldap_api.staging_area import (
     GraphDbStagingAreaRepository,
     StagingAreaPermissionDenied,
     StagingAreaServiceUnavailable,
     StagingAreaValidationError,
     StagingGraph,
+    StagingGraphCache,
     StagingStructureConflict,
     StagingSystemFolderPolicy,
     run_staging_mutation,
+    staging_lock_scopes,
 )
 from oldap_api.staging_lock import (
     RedisStagingMutationLock,
     StagingMutationLockUnavailable,
+    staging_area_scope,
+    staging_lock_names,
 )
 from oldap_api.mobile_media.commit_lock import RedisMobileMediaCommitLock
+from oldap_api.model_cache import ModelVersions
+from oldap_api.test.test_data_stamps import BrokenRedis, FakeRedis
+from oldap_api.test.test_staging_lock import QueueRedis
 
 AREA = "urn:uuid:00000000-0000-0000-0000-000000000201"
 TOP = "urn:uuid:00000000-0000-0000-0000-000000000202"
@@ -48,11 +56,18 @@ def configure_context(name: str) -> None:
     Context(name=name)["fasnacht"] = "http://oldap.org/fasnacht#"
 
 
-def test_resolves_project_graph_for_a_fresh_bearer_context() -> None:
+def test_resolves_project_graph_for_a_fresh_bearer_context(monkeypatch) -> None:
+    redis = FakeRedis()
+    versions = ModelVersions(redis)
+    cache = StagingGraphCache(versions=versions)
+    monkeypatch.setattr(staging_area, "STAGING_GRAPHS", cache)
+
     class FreshBearerConnection:
         context_name = "STAGING_FRESH_BEARER_CONTEXT"
+        queries = 0
 
         def query(self, query: str):
+            FreshBearerConnection.queries += 1
             assert "# staging-project-namespace" in query
             assert '"fasnacht"^^<http://www.w3.org/2001/XMLSchema#NCName>' in query
             return result([{"namespace": binding("http://oldap.org/fasnacht#")}])
@@ -62,6 +77,28 @@ def test_resolves_project_graph_for_a_fresh_bearer_context() -> None:
     assert graph.project_namespace == "http://oldap.org/fasnacht#"
     assert graph.data_graph_iri == "http://oldap.org/fasnacht#data"
 
+    # Later policies and repositories reuse the graph until a project write in
+    # any worker advances the model version.
+    assert StagingGraph.resolve(FreshBearerConnection(), "fasnacht") is graph
+    assert cache.stats() == {
+        "hits": 1,
+        "misses": 1,
+        "bypassed": 0,
+        "fallbackQueries": 1,
+        "entries": 1,
+    }
+    versions.bump(None)
+    assert StagingGraph.resolve(FreshBearerConnection(), "fasnacht") is not graph
+    versions.bump("fasnacht")
+    StagingGraph.resolve(FreshBearerConnection(), "fasnacht")
+    assert FreshBearerConnection.queries == cache.stats()["fallbackQueries"] == 3
+
+    # Without the version store every request resolves the graph itself.
+    cache = StagingGraphCache(versions=ModelVersions(BrokenRedis()))
+    monkeypatch.setattr(staging_area, "STAGING_GRAPHS", cache)
+    StagingGraph.resolve(FreshBearerConnection(), "fasnacht")
+    assert cache.stats()["bypassed"] == 1 and cache.stats()["entries"] == 0
+
 
 class PolicyConnection:
     """Return deterministic GraphDB facts for generic-operation guards."""
@@ -74,14 +111,12 @@ class PolicyConnection:
         top: set[str] | None = None,
         mobile: set[str] | None = None,
         trash: set[str] | None = None,
-        protected: set[str] | None = None,
         reserved: list[tuple[str, str, str | None]] | None = None,
     ) -> None:
         configure_context(self.context_name)
         self.top = top or set()
         self.mobile = mobile or set()
         self.trash = trash or set()
-        self.protected = protected or set()
         top_parent = next(iter(self.top), None)
         self.reserved = [
             *((iri, "top", None) for iri in self.top),
@@ -89,23 +124,22 @@ class PolicyConnection:
             *((iri, "Trash", top_parent) for iri in self.trash),
             *(reserved or []),
         ]
+        self.queries: list[str] = []
 
     def query(self, query: str):
-        if "# staging-system-state" in query:
+        self.queries.append(query)
+        if "# staging-policy-snapshot" in query:
+            area = {"area": binding(AREA), "defaultRole": binding(DEFAULT_ROLE)}
             rows = [
-                {
-                    "defaultRole": binding(DEFAULT_ROLE),
+                area
+                | {
                     "reservedFolder": binding(iri),
                     "reservedName": literal(name),
                     **({"reservedParent": binding(parent)} if parent else {}),
                 }
                 for iri, name, parent in self.reserved
-            ] or [{"defaultRole": binding(DEFAULT_ROLE)}]
+            ] or [area]
             return result(rows)
-        if "# protected-staging-folder" in query:
-            return {"boolean": any(f"<{iri}>" in query for iri in self.protected)}
-        if "# protected-mobile-folder" in query:
-            return {"boolean": any(f"<{iri}>" in query for iri in self.mobile)}
         raise AssertionError(f"Unexpected query: {query}")
 
 
@@ -211,7 +245,7 @@ def test_existing_ambiguous_reserved_folders_block_further_provisioning(
 
 
 def test_blocks_every_generic_protected_folder_mutation() -> None:
-    connection = PolicyConnection(protected={TOP, MOBILE, TRASH}, mobile={MOBILE})
+    connection = PolicyConnection(top={TOP}, mobile={MOBILE}, trash={TRASH})
     policy = StagingSystemFolderPolicy(connection, "fasnacht")
 
     for operation in (
@@ -244,6 +278,31 @@ def test_blocks_every_generic_protected_folder_mutation() -> None:
     policy.assert_transform_target_allowed("fasnacht:Place")
 
 
+def test_policy_checks_evaluate_one_snapshot_query() -> None:
+    connection = PolicyConnection(
+        top={TOP},
+        reserved=[(MOBILE, "Mobile", USER_FOLDER), (USER_FOLDER, "top", TOP)],
+    )
+    policy = StagingSystemFolderPolicy(connection, "fasnacht")
+
+    # A nested "top" and a "Mobile" below it are ordinary folders.
+    policy.assert_move_allowed(USER_FOLDER, MOBILE)
+    assert len(connection.queries) == 1
+    assert f"<{MOBILE}> <{USER_FOLDER}>" in connection.queries[0]
+
+    snapshot = policy.snapshot(folders=(TOP, MOBILE), areas=(AREA,))
+    policy.assert_delete_allowed(MOBILE, snapshot=snapshot)
+    with pytest.raises(StagingStructureConflict, match="cannot be moved"):
+        policy.assert_move_allowed(TOP, USER_FOLDER, snapshot=snapshot)
+    with pytest.raises(StagingStructureConflict, match="StagingArea root"):
+        policy.assert_create_allowed(
+            "shared:StagingFolder",
+            folder_payload("Trash", parent=TOP),
+            snapshot=snapshot,
+        )
+    assert len(connection.queries) == 2
+
+
 def test_blocks_generic_rename_to_any_reserved_system_folder_name() -> None:
     policy = StagingSystemFolderPolicy(PolicyConnection(), "fasnacht")
 
@@ -261,7 +320,7 @@ def test_staging_lock_uses_a_cross_thread_renewable_bounded_lease() -> None:
         released = 0
 
         def acquire(self, *, blocking):
-            assert blocking is True
+            assert blocking is False
             return True
 
         def extend(self, additional_time, *, replace_ttl):
@@ -270,37 +329,146 @@ def test_staging_lock_uses_a_cross_thread_renewable_bounded_lease() -> None:
         def release(self):
             self.released += 1
 
-    class FakeRedis:
+    class FakeRedis(QueueRedis):
         def __init__(self):
+            super().__init__()
             self.lease = FakeLease()
             self.arguments = None
 
-        def lock(self, name, *, timeout, blocking_timeout, thread_local):
-            self.arguments = (name, timeout, blocking_timeout, thread_local)
+        def lock(self, name, *, timeout, thread_local):
+            self.arguments = (name, timeout, thread_local)
             return self.lease
 
     client = FakeRedis()
     guard = RedisStagingMutationLock(client)
-
-    assert guard.run(lambda: "written") == "written"
-    assert client.arguments == (
-        guard.LOCK_NAME,
-        guard.LEASE_SECONDS,
-        guard.WAIT_SECONDS,
-        False,
-    )
+    scopes = [staging_area_scope(AREA)]
+
+    assert guard.run(lambda: "written", scopes) == "written"
+    name, timeout, thread_local = client.arguments
+    assert (name,) == staging_lock_names(scopes)
+    assert name.startswith(guard.LOCK_NAME + ":")
+    assert timeout == guard.LEASE_SECONDS
+    assert thread_local is False
     assert client.lease.released == 1
 
     with pytest.raises(KeyboardInterrupt):
-        guard.run(lambda: (_ for _ in ()).throw(KeyboardInterrupt()))
+        guard.run(lambda: (_ for _ in ()).throw(KeyboardInterrupt()), scopes)
     assert client.lease.released == 2
 
 
+def test_staging_leases_are_taken_per_area_in_one_fixed_order() -> None:
+    class FakeLease:
+        def __init__(self, name, held, acquired):
+            self.name = name
+            self.held = held
+            self.acquired = acquired
+
+        def acquire(self, *, blocking):
+            if self.acquired:
+                self.held.append(self.name)
+            return self.acquired
+
+        def release(self):
+            self.held.remove(self.name)
+
+    class FakeRedis(QueueRedis):
+        def __init__(self, unavailable=()):
+            super().__init__()
+            self.held = []
+            self.requested = []
+            self.unavailable = set(unavailable)
+
+        def lock(self, name, *, timeout, thread_local):
+            self.requested.append(name)
+            return FakeLease(name, self.held, name not in self.unavailable)
+
+    other_area = "urn:uuid:00000000-0000-0000-0000-000000000299"
+    forward = [staging_area_scope(AREA), staging_area_scope(other_area)]
+    client = FakeRedis()
+    guard = RedisStagingMutationLock(client)
+
+    assert guard.run(lambda: list(client.held), forward) == list(
+        staging_lock_names(forward)
+    )
+    guard.run(lambda: None, reversed(forward))
+    assert client.requested[:2] == client.requested[2:] == sorted(client.requested[:2])
+    assert client.held == []
+    assert staging_lock_names([staging_area_scope(AREA)]) != staging_lock_names(
+        [staging_area_scope(other_area)]
+    )
+
+    busy = FakeRedis(unavailable=[staging_lock_names(forward)[1]])
+    busy_guard = RedisStagingMutationLock(busy)
+    busy_guard.WAIT_SECONDS = 0.1
+    with pytest.raises(StagingMutationLockUnavailable, match="still active"):
+        busy_guard.run(pytest.fail, forward)
+    assert busy.held == []
+
+
+def test_lock_scopes_resolve_each_resource_to_its_staging_area() -> None:
+    other_area = "urn:uuid:00000000-0000-0000-0000-000000000299"
+
+    class ScopeConnection:
+        context_name = "STAGING_SCOPE_TEST"
+        queries = []
+
+        def query(self, query):
+            self.queries.append(query)
+            assert "# staging-area-of" in query
+            return result(
+                [
+                    {"resource": binding(USER_FOLDER), "area": binding(AREA)},
+                    {"resource": binding(TOP), "area": binding(other_area)},
+                    {"resource": binding(AREA)},
+                ]
+            )
+
+    configure_context(ScopeConnection.context_name)
+    connection = ScopeConnection()
+
+    assert staging_lock_scopes(connection, "fasnacht", (USER_FOLDER, TOP)) == tuple(
+        sorted((staging_area_scope(AREA), staging_area_scope(other_area)))
+    )
+    assert staging_lock_scopes(connection, "fasnacht", (AREA,)) == (
+        staging_area_scope(AREA),
+    )
+    assert staging_lock_scopes(
+        connection, "fasnacht", data={"shared:inStagingArea": AREA}
+    ) == (staging_area_scope(AREA),)
+    assert staging_lock_scopes(connection, "fasnacht", data={}) == ("project:fasnacht",)
+    assert len(connection.queries) == 2
+
+
+def test_staging_mutation_retries_when_its_areas_change_before_the_lease(
+    monkeypatch,
+) -> None:
+    taken = []
+
+    class RecordingLock:
+        def run(self, operation, scopes):
+            taken.append(sorted(scopes))
+            return operation()
+
+    resolved = iter([["area:a"], ["area:b"], ["area:b"], ["area:b"]])
+    monkeypatch.setattr(
+        "oldap_api.staging_area.RedisStagingMutationLock", RecordingLock
+    )
+
+    assert (
+        run_staging_mutation(
+            "shared:StagingFolder", lambda: "moved", lambda: next(resolved)
+        )
+        == "moved"
+    )
+    assert taken == [["area:a"], ["area:b"]]
+    assert run_staging_mutation("test:Book", lambda: "plain", pytest.fail) == "plain"
+
+
 def test_staging_mutation_maps_coordination_failure_to_retryable_http_error(
     monkeypatch,
 ) -> None:
     class UnavailableLock:
-        def run(self, operation):
+        def run(self, operation, scopes):
             raise StagingMutationLockUnavailable("Redis is unavailable.")
 
     monkeypatch.setattr(
@@ -308,7 +476,9 @@ def test_staging_mutation_maps_coordination_failure_to_retryable_http_error(
     )
 
     with pytest.raises(StagingAreaServiceUnavailable, match="Redis is unavailable"):
-        run_staging_mutation("shared:StagingFolder", lambda: None)
+        run_staging_mutation(
+            "shared:StagingFolder", lambda: None, lambda: ["area:" + AREA]
+        )
 
 
 class TransactionConnection:
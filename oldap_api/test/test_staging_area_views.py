@@ -32,7 +32,7 @@ def immediate_staging_mutations(monkeypatch):
     monkeypatch.setattr(
         instance_views,
         "run_staging_mutation",
-        lambda resource_classes, operation: operation(),
+        lambda resource_classes, operation, scopes: operation(),
     )
 
 
@@ -158,7 +158,7 @@ def test_generic_nonfolder_creation_retains_existing_path(monkeypatch) -> None:
 
     monkeypatch.setattr(instance_views, "authenticated_connection", object)
     monkeypatch.setattr(instance_views, "StagingSystemFolderPolicy", RecordingPolicy)
-    monkeypatch.setattr(instance_views, "ResourceInstanceFactory", FakeFactory)
+    monkeypatch.setattr(instance_views, "CachedResourceInstanceFactory", FakeFactory)
     app = Flask(__name__)
     payload = {"schema:name": ["Ordinary resource"]}
 
@@ -199,13 +199,13 @@ def test_generic_staging_creation_checks_policy_inside_serialized_write(
         def createObjectInstance(self, resource):
             return lambda **data: FakeInstance()
 
-    def serialized(resource_classes, operation):
+    def serialized(resource_classes, operation, scopes):
         calls.append(("lock", resource_classes))
         return operation()
 
     monkeypatch.setattr(instance_views, "authenticated_connection", object)
     monkeypatch.setattr(instance_views, "StagingSystemFolderPolicy", RecordingPolicy)
-    monkeypatch.setattr(instance_views, "ResourceInstanceFactory", FakeFactory)
+    monkeypatch.setattr(instance_views, "CachedResourceInstanceFactory", FakeFactory)
     monkeypatch.setattr(instance_views, "run_staging_mutation", serialized)
     app = Flask(__name__)
     payload = {
@@ -260,7 +260,7 @@ def test_generic_staging_update_checks_policy_inside_serialized_write(
             calls.append(f"read-{self.reads}")
             return FakeInstance()
 
-    def serialized(resource_classes, operation):
+    def serialized(resource_classes, operation, scopes):
         calls.append(("lock", str(resource_classes)))
         return operation()
 
@@ -268,7 +268,7 @@ def test_generic_staging_update_checks_policy_inside_serialized_write(
     Context(name="DEFAULT")["fasnacht"] = "http://oldap.org/fasnacht#"
     monkeypatch.setattr(instance_views, "authenticated_connection", lambda: connection)
     monkeypatch.setattr(instance_views, "StagingSystemFolderPolicy", RecordingPolicy)
-    monkeypatch.setattr(instance_views, "ResourceInstanceFactory", FakeFactory)
+    monkeypatch.setattr(instance_views, "CachedResourceInstanceFactory", FakeFactory)
     monkeypatch.setattr(instance_views, "run_staging_mutation", serialized)
     app = Flask(__name__)
 
@@ -333,7 +333,7 @@ def test_generic_staging_transform_uses_a_fresh_instance_inside_the_lock(
             calls.append(f"read-{self.reads}")
             return FakeInstance(self.reads)
 
-    def serialized(resource_classes, operation):
+    def serialized(resource_classes, operation, scopes):
         calls.append(("lock", tuple(str(value) for value in resource_classes)))
         return operation()
 
@@ -341,7 +341,7 @@ def test_generic_staging_transform_uses_a_fresh_instance_inside_the_lock(
     Context(name="DEFAULT")["fasnacht"] = "http://oldap.org/fasnacht#"
     monkeypatch.setattr(instance_views, "authenticated_connection", lambda: connection)
     monkeypatch.setattr(instance_views, "StagingSystemFolderPolicy", RecordingPolicy)
-    monkeypatch.setattr(instance_views, "ResourceInstanceFactory", FakeFactory)
+    monkeypatch.setattr(instance_views, "CachedResourceInstanceFactory", FakeFactory)
     monkeypatch.setattr(instance_views, "run_staging_mutation", serialized)
     app = Flask(__name__)
 
@@ -396,7 +396,7 @@ def test_generic_staging_area_delete_requires_the_atomic_route(monkeypatch) -> N
             calls.append(f"read-{self.reads}")
             return FakeInstance()
 
-    def serialized(resource_classes, operation):
+    def serialized(resource_classes, operation, scopes):
         calls.append(("lock", str(resource_classes)))
         return operation()
 
@@ -404,7 +404,7 @@ def test_generic_staging_area_delete_requires_the_atomic_route(monkeypatch) -> N
     Context(name="DEFAULT")["fasnacht"] = "http://oldap.org/fasnacht#"
     monkeypatch.setattr(instance_views, "authenticated_connection", lambda: connection)
     monkeypatch.setattr(instance_views, "StagingSystemFolderPolicy", RejectingPolicy)
-    monkeypatch.setattr(instance_views, "ResourceInstanceFactory", FakeFactory)
+    monkeypatch.setattr(instance_views, "CachedResourceInstanceFactory", FakeFactory)
     monkeypatch.setattr(instance_views, "run_staging_mutation", serialized)
     app = Flask(__name__)
 
@@ -450,14 +450,14 @@ def test_stale_staging_delete_cannot_delete_a_concurrently_transformed_resource(
             calls.append(str(instance.name))
             return instance
 
-    def serialized(resource_classes, operation):
+    def serialized(resource_classes, operation, scopes):
         calls.append(("lock", str(resource_classes)))
         return operation()
 
     connection = SimpleNamespace(context_name="DEFAULT")
     Context(name="DEFAULT")["fasnacht"] = "http://oldap.org/fasnacht#"
     monkeypatch.setattr(instance_views, "authenticated_connection", lambda: connection)
-    monkeypatch.setattr(instance_views, "ResourceInstanceFactory", FakeFactory)
+    monkeypatch.setattr(instance_views, "CachedResourceInstanceFactory", FakeFactory)
     monkeypatch.setattr(instance_views, "run_staging_mutation", serialized)
     app = Flask(__name__)
 
@@ -515,14 +515,14 @@ def test_legacy_admin_create_cannot_bypass_staging_policy(monkeypatch) -> None:
             if resource_class == "shared:StagingFolder":
                 raise StagingStructureConflict("Reserved Staging folder rejected.")
 
-    def serialized(resource_classes, operation):
+    def serialized(resource_classes, operation, scopes):
         calls.append(("lock", resource_classes))
         return operation()
 
     monkeypatch.setattr(resource_views, "authenticated_connection", object)
     monkeypatch.setattr(resource_views, "Project", FakeProject)
     monkeypatch.setattr(resource_views, "DataModel", FakeDataModel)
-    monkeypatch.setattr(resource_views, "ResourceInstanceFactory", FakeFactory)
+    monkeypatch.setattr(resource_views, "CachedResourceInstanceFactory", FakeFactory)
     monkeypatch.setattr(resource_views, "StagingSystemFolderPolicy", RejectingPolicy)
     monkeypatch.setattr(resource_views, "run_staging_mutation", serialized)
     app = Flask(__name__)
@@ -568,7 +568,7 @@ def test_zip_import_commit_uses_the_shared_staging_write_lease(monkeypatch) -> N
             calls.append(("commit", import_id, payload))
             return job, "event-id", ({"iri": "urn:uuid:resource"},)
 
-    def serialized(resource_classes, operation):
+    def serialized(resource_classes, operation, scopes):
         calls.append(("lock", resource_classes))
         return operation()
 
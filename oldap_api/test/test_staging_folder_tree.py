@@ -104,7 +104,7 @@ def test_generic_update_cannot_bypass_staging_folder_move(client, token_headers,
         def read(self, iri):
             return SimpleNamespace(name=instance_views.Xsd_QName("shared:StagingFolder"))
 
-    monkeypatch.setattr(instance_views, "ResourceInstanceFactory", FakeFactory)
+    monkeypatch.setattr(instance_views, "CachedResourceInstanceFactory", FakeFactory)
     response = client.post(
         f"/data/test/{node_iri}",
         json={
@@ -0,0 +1,292 @@
+"""Queued Staging leases record their metrics and shed load when the queue is full."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask
+from oldaplib.src.enums.adminpermissions import AdminPermission
+
+from oldap_api import authentication
+from oldap_api.staging_lock import (
+    EXPORT_QUOTA_SCOPE,
+    STAGING_METRICS_KEY,
+    STAGING_METRICS_TTL_SECONDS,
+    STAGING_QUEUE_DEPTH,
+    RedisQuotaLease,
+    RedisStagingMutationLock,
+    StagingMutationLockUnavailable,
+    StagingMutationQueueFull,
+    acquire_leases,
+    staging_area_scope,
+    staging_lock_metrics,
+    staging_lock_name,
+)
+from oldap_api.views import metrics_views
+
+SCOPE = staging_area_scope("urn:uuid:00000000-0000-0000-0000-000000000301")
+NAME = staging_lock_name(SCOPE)
+WAITER = "oldap-api:staging:waiter:"
+
+
+class QueueRedis:
+    """In-memory stand-in for the Redis commands behind queued Staging leases."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, object] = {}
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+
+    def lock(self, name, *, timeout, **options):
+        return QueueLease(self, name)
+
+    def pipeline(self, transaction=True):
+        return Pipeline(self)
+
+    def incr(self, key):
+        self.values[key] = int(self.values.get(key, 0)) + 1
+        return self.values[key]
+
+    def set(self, key, value, *, px=None, ex=None):
+        self.values[key] = value
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def exists(self, key):
+        return int(key in self.values)
+
+    def pexpire(self, key, milliseconds):
+        return key in self.values
+
+    def expire(self, key, seconds):
+        return key in self.hashes
+
+    def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+            self.hashes.pop(key, None)
+
+    def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    def zrank(self, key, member):
+        order = self.zrange(key, 0, -1)
+        return order.index(member) if member in order else None
+
+    def zrange(self, key, start, end):
+        members = self.zsets.get(key, {})
+        order = sorted(members, key=members.get)
+        return order[start:] if end == -1 else order[start : end + 1]
+
+    def zrem(self, key, member):
+        self.zsets.get(key, {}).pop(member, None)
+
+    def zcard(self, key):
+        return len(self.zsets.get(key, {}))
+
+    def zrangebyscore(self, key, low, high):
+        members = self.zsets.get(key, {})
+        return [member for member in members if members[member] >= low]
+
+    def zremrangebyscore(self, key, low, high):
+        members = self.zsets.get(key, {})
+        for member in [member for member in members if members[member] <= high]:
+            del members[member]
+
+    def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = str(value)
+
+    def hincrby(self, key, field, amount):
+        values = self.hashes.setdefault(key, {})
+        values[field] = str(int(values.get(field, 0)) + amount)
+
+    def hincrbyfloat(self, key, field, amount):
+        values = self.hashes.setdefault(key, {})
+        values[field] = str(float(values.get(field, 0)) + amount)
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+
+class Pipeline:
+    def __init__(self, client: QueueRedis) -> None:
+        self._client = client
+        self._replies: list[object] = []
+
+    def __getattr__(self, name):
+        def queued(*args, **kwargs):
+            self._replies.append(getattr(self._client, name)(*args, **kwargs))
+
+        return queued
+
+    def execute(self):
+        replies, self._replies = self._replies, []
+        return replies
+
+
+class QueueLease:
+    def __init__(self, client: QueueRedis, name: str) -> None:
+        self.client = client
+        self.name = name
+
+    def acquire(self, *, blocking):
+        assert blocking is False
+        if self.name in self.client.values:
+            return False
+        self.client.values[self.name] = "held"
+        return True
+
+    def extend(self, additional_time, *, replace_ttl):
+        return True
+
+    def release(self):
+        self.client.values.pop(self.name)
+
+
+def wait_behind(client: QueueRedis, *tokens: str) -> None:
+    for ticket, token in enumerate(tokens):
+        client.set(WAITER + token, SCOPE)
+        client.zadd(f"{NAME}:queue", {token: -len(tokens) + ticket})
+
+
+def test_leases_record_wait_hold_and_holder_per_scope() -> None:
+    client = QueueRedis()
+    guard = RedisStagingMutationLock(client)
+
+    def write():
+        (lease,) = guard.metrics()
+        assert lease["holder"]["holder"]
+        assert lease["queueDepth"] == 0
+        return "written"
+
+    assert guard.run(write, [SCOPE]) == "written"
+
+    (lease,) = staging_lock_metrics(client)
+    assert lease["lease"] == NAME
+    assert lease["scope"] == SCOPE
+    assert lease["acquired"] == 1
+    assert lease["waitSeconds"] >= 0 and lease["holdSeconds"] >= 0
+    assert lease["timeouts"] == lease["rejected"] == lease["renewalFailures"] == 0
+    assert lease["holder"] is None
+    assert client.zcard(f"{NAME}:queue") == 0
+
+
+def test_only_recent_staging_area_leases_are_recorded() -> None:
+    client = QueueRedis()
+    stale = staging_lock_name(staging_area_scope("urn:example:unused"))
+    client.zadd(STAGING_METRICS_KEY, {stale: 0})
+    client.hset(f"{STAGING_METRICS_KEY}:{stale.rsplit(':', 1)[-1]}", "scope", "x")
+
+    RedisStagingMutationLock(client).run(
+        lambda: None, [SCOPE, "mobile-receipts:upload:3", "mobile-receipts:event:7"]
+    )
+
+    assert [lease["scope"] for lease in staging_lock_metrics(client)] == [SCOPE]
+    assert set(client.zsets[STAGING_METRICS_KEY]) == {NAME}
+    assert client.zsets[STAGING_METRICS_KEY][NAME] > STAGING_METRICS_TTL_SECONDS
+
+
+def test_a_full_queue_is_refused_without_waiting() -> None:
+    client = QueueRedis()
+    wait_behind(client, *(f"waiter{index}" for index in range(STAGING_QUEUE_DEPTH)))
+
+    with pytest.raises(StagingMutationQueueFull):
+        RedisStagingMutationLock(client).run(pytest.fail, [SCOPE])
+
+    (lease,) = staging_lock_metrics(client)
+    assert lease["rejected"] == 1
+    assert lease["acquired"] == 0
+    assert lease["queueDepth"] == STAGING_QUEUE_DEPTH
+
+
+def test_waiters_are_served_in_arrival_order() -> None:
+    client = QueueRedis()
+    wait_behind(client, "earlier")
+
+    # A free lease still goes to the live waiter that queued first.
+    assert acquire_leases(client, [SCOPE], timeout=60, blocking_timeout=0.1) is None
+    assert staging_lock_metrics(client)[0]["timeouts"] == 1
+    assert client.zrange(f"{NAME}:queue", 0, -1) == ["earlier"]
+
+    # A waiter that stopped refreshing its entry is dropped from the queue.
+    client.delete(WAITER + "earlier")
+    (lease,) = acquire_leases(client, [SCOPE], timeout=60, blocking_timeout=0.1)
+    assert lease.name == NAME
+    assert client.zcard(f"{NAME}:queue") == 0
+
+
+def test_a_quota_lease_is_held_once_per_transaction() -> None:
+    client = QueueRedis()
+    lease = RedisQuotaLease(EXPORT_QUOTA_SCOPE, client)
+    other = RedisQuotaLease(EXPORT_QUOTA_SCOPE, client)
+    other.WAIT_SECONDS = 0.1
+    name = staging_lock_name(EXPORT_QUOTA_SCOPE)
+
+    lease.hold()
+    lease.hold()
+    assert client.values[name] == "held"
+    with pytest.raises(StagingMutationLockUnavailable):
+        other.hold()
+
+    lease.release()
+    lease.release()
+    other.hold()
+    other.release()
+    assert name not in client.values
+    assert staging_lock_metrics(client) == []
+
+
+def test_metrics_endpoint_is_limited_to_system_administrators(monkeypatch) -> None:
+    permissions = {
+        "admin": {"oldap:SystemProject": {AdminPermission.ADMIN_OLDAP}},
+        "editor": {"test:project": {AdminPermission.ADMIN_RESOURCES}},
+    }
+
+    class FakeConnection:
+        def __init__(self, token=None, **kwargs) -> None:
+            self.userdata = SimpleNamespace(inProject=permissions[token])
+
+    client = QueueRedis()
+    RedisStagingMutationLock(client).run(lambda: None, [SCOPE])
+    monkeypatch.setattr(authentication, "Connection", FakeConnection)
+    monkeypatch.setattr(
+        metrics_views,
+        "RedisStagingMutationLock",
+        lambda: RedisStagingMutationLock(client),
+    )
+    app = Flask(__name__)
+    app.register_blueprint(metrics_views.metrics_bp)
+    http = app.test_client()
+
+    denied = http.get(
+        "/metrics/staging-locks", headers={"Authorization": "Bearer editor"}
+    )
+    allowed = http.get(
+        "/metrics/staging-locks", headers={"Authorization": "Bearer admin"}
+    )
+
+    assert denied.status_code == 403
+    assert allowed.status_code == 200
+    assert allowed.json["queueDepthLimit"] == STAGING_QUEUE_DEPTH
+    assert [lease["scope"] for lease in allowed.json["leases"]] == [SCOPE]
+    assert allowed.headers["Cache-Control"] == "no-store"
+
+    graphs = http.get(
+        "/metrics/staging-graphs", headers={"Authorization": "Bearer admin"}
+    )
+    assert graphs.status_code == 200
+    assert set(graphs.json) == {
+        "hits",
+        "misses",
+        "bypassed",
+        "fallbackQueries",
+        "entries",
+    }
+    assert (
+        http.get(
+            "/metrics/staging-graphs", headers={"Authorization": "Bearer editor"}
+        ).status_code
+        == 403
+    )
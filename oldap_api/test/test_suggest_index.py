@@ -0,0 +1,173 @@
+"""Typeahead suggestions come from an in-process index kept in step with writes."""
+
+import re
+from types import SimpleNamespace
+
+from flask import Flask, jsonify
+from oldaplib.src.xsd.xsd_qname import Xsd_QName
+
+from oldap_api import authentication
+from oldap_api.data_stamps import DataGraphStamps
+from oldap_api.requester_roles import RequesterRoles
+from oldap_api.suggest_index import SuggestIndex
+from oldap_api.test.test_data_stamps import FakeRedis
+from oldap_api.views import instance_views
+
+EDITOR = "http://oldap.org/shared#Editor"
+GUEST = "http://oldap.org/shared#Guest"
+ROLES = {"alice": {"shared:Editor": "oldap:DATA_UPDATE"}, "carol": {GUEST: None}}
+# The roles in oldap:admin, which decide visibility over the token's roles.
+GRAPH_ROLES = {"alice": [EDITOR], "carol": [GUEST]}
+
+
+class ListRedis(FakeRedis):
+    def __init__(self) -> None:
+        super().__init__()
+        self.lists: dict[str, list[str]] = {}
+
+    def rpush(self, key, value):
+        self.lists.setdefault(key, []).append(value)
+        return len(self.lists[key])
+
+    def llen(self, key):
+        return len(self.lists.get(key, []))
+
+    def lrange(self, key, start, end):
+        return self.lists.get(key, [])[start : end + 1]
+
+    def delete(self, key):
+        self.lists.pop(key, None)
+
+
+class Graph:
+    labels = {
+        "urn:example:1": [("Fasnachtsumzug", None), ("Carnival parade", "en")],
+        "urn:example:2": [("Fähnrich der Clique", "de")],
+        "urn:example:3": [("Fasnachtslaterne", None)],
+    }
+    roles = {
+        "urn:example:1": EDITOR,
+        "urn:example:2": EDITOR,
+        "urn:example:3": GUEST,
+        "urn:example:4": EDITOR,
+    }
+
+
+class FakeConnection:
+    context_name = "DEFAULT"
+    queries: list[str] = []
+
+    def __init__(self, token=None, **kwargs) -> None:
+        self.token = token
+        self.userIri = f"https://example.org/users/{token}"
+        self.userdata = SimpleNamespace(hasRole=ROLES[token])
+
+    def query(self, query):
+        if "oldap:hasRole" in query:
+            roles = GRAPH_ROLES[self.token]
+            return {"results": {"bindings": [{"role": {"value": r}} for r in roles]}}
+        FakeConnection.queries.append(query)
+        values = re.search(r"VALUES \?res \{([^}]*)\}", query)
+        wanted = re.findall(r"<([^>]+)>", values.group(1)) if values else Graph.labels
+        bindings = [
+            {
+                "res": {"type": "uri", "value": iri},
+                "label": {"type": "literal", "value": label}
+                | ({"xml:lang": lang} if lang else {}),
+                "role": {"type": "uri", "value": Graph.roles[iri]},
+            }
+            for iri in wanted
+            for label, lang in Graph.labels.get(iri, [])
+        ]
+        return {"results": {"bindings": bindings}}
+
+
+def _setup(monkeypatch):
+    FakeConnection.queries = []
+    Graph.labels = dict(Graph.labels)
+    monkeypatch.setitem(GRAPH_ROLES, "carol", [GUEST])
+    stamps = DataGraphStamps(ListRedis())
+    index = SuggestIndex(
+        stamps=stamps,
+        properties=lambda project: (
+            (Xsd_QName("shared:name"),) if project == "shared" else ()
+        ),
+        roles=RequesterRoles(),
+    )
+    monkeypatch.setattr(authentication, "Connection", FakeConnection)
+    monkeypatch.setattr(instance_views, "SUGGEST_INDEX", index)
+    app = Flask(__name__)
+    app.register_blueprint(instance_views.instance_bp)
+    return app, index, stamps
+
+
+def _suggest(client, query, user="alice"):
+    return client.get(
+        f"/data/suggest/shared?q={query}",
+        headers={"Authorization": f"Bearer {user}"},
+    )
+
+
+def test_suggestions_match_word_prefixes_visible_to_the_requester(monkeypatch):
+    app, index, _ = _setup(monkeypatch)
+    client = app.test_client()
+
+    assert _suggest(client, "fas").json == {
+        "suggestions": [{"iri": "urn:example:1", "label": "Fasnachtsumzug"}]
+    }
+    assert _suggest(client, "fahnrich cli").json["suggestions"] == [
+        {"iri": "urn:example:2", "label": "Fähnrich der Clique", "lang": "de"}
+    ]
+    assert _suggest(client, "parade car").json["suggestions"][0]["lang"] == "en"
+    assert _suggest(client, "fas", user="carol").json["suggestions"] == [
+        {"iri": "urn:example:3", "label": "Fasnachtslaterne"}
+    ]
+    assert _suggest(client, "f").json == {"suggestions": []}
+    assert len(FakeConnection.queries) == 1
+    assert index.stats()["rebuilds"] == 1
+
+    headers = {"Authorization": "Bearer alice"}
+    assert client.get("/data/suggest/other?q=fas", headers=headers).status_code == 404
+    assert (
+        client.get("/data/suggest/shared?q=fas&limit=0", headers=headers).status_code
+        == 400
+    )
+    assert client.get("/data/suggest/shared?x=1", headers=headers).status_code == 400
+
+
+def test_logged_writes_update_the_index_and_other_changes_rebuild_it(monkeypatch):
+    app, index, stamps = _setup(monkeypatch)
+    client = app.test_client()
+    _suggest(client, "fas")
+
+    Graph.labels["urn:example:1"] = [("Morgestraich", None)]
+    Graph.labels["urn:example:4"] = [("Fasnachtsbummel", None)]
+    stamps.bump("shared")
+    with app.test_request_context("/data/shared/urn:example:1", method="DELETE"):
+        instance_views.record_suggest_writes(jsonify({"iri": "urn:example:4"}))
+
+    assert _suggest(client, "fas").json["suggestions"] == [
+        {"iri": "urn:example:4", "label": "Fasnachtsbummel"}
+    ]
+    assert _suggest(client, "morge").json["suggestions"][0]["iri"] == "urn:example:1"
+    assert (
+        "VALUES ?res { <urn:example:1> <urn:example:4> }" in FakeConnection.queries[1]
+    )
+    assert index.stats()["updates"] == 1
+
+    stamps.bump("shared")
+    _suggest(client, "fas")
+    assert index.stats()["rebuilds"] == 2
+    assert "VALUES ?res" not in FakeConnection.queries[2]
+
+
+def test_revoked_roles_stop_suggestions_despite_the_token(monkeypatch):
+    app, _, stamps = _setup(monkeypatch)
+    client = app.test_client()
+    assert _suggest(client, "fas", user="carol").json["suggestions"]
+
+    # Role changes go through the user routes, which advance the global stamp.
+    GRAPH_ROLES["carol"] = []
+    stamps.bump(None)
+
+    assert _suggest(client, "fas", user="carol").json == {"suggestions": []}
@@ -44,8 +44,10 @@ from oldaplib.src.xsd.xsd_ncname import Xsd_NCName
 from oldaplib.src.xsd.xsd_qname import Xsd_QName
 
 from oldap_api.apierror import ApiError
+from oldap_api.data_stamps import MUTATING_METHODS
 from oldap_api.helpers.process_langstring import process_langstring
 from oldap_api.helpers.process_set import process_set
+from oldap_api.model_cache import DATAMODEL_DOCUMENTS
 from oldap_api.views import known_languages
 
 datamodel_bp = Blueprint('datamodel', __name__, url_prefix='/admin')
@@ -64,24 +66,68 @@ def read_datamodel(project):
         "resources": [{...}, {...}, ...]
     }
     For a more detailed fiew look into the .yaml file.
+    The serialized document is cached per model version and carries an ETag; a matching
+    If-None-Match header yields an empty 304 response.
     """
 
     con = authenticated_connection()
 
+    version = DATAMODEL_DOCUMENTS.version(project)
+    document = DATAMODEL_DOCUMENTS.get(project, version)
+    if document is None:
+        try:
+            dm = DataModel.read(con, project)
+        except OldapErrorNotFound as error:
+            return jsonify({'message': str(error)}), 404
+        except OldapError as error:
+            return jsonify({'message': str(error)}), 500
+        document = DATAMODEL_DOCUMENTS.store(project, version, serialize_datamodel(project, dm))
+
+    response = Response(document.body, mimetype='application/json')
+    response.set_etag(document.etag)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response.make_conditional(request)
+
+
+@datamodel_bp.after_app_request
+def rebuild_datamodel_document(response):
+    """
+    Re-serialize the data model after every successful data model write.
+    The hook is registered on the application when the blueprint is, i.e. before
+    the model-version hook, and therefore runs after the version was advanced.
+    :param response: The response of the write route
+    :return: The unchanged response
+    """
+    project = (request.view_args or {}).get('project')
+    if (request.blueprint != datamodel_bp.name or request.method not in MUTATING_METHODS
+            or response.status_code >= 400 or not project):
+        return response
+    version = DATAMODEL_DOCUMENTS.version(project)
+    if version is None:
+        return response
     try:
-        dm = DataModel.read(con, project)
-    except OldapErrorNotFound as error:
-        return jsonify({'message': str(error)}), 404
-    except OldapError as error:
-        return jsonify({'message': str(error)}), 500
+        dm = DataModel.read(authenticated_connection(), project)
+        DATAMODEL_DOCUMENTS.store(project, version, serialize_datamodel(project, dm), rebuild=True)
+    except (OldapError, RuntimeError) as error:
+        current_app.logger.info(f'Project {project}: data model document not rebuilt: {error}')
+    return response
 
+
+def serialize_datamodel(project: str, dm: DataModel) -> bytes:
+    """
+    Serialize a datamodel to the JSON document returned by read_datamodel.
+    Classes, properties and set members are sorted so that every worker produces
+    the same bytes, and hence the same ETag, for the same datamodel.
+    :param project: The project short name as given in the request
+    :param dm: The datamodel of the project
+    :return: The UTF-8 encoded JSON document
+    """
     current_app.logger.debug(f'Project {project}: Number of resources classes found: {len(dm.get_resclasses())}')
     current_app.logger.debug(f'Project {project}: Number of properties found: {len(dm.get_propclasses())}')
 
-
-    extontos = set(dm.get_extontos())
-    propclasses = set(dm.get_propclasses())
-    resclasses = set(dm.get_resclasses())
+    extontos = sorted(set(dm.get_extontos()), key=str)
+    propclasses = sorted(set(dm.get_propclasses()), key=str)
+    resclasses = sorted(set(dm.get_resclasses()), key=str)
 
     res = {
         "project": project,
@@ -91,10 +137,6 @@ def read_datamodel(project):
     }
 
     for onto in extontos:
-        #current_app.logger.debug(dm[onto].proposedResourceClass)
-        print(onto, "--->", dm[onto].proposedResourceClass)
-        print(onto, "--->", dm[onto].proposedDatatypePropertyClass)
-        print(onto, "--->", dm[onto].proposedObjectPropertyClass)
         res['externalOntologies'].append({
             **({"created": str(dm[onto].created)} if dm[onto].created is not None else {}),
             **({"creator": str(dm[onto].creator)} if dm[onto].creator is not None else {}),
@@ -132,7 +174,7 @@ def read_datamodel(project):
             **({"description": [f'{value}@{lang.name.lower()}' for lang, value in dm[prop].description.items()]} if dm[prop].description else {}),
             **({"languageIn": [f'{tag}'[-2:].lower() for tag in dm[prop].languageIn]} if dm[prop].languageIn else {}),
             **({"uniqueLang": bool(dm[prop].uniqueLang)} if dm[prop].uniqueLang is not None else {}),
-            **({"inSet": list({str(x) for x in dm[prop].inSet})} if dm[prop].inSet is not None else {}),
+            **({"inSet": sorted({str(x) for x in dm[prop].inSet})} if dm[prop].inSet is not None else {}),
             **({"minLength": dm[prop].minLength.value} if dm[prop].minLength is not None else {}),
             **({"maxLength": dm[prop].maxLength.value} if dm[prop].maxLength is not None else {}),
             **({"pattern": str(dm[prop].pattern)} if dm[prop].pattern is not None else {}),
@@ -182,7 +224,7 @@ def read_datamodel(project):
                 **({"description": [f'{value}@{lang.name.lower()}' for lang, value in prop.description.items()]} if prop.description else {}),
                 **({"languageIn": [f'{tag}'[-2:].lower() for tag in prop.languageIn]} if prop.languageIn else {}),
                 **({"uniqueLang": bool(prop.uniqueLang)} if prop.uniqueLang is not None else {}),
-                **({"inSet": list({str(x) for x in prop.inSet})} if prop.inSet is not None else {}),
+                **({"inSet": sorted({str(x) for x in prop.inSet})} if prop.inSet is not None else {}),
                 **({"minLength": prop.minLength.value} if prop.minLength is not None else {}),
                 **({"maxLength": prop.maxLength.value} if prop.maxLength is not None else {}),
                 **({"pattern": str(prop.pattern)} if prop.pattern is not None else {}),
@@ -202,8 +244,7 @@ def read_datamodel(project):
             }
             rdata["properties"].append(pdata)
         res["resources"].append(rdata)
-    #print(json.dumps(res, indent=4))
-    return res, 200
+    return current_app.json.dumps(res).encode()
 
 @datamodel_bp.route('/datamodel/<project>', methods=['PUT'])
 @require_auth
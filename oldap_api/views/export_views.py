@@ -12,11 +12,13 @@ from oldaplib.src.connection import Connection
 from oldaplib.src.helpers.oldaperror import OldapError
 
 from oldap_api.authentication import authenticated_connection, require_auth
+from oldap_api.exports.authorization_cache import CachedExportDownloadAuthorizer
 from oldap_api.exports.capabilities import ExportDownloadCapabilityIssuer
 from oldap_api.exports.archive_snapshot import (
     ArchiveDownloadAuthorizer,
     ArchiveSnapshotProjector,
     OldapArchiveInventoryReader,
+    TargetedArchiveDownloadAuthorizer,
 )
 from oldap_api.exports.domain import (
     ExportNotificationStatus,
@@ -25,6 +27,7 @@ from oldap_api.exports.domain import (
     ExportVersionConflict,
 )
 from oldap_api.exports.manifest import ExportManifestError
+from oldap_api.exports.manifest_store import FileManifestBlobStore
 from oldap_api.exports.internal_auth import require_export_service
 from oldap_api.exports.notifications import deliver_export_notification
 from oldap_api.exports.media_sources import (
@@ -68,6 +71,7 @@ from oldap_api.exports.worker_service import (
     ExportWorkerService,
     ExportWorkerValidationError,
 )
+from oldap_api.staging_lock import EXPORT_QUOTA_SCOPE, RedisQuotaLease
 
 export_bp = Blueprint("exports", __name__, url_prefix="/exports")
 internal_export_bp = Blueprint(
@@ -91,7 +95,7 @@ def _service(
     options = {"operating_policy": policy}
     if snapshots:
         registry = FileExportProfileRegistry.from_environment()
-        archive_reader = OldapArchiveInventoryReader()
+        archive_reader = OldapArchiveInventoryReader(single_query=True)
         options.update(
             profile_registry=registry,
             snapshot_projector=ExportSnapshotRouter(
@@ -111,19 +115,33 @@ def _service(
         registry = FileExportProfileRegistry.from_environment()
         options.update(
             capability_issuer=ExportDownloadCapabilityIssuer(),
-            download_authorizer=ExportDownloadAuthorizerRouter(
-                StagingDownloadAuthorizer(OldapStagingInventoryReader()),
-                ArchiveDownloadAuthorizer(OldapArchiveInventoryReader(), registry),
+            download_authorizer=CachedExportDownloadAuthorizer(
+                ExportDownloadAuthorizerRouter(
+                    StagingDownloadAuthorizer(OldapStagingInventoryReader()),
+                    TargetedArchiveDownloadAuthorizer(registry),
+                    archive_fallback=ArchiveDownloadAuthorizer(
+                        OldapArchiveInventoryReader(single_query=True), registry
+                    ),
+                )
             ),
         )
-    return ExportJobService(GraphDbExportJobRepository(connection), **options)
+    repository = GraphDbExportJobRepository(
+        connection,
+        manifest_store=FileManifestBlobStore.from_environment(),
+        quota_lease=RedisQuotaLease(EXPORT_QUOTA_SCOPE),
+    )
+    return ExportJobService(repository, **options)
 
 
 def _internal_service() -> ExportWorkerService:
     """Build the worker service with non-token-issuing OLDAP credentials."""
 
     return ExportWorkerService(
-        GraphDbExportJobRepository(_export_service_connection()),
+        GraphDbExportJobRepository(
+            _export_service_connection(),
+            manifest_store=FileManifestBlobStore.from_environment(),
+            quota_lease=RedisQuotaLease(EXPORT_QUOTA_SCOPE),
+        ),
         operating_policy=ExportOperatingPolicy.from_environment(),
     )
 
@@ -412,7 +430,9 @@ def get_export_manifest(export_id: str):
     except Exception as error:
         return _handle_error(error)
     digest = base64.b64encode(bytes.fromhex(manifest.sha256)).decode("ascii")
-    response = Response(manifest.canonical_json, content_type="application/json")
+    response = Response(manifest.iter_bytes(), content_type="application/json")
+    response.call_on_close(manifest.close)
+    response.content_length = manifest.size_bytes
     response.headers["Digest"] = f"sha-256={digest}"
     response.headers["Cache-Control"] = "private, no-store"
     return response
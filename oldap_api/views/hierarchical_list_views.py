@@ -17,6 +17,7 @@ from oldaplib.src.oldaplist_helpers import load_list_from_yaml, dump_list_to, Li
 from oldaplib.src.oldaplistnode import OldapListNode
 from oldaplib.src.xsd.xsd_ncname import Xsd_NCName
 
+from oldap_api.helpers.conditional import conditional_response
 from oldap_api.helpers.process_langstring import process_langstring
 
 hierarchical_list_bp = Blueprint('hlist', __name__, url_prefix='/admin')
@@ -157,7 +158,16 @@ def read_hlist(project, hlistid):
         return jsonify({'message': str(error)}), 500 # Should not be reachable
 
     #return json.dumps(hlist, cls=SpecialEncoder), 200
-    return Response(json.dumps(oldaplist, cls=SpecialEncoder), mimetype="application/json"), 200
+    # Removing a node changes no remaining modification date, so the node positions are
+    # part of the ETag.
+    return conditional_response(lambda: Response(json.dumps(oldaplist, cls=SpecialEncoder), mimetype="application/json"),
+                                oldaplist.iri, oldaplist.modified, *_node_validators(hlist))
+
+
+def _node_validators(nodes):
+    for node in nodes or []:
+        yield f'{node.iri} {node.leftIndex} {node.rightIndex} {node.modified}'
+        yield from _node_validators(node.nodes)
 
 @hierarchical_list_bp.route('/hlist/<project>/<hlistid>', methods=['POST'])
 @require_auth
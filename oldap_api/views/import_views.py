@@ -45,6 +45,11 @@ from oldap_api.staging_area import (
     StagingAreaServiceUnavailable,
     run_staging_mutation,
 )
+from oldap_api.staging_lock import (
+    IMPORT_QUOTA_SCOPE,
+    RedisQuotaLease,
+    staging_area_scope,
+)
 
 import_bp = Blueprint("imports", __name__, url_prefix="/imports")
 internal_import_bp = Blueprint(
@@ -59,7 +64,9 @@ REQUEST_ID_RE = re.compile(r"^[A-Za-z0-9._:-]{1,128}$")
 def _service(connection) -> ImportJobService:
     """Build the request-scoped service around the authenticated connection."""
     return ImportJobService(
-        GraphDbImportJobRepository(connection),
+        GraphDbImportJobRepository(
+            connection, quota_lease=RedisQuotaLease(IMPORT_QUOTA_SCOPE)
+        ),
         OldapImportAuthorizer(),
         UploadCapabilityIssuer(),
         OldapImportTargetInspector(connection),
@@ -396,6 +403,7 @@ def commit_staging_import(import_id: str):
         job, event_id, resources = run_staging_mutation(
             "shared:StagingMediaObject",
             lambda: service.commit_import(import_id, payload),
+            lambda: (staging_area_scope(service.staging_area_iri(import_id)),),
         )
         job = _attempt_notification(service, job)
     except Exception as error:
@@ -1,8 +1,17 @@
+from collections.abc import Callable, Iterator
+from itertools import chain
 from pprint import pprint
 from typing import Any
 from urllib.parse import unquote
-from flask import request, jsonify, Blueprint, current_app
+from flask import request, jsonify, Blueprint, Response, current_app, stream_with_context
 from oldap_api.authentication import authenticated_connection, require_auth
+from oldap_api.data_stamps import MUTATING_METHODS, NON_DATA_ENDPOINTS
+from oldap_api.helpers.conditional import conditional_response
+from oldap_api.instance_cache import INSTANCE_READ_CACHE
+from oldap_api.model_cache import CachedResourceInstanceFactory, mark_list_node_context
+from oldap_api.search_cache import SEARCH_RESULT_CACHE
+from oldap_api.search_cursor import keyset_search
+from oldap_api.suggest_index import DEFAULT_SUGGESTIONS, MAX_SUGGESTIONS, SUGGEST_INDEX
 from oldap_api.staging_area import (
     GraphDbStagingAreaRepository,
     StagingStructureConflict,
@@ -12,6 +21,7 @@ from oldap_api.staging_area import (
     is_staging_mutation_class,
     is_staging_structure_class,
     run_staging_mutation,
+    staging_lock_scopes,
 )
 from oldaplib.src.datamodel import DataModel
 from oldaplib.src.enums.datapermissions import DataPermission
@@ -21,7 +31,8 @@ from oldaplib.src.helpers.oldaperror import OldapError, OldapErrorValue, OldapEr
 from oldaplib.src.helpers.langstring import LangString
 from oldaplib.src.helpers.query_processor import QueryProcessor
 from oldaplib.src.objectfactory import CompOp, FTSearchFilter, HLSearchFilter, LogicOp, ResourceInstance, \
-    ResourceInstanceFactory, SearchFilter, SortBy, SortDir, SortKind, convert2datatype
+    SearchFilter, SortBy, SortDir, SortKind, convert2datatype, \
+    MAX_RESOURCE_SUMMARY_BATCH, MAX_RESOURCE_SUMMARY_PROPERTIES
 try:
     from oldaplib.src.objectfactory import LinkedResourceSearchFilter
 except ImportError:
@@ -53,6 +64,10 @@ from oldaplib.src.xsd.xsd_string import Xsd_string
 
 instance_bp = Blueprint('instance', __name__, url_prefix='/data')
 
+MAX_BATCH_READ = 200
+SEARCH_STREAM_CHUNK = 500
+DEFAULT_SEARCH_LIMIT = 100
+
 
 def _staging_structure_error(error: StagingStructureError):
     """Map stable Staging structure policy failures to HTTP responses."""
@@ -184,6 +199,81 @@ def to_json_compatible_value(val):
         return str(val) if val is not None else None
 
 
+# Sanitizes XSD values to primitive Python types
+def sanitize_datatype(val: Xsd | None) -> str | int | float | bool | list[str] | None:
+    if val is None:
+        return None
+    if isinstance(val, LangString):
+        return [str(langval) for langval in val]
+    if isinstance(val, dict):
+        return {sanitize_datatype(k): sanitize_datatype(v) for k, v in val.items()}
+    elif isinstance(val, list):
+        return [sanitize_datatype(v) for v in val]
+    elif isinstance(val, (Xsd_integer, FloatingPoint, Xsd_boolean)):
+        return val.value
+    else:
+        return str(val)
+
+
+ORDERED_DATATYPES = {
+    XsdDatatypes.langString,
+    XsdDatatypes.integer,
+    XsdDatatypes.nonPositiveInteger,
+    XsdDatatypes.negativeInteger,
+    XsdDatatypes.long,
+    XsdDatatypes.int,
+    XsdDatatypes.short,
+    XsdDatatypes.byte,
+    XsdDatatypes.nonNegativeInteger,
+    XsdDatatypes.unsignedLong,
+    XsdDatatypes.unsignedInt,
+    XsdDatatypes.unsignedShort,
+    XsdDatatypes.unsignedByte,
+    XsdDatatypes.positiveInteger,
+    XsdDatatypes.decimal,
+    XsdDatatypes.float,
+    XsdDatatypes.double,
+}
+
+
+def instance_read_response(data: dict, asserted_types: list[str], instance_class: Any) -> dict[str, Any]:
+    """Shape permission-checked resource data as the single-instance read response."""
+    res = {}
+    asserted_type_set = set(asserted_types)
+    inferred_types = []
+    for x, y in data.items():
+        if str(x) == 'rdf:type':
+            all_types = y if isinstance(y, list) else [y]
+            visible_types = {sanitize_datatype(node_type) for node_type in all_types}
+            inferred_types = sorted(visible_types - asserted_type_set)
+            res['rdf:type'] = asserted_types
+            continue
+        attr = Xsd_QName(str(x), validate=False)
+        prop = instance_class.properties.get(attr)
+        datatype = prop.datatype if prop else None
+        if isinstance(y, list):
+            values = []
+            for yy in y:
+                if datatype is not None and not isinstance(yy, LangString):
+                    yy = convert2datatype(yy, datatype)
+                sanitized = sanitize_datatype(yy)
+                if isinstance(yy, LangString):
+                    values.extend(sanitized)
+                else:
+                    values.append(sanitized)
+            if datatype in ORDERED_DATATYPES:
+                values.sort()
+            if datatype == XsdDatatypes.boolean and prop.maxCount == 1:
+                res[str(x)] = values[0] if values else None
+            else:
+                res[str(x)] = values
+        else:
+            res[str(x)] = sanitize_datatype(y)
+    if inferred_types:
+        res['virtual:inferredTypes'] = inferred_types
+    return res
+
+
 def media_object_json_response(res: dict[str, Any]) -> tuple[Any, int]:
     """Serialize a MediaObject lookup result returned by oldaplib.
 
@@ -414,11 +504,70 @@ def parse_text_search_sort_by(sort_by_values: list[str | dict[str, Any]]) -> lis
     return sort_by_param
 
 
+def search_result_chunks(search: Callable[..., Any], params: dict[str, Any]) -> Iterator[Any]:
+    """Run a search in windows of at most ``SEARCH_STREAM_CHUNK`` rows up to the requested limit.
+
+    Only for ``ResourceInstance.search``: it orders results with the resource IRI as the
+    last key, so the windows continue each other like one query with the requested limit
+    and offset. ``search_fulltext`` has no such total order and limits triple rows rather
+    than resources, so it must run as a single query.
+    """
+    params = dict(params)
+    limit = params.pop('limit', DEFAULT_SEARCH_LIMIT)
+    offset = params.pop('offset', 0)
+    while True:
+        size = min(limit, SEARCH_STREAM_CHUNK)
+        rows = search(limit=size, offset=offset, **params)
+        yield rows
+        limit -= size
+        offset += size
+        if not isinstance(rows, list) or len(rows) < size or limit <= 0:
+            return
+
+
+def json_array_response(first: list, rest: Iterator[list]) -> Response:
+    """Stream search rows as one JSON array, converting each row as it is written.
+
+    The first window is read before the response starts so that its errors still
+    yield a 400. An error in a later window can only end the stream early, which
+    leaves the array unterminated and thus recognisably incomplete.
+    """
+    def generate():
+        yield '['
+        separator = ''
+        try:
+            for rows in chain([first], rest):
+                for row in rows:
+                    yield separator + current_app.json.dumps(to_json_compatible_value(row))
+                    separator = ','
+        except OldapError as error:
+            current_app.logger.error(f"Search failed while streaming results: {str(error)}")
+            return
+        yield ']\n'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
+
+def cursor_page_response(con, project: str, params: dict[str, Any], cursor: str):
+    """Answer one keyset page of a class listing; an empty cursor asks for the first page."""
+    try:
+        rows, next_cursor = keyset_search(con=con,
+                                          project=Xsd_NCName(project, validate=True),
+                                          resClass=params['resClass'],
+                                          includeProperties=params.get('includeProperties'),
+                                          sortBy=params.get('sortBy'),
+                                          limit=params.get('limit', DEFAULT_SEARCH_LIMIT),
+                                          cursor=cursor or None)
+    except OldapError as error:
+        return jsonify({"message": f"Search failed: {str(error)}"}), 400
+    return jsonify({"items": [to_json_compatible_value(row) for row in rows], "nextCursor": next_cursor}), 200
+
+
 def parse_text_search_request(resclass: str | None = None,
                               allow_search_fulltext: bool = False) -> tuple[dict[str, Any] | None, tuple[Any, int] | None]:
     known_fields = {
         "q", "searchString", "ftField", "ftProperty", "resClass", "resclass", "includeProperties", "filter", "ftfilter", "hlfilter",
-        "countOnly", "sortBy", "sortBy[]", "limit", "offset",
+        "countOnly", "sortBy", "sortBy[]", "limit", "offset", "cursor",
     }
 
     if request.method == "POST":
@@ -443,6 +592,7 @@ def parse_text_search_request(resclass: str | None = None,
             "sort_by": data.get("sortBy[]", data.get("sortBy", [])),
             "limit": data.get("limit", None),
             "offset": data.get("offset", None),
+            "cursor": data.get("cursor", None),
         }
     else:
         if request.args:
@@ -464,6 +614,7 @@ def parse_text_search_request(resclass: str | None = None,
             "sort_by": request.args.getlist("sortBy[]") or request.args.getlist("sortBy"),
             "limit": request.args.get("limit", None),
             "offset": request.args.get("offset", None),
+            "cursor": request.args.get("cursor", None),
         }
 
     if allow_search_fulltext:
@@ -522,6 +673,13 @@ def parse_text_search_request(resclass: str | None = None,
     ]):
         return None, (jsonify({"message": "Search without filters requires resClass, filter, ftfilter or hlfilter."}), 400)
 
+    if raw["cursor"] is not None:
+        if params['countOnly'] or params['use_search_fulltext'] or raw["offset"] or any([
+            params.get('filter'), params.get('ftfilter'), params.get('hlfilter')
+        ]):
+            return None, (jsonify({"message": '"cursor" pages class listings and cannot be combined with "offset", "countOnly", a search string or filters.'}), 400)
+        params['cursor'] = str(raw["cursor"])
+
     return params, None
 
 
@@ -542,29 +700,38 @@ def text_search_response(project: str, resclass: str | None = None, allow_search
 
     con = authenticated_connection()
 
+    searchstr = params.pop('searchstr')
+    use_search_fulltext = params.pop('use_search_fulltext')
+    if 'cursor' in params:
+        return cursor_page_response(con, project, params, params.pop('cursor'))
+
+    def search(**kwargs):
+        def run():
+            if use_search_fulltext:
+                return ResourceInstance.search_fulltext(con=con,
+                                                        project=Xsd_NCName(project, validate=True),
+                                                        searchstr=searchstr,
+                                                        **kwargs)
+            return ResourceInstance.search(con=con,
+                                           project=Xsd_NCName(project, validate=True),
+                                           **kwargs)
+        operation, cache_params = ('search_fulltext', {'searchstr': searchstr, **kwargs}) if use_search_fulltext \
+            else ('search', kwargs)
+        return SEARCH_RESULT_CACHE.result(con, project, operation, cache_params,
+                                          lambda: to_json_compatible_value(run()))
+
     try:
-        searchstr = params.pop('searchstr')
-        use_search_fulltext = params.pop('use_search_fulltext')
-        if use_search_fulltext:
-            res = ResourceInstance.search_fulltext(con=con,
-                                                   project=Xsd_NCName(project, validate=True),
-                                                   searchstr=searchstr,
-                                                   **params)
-        else:
-            res = ResourceInstance.search(con=con,
-                                          project=Xsd_NCName(project, validate=True),
-                                          **params)
+        if params['countOnly']:
+            return jsonify({"count": to_json_compatible_value(search(**params))}), 200
+        chunks = iter([search(**params)]) if use_search_fulltext else search_result_chunks(search, params)
+        res = next(chunks)
     except OldapError as error:
         return jsonify({"message": f"Search failed: {str(error)}"}), 400
 
-    if params['countOnly']:
-        return jsonify({"count": to_json_compatible_value(res)}), 200
-    else:
-        if isinstance(res, dict):
-            tmp = {str(key): {str(x): to_json_compatible_value(y) for x, y in value.items()} for key, value in res.items()}
-        else:
-            tmp = to_json_compatible_value(res)
+    if isinstance(res, dict):
+        tmp = {str(key): {str(x): to_json_compatible_value(y) for x, y in value.items()} for key, value in res.items()}
         return jsonify(tmp), 200
+    return json_array_response(res, chunks)
 
 
 @instance_bp.route('/mediaobject/id/<imageid>', methods=['GET'])
@@ -616,13 +783,75 @@ def textsearch_instance(project):
     return text_search_response(project=project, allow_search_fulltext=True)
 
 
+@instance_bp.route('/suggest/<path:project>', methods=['GET'])
+@require_auth
+def suggest_instance(project):
+    """
+    Suggest resources whose configured label properties match the typed prefix.
+    Answered from the project's in-process suggest index; only projects listed in
+    OLDAP_SUGGEST_PROPERTIES offer suggestions.
+    :param project: The project short name
+    :return: The best matching resources visible to the requester
+    """
+    current_app.logger.info(f"/data/suggest/{project} with GET called")
+
+    project = unquote(project)
+    known_fields = {"q", "limit"}
+    unknown_field = set(request.args.keys()) - known_fields
+    if unknown_field:
+        return jsonify({"message": f"The Field/s {unknown_field} is/are not used for suggestions. Usable are {known_fields}. Aborted operation"}), 400
+    try:
+        limit = int(request.args.get("limit", DEFAULT_SUGGESTIONS))
+    except ValueError:
+        return jsonify({"message": '"limit" must be an integer.'}), 400
+    if not 0 < limit <= MAX_SUGGESTIONS:
+        return jsonify({"message": f'"limit" must be between 1 and {MAX_SUGGESTIONS}.'}), 400
+
+    con = authenticated_connection()
+    try:
+        Xsd_NCName(project, validate=True)
+    except OldapErrorValue as error:
+        return jsonify({"message": str(error)}), 400
+    if not Context(name=con.context_name).get(project) or not SUGGEST_INDEX.enabled(project):
+        return jsonify({"message": f'Suggestions are not available for project "{project}"'}), 404
+    try:
+        suggestions = SUGGEST_INDEX.suggest(con, project, request.args.get("q", ""), limit=limit)
+    except OldapError as error:
+        return jsonify({"message": f"Suggest failed: {str(error)}"}), 400
+    return jsonify({"suggestions": [
+        {"iri": s.iri, "label": s.label, **({"lang": s.lang} if s.lang else {})} for s in suggestions
+    ]}), 200
+
+
+@instance_bp.after_app_request
+def record_suggest_writes(response):
+    """
+    Log the resources a successful instance write touched for the suggest index.
+    The hook is registered on the application when the blueprint is, i.e. before
+    the data-graph stamp hook, and therefore runs after the stamp was advanced.
+    :param response: The response of the write route
+    :return: The unchanged response
+    """
+    view_args = request.view_args or {}
+    if (request.blueprint != instance_bp.name or request.method not in MUTATING_METHODS
+            or request.endpoint in NON_DATA_ENDPOINTS or response.status_code >= 400
+            or response.is_streamed or not view_args.get('project')):
+        return response
+    iris = [unquote(view_args['instiri'])] if view_args.get('instiri') else []
+    body = response.get_json(silent=True)
+    if isinstance(body, dict) and isinstance(body.get('iri'), str):
+        iris.append(body['iri'])
+    SUGGEST_INDEX.record_writes(unquote(view_args['project']), iris)
+    return response
+
+
 @instance_bp.route('/ofclass/<path:project>', methods=['GET'])
 @require_auth
 def allofclass_instance(project):
     current_app.logger.info(f"/data/ofclass/{project} with GET called")
 
     project = unquote(project)
-    known_json_fields = {"resClass", "includeProperties[]", "countOnly", "sortBy[]", "limit", "offset"}
+    known_json_fields = {"resClass", "includeProperties[]", "countOnly", "sortBy[]", "limit", "offset", "cursor"}
 
     if request.args:
         unknown_json_field = set(request.args.keys()) - known_json_fields
@@ -637,6 +866,7 @@ def allofclass_instance(project):
     sortBy = getattr(request, "args", {}).getlist("sortBy[]", None)
     limit = getattr(request, "args", {}).get("limit", None)
     offset = getattr(request, "args", {}).get("offset", None)
+    cursor = getattr(request, "args", {}).get("cursor", None)
 
     current_app.logger.info(f"/data/allofclass/{project}: resClass: {resClass}, includeProperties: {includeProperties}, countOnly: {countOnly}, sortBy: {sortBy}, limit: {limit}, offset: {offset}")
 
@@ -671,19 +901,24 @@ def allofclass_instance(project):
         return jsonify({"message": str(error)}), 400
     con = authenticated_connection()
 
+    if cursor is not None:
+        if count_only or offset:
+            return jsonify({"message": '"cursor" cannot be combined with "offset" or "countOnly".'}), 400
+        return cursor_page_response(con, project, params, cursor)
+
+    def search(**kwargs):
+        return SEARCH_RESULT_CACHE.result(con, project, 'search', kwargs, lambda: to_json_compatible_value(
+            ResourceInstance.search(con=con, project=Xsd_NCName(project, validate=True), **kwargs)))
+
     try:
-        res = ResourceInstance.search(con=con,
-                                      project=Xsd_NCName(project, validate=True),
-                                      **params)
+        if count_only:
+            return jsonify({"count": to_json_compatible_value(search(**params))}), 200
+        chunks = search_result_chunks(search, params)
+        res = next(chunks)
     except OldapError as error:
         return jsonify({"message": f"Connection failed: {str(error)}"}), 400
 
-    if count_only:
-        return jsonify({"count": to_json_compatible_value(res)}), 200
-    else:
-        tmp = to_json_compatible_value(res)
-
-        return jsonify(tmp), 200
+    return json_array_response(res, chunks)
 
 
 @instance_bp.route('/<path:project>/<resource>', methods=['PUT'])
@@ -700,7 +935,7 @@ def add_instance(project, resource):
 
     con = authenticated_connection()
 
-    factory = ResourceInstanceFactory(con=con, project=project)
+    factory = CachedResourceInstanceFactory(con=con, project=project)
     instclass = factory.createObjectInstance(resource)
 
     data = request.get_json()
@@ -719,7 +954,11 @@ def add_instance(project, resource):
                 )
             instance.create()
 
-        run_staging_mutation(resource, create_instance)
+        run_staging_mutation(
+            resource,
+            create_instance,
+            lambda: staging_lock_scopes(con, project, data=data),
+        )
     except StagingStructureError as error:
         return _staging_structure_error(error)
     except OldapErrorNoPermission as error:
@@ -738,21 +977,6 @@ def add_instance(project, resource):
 def read_instance(project, instiri):
     current_app.logger.info(f"/data/{project}/{instiri} with GET called")
 
-    # Sanitizes XSD values to primitive Python types
-    def sanitize_datatype(val: Xsd | None) -> str | int | float | bool | list[str] | None:
-        if val is None:
-            return None
-        if isinstance(val, LangString):
-            return [str(langval) for langval in val]
-        if isinstance(val, dict):
-            return {sanitize_datatype(k): sanitize_datatype(v) for k, v in val.items()}
-        elif isinstance(val, list):
-            return [sanitize_datatype(v) for v in val]
-        elif isinstance(val, (Xsd_integer, FloatingPoint, Xsd_boolean)):
-            return val.value
-        else:
-            return str(val)
-
     project = unquote(project)
     instiri = unquote(instiri)
 
@@ -766,26 +990,39 @@ def read_instance(project, instiri):
     if not context.get(project):
         return jsonify({"message": f'Project "{project}" not found'}), 404
 
-    query = context.sparql_context
-    query += f"SELECT ?resclass FROM {project}:data WHERE {{ {iri.toRdf} a ?resclass }}"
-    try:
-        jsonres = con.query(query)
-    except OldapError as error:
-        return jsonify({"message": str(error)}), 500
-    res = QueryProcessor(context, jsonres)
-    asserted_types = []
-    resource = None
-    for r in res:
-        resource = r['resclass']
-        resource_type = str(resource)
-        if resource_type not in asserted_types:
-            asserted_types.append(resource_type)
-    if resource is None:
-        return jsonify({'message': f'Resource with iri <{iri}> not found.'}), 404
+    stamp = INSTANCE_READ_CACHE.stamp(project)
+    cached_types = INSTANCE_READ_CACHE.types(project, stamp, str(iri))
+    if cached_types is not None:
+        asserted_types, resource = cached_types
+    else:
+        query = context.sparql_context
+        query += f"SELECT ?resclass FROM {project}:data WHERE {{ {iri.toRdf} a ?resclass }}"
+        try:
+            jsonres = con.query(query)
+        except OldapError as error:
+            return jsonify({"message": str(error)}), 500
+        res = QueryProcessor(context, jsonres)
+        asserted_types = []
+        resource = None
+        for r in res:
+            resource = r['resclass']
+            resource_type = str(resource)
+            if resource_type not in asserted_types:
+                asserted_types.append(resource_type)
+        if resource is None:
+            return jsonify({'message': f'Resource with iri <{iri}> not found.'}), 404
+        INSTANCE_READ_CACHE.store_types(project, stamp, str(iri), asserted_types, resource)
 
     try:
-        factory = ResourceInstanceFactory(con=con, project=project)
-        instance_class = factory.createObjectInstance(resource)
+        instance_class = INSTANCE_READ_CACHE.instance_class(project, stamp, resource)
+        if instance_class is None:
+            factory = CachedResourceInstanceFactory(con=con, project=project)
+            instance_class = INSTANCE_READ_CACHE.store_instance_class(
+                project, stamp, resource, factory.createObjectInstance(resource))
+        else:
+            # The factory that filled the cache under this stamp already
+            # registered the project's list-node prefixes in the shared context.
+            mark_list_node_context(con, project)
         data = ResourceInstance.read_data(con=con,
                                           iri=Iri(instiri, validate=True),
                                           projectShortName=Xsd_NCName(project, validate=True),
@@ -796,59 +1033,110 @@ def read_instance(project, instiri):
         return jsonify({'message': str(error)}), 404
     except OldapError as error:
         return jsonify({'message': str(error)}), 500
-    res = {}
-    asserted_type_set = set(asserted_types)
-    inferred_types = []
-    ordered_datatypes = {
-        XsdDatatypes.langString,
-        XsdDatatypes.integer,
-        XsdDatatypes.nonPositiveInteger,
-        XsdDatatypes.negativeInteger,
-        XsdDatatypes.long,
-        XsdDatatypes.int,
-        XsdDatatypes.short,
-        XsdDatatypes.byte,
-        XsdDatatypes.nonNegativeInteger,
-        XsdDatatypes.unsignedLong,
-        XsdDatatypes.unsignedInt,
-        XsdDatatypes.unsignedShort,
-        XsdDatatypes.unsignedByte,
-        XsdDatatypes.positiveInteger,
-        XsdDatatypes.decimal,
-        XsdDatatypes.float,
-        XsdDatatypes.double,
+    # The property names reflect what the requester may see, the modification date the values.
+    modified = next((value for key, value in data.items() if str(key) == 'oldap:lastModificationDate'), None)
+    return conditional_response(lambda: instance_read_response(data, asserted_types, instance_class),
+                                instiri, modified, *asserted_types, *sorted(str(key) for key in data))
+
+@instance_bp.route('/<path:project>/batch-read', methods=['POST'])
+@require_auth
+def batch_read_instances(project):
+    """Read up to ``MAX_BATCH_READ`` instances with grouped, permission-checked queries.
+
+    Types of uncached IRIs are resolved with one ``VALUES`` query. Each class
+    group is then read with ``ResourceInstanceFactory.read_summaries``, whose
+    single CONSTRUCT per chunk applies the same DATA_VIEW check as a single
+    read. Missing and unreadable IRIs are reported alike under ``errors``.
+    """
+    current_app.logger.info(f"/data/{project}/batch-read with POST called")
+
+    project = unquote(project)
+
+    if not request.is_json:
+        return jsonify({"message": "Invalid request format, JSON required"}), 400
+    data = request.get_json()
+    if not isinstance(data, dict) or set(data) != {"iris"}:
+        return jsonify({"message": "Request body must contain only iris."}), 400
+    raw_iris = data["iris"]
+    if (not isinstance(raw_iris, list) or not raw_iris
+            or not all(isinstance(item, str) for item in raw_iris)):
+        return jsonify({"message": "iris must be a non-empty list of strings."}), 400
+    requested = list(dict.fromkeys(raw_iris))
+    if len(requested) > MAX_BATCH_READ:
+        return jsonify({"message": f"At most {MAX_BATCH_READ} iris can be read at once."}), 400
+    try:
+        iris = {value: Iri(value, validate=True) for value in requested}
+    except OldapErrorValue as error:
+        return jsonify({"message": str(error)}), 400
+
+    con = authenticated_connection()
+    context = Context(name=con.context_name)
+    if not context.get(project):
+        return jsonify({"message": f'Project "{project}" not found'}), 404
+
+    stamp = INSTANCE_READ_CACHE.stamp(project)
+    types: dict[str, tuple[list[str], Any]] = {}
+    for value in requested:
+        cached_types = INSTANCE_READ_CACHE.types(project, stamp, str(iris[value]))
+        if cached_types is not None:
+            types[value] = cached_types
+    uncached = [value for value in requested if value not in types]
+    if uncached:
+        rows = " ".join(f"({index} {iris[value].toRdf})" for index, value in enumerate(uncached))
+        query = context.sparql_context
+        query += (f"SELECT ?key ?resclass FROM {project}:data WHERE {{ "
+                  f"VALUES (?key ?res) {{ {rows} }} ?res a ?resclass }}")
+        try:
+            jsonres = con.query(query)
+        except OldapError as error:
+            return jsonify({"message": str(error)}), 500
+        for r in QueryProcessor(context, jsonres):
+            value = uncached[int(r['key'])]
+            asserted_types, _ = types.get(value, ([], None))
+            if str(r['resclass']) not in asserted_types:
+                asserted_types.append(str(r['resclass']))
+            types[value] = (asserted_types, r['resclass'])
+        for value in uncached:
+            if value in types:
+                INSTANCE_READ_CACHE.store_types(project, stamp, str(iris[value]), *types[value])
+
+    groups: dict[str, list[str]] = {}
+    for value in requested:
+        if value in types:
+            groups.setdefault(str(types[value][1]), []).append(value)
+    resources: dict[str, Any] = {}
+    try:
+        factory = CachedResourceInstanceFactory(con=con, project=project) if groups else None
+        for members in groups.values():
+            resource = types[members[0]][1]
+            instance_class = INSTANCE_READ_CACHE.instance_class(project, stamp, resource)
+            if instance_class is None:
+                instance_class = INSTANCE_READ_CACHE.store_instance_class(
+                    project, stamp, resource, factory.createObjectInstance(resource))
+            properties = sorted(instance_class.resolved_properties(), key=str)
+            property_chunks = [properties[start:start + MAX_RESOURCE_SUMMARY_PROPERTIES]
+                               for start in range(0, len(properties), MAX_RESOURCE_SUMMARY_PROPERTIES)] or [[]]
+            for start in range(0, len(members), MAX_RESOURCE_SUMMARY_BATCH):
+                chunk = members[start:start + MAX_RESOURCE_SUMMARY_BATCH]
+                read: dict[str, dict] = {}
+                for property_chunk in property_chunks:
+                    summaries = factory.read_summaries([iris[value] for value in chunk], property_chunk)
+                    for value in chunk:
+                        summary = summaries.get(iris[value])
+                        if summary is not None:
+                            read.setdefault(value, {}).update(summary.data)
+                for value, item in read.items():
+                    resources[value] = instance_read_response(item, types[value][0], instance_class)
+    except OldapErrorValue as error:
+        return jsonify({"message": str(error)}), 400
+    except OldapError as error:
+        return jsonify({"message": str(error)}), 500
+    errors = {
+        value: {"status": 404, "message": f"Resource with iri <{iris[value]}> not found."}
+        for value in requested
+        if value not in resources
     }
-    for x, y in data.items():
-        if str(x) == 'rdf:type':
-            all_types = y if isinstance(y, list) else [y]
-            visible_types = {sanitize_datatype(node_type) for node_type in all_types}
-            inferred_types = sorted(visible_types - asserted_type_set)
-            res['rdf:type'] = asserted_types
-            continue
-        attr = Xsd_QName(str(x), validate=False)
-        prop = instance_class.properties.get(attr)
-        datatype = prop.datatype if prop else None
-        if isinstance(y, list):
-            values = []
-            for yy in y:
-                if datatype is not None and not isinstance(yy, LangString):
-                    yy = convert2datatype(yy, datatype)
-                sanitized = sanitize_datatype(yy)
-                if isinstance(yy, LangString):
-                    values.extend(sanitized)
-                else:
-                    values.append(sanitized)
-            if datatype in ordered_datatypes:
-                values.sort()
-            if datatype == XsdDatatypes.boolean and prop.maxCount == 1:
-                res[str(x)] = values[0] if values else None
-            else:
-                res[str(x)] = values
-        else:
-            res[str(x)] = sanitize_datatype(y)
-    if inferred_types:
-        res['virtual:inferredTypes'] = inferred_types
-    return jsonify(res), 200
+    return jsonify({"resources": resources, "errors": errors}), 200
 
 @instance_bp.route('/<path:project>/<path:instiri>/transform', methods=['POST'])
 @require_auth
@@ -911,7 +1199,7 @@ def transform_instance(project, instiri):
         return jsonify({"message": f'Project "{project}" not found'}), 404
 
     try:
-        factory = ResourceInstanceFactory(con=con, project=project)
+        factory = CachedResourceInstanceFactory(con=con, project=project)
         instance = factory.read(iri)
         source_class = getattr(instance, "name", expected_source_class)
         staging_mutation = is_staging_mutation_class(
@@ -943,7 +1231,12 @@ def transform_instance(project, instiri):
                 link_from_property=link_from_property,
             )
 
-        transformed = run_staging_mutation((source_class, target_class), transform)
+        transformed = run_staging_mutation(
+            (source_class, target_class),
+            transform,
+            lambda: staging_lock_scopes(con, project, (str(iri),)),
+        )
+        INSTANCE_READ_CACHE.forget(project, str(iri), str(transformed.iri))
         return jsonify({
             "message": "Instance successfully transformed",
             "iri": str(transformed.iri),
@@ -1076,7 +1369,11 @@ def move_staging_folder(project, instiri):
             )
             return StagingFolderTree(con=con, project=project).move(iri, parent_iri)
 
-        moved = run_staging_mutation("shared:StagingFolder", move_folder)
+        moved = run_staging_mutation(
+            "shared:StagingFolder",
+            move_folder,
+            lambda: staging_lock_scopes(con, project, (str(iri), parent_iri.strip())),
+        )
         moved_parent = moved.get(Xsd_QName(parent_property, validate=False))
         return jsonify({
             "message": "Staging folder successfully moved",
@@ -1121,7 +1418,7 @@ def update_instance(project, instiri):
     if not context.get(project):
         return jsonify({"message": f'Project "{project}" not found'}), 404
     try:
-        factory = ResourceInstanceFactory(con=con, project=project)
+        factory = CachedResourceInstanceFactory(con=con, project=project)
         instance = factory.read(iri)
         staging_mutation = is_staging_mutation_class(instance.name)
 
@@ -1139,7 +1436,11 @@ def update_instance(project, instiri):
             current.update()
             return None
 
-        error_message = run_staging_mutation(instance.name, update)
+        error_message = run_staging_mutation(
+            instance.name,
+            update,
+            lambda: staging_lock_scopes(con, project, (str(iri),), data),
+        )
         if error_message is not None:
             return jsonify({"message": error_message}), 400
         return jsonify({"message": "Instance successfully updated"}), 200
@@ -1168,7 +1469,7 @@ def delete_instance(project, instiri):
         return jsonify({"message": f'Project "{project}" not found'}), 404
 
     try:
-        factory = ResourceInstanceFactory(con=con, project=project)
+        factory = CachedResourceInstanceFactory(con=con, project=project)
         instance = factory.read(iri)
         staging_mutation = is_staging_mutation_class(instance.name)
 
@@ -1185,7 +1486,12 @@ def delete_instance(project, instiri):
                     policy.assert_delete_allowed(str(iri))
             current.delete()
 
-        run_staging_mutation(instance.name, delete)
+        run_staging_mutation(
+            instance.name,
+            delete,
+            lambda: staging_lock_scopes(con, project, (str(iri),)),
+        )
+        INSTANCE_READ_CACHE.forget(project, str(iri))
         return jsonify({"message": "Instance successfully deleted"}), 200
     except StagingStructureError as error:
         return _staging_structure_error(error)
@@ -1220,6 +1526,7 @@ def delete_empty_staging_area(project, staging_area_iri):
             lambda: GraphDbStagingAreaRepository(connection, project).delete_empty(
                 staging_area_iri
             ),
+            lambda: staging_lock_scopes(connection, project, (staging_area_iri,)),
         )
     except StagingStructureError as error:
         return _staging_structure_error(error)
@@ -0,0 +1,97 @@
+"""Operational metrics for OLDAP system administrators."""
+
+from __future__ import annotations
+
+from flask import Blueprint, current_app, jsonify
+from oldaplib.src.enums.adminpermissions import AdminPermission
+from redis.exceptions import RedisError
+
+from oldap_api.authentication import (
+    VERIFIED_TOKEN_CACHE,
+    authenticated_connection,
+    require_auth,
+)
+from oldap_api.model_cache import DATAMODEL_DOCUMENTS, PROJECT_MODEL_CACHE
+from oldap_api.staging_area import STAGING_GRAPHS
+from oldap_api.staging_lock import (
+    STAGING_MUTATION_LEASE_SECONDS,
+    STAGING_MUTATION_WAIT_SECONDS,
+    STAGING_QUEUE_DEPTH,
+    RedisStagingMutationLock,
+)
+
+metrics_bp = Blueprint("metrics", __name__, url_prefix="/metrics")
+
+
+def _is_system_admin(connection) -> bool:
+    userdata = getattr(connection, "userdata", None)
+    in_project = getattr(userdata, "inProject", None) or {}
+    return any(
+        AdminPermission.ADMIN_OLDAP in set(permissions or ())
+        for permissions in in_project.values()
+    )
+
+
+@metrics_bp.get("/staging-locks")
+@require_auth
+def staging_lock_metrics():
+    """Report wait, hold, timeout, and queue figures of the Staging write leases."""
+
+    if not _is_system_admin(authenticated_connection()):
+        return jsonify({"message": "ADMIN_OLDAP permission is required."}), 403
+    try:
+        leases = RedisStagingMutationLock().metrics()
+    except RedisError:
+        current_app.logger.exception("Staging lock metrics are unavailable")
+        return jsonify({"message": "Staging lock metrics are unavailable."}), 503
+    response = jsonify(
+        {
+            "leaseSeconds": STAGING_MUTATION_LEASE_SECONDS,
+            "waitSeconds": STAGING_MUTATION_WAIT_SECONDS,
+            "queueDepthLimit": STAGING_QUEUE_DEPTH,
+            "leases": leases,
+        }
+    )
+    response.headers["Cache-Control"] = "no-store"
+    return response
+
+
+@metrics_bp.get("/staging-graphs")
+@require_auth
+def staging_graph_metrics():
+    """Report this worker's StagingGraph cache and namespace fallback queries."""
+
+    if not _is_system_admin(authenticated_connection()):
+        return jsonify({"message": "ADMIN_OLDAP permission is required."}), 403
+    response = jsonify(STAGING_GRAPHS.stats())
+    response.headers["Cache-Control"] = "no-store"
+    return response
+
+
+@metrics_bp.get("/auth-tokens")
+@require_auth
+def verified_token_metrics():
+    """Report this worker's verified-token cache and authentication latencies."""
+
+    if not _is_system_admin(authenticated_connection()):
+        return jsonify({"message": "ADMIN_OLDAP permission is required."}), 403
+    response = jsonify(VERIFIED_TOKEN_CACHE.stats())
+    response.headers["Cache-Control"] = "no-store"
+    return response
+
+
+@metrics_bp.get("/model-cache")
+@require_auth
+def model_cache_metrics():
+    """Report this worker's project model and serialized data model caches."""
+
+    if not _is_system_admin(authenticated_connection()):
+        return jsonify({"message": "ADMIN_OLDAP permission is required."}), 403
+    response = jsonify(
+        {
+            "projectModels": PROJECT_MODEL_CACHE.stats(),
+            "datamodelDocuments": DATAMODEL_DOCUMENTS.stats(),
+        }
+    )
+    response.headers["Cache-Control"] = "no-store"
+    return response
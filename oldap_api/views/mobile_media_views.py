@@ -124,3 +124,24 @@ def commit_mobile_media(upload_id: str):
     response = jsonify(result.to_dict())
     response.headers["Cache-Control"] = "no-store"
     return response
+
+
+@internal_mobile_media_bp.post("/commit-batch")
+@require_mobile_media_service
+def commit_mobile_media_batch():
+    """Atomically create or replay several staging media in one transaction."""
+
+    try:
+        results = _internal_service().commit_batch(request.get_json(silent=True))
+    except Exception as error:
+        return _handle_error(error)
+    for result in results:
+        current_app.logger.info(
+            "Mobile-media commit accepted uploadId=%s clientAssetId=%s requestId=%s",
+            result.upload_id,
+            result.client_asset_id,
+            _request_id(),
+        )
+    response = jsonify({"results": [result.to_dict() for result in results]})
+    response.headers["Cache-Control"] = "no-store"
+    return response
@@ -26,6 +26,7 @@ from oldaplib.src.xsd.xsd_date import Xsd_date
 from oldaplib.src.xsd.xsd_ncname import Xsd_NCName
 from oldaplib.src.xsd.xsd_qname import Xsd_QName
 
+from oldap_api.helpers.conditional import conditional_response
 from oldap_api.helpers.process_langstring import process_langstring
 
 project_bp = Blueprint('project', __name__, url_prefix='/admin')
@@ -168,7 +169,7 @@ def read_project(projectid):
         **({"projectStart": str(project.projectStart)} if project.projectStart else {}),
         **({"projectEnd": str(project.projectEnd)} if project.projectEnd else {}),
     }
-    return res, 200
+    return conditional_response(lambda: res, project.projectIri, project.modified)
 
 @project_bp.route('/project/get', methods=['GET'])
 @require_auth
@@ -203,7 +204,7 @@ def get_project_by_iri():
         **({"projectStart": str(project.projectStart)} if project.projectStart else {}),
         **({"projectEnd": str(project.projectEnd)} if project.projectEnd else {}),
     }
-    return res, 200
+    return conditional_response(lambda: res, project.projectIri, project.modified)
 
 
 @project_bp.route('/project/search', methods=['GET'])
@@ -2,9 +2,9 @@ import json
 
 from flask import Blueprint, request, jsonify, Response
 from oldap_api.authentication import authenticated_connection, require_auth
+from oldap_api.model_cache import CachedResourceInstanceFactory
 from oldaplib.src.datamodel import DataModel
 from oldaplib.src.project import Project
-from oldaplib.src.objectfactory import ResourceInstanceFactory
 from oldaplib.src.helpers.oldaperror import OldapError, OldapErrorNoPermission, OldapErrorAlreadyExists, \
     OldapErrorInconsistency, OldapErrorValue, OldapErrorNotFound, OldapErrorUpdateFailed, OldapErrorKey
 from oldap_api.staging_area import (
@@ -12,6 +12,7 @@ from oldap_api.staging_area import (
     StagingSystemFolderPolicy,
     is_staging_folder_class,
     run_staging_mutation,
+    staging_lock_scopes,
 )
 
 
@@ -30,7 +31,7 @@ def get_resource(project, iri):
         return jsonify({'message': str(error)}), 400
 
     try:
-        factory = ResourceInstanceFactory(con=con, project=project)
+        factory = CachedResourceInstanceFactory(con=con, project=project)
     except (OldapErrorInconsistency, OldapErrorNotFound, OldapError) as error:
         return jsonify({'message': str(error)}), 400
 
@@ -63,7 +64,7 @@ def create_resource(project, resclass):
     pass
 
     try:
-        factory = ResourceInstanceFactory(con=con, project=project)
+        factory = CachedResourceInstanceFactory(con=con, project=project)
         Resclass = factory.createObjectInstance(resclass)
     except OldapError as error:
         return jsonify({'message': str(error)}), 500
@@ -83,7 +84,11 @@ def create_resource(project, resclass):
                 ).assert_create_allowed(resclass, data)
             instance.create()
 
-        run_staging_mutation(resclass, create_instance)
+        run_staging_mutation(
+            resclass,
+            create_instance,
+            lambda: staging_lock_scopes(con, project_short_name, data=data),
+        )
     except StagingStructureError as error:
         return jsonify({"message": str(error)}), error.status
     except OldapErrorNoPermission as error:
@@ -22,6 +22,7 @@ from oldaplib.src.helpers.oldaperror import OldapError, OldapErrorNoPermission,
 from oldaplib.src.role import Role
 from oldaplib.src.xsd.xsd_qname import Xsd_QName
 
+from oldap_api.helpers.conditional import conditional_response
 from oldap_api.helpers.process_langstring import process_langstring
 from oldap_api.views import known_languages
 
@@ -88,7 +89,7 @@ def role_get_by_iri():
         'definedByProject': str(role.definedByProject),
     }
 
-    return res, 200
+    return conditional_response(lambda: res, role.iri, role.modified)
 
 
 @role_bp.route('/role/<path:definedByProject>/<roleId>', methods=['PUT'])
@@ -197,7 +198,7 @@ def read_role(definedByProject, roleId):
         'definedByProject': str(role.definedByProject),
     }
 
-    return res, 200
+    return conditional_response(lambda: res, role.iri, role.modified)
 
 
 @role_bp.route('/role/search', methods=['GET'])
@@ -15,6 +15,7 @@ from typing import Any, Dict, Set
 
 from flask import jsonify, request, Blueprint
 from oldap_api.authentication import authenticated_connection, require_auth
+from oldap_api.helpers.conditional import conditional_response
 from oldaplib.src.enums.adminpermissions import AdminPermission
 from oldaplib.src.enums.datapermissions import DataPermission
 from oldaplib.src.helpers.irincname import IriOrNCName
@@ -225,7 +226,7 @@ def read_users(userid):
             proj = {"project": str(projname), "permissions": [x.value for x in permissions] if permissions else []}
             answer["inProjects"].append(proj)
 
-    return jsonify(answer), 200
+    return conditional_response(lambda: answer, user.userIri, user.modified, user.passwordResetRequestAt)
 
 
 @user_bp.route('/user/<userid>', methods=['DELETE'])
@@ -555,4 +556,4 @@ def user_get_by_iri():
             proj = {"project": str(projname), "permissions": [x.value for x in permissions] if permissions else []}
             answer["inProjects"].append(proj)
 
-    return jsonify(answer), 200
+    return conditional_response(lambda: answer, user.userIri, user.modified, user.passwordResetRequestAt)